@@ -0,0 +1,55 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks 10 seconds of simulated AutoPlay gameplay (update, collisions, and draw) run
+                        headless with fixed VECTOR_1 ticks rather than real time.
+"""
+
+import random
+
+from benchcore import benchmark, make_playing_engine
+
+SIM_SECONDS: int = 10
+TICK_MS: int = 4  # 1000 / MAX_FPS_VECTOR
+REPEATS: int = 3  # each plays a fresh game
+
+
+@benchmark('autoplay/10s_simulated', number=1, repeat=REPEATS)
+def bench_autoplay():
+    """
+    Run handle_gamestate() for 10s of game time with AutoPlay driving the paddle
+
+    :return:
+    """
+    import pygame
+    from constants import BLACK
+    from gamestate import GameState
+    from leveltheme import LevelTheme
+
+    from gameworld import GameWorld
+    from playerstate import PlayerState
+
+    # the engine, and a fresh game's world for each repeat, are built here so only the play is timed
+    ge = make_playing_engine(LevelTheme.MODERN, tick_time=TICK_MS)
+    worlds = [GameWorld(LevelTheme.MODERN) for _ in range(REPEATS)]
+
+    def play_10s():
+        random.seed(495)
+        ge.gw = worlds.pop()
+        ge.ps = PlayerState()
+        ge.ps.theme = LevelTheme.MODERN
+        ge.contacts.clear()
+        ge.gs.cur_state = GameState.GameStateName.PLAYING
+        for _ in range((SIM_SECONDS * 1000) // TICK_MS):
+            ge.screen.fill(BLACK)
+            ge.handle_gamestate([])
+            if ge.gs.cur_state == GameState.GameStateName.READY_TO_LAUNCH:
+                ge.gs.cur_state = GameState.GameStateName.PLAYING
+            pygame.event.pump()
+
+    return play_10s
@@ -0,0 +1,76 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks the autosave's cost to the game thread: a full MODERN PLAYING frame with autosave
+                        off, and with a snapshot due on EVERY frame (the worst case - normally it's one frame every
+                        AUTOSAVE_INTERVAL_MS), writing to a temporary game data dir.  The report gives the frame
+                        profiler's 'autosave' span (max and p99, in ms) against the frame budget at MAX_FPS_VECTOR,
+                        and how many snapshots the worker actually wrote.
+"""
+
+import atexit
+import shutil
+import tempfile
+
+from benchcore import benchmark, make_playing_engine, play_frame
+
+import autosave
+import constants
+import persistence
+from leveltheme import LevelTheme
+
+
+def make_autoplay_game():
+    """
+    A MODERN game in AutoPlay, with its frames profiled like the real loop's
+
+    :return: (GameEngine, frame callable)
+    """
+    ge = make_playing_engine(LevelTheme.MODERN, tick_time=1000 // constants.MAX_FPS_VECTOR)
+    return ge, lambda: play_frame(ge)
+
+
+@benchmark('autosave/frame_off', number=500)
+def bench_frame_autosave_off():
+    """
+    A full PLAYING frame, no autosave
+
+    :return:
+    """
+    autosave.enable(False)
+    return make_autoplay_game()[1]
+
+
+@benchmark('autosave/frame_saving_every_frame', number=500)
+def bench_frame_autosave_every_frame():
+    """
+    A full PLAYING frame that also hands a snapshot to the autosave worker
+
+    :return:
+    """
+    data_dir = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, data_dir, True)
+    game_data_path = persistence.GAME_DATA_PATH
+    persistence.GAME_DATA_PATH = data_dir
+    autosave.enable()
+    autosave.interval_ms = 0
+    ge, frame = make_autoplay_game()
+    writes = autosave.writes
+
+    def report() -> dict:
+        autosave.wait()
+        autosave.enable(False)
+        autosave.interval_ms = constants.AUTOSAVE_INTERVAL_MS
+        persistence.GAME_DATA_PATH = game_data_path
+        span = ge.profiler.rings['autosave']
+        p99 = span.percentiles((99,))[0]
+        return {'autosave_max_ms': span.max() / 1e6, 'autosave_p99_ms': p99 / 1e6,
+                'frame_budget_ms': 1000 / constants.MAX_FPS_VECTOR, 'snapshots_written': autosave.writes - writes,
+                'unchanged_skipped': autosave.skipped}
+
+    return frame, report
@@ -0,0 +1,76 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks the spectator broadcast: an AutoPlay game's 60 FPS frames published to 1, 16,
+                        and 64 spectators (socket pairs, all read every frame).  The timing is the whole frame - the
+                        game, the publish, and the spectators' reads - and the reports break out the publish time
+                        (total and per spectator), the stream's bytes per second (what each spectator receives),
+                        its keyframes, and a spectator's decode time per frame.
+"""
+
+import socket
+from time import perf_counter_ns
+
+from benchcore import FRAME_MS, benchmark, make_playing_engine
+
+from gamestate import GameState
+from leveltheme import LevelTheme
+
+
+@benchmark('broadcast/publish_{}_spectators', number=300, params=[1, 16, 64])
+def bench_broadcast_publish(spectator_count: int):
+    """
+    An AutoPlay game frame, its publish, and the spectators' reads
+
+    :param spectator_count: how many spectators
+    :return:
+    """
+    from broadcast import BroadcastServer, SpectatorClient
+
+    ge = make_playing_engine(LevelTheme.MODERN)
+    server = BroadcastServer()
+    clients = []
+    for _ in range(spectator_count):
+        server_end, client_end = socket.socketpair()
+        server.add_spectator(server_end)
+        clients.append(SpectatorClient(client_end))
+    frames = [0]
+    publish_ns = [0]
+    decode_ns = [0]
+
+    def game_frame():
+        ge.handle_gamestate([])
+        if ge.gs.cur_state == GameState.GameStateName.READY_TO_LAUNCH:
+            ge.gs.cur_state = GameState.GameStateName.PLAYING
+        elif ge.gs.cur_state != GameState.GameStateName.PLAYING:
+            # a run that's over (or a cleared level) starts over
+            ge.reset_game()
+            ge.gs.cur_state = GameState.GameStateName.PLAYING
+
+    def frame():
+        game_frame()
+        start = perf_counter_ns()
+        server.publish(ge.gw, ge.gs, ge.ps)
+        publish_ns[0] += perf_counter_ns() - start
+        start = perf_counter_ns()
+        clients[0].receive()
+        decode_ns[0] += perf_counter_ns() - start
+        for client in clients[1:]:
+            client.receive()
+        frames[0] += 1
+
+    def report() -> dict:
+        seconds = frames[0] * FRAME_MS / 1000
+        publish_us = publish_ns[0] / max(frames[0], 1) / 1000
+        return {'publish_us': publish_us, 'publish_us_per_spectator': publish_us / spectator_count,
+                'bytes_per_sec': clients[0].bytes_received / seconds,
+                'messages_per_sec': clients[0].messages / seconds,
+                'keyframes_per_sec': clients[0].keyframes / seconds,
+                'spectator_decode_us': decode_ns[0] / max(frames[0], 1) / 1000, 'skipped': server.skipped}
+
+    return frame, report
@@ -0,0 +1,39 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks the per-frame collision checks of the ball against a growing number of bricks.
+"""
+
+from benchcore import benchmark, make_engine
+
+
+@benchmark('collision/ball_vs_{}_bricks', number=200, params=[10, 55, 200, 500])
+def bench_collision_vs_brick_count(brick_count: int):
+    """
+    One ball checked against the world objects in its collision mask (as in handle_gamestate), none actually colliding
+
+    :param brick_count: number of bricks in the world
+    :return:
+    """
+    import pygame
+    from ball import Ball
+    from brick import Brick
+    from leveltheme import LevelTheme
+
+    ge = make_engine(LevelTheme.CLASSIC)
+    ge.gw.remove_bricks()
+    ge.gw.remove_obstacles()
+    for i in range(brick_count):
+        ge.gw.world_objects.append(Brick(pygame.Rect(10 + (i % 50) * 20, 100 + (i // 50) * 12, 18, 10),
+                                         (255, 0, 0)))
+    ball = next(wo for wo in ge.gw.world_objects if isinstance(wo, Ball))
+
+    def check_collisions():
+        ge.handle_collisions_for(ball)
+
+    return check_collisions
@@ -0,0 +1,197 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks the drawing hot paths: full gameplay frames, Animations, and HUD text.
+"""
+
+from benchcore import benchmark, init_pygame, make_engine
+
+
+@benchmark('draw/full_frame_{}', number=50, params=['CLASSIC', 'MODERN'])
+def bench_full_frame(theme_name: str):
+    """
+    A complete gameplay frame draw (fill, world objects, status HUD) for a themed level with strong bricks
+
+    :param theme_name: LevelTheme name
+    :return:
+    """
+    from constants import BLACK
+    from leveltheme import LevelTheme
+    from levels import Levels
+
+    theme = LevelTheme[theme_name]
+    ge = make_engine(theme, Levels.LevelName[f"{theme_name}_MIXED_2"])
+
+    def draw_frame():
+        ge.screen.fill(BLACK)
+        ge.draw_world_and_status()
+
+    return draw_frame
+
+
+@benchmark('draw/animation_brick_destroy', number=200)
+def bench_animation_draw():
+    """
+    Draw of an image-brick destruction Animation
+
+    :return:
+    """
+    import pygame
+    import assets
+    from animation import Animation
+    from constants import EFFECT_BRICK_IMAGE_DESTROY_DURATION, RED
+
+    init_pygame()
+    screen = pygame.display.get_surface()
+    anim = Animation(EFFECT_BRICK_IMAGE_DESTROY_DURATION, pygame.Rect(100, 100, 100, 50), RED,
+                     images=assets.BRICK_ANIMATION)
+
+    def draw_animation():
+        anim.draw_wo(screen)
+
+    return draw_animation
+
+
+@benchmark('draw/hud_status_text', number=200)
+def bench_hud_text():
+    """
+    UserInterface.draw_status() (lives, score, and level text)
+
+    :return:
+    """
+    ge = make_engine()
+
+    def draw_hud():
+        ge.ui.draw_status(3, 12345, 7)
+
+    return draw_hud
+
+
+@benchmark('draw/menu_{}', number=100, params=['start', 'how_to_play', 'credits', 'leaderboard', 'settings'])
+def bench_menu_screen(screen_name: str):
+    """
+    A menu screen frame (the mouse isn't moving, so the static screens stay cached)
+
+    :param screen_name: which screen
+    :return:
+    """
+    from constants import BLACK
+
+    ge = make_engine()
+    draw_screen = {'start': ge.ui.draw_start_screen,
+                   'how_to_play': ge.ui.draw_how_to_play_screen,
+                   'credits': ge.ui.draw_credits_screen,
+                   'leaderboard': lambda: ge.ui.draw_leaderboard_screen(ge.lb),
+                   'settings': lambda: ge.ui.draw_settings_screen(ge.gset)}[screen_name]
+
+    def draw_frame():
+        ge.screen.fill(BLACK)
+        draw_screen()
+
+    return draw_frame
+
+
+@benchmark('draw/leaderboard_scroll_{}_scores', number=100, params=[10, 100, 500])
+def bench_leaderboard_scroll(num_scores: int):
+    """
+    A leaderboard screen frame that scrolls one row (so the screen is re-rendered from the cached rows each frame)
+
+    :param num_scores: leaderboard length
+    :return:
+    """
+    from constants import BLACK
+    from score import Score
+
+    ge = make_engine()
+    ge.lb.l_top_scores = [Score(i * 10, 1 + i % 20, "abc") for i in range(num_scores)]
+    ge.lb.mark_changed()
+    step = [1]
+
+    def draw_frame():
+        before = ge.ui.leaderboard_first_row
+        ge.ui.scroll_leaderboard(step[0], ge.lb)
+        if ge.ui.leaderboard_first_row == before:
+            step[0] = -step[0]
+        ge.screen.fill(BLACK)
+        ge.ui.draw_leaderboard_screen(ge.lb)
+
+    return draw_frame
+
+
+@benchmark('draw/settings_slider_drag', number=100)
+def bench_settings_slider_drag():
+    """
+    A settings screen frame while the music slider is being dragged (the volume changes every frame)
+
+    :return:
+    """
+    from constants import BLACK, MUSIC_VOLUME_STEP
+
+    ge = make_engine()
+    ge.gset.bgm_sounds = True
+    step = [MUSIC_VOLUME_STEP]
+
+    def draw_frame():
+        volume = ge.gset.music_volume + step[0]
+        if not MUSIC_VOLUME_STEP <= volume <= 1.0:
+            step[0] = -step[0]
+            volume = ge.gset.music_volume + step[0]
+        ge.gset.music_volume = volume
+        ge.screen.fill(BLACK)
+        ge.ui.draw_settings_screen(ge.gset)
+
+    return draw_frame
+
+
+@benchmark('draw/shake_frame_strength_{}', number=200, params=[4, 40])
+def bench_shake_frame(strength: int):
+    """
+    A full-frame draw while the screen is shaking (40 is the level-cleared shake), restarting the shake as it ends
+
+    :param strength: the shake strength
+    :return:
+    """
+    import utils
+    from constants import BLACK
+
+    ge = make_engine()
+
+    def draw_frame():
+        if not ge.gs.shake_screen_brick:
+            utils.start_shake(ge.gs, strength)
+        ge.screen.fill(BLACK)
+        ge.draw_world_and_status()
+
+    return draw_frame
+
+
+@benchmark('draw/animation_pool_burst', number=200)
+def bench_animation_pool_burst():
+    """
+    A frame of a 10-brick burst: spawn 10 plain brick-destroy Animations from the pool, then update and draw all
+    that are playing (the pool fills up and recycles)
+
+    :return:
+    """
+    import pygame
+    from unittest.mock import MagicMock
+    from animationpool import AnimationPool
+    from constants import EFFECT_BRICK_PLAIN_DESTROY_DURATION, RED
+
+    init_pygame()
+    screen = pygame.display.get_surface()
+    pool = AnimationPool()
+    gs = MagicMock(tick_time=4)
+
+    def burst_frame():
+        for i in range(10):
+            pool.spawn(EFFECT_BRICK_PLAIN_DESTROY_DURATION, (60 * i, 100, 60, 25), RED, fade=True)
+        pool.update(gs, None, None, None)
+        pool.draw(screen)
+
+    return burst_frame
@@ -0,0 +1,116 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks the endless mode: one 60 FPS frame of an AutoPlay endless run (a new run when one
+                        ends), and a soak of a whole 30 minute session of them.  The soak checks the run doesn't
+                        wear down as the rows stream through - the frame time of its last minute against its first,
+                        and (with tracemalloc) that the memory in use at the end is no more than after the first
+                        minute, failing the benchmark if it's grown by more than ENDLESS_SOAK_MAX_GROWTH_BYTES.
+"""
+
+import tracemalloc
+from time import perf_counter_ns
+
+from benchcore import benchmark, make_playing_engine
+
+from gamestate import GameState
+from leveltheme import LevelTheme
+
+# the soak's session length, and the frames in a minute of it
+SOAK_MINUTES: int = 30
+FRAMES_PER_MINUTE: int = 60 * 60
+
+# how much the memory in use may grow over the soak (after its first minute) before the benchmark fails
+ENDLESS_SOAK_MAX_GROWTH_BYTES: int = 256 * 1024
+
+
+def make_endless_frame():
+    """
+    An AutoPlay endless run, and its frame function
+
+    :return: (GameEngine, frame)
+    """
+    ge = make_playing_engine(LevelTheme.MODERN)
+    ge.play_music = lambda: None
+    ge.start_endless()
+    ge.gs.cur_state = GameState.GameStateName.PLAYING
+    restarts = [0]
+
+    def frame():
+        ge.screen.fill((0, 0, 0))
+        ge.handle_gamestate([])
+        if ge.gs.cur_state == GameState.GameStateName.READY_TO_LAUNCH:
+            ge.gs.cur_state = GameState.GameStateName.PLAYING
+        elif ge.gs.cur_state != GameState.GameStateName.PLAYING:
+            # a run that's over starts over
+            ge.start_endless()
+            ge.gs.cur_state = GameState.GameStateName.PLAYING
+            restarts[0] += 1
+
+    return ge, frame, restarts
+
+
+@benchmark('endless/frame', number=600)
+def bench_endless_frame():
+    """
+    One frame of an AutoPlay endless run
+
+    :return:
+    """
+    ge, frame, restarts = make_endless_frame()
+
+    def report() -> dict:
+        field = ge.gw.brick_field
+        return {'rows': len(field.rows), 'rows_streamed': field.rows_streamed, 'restarts': restarts[0]}
+
+    return frame, report
+
+
+@benchmark('endless/soak_30min', number=1, repeat=1)
+def bench_endless_soak():
+    """
+    A whole 30 minute endless session, with the memory traced
+
+    :return:
+    """
+    ge, frame, restarts = make_endless_frame()
+    stats = {}
+
+    def soak():
+        tracemalloc.start()
+        minute_ms = []
+        rows_streamed = 0
+        baseline = 0
+        try:
+            for minute in range(SOAK_MINUTES):
+                start = perf_counter_ns()
+                field = ge.gw.brick_field
+                streamed = field.rows_streamed
+                for _ in range(FRAMES_PER_MINUTE):
+                    frame()
+                    if ge.gw.brick_field is not field:
+                        rows_streamed += field.rows_streamed - streamed
+                        field = ge.gw.brick_field
+                        streamed = field.rows_streamed
+                rows_streamed += field.rows_streamed - streamed
+                minute_ms.append((perf_counter_ns() - start) / 1e6 / FRAMES_PER_MINUTE)
+                if minute == 0:
+                    baseline = tracemalloc.get_traced_memory()[0]
+            growth = tracemalloc.get_traced_memory()[0] - baseline
+        finally:
+            tracemalloc.stop()
+
+        stats.update({'first_minute_frame_ms': minute_ms[0], 'last_minute_frame_ms': minute_ms[-1],
+                      'worst_minute_frame_ms': max(minute_ms), 'memory_growth_bytes': growth,
+                      'rows_streamed': rows_streamed, 'restarts': restarts[0]})
+        assert growth <= ENDLESS_SOAK_MAX_GROWTH_BYTES, f"memory grew {growth} bytes over the soak"
+
+    def report() -> dict:
+        return stats
+
+    return soak, report
@@ -0,0 +1,77 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks the training environment's throughput: one lockstep step of 1, 8, and 64 envs
+                        (random actions), in process and across subprocess workers (one per CPU), reporting the
+                        env steps per second.
+"""
+
+import random
+from time import perf_counter_ns
+
+from benchcore import benchmark, init_pygame
+
+ENV_COUNTS: list[int] = [1, 8, 64]
+REPORT_STEPS: int = 200
+
+
+def make_stepper(vector_env):
+    """
+    Reset the vector env and make its timed step (random actions) and its steps/second report
+
+    :param vector_env: a SmashVectorEnv or SubprocVectorEnv
+    :return: (step, report)
+    """
+    from smashenv import NUM_ACTIONS
+
+    rng = random.Random(495)
+    actions = [[rng.randrange(NUM_ACTIONS) for _ in range(vector_env.num_envs)] for _ in range(64)]
+    vector_env.reset(seed=495)
+    step_num = [0]
+
+    def step():
+        step_num[0] += 1
+        vector_env.step(actions[step_num[0] % len(actions)])
+
+    def report() -> dict:
+        start = perf_counter_ns()
+        for _ in range(REPORT_STEPS):
+            step()
+        secs = (perf_counter_ns() - start) / 1e9
+        vector_env.close()
+        return {'env_steps_per_sec': REPORT_STEPS * vector_env.num_envs / secs}
+
+    return step, report
+
+
+@benchmark('env/step_in_process_{}', number=50, params=ENV_COUNTS)
+def bench_env_in_process(num_envs: int):
+    """
+    A lockstep step of num_envs envs in this process
+
+    :param num_envs: how many envs
+    :return:
+    """
+    from smashenv import SmashVectorEnv
+
+    init_pygame()
+    return make_stepper(SmashVectorEnv(num_envs))
+
+
+@benchmark('env/step_subprocess_{}', number=50, params=ENV_COUNTS)
+def bench_env_subprocess(num_envs: int):
+    """
+    A lockstep step of num_envs envs split across the subprocess workers
+
+    :param num_envs: how many envs
+    :return:
+    """
+    from smashenv import SubprocVectorEnv
+
+    init_pygame()
+    return make_stepper(SubprocVectorEnv(num_envs))
@@ -0,0 +1,148 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks the LASER power-up's shots, with a steady number in flight over a full level (each
+                        step tops the pool back up with shots scattered below the bricks, and the bricks are made
+                        too strong to destroy, so the level stays full): the LaserPool's batched, column-indexed
+                        step, a baseline that tests each shot against every brick (as WorldObjects in the
+                        all-pairs loop would be), and a full AutoPlay PLAYING frame - the shots' hits scoring
+                        through the engine, and drawn.  The frame's report gives its mean time against the 60 FPS
+                        budget.
+"""
+
+import random
+
+import pygame
+
+from benchcore import FRAME_MS, benchmark, frame_report, init_pygame, make_playing_engine, play_frame
+
+from gamestate import GameState
+from gameworld import GameWorld
+from lasers import LaserPool, TARGET_LAYERS
+from leveltheme import LevelTheme
+from levels import Levels
+
+import constants
+
+# the bricks' strength, too much to destroy over a benchmark (and still in a snapshot's range)
+UNBREAKABLE_STRENGTH: int = 30000
+
+
+def make_level() -> GameWorld:
+    """
+    A full grid level, its bricks too strong to destroy
+
+    :return: its GameWorld
+    """
+    init_pygame()
+    gw = GameWorld(LevelTheme.CLASSIC)
+    gw.build_level(Levels.LevelName.CLASSIC_MIXED_1, 495)
+    for wo in gw.world_objects:
+        if wo.collision_layer & TARGET_LAYERS:
+            wo.strength = UNBREAKABLE_STRENGTH
+    return gw
+
+
+def top_up(lasers: LaserPool, shots: int, rng: random.Random) -> None:
+    """
+    Fire shots until there are this many, scattered below the bricks
+
+    :param lasers: the LaserPool
+    :param shots: how many
+    :param rng: for the positions
+    :return:
+    """
+    while len(lasers) < shots:
+        lasers.spawn(rng.uniform(0, constants.WIDTH - 1), rng.uniform(constants.HEIGHT // 2, constants.HEIGHT))
+
+
+@benchmark('lasers/step_{}_shots', number=500, params=[100, 500, 1000])
+def bench_step(shots: int):
+    """
+    One LaserPool step with this many shots in flight (the hits absorbed)
+
+    :param shots: how many
+    :return:
+    """
+    gw = make_level()
+    gs = GameState()
+    gs.cur_state = GameState.GameStateName.PLAYING
+    gs.tick_time = FRAME_MS
+    lasers = LaserPool()
+    rng = random.Random(495)
+    hits = [0]
+    bricks_hit = set()
+
+    def on_hit(wo) -> bool:
+        hits[0] += 1
+        bricks_hit.add(wo)
+        return False
+
+    def step():
+        top_up(lasers, shots, rng)
+        lasers.update(gw, gs, on_hit)
+
+    return step, lambda: {'shots': shots, 'hits': hits[0], 'bricks_hit': len(bricks_hit)}
+
+
+@benchmark('lasers/all_pairs_{}_shots', number=50, params=[100, 500, 1000])
+def bench_all_pairs(shots: int):
+    """
+    The baseline: the same step, with each shot tested against every brick
+
+    :param shots: how many
+    :return:
+    """
+    gw = make_level()
+    targets = [wo for wo in gw.world_objects if wo.collision_layer & TARGET_LAYERS]
+    lasers = LaserPool()
+    rng = random.Random(495)
+    rise = constants.LASER_SPEED * FRAME_MS
+
+    def step():
+        top_up(lasers, shots, rng)
+        xs, ys = lasers.xs, lasers.ys
+        i = 0
+        while i < lasers.count:
+            shot = pygame.Rect(int(xs[i]) - 2, int(ys[i] - rise), 4, int(rise) + constants.LASER_SHOT_HEIGHT)
+            hit = None
+            for wo in targets:
+                if shot.colliderect(wo.rect) and ((hit is None) or (wo.rect.bottom > hit.rect.bottom)):
+                    hit = wo
+            if (hit is None) and (ys[i] - rise + constants.LASER_SHOT_HEIGHT > 0):
+                ys[i] -= rise
+                i += 1
+            else:
+                lasers.count -= 1
+                xs[i], ys[i] = xs[lasers.count], ys[lasers.count]
+
+    return step, lambda: {'shots': shots, 'bricks': len(targets)}
+
+
+@benchmark('lasers/frame_{}_shots', number=300, params=[0, 500])
+def bench_frame(shots: int):
+    """
+    A full AutoPlay PLAYING frame with this many shots in flight
+
+    :param shots: how many
+    :return:
+    """
+    ge = make_playing_engine(LevelTheme.CLASSIC, Levels.LevelName.CLASSIC_MIXED_1)
+    for wo in ge.gw.world_objects:
+        if wo.collision_layer & TARGET_LAYERS:
+            wo.strength = UNBREAKABLE_STRENGTH
+    rng = random.Random(495)
+
+    def frame():
+        top_up(ge.lasers, shots, rng)
+        play_frame(ge)
+
+    def report() -> dict:
+        return dict(frame_report(ge), shots=shots, collision_ms=ge.profiler.rings['collision'].mean() / 1e6)
+
+    return frame, report
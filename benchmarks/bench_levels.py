@@ -0,0 +1,29 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks building every level.
+"""
+
+from benchcore import benchmark, init_pygame
+from levels import Levels
+
+
+@benchmark('levels/build_{}', number=20, params=[level_name.name for level_name in Levels.LevelName])
+def bench_build_level(level_name: str):
+    """
+    Levels.build_level() into an empty list
+
+    :param level_name: LevelName name
+    :return:
+    """
+    init_pygame()
+
+    def build():
+        Levels.build_level([], Levels.LevelName[level_name])
+
+    return build
@@ -0,0 +1,80 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks the per-frame integrate() cost of each registered motion model on a fast ball
+                        under strong gravity, and reports each model's energy drift over a fixed flight.
+"""
+
+from benchcore import benchmark
+
+GRAVITY: float = 0.004  # 10x the dev overlay's default WORLD_GRAVITY_ACC step, px/ms^2
+BALL_SPEED: float = 2.0  # ~4x BALL_SPEED_VECTOR, px/ms
+TICK_MS: int = 4  # 1000 / MAX_FPS_VECTOR
+DRIFT_FRAMES: int = 2500  # 10 seconds of flight
+
+
+@benchmark('motion/step_{}', number=2000, params=['SIMPLE_1', 'VECTOR_1', 'SUBSTEP_1'])
+def bench_motion_step(model_name: str):
+    """
+    One model's integrate() for a ball bouncing around the screen (the floor bounce is done here, as the paddle
+    would), plus the energy drift (% of the starting energy) after DRIFT_FRAMES
+
+    :param model_name: MotionModels name
+    :return:
+    """
+    import pygame
+    import gameevents
+    import motionregistry
+    from ball import Ball
+    from constants import WIDTH, HEIGHT
+    from gamestate import GameState
+    from motionmodels import MotionModels
+
+    gs = GameState()
+    gs.cur_state = GameState.GameStateName.PLAYING
+    gs.motion_model = MotionModels[model_name]
+    gs.gravity_acc_length = GRAVITY
+    gs.v_gravity_acc = pygame.Vector2(0.0, GRAVITY)
+    gs.tick_time = TICK_MS
+    model = motionregistry.get_motion_model(gs.motion_model)
+    ball = Ball(WIDTH // 2, HEIGHT // 2)
+
+    def launch():
+        ball.v_pos = pygame.Vector2(WIDTH // 2, HEIGHT // 2)
+        ball.v_vel = pygame.Vector2(BALL_SPEED, -BALL_SPEED)
+        ball.v_vel_unit = ball.v_vel.normalize()
+        ball.rect.center = (WIDTH // 2, HEIGHT // 2)
+
+    def floor_bounce():
+        # the SIMPLE model steps the rect, the VECTOR models the v_pos
+        if ball.rect.bottom > HEIGHT:
+            ball.dy = -abs(ball.dy)
+            if ball.v_vel.y > 0:
+                ball.v_vel.y = -ball.v_vel.y
+                ball.v_vel_unit.y = -ball.v_vel_unit.y
+
+    def step():
+        model.integrate(ball, gs)
+        floor_bounce()
+        gameevents.clear()
+
+    def energy() -> float:
+        return 0.5 * ball.v_vel.length_squared() + GRAVITY * (HEIGHT - ball.v_pos.y)
+
+    def report() -> dict:
+        if gs.motion_model == MotionModels.SIMPLE_1:
+            # fixed px/frame steps with no gravity, so there's no energy to drift
+            return {'energy_drift_pct': 0.0}
+        launch()
+        start = energy()
+        for _ in range(DRIFT_FRAMES):
+            step()
+        return {'energy_drift_pct': 100.0 * (energy() - start) / start}
+
+    launch()
+    return step, report
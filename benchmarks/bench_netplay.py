@@ -0,0 +1,68 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks the networked versus play: one 60 FPS frame of both linked cabinets' sessions
+                        over a loopback link (a clean LAN, and a bad link with latency, jitter, and loss), in pure
+                        lockstep and with rollback.  Each player chases their ball with an always-changing paddle x,
+                        the worst case for predicting the peer.  The reports give the packet bandwidth per cabinet,
+                        the stalls, and the rollbacks' re-simulation cost (steps and time per rollback, and the
+                        worst one).
+"""
+
+from benchcore import FRAME_MS, benchmark, init_pygame
+
+# the links: (latency ms, jitter ms, loss)
+LINKS: dict[str, tuple[float, float, float]] = {'lan': (1.0, 1.0, 0.0), 'bad': (40.0, 20.0, 0.1)}
+
+
+@benchmark('netplay/frame_{}', number=600, params=['lan_lockstep', 'lan_rollback', 'bad_lockstep', 'bad_rollback'])
+def bench_netplay_frame(mode: str):
+    """
+    One frame of both sessions, then the link's clock moved on a frame
+
+    :param mode: link name and lockstep/rollback
+    :return:
+    """
+    import constants
+    from gamestate import GameState
+    from leveltheme import LevelTheme
+    from netplay import LoopbackLink, NetSession
+
+    init_pygame()
+    link_name, sync_mode = mode.split('_')
+    latency_ms, jitter_ms, loss = LINKS[link_name]
+    max_rollback = constants.NET_MAX_ROLLBACK_TICKS if sync_mode == 'rollback' else 0
+
+    link = LoopbackLink(latency_ms, jitter_ms, loss, seed=495)
+    sessions = (NetSession(1, link.ends[0], seed=495, level_theme=LevelTheme.MODERN, max_rollback=max_rollback),
+                NetSession(2, link.ends[1], level_theme=LevelTheme.MODERN, max_rollback=max_rollback))
+    frame_num = [0]
+
+    def frame():
+        frame_num[0] += 1
+        for session in sessions:
+            if session.match is not None:
+                side = session.match.sides[session.player - 1]
+                session.local_x = int(side.ball.rect.centerx) + ((frame_num[0] % 7) * 3)
+                if side.gs.cur_state == GameState.GameStateName.READY_TO_LAUNCH:
+                    session.launch_pressed = True
+            session.update(FRAME_MS)
+        link.advance(FRAME_MS)
+
+    def report() -> dict:
+        stats = sessions[0].get_stats()
+        rollbacks = max(stats['rollbacks'], 1)
+        return {'bytes_sent_per_sec': stats['bytes_sent'] * 1000 / (frame_num[0] * FRAME_MS),
+                'packets_sent_per_sec': stats['packets_sent'] * 1000 / (frame_num[0] * FRAME_MS),
+                'steps_per_frame': stats['ticks'] / frame_num[0], 'stalls': stats['stalls'],
+                'rollbacks': stats['rollbacks'],
+                'resimulated_steps_per_rollback': stats['resimulated_ticks'] / rollbacks,
+                'resimulate_ms_per_rollback': stats['resimulate_ms'] / rollbacks,
+                'resimulate_max_ms': stats['resimulate_max_ms'], 'desyncs': stats['desyncs']}
+
+    return frame, report
@@ -0,0 +1,66 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks persisting and loading the leaderboard and settings.
+"""
+
+import tempfile
+
+from benchcore import benchmark
+
+
+def _use_temp_game_data_path() -> None:
+    """
+    Point persistence at a throwaway dir so the benchmarks never touch the real game data
+
+    :return:
+    """
+    import persistence
+
+    persistence.GAME_DATA_PATH = tempfile.mkdtemp(prefix='smashcore_bench_')
+
+
+@benchmark('persistence/store_load_leaderboard', number=50)
+def bench_leaderboard_round_trip():
+    """
+    Store then load a full leaderboard
+
+    :return:
+    """
+    import constants
+    from leaderboard import Leaderboard
+    from score import Score
+
+    _use_temp_game_data_path()
+    lb = Leaderboard()
+    lb.l_top_scores = [Score(i * 100, i, "abc") for i in range(constants.LEADERBOARD_SIZE)]
+
+    def round_trip():
+        lb.store('bench_leaderboard.pkl')
+        Leaderboard.load('bench_leaderboard.pkl')
+
+    return round_trip
+
+
+@benchmark('persistence/store_load_settings', number=50)
+def bench_settings_round_trip():
+    """
+    Store then load the game settings
+
+    :return:
+    """
+    from gamesettings import GameSettings
+
+    _use_temp_game_data_path()
+    gset = GameSettings()
+
+    def round_trip():
+        gset.store('bench_settings.pkl')
+        GameSettings.load('bench_settings.pkl')
+
+    return round_trip
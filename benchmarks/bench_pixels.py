@@ -0,0 +1,93 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks the pixel observations: rendering a level and publishing the frame into a shared
+                        memory FrameRing, at 84x84 grayscale and at full size (32-bit color), plus a lockstep step of
+                        8 subprocess envs rendering their frames - reporting the frames per second.
+"""
+
+from time import perf_counter_ns
+
+from benchcore import benchmark, init_pygame
+
+PIXEL_FORMATS: dict[str, tuple[tuple[int, int], bool]] = {'84x84_gray': ((84, 84), True),
+                                                          'full_rgb': ((1200, 800), False)}
+REPORT_FRAMES: int = 100
+
+
+def get_report(timed, frames_per_call: int, frame_size: int, cleanup=None):
+    """
+    Make a report of the timed callable's frame rate
+
+    :param timed: the benchmark's timed callable
+    :param frames_per_call: frames it renders per call
+    :param frame_size: bytes per frame
+    :param cleanup: optional callable run after
+    :return: report()
+    """
+    def report() -> dict:
+        start = perf_counter_ns()
+        for _ in range(REPORT_FRAMES):
+            timed()
+        secs = (perf_counter_ns() - start) / 1e9
+        if cleanup is not None:
+            cleanup()
+        frames_per_sec = REPORT_FRAMES * frames_per_call / secs
+        return {'frames_per_sec': frames_per_sec, 'mb_per_sec': frames_per_sec * frame_size / 1e6}
+    return report
+
+
+@benchmark('pixels/render_publish_{}', number=50, params=list(PIXEL_FORMATS))
+def bench_render_publish(format_name: str):
+    """
+    Render a CLASSIC level's frame and publish it into a FrameRing
+
+    :param format_name: key of PIXEL_FORMATS
+    :return:
+    """
+    from framering import FrameRing
+    from gameworld import GameWorld
+    from leveltheme import LevelTheme
+    from pixelrenderer import PixelRenderer
+
+    init_pygame()
+    size, grayscale = PIXEL_FORMATS[format_name]
+    renderer = PixelRenderer(size, grayscale)
+    ring = FrameRing(renderer.frame_size)
+    gw = GameWorld(LevelTheme.CLASSIC)
+
+    def render_publish():
+        ring.publish(renderer.render(gw))
+
+    def cleanup():
+        ring.close()
+        ring.unlink()
+
+    return render_publish, get_report(render_publish, 1, renderer.frame_size, cleanup)
+
+
+@benchmark('pixels/subprocess_step_8_{}', number=20, params=list(PIXEL_FORMATS))
+def bench_subprocess_pixels(format_name: str):
+    """
+    A lockstep step of 8 subprocess envs, each rendering its frame into its FrameRing
+
+    :param format_name: key of PIXEL_FORMATS
+    :return:
+    """
+    from smashenv import SubprocVectorEnv, ACTION_STAY
+
+    init_pygame()
+    size, grayscale = PIXEL_FORMATS[format_name]
+    vector_env = SubprocVectorEnv(8, pixel_size=size, grayscale=grayscale)
+    vector_env.reset(seed=495)
+    actions = [ACTION_STAY] * 8
+
+    def step():
+        vector_env.step(actions)
+
+    return step, get_report(step, 8, vector_env.rings[0].frame_size, vector_env.close)
@@ -0,0 +1,103 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks the power-ups' timed effects.  The scheduler benchmarks hold a steady number of
+                        concurrent effects (each one that ends is replaced by a new one), timing a 60 FPS frame's
+                        worth of expiring them - with the EffectScheduler's min-heap, and with a baseline that polls
+                        every active effect's end time each frame (as a per-effect timer would).  The frame
+                        benchmark is a full AutoPlay PLAYING frame of the game with that many effects running.
+"""
+
+from benchcore import FRAME_MS, benchmark, frame_report, make_playing_engine, play_frame
+
+from leveltheme import LevelTheme
+from powerups import EffectScheduler
+from poweruptype import PowerUpType
+
+# the concurrent effects' durations are spread over this long, so a few end every frame
+SPREAD_MS: int = 10000
+
+# the effect kinds cycled through (the ones that don't add balls or hold them)
+EFFECTS: list[PowerUpType] = [PowerUpType.WIDE_PADDLE, PowerUpType.SLOW_BALL, PowerUpType.LASER]
+
+
+def spread_end(i: int, effects: int) -> int:
+    """
+    :param i: the effect's number
+    :param effects: how many there are
+    :return: its end time, spread evenly over SPREAD_MS
+    """
+    return FRAME_MS + ((i * SPREAD_MS) // effects)
+
+
+@benchmark('powerups/scheduler_{}_effects', number=2000, params=[100, 1000, 10000])
+def bench_scheduler(effects: int):
+    """
+    One frame of the EffectScheduler with this many effects running
+
+    :param effects: how many
+    :return:
+    """
+    scheduler = EffectScheduler()
+    for i in range(effects):
+        scheduler.schedule(EFFECTS[i % len(EFFECTS)], spread_end(i, effects))
+    now = [0]
+    ended = [0]
+
+    def frame():
+        now[0] += FRAME_MS
+        running = len(scheduler)
+        scheduler.expire(now[0])
+        # (each ended effect is replaced, keeping the number running steady)
+        just_ended = running - len(scheduler)
+        for i in range(just_ended):
+            scheduler.schedule(EFFECTS[i % len(EFFECTS)], now[0] + SPREAD_MS)
+        ended[0] += just_ended
+
+    def report() -> dict:
+        return {'effects_running': len(scheduler), 'ended_per_frame': ended[0] / max(now[0] // FRAME_MS, 1)}
+
+    return frame, report
+
+
+@benchmark('powerups/polling_{}_effects', number=2000, params=[100, 1000, 10000])
+def bench_polling(effects: int):
+    """
+    The baseline: one frame of checking every running effect's end time
+
+    :param effects: how many
+    :return:
+    """
+    running = [[spread_end(i, effects), EFFECTS[i % len(EFFECTS)]] for i in range(effects)]
+    now = [0]
+
+    def frame():
+        now[0] += FRAME_MS
+        for timer in running:
+            if timer[0] <= now[0]:
+                timer[0] += SPREAD_MS
+
+    return frame, lambda: {'effects_running': len(running)}
+
+
+@benchmark('powerups/frame_{}_effects', number=300, params=[0, 100, 1000])
+def bench_frame(effects: int):
+    """
+    A full AutoPlay PLAYING frame with this many effects running (lasting past the benchmark)
+
+    :param effects: how many
+    :return:
+    """
+    ge = make_playing_engine(LevelTheme.CLASSIC)
+    for i in range(effects):
+        ge.power_ups.activate(EFFECTS[i % len(EFFECTS)], ge.gw, ge.gs, duration_ms=1000000 + spread_end(i, effects))
+
+    def report() -> dict:
+        return dict(frame_report(ge), effects_running=len(ge.power_ups.scheduler))
+
+    return lambda: play_frame(ge), report
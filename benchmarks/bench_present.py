@@ -0,0 +1,49 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks a full gameplay frame (draw into the logical backbuffer, then present) on the
+                        logical-size window and on 1080p, 1440p, and 4K fullscreen displays, reporting the present
+                        path and scale each display gets.
+"""
+
+from benchcore import benchmark, make_engine
+
+DISPLAY_SIZES: dict[str, tuple[int, int]] = {'logical': (1200, 800), '1080p': (1920, 1080),
+                                             '1440p': (2560, 1440), '4k': (3840, 2160)}
+
+
+@benchmark('present/full_frame_{}', number=50, params=list(DISPLAY_SIZES))
+def bench_present_frame(display_name: str):
+    """
+    A MODERN gameplay frame drawn and presented to a display of the given size
+
+    :param display_name: key of DISPLAY_SIZES
+    :return:
+    """
+    import pygame
+    import presenter
+    from constants import BLACK
+
+    ge = make_engine()
+    size = DISPLAY_SIZES[display_name]
+    ge.use_backbuffer(presenter.use_display(pygame.display.set_mode(size), size))
+
+    def frame():
+        ge.screen.fill(BLACK)
+        ge.draw_world_and_status()
+        presenter.present()
+
+    def report() -> dict:
+        metrics = {'scale': presenter.dest_rect.width / presenter.backbuffer.get_width(),
+                   'nearest_pixel_scaling': float(presenter.mode != presenter.SMOOTH)}
+        # back to the small headless display the other benchmarks expect
+        presenter.window = presenter.backbuffer = pygame.display.set_mode((1, 1))
+        presenter.mode, presenter.dest_surface = presenter.DIRECT, None
+        return metrics
+
+    return frame, report
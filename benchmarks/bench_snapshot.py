@@ -0,0 +1,84 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks the game-state snapshot: taking one, restoring it into the same level (the
+                        retry/look-ahead path), and restoring it into a GameWorld on another level (the rebuild from
+                        the level seed, as after a crash), mid-game on a MODERN level with playing Animations.
+                        Reports the snapshot size.
+"""
+
+from benchcore import benchmark, make_playing_engine
+
+import gamesnapshot
+from gamestate import GameState
+from gameworld import GameWorld
+from levels import Levels
+from leveltheme import LevelTheme
+
+PLAY_FRAMES: int = 1500
+
+
+def make_mid_game_engine():
+    """
+    A MODERN game played (auto-play) until some Bricks are gone and effects are playing
+
+    :return: GameEngine
+    """
+    ge = make_playing_engine(LevelTheme.MODERN, tick_time=4)
+    for _ in range(PLAY_FRAMES):
+        ge.handle_gamestate([])
+        if ge.gs.cur_state == GameState.GameStateName.READY_TO_LAUNCH:
+            ge.gs.cur_state = GameState.GameStateName.PLAYING
+    return ge
+
+
+@benchmark('snapshot/take', number=2000)
+def bench_snapshot_take():
+    """
+    snapshot() of a mid-game engine
+
+    :return:
+    """
+    ge = make_mid_game_engine()
+
+    def report() -> dict:
+        return {'snapshot_bytes': len(ge.snapshot()), 'level_objects': len(ge.gw.level_objects),
+                'animations': len(ge.animations.active)}
+
+    return ge.snapshot, report
+
+
+@benchmark('snapshot/restore_same_level', number=2000)
+def bench_snapshot_restore_same_level():
+    """
+    restore() into the GameWorld still playing the snapshot's level
+
+    :return:
+    """
+    ge = make_mid_game_engine()
+    data = ge.snapshot()
+    return lambda: gamesnapshot.restore(data, ge.gw, ge.gs, ge.ps, ge.contacts, ge.animations)
+
+
+@benchmark('snapshot/restore_rebuild_level', number=200)
+def bench_snapshot_restore_rebuild_level():
+    """
+    restore() into a GameWorld on another level, so the snapshot's level is rebuilt from its seed
+
+    :return:
+    """
+    ge = make_mid_game_engine()
+    data = ge.snapshot()
+    other_level = Levels.get_level_name_from_num(LevelTheme.MODERN, 2)
+    gw = GameWorld(LevelTheme.MODERN, other_level)
+
+    def restore():
+        gw.level_name = other_level
+        gamesnapshot.restore(data, gw, ge.gs, ge.ps, ge.contacts, ge.animations)
+
+    return restore
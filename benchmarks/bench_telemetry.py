@@ -0,0 +1,89 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks an AutoPlay gameplay frame with telemetry recording on, and reports the recording
+                        overhead as a percent of the frame time - both measured (alternating blocks of frames with
+                        it off and on) and estimated from the recording calls made per frame and their cost.
+"""
+
+import random
+import tempfile
+from time import perf_counter_ns
+
+from benchcore import benchmark, make_playing_engine
+
+TICK_MS: int = 4  # 1000 / MAX_FPS_VECTOR
+BLOCK_FRAMES: int = 250
+BLOCKS: int = 8
+
+
+@benchmark('telemetry/autoplay_frame_recording', number=250)
+def bench_telemetry_frame():
+    """
+    One AutoPlay frame (update, collisions, and draw) with every telemetry hook recording
+
+    :return:
+    """
+    import pygame
+    import persistence
+    import telemetry
+    from constants import BLACK
+    from gamestate import GameState
+    from leveltheme import LevelTheme
+    from levels import Levels
+
+    # any level-end records go to a throwaway dir, not the real game data dir
+    persistence.GAME_DATA_PATH = tempfile.mkdtemp()
+    random.seed(495)
+    ge = make_playing_engine(LevelTheme.MODERN, tick_time=TICK_MS)
+    telemetry.enable()
+    telemetry.begin_level(Levels.get_level_name_from_num(LevelTheme.MODERN, 1))
+
+    def frame():
+        ge.screen.fill(BLACK)
+        ge.handle_gamestate([])
+        if ge.gs.cur_state != GameState.GameStateName.PLAYING:
+            ge.gs.cur_state = GameState.GameStateName.PLAYING
+        pygame.event.pump()
+
+    def record_count() -> int:
+        # every frame adds play time, plus each hit, contact, and bounce counted
+        return (sum(telemetry.brick_hits) + sum(telemetry.paddle_offsets) + sum(telemetry.wall_bounces) +
+                (telemetry.play_ms // TICK_MS))
+
+    def report() -> dict:
+        # alternate blocks with recording off and on, so drifts in the game/machine hit both equally
+        frame_ns = {False: 0, True: 0}
+        telemetry.begin_level(Levels.get_level_name_from_num(LevelTheme.MODERN, 1))
+        for block in range(BLOCKS * 2):
+            recording = (block % 2) == 1
+            telemetry.enable(recording)
+            start = perf_counter_ns()
+            for _ in range(BLOCK_FRAMES):
+                frame()
+            frame_ns[recording] += perf_counter_ns() - start
+        telemetry.enable()
+        frames = BLOCKS * BLOCK_FRAMES
+        calls_per_frame = record_count() / frames
+
+        # the cost of a recording call (the most expensive one, the grid cell count)
+        start = perf_counter_ns()
+        for i in range(10000):
+            telemetry.record_brick_hit(i % 1200, 300)
+        call_ns = (perf_counter_ns() - start) / 10000
+
+        telemetry.end_level(False)
+        telemetry.wait()
+        telemetry.enable(False)
+        off_ns, on_ns = frame_ns[False] / frames, frame_ns[True] / frames
+        return {'frame_us_off': off_ns / 1e3, 'frame_us_on': on_ns / 1e3,
+                'overhead_pct_measured': 100.0 * (on_ns - off_ns) / off_ns,
+                'record_calls_per_frame': calls_per_frame,
+                'overhead_pct_estimated': 100.0 * calls_per_frame * call_ns / off_ns}
+
+    return frame, report
@@ -0,0 +1,69 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Benchmarks the versus mode's frame cost against the one player game's: a full one world
+                        PLAYING frame, and a full VERSUS frame (both worlds' fixed steps, both draws, and the
+                        scaling into the side-by-side views), each with the elapsed time of a 60 FPS frame and the
+                        paddles kept under the balls.  The reports give the mean frame time against the 60 FPS
+                        budget, and the fixed steps per VERSUS frame.
+"""
+
+import pygame
+
+from benchcore import FRAME_MS, benchmark, frame_report, make_engine, make_playing_engine, play_frame
+
+from leveltheme import LevelTheme
+
+
+@benchmark('versus/frame_one_world_{}', number=300, params=['CLASSIC', 'MODERN'])
+def bench_frame_one_world(theme_name: str):
+    """
+    A full one player PLAYING frame (AutoPlay keeps the paddle under the ball)
+
+    :param theme_name: LevelTheme name
+    :return:
+    """
+    ge = make_playing_engine(LevelTheme[theme_name])
+    return lambda: play_frame(ge), lambda: frame_report(ge)
+
+
+@benchmark('versus/frame_two_worlds_{}', number=300, params=['CLASSIC', 'MODERN'])
+def bench_frame_two_worlds(theme_name: str):
+    """
+    A full VERSUS frame, with both paddles kept under their balls (relaunched right away)
+
+    :param theme_name: LevelTheme name
+    :return:
+    """
+    import versus
+
+    ge = make_engine(LevelTheme[theme_name])
+    ge.start_versus()
+    # in the benchmarked theme
+    ge.versus = versus.VersusMatch(LevelTheme[theme_name], gset=ge.gset)
+    ge.gs.tick_time = FRAME_MS
+    steps = []
+
+    def frame():
+        match = ge.versus
+        for side in match.sides:
+            side.paddle.commanded_pos_x = side.ball.rect.centerx
+            side.launch()
+        start_steps = match.steps
+        ge.handle_gamestate([])
+        ge.profiler.end_frame()
+        pygame.event.pump()
+        steps.append(match.steps - start_steps)
+        # a match that's been decided starts over
+        if match.winner is not None:
+            ge.versus = versus.VersusMatch(LevelTheme[theme_name], gset=ge.gset)
+
+    def report() -> dict:
+        return dict(frame_report(ge), steps_per_frame=sum(steps) / max(len(steps), 1))
+
+    return frame, report
@@ -0,0 +1,235 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: The small benchmark registry/runner behind run_benchmarks.py.  A benchmark is a setup
+                        function (registered with @benchmark) that returns the callable to be timed.  Results
+                        are the per-call ns of the best and median repeats, and can be saved as a JSON baseline
+                        and compared against one.  The helpers at the end build and step the AutoPlay game the
+                        frame benchmarks share.
+"""
+
+import json
+import os
+import statistics
+import sys
+from time import perf_counter_ns
+
+# run headless - these must be set before pygame creates the display/mixer
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+SRC_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+# registered benchmarks: name -> (setup function, param, number of calls per repeat, repeats)
+BENCHMARKS: dict[str, tuple] = {}
+
+# the elapsed time of each benchmarked frame, in ms (a 60 FPS frame)
+FRAME_MS: int = 1000 // 60
+
+
+def benchmark(name: str, number: int = 100, repeat: int = 5, params: list = None):
+    """
+    Decorator registering a benchmark setup function.  The setup returns the callable to time, or a
+    (callable, report) pair where report() returns a dict of extra (non-timing) metrics, run after timing.
+    If params are given, one benchmark is registered per param (name formatted with it) and the setup
+    receives it.
+
+    :param name: benchmark name (a format string if params are given)
+    :param number: calls of the timed callable per repeat
+    :param repeat: how many repeats to time
+    :param params: optional list of params
+    :return:
+    """
+    def register(setup):
+        if params is None:
+            BENCHMARKS[name] = (setup, None, number, repeat)
+        else:
+            for param in params:
+                BENCHMARKS[name.format(param)] = (setup, param, number, repeat)
+        return setup
+    return register
+
+
+def run_benchmark(name: str) -> dict:
+    """
+    Set up and time a single benchmark
+
+    :param name: registered benchmark name
+    :return: dict with the per-call ns (best, median), the call counts, and any reported metrics
+    """
+    setup, param, number, repeat = BENCHMARKS[name]
+    timed = setup() if param is None else setup(param)
+    report = None
+    if isinstance(timed, tuple):
+        timed, report = timed
+
+    per_call_ns = []
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        for _ in range(number):
+            timed()
+        per_call_ns.append((perf_counter_ns() - start) / number)
+
+    result = {'best_ns': min(per_call_ns), 'median_ns': statistics.median(per_call_ns),
+              'number': number, 'repeat': repeat}
+    if report is not None:
+        result['metrics'] = report()
+    return result
+
+
+def run_all(name_filter: str = '') -> dict[str, dict]:
+    """
+    Run every registered benchmark whose name contains the filter
+
+    :param name_filter: substring to select benchmarks
+    :return: results by benchmark name
+    """
+    results = {}
+    for name in sorted(BENCHMARKS):
+        if name_filter in name:
+            results[name] = run_benchmark(name)
+            print(f"{name:<48} best {results[name]['best_ns'] / 1e3:>10.1f} us   "
+                  f"median {results[name]['median_ns'] / 1e3:>10.1f} us")
+            for metric, value in results[name].get('metrics', {}).items():
+                print(f"    {metric:<44} {value:>12.4g}")
+    return results
+
+
+def save_results(results: dict[str, dict], path: str) -> None:
+    """
+    Write results as a JSON baseline
+
+    :param results: results by benchmark name
+    :param path: file path
+    :return:
+    """
+    with open(path, 'w', encoding='utf-8') as file_out:
+        json.dump(results, file_out, indent=2, sort_keys=True)
+
+
+def compare_results(results: dict[str, dict], baseline_path: str, threshold_pct: float) -> list[str]:
+    """
+    Compare the best times against a saved baseline (the best is the least disturbed by other load on the machine)
+
+    :param results: results by benchmark name
+    :param baseline_path: baseline JSON file path
+    :param threshold_pct: slowdown (in percent) that counts as a regression
+    :return: the names of the regressed benchmarks
+    """
+    with open(baseline_path, 'r', encoding='utf-8') as file_in:
+        baseline = json.load(file_in)
+
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<48} (no baseline)")
+            continue
+        change_pct = ((result['best_ns'] / baseline[name]['best_ns']) - 1.0) * 100.0
+        flag = ''
+        if change_pct > threshold_pct:
+            regressions.append(name)
+            flag = '  <-- REGRESSION'
+        print(f"{name:<48} {change_pct:>+8.1f}%{flag}")
+    return regressions
+
+
+def init_pygame() -> None:
+    """
+    Initialize pygame headless and load the assets (once).  Asset paths are relative to src, so work from there.
+
+    :return:
+    """
+    import pygame
+    import assets
+
+    if pygame.display.get_init() and assets.BALL_IMG is not None:
+        return
+
+    os.chdir(SRC_DIR)
+    pygame.mixer.pre_init(44100, -16, 2, 128)
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    assets.load_assets()
+
+
+def make_engine(theme=None, level_name=None):
+    """
+    Build a complete GameEngine (real UI, world, and state objects) for benchmarking
+
+    :param theme: LevelTheme for the GameWorld/PlayerState (default MODERN)
+    :param level_name: optional LevelName to build instead of the theme's first level
+    :return: GameEngine
+    """
+    init_pygame()
+
+    from gameengine import GameEngine
+    from gamesettings import GameSettings
+    from gamestate import GameState
+    from gameworld import GameWorld
+    from leaderboard import Leaderboard
+    from leveltheme import LevelTheme
+    from playerstate import PlayerState
+    from userinterface import UserInterface
+
+    ps = PlayerState()
+    ps.theme = LevelTheme.MODERN if theme is None else theme
+    ge = GameEngine(Leaderboard(), ps, GameWorld(ps.theme, level_name), GameState(), GameSettings(),
+                    UserInterface())
+    # headless - the sound effects aren't part of what's being measured
+    ge.sfx_player.enabled = False
+    return ge
+
+
+def make_playing_engine(theme=None, level_name=None, tick_time: int = FRAME_MS):
+    """
+    make_engine(), with AutoPlay driving the paddle and the game PLAYING
+
+    :param theme: LevelTheme for the GameWorld/PlayerState (default MODERN)
+    :param level_name: optional LevelName to build instead of the theme's first level
+    :param tick_time: each frame's elapsed game time, in ms
+    :return: GameEngine
+    """
+    from gamestate import GameState
+
+    ge = make_engine(theme, level_name)
+    ge.gs.auto_play = True
+    ge.gs.tick_time = tick_time
+    ge.gs.cur_state = GameState.GameStateName.PLAYING
+    return ge
+
+
+def play_frame(ge) -> None:
+    """
+    One AutoPlay frame, profiled like the real loop's (a lost ball is launched again right away)
+
+    :param ge: GameEngine, from make_playing_engine()
+    :return:
+    """
+    import pygame
+    from gamestate import GameState
+
+    ge.handle_gamestate([])
+    if ge.gs.cur_state == GameState.GameStateName.READY_TO_LAUNCH:
+        ge.gs.cur_state = GameState.GameStateName.PLAYING
+    ge.profiler.end_frame()
+    pygame.event.pump()
+
+
+def frame_report(ge) -> dict:
+    """
+    The mean frame time from the engine's frame profiler, against the 60 FPS budget
+
+    :param ge: GameEngine
+    :return:
+    """
+    from profiler import FrameProfiler
+
+    frame_ms = ge.profiler.rings[FrameProfiler.FRAME].mean() / 1e6
+    return {'frame_ms': frame_ms, 'frame_budget_ms': 1000 / 60, 'fps_equivalent': 1000 / frame_ms}
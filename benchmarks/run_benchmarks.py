@@ -0,0 +1,61 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Runs the engine hot-path benchmarks (every bench_*.py in this dir) headless.
+
+                        python benchmarks/run_benchmarks.py                        run everything
+                        python benchmarks/run_benchmarks.py -k collision           run a subset
+                        python benchmarks/run_benchmarks.py --save baseline.json   save a JSON baseline
+                        python benchmarks/run_benchmarks.py --compare baseline.json --threshold 10
+                            exits 1 if any benchmark's best time is more than 10% slower than the baseline's
+"""
+
+import argparse
+import glob
+import importlib
+import os
+import sys
+
+import benchcore
+
+
+def main() -> int:
+    """
+    Parse args, run the benchmarks, then save and/or compare
+
+    :return: process exit code
+    """
+    parser = argparse.ArgumentParser(description='SmashCore benchmarks')
+    parser.add_argument('-k', dest='name_filter', default='', help='only run benchmarks containing this')
+    parser.add_argument('--save', metavar='JSON', help='save the results as a baseline')
+    parser.add_argument('--compare', metavar='JSON', help='compare the results against a baseline')
+    parser.add_argument('--threshold', type=float, default=10.0, help='regression threshold in percent')
+    args = parser.parse_args()
+
+    bench_dir = os.path.dirname(os.path.abspath(__file__))
+    for path in sorted(glob.glob(os.path.join(bench_dir, 'bench_*.py'))):
+        importlib.import_module(os.path.splitext(os.path.basename(path))[0])
+
+    # the benchmarks chdir into src for the assets, so resolve output paths first
+    save_path = os.path.abspath(args.save) if args.save else None
+    compare_path = os.path.abspath(args.compare) if args.compare else None
+
+    results = benchcore.run_all(args.name_filter)
+
+    if save_path:
+        benchcore.save_results(results, save_path)
+    if compare_path:
+        regressions = benchcore.compare_results(results, compare_path, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) regressed more than {args.threshold}%")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
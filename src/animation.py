@@ -18,7 +18,7 @@ from gamesettings import GameSettings
 from gamestate import GameState
 from leaderboard import Leaderboard
 from playerstate import PlayerState
-from worldobject import WorldObject
+from worldobject import WorldObject, CollisionLayer
 
 class Animation(WorldObject, pygame.sprite.Sprite):
     """
@@ -44,35 +44,56 @@ class Animation(WorldObject, pygame.sprite.Sprite):
         super().__init__()
         pygame.sprite.Sprite.__init__(self)
 
-        self.primed_collision = False
+        self.collision_layer = CollisionLayer.EFFECT
 
+        self.rect: pygame.rect = pygame.Rect(rect)
+        self.v_pos: Vector2 = Vector2(0.0, 0.0)
+        self.v_vel: Vector2 = Vector2(0.0, 0.0)
+        self.v_acc: Vector2 = Vector2(0.0, 0.0)
+        self.cur_ticks: float = 0.0
+        self.alpha: int = 255
+        self.images_index: int = 0
+        # the (large) level cleared font is only created if this Animation ever shows that message, unless an
+        # AnimationPool shares its own
+        self.font_logo: pygame.font = None
+
+        self.reset(duration, rect, color, fade, v_vel, v_acc, images, is_ball, is_lvl_clr_msg)
+
+    def reset(self, duration: int, rect: pygame.rect, color: Color, fade: bool = False,
+              v_vel: Vector2 = None, v_acc: Vector2 = None, images: list[pygame.image] = None,
+              is_ball: bool = False, is_lvl_clr_msg: bool = False) -> None:
+        """
+        (Re)start the Animation with new settings, reusing its Rect and Vector2s (so an AnimationPool can
+        recycle it).  The params are as for __init__().
+
+        :return:
+        """
         self.start_ticks: float = pygame.time.get_ticks()
-        self.cur_ticks: float = self.start_ticks
+        self.cur_ticks = self.start_ticks
         self.duration: int = duration
 
         self.fade: bool = fade
-        self.alpha: int = 255
+        self.alpha = 255
 
-        self.rect: pygame.rect = pygame.Rect(rect)
-        self.v_pos: Vector2 = Vector2(self.rect.x, self.rect.y)
+        self.rect.update(rect)
+        self.v_pos.update(self.rect.x, self.rect.y)
         if v_vel is None:
-            self.v_vel: Vector2 = Vector2(0.0, 0.0)
+            self.v_vel.update(0.0, 0.0)
         else:
-            self.v_vel: Vector2 = v_vel
+            self.v_vel.update(v_vel)
         if v_acc is None:
-            self.v_acc: Vector2 = Vector2(0.0, 0.0)
+            self.v_acc.update(0.0, 0.0)
         else:
-            self.v_acc: Vector2 = v_acc
+            self.v_acc.update(v_acc)
 
         self.is_ball: bool = is_ball
 
         self.color: Color = color
         self.images: list[pygame.image] = images
         self.num_images: int = 0 if self.images is None else len(self.images)
-        self.images_index: int = 0
+        self.images_index = 0
 
         self.is_cleared_msg: bool = is_lvl_clr_msg
-        self.font_logo: pygame.font = pygame.font.Font(None, 100)
 
     def update_wo(self, gs: GameState, ps: PlayerState, lb: Leaderboard, gset: GameSettings) -> None:
         """
@@ -170,14 +191,6 @@ class Animation(WorldObject, pygame.sprite.Sprite):
 
         return False
 
-    def prime_for_collision(self) -> None:
-        """
-        Reset the latch to allow for future collisions
-
-        :return:
-        """
-        self.primed_collision = False
-
     def draw_cleared_msg(self, surface: pygame.Surface, msg_x, msg_y) -> None:
         """
         Show the level cleared message
@@ -188,6 +201,9 @@ class Animation(WorldObject, pygame.sprite.Sprite):
         text_color = constants.WHITE
         shadow_color = constants.ORANGE
 
+        if self.font_logo is None:
+            self.font_logo = pygame.font.Font(None, 100)
+
         text_cleared_1 = self.font_logo.render("Level", True, text_color)
         text_cleared_shadow_1 = self.font_logo.render("Level", True, shadow_color)
         text_cleared_2 = self.font_logo.render("Cleared!", True, text_color)
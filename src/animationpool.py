@@ -0,0 +1,129 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: A fixed-capacity pool of Animation effects, kept apart from the GameWorld's collision-tested
+                        world_objects.  Finished Animations go back on a free list and are reset() for the next
+                        effect, rather than building new Rects/Vector2s/Fonts for every destroyed Brick.
+"""
+
+from collections import deque
+from enum import Enum, auto
+
+import pygame
+from pygame import Vector2, Color
+
+import constants
+from animation import Animation
+from gamesettings import GameSettings
+from gamestate import GameState
+from leaderboard import Leaderboard
+from playerstate import PlayerState
+
+
+class PoolExhaustionPolicy(Enum):
+    """ What spawn() does when every Animation in the pool is playing """
+
+    RECYCLE_OLDEST = auto()  # cut short the oldest playing Animation and reuse it
+    DROP_NEW = auto()  # skip the new effect
+
+
+class AnimationPool:
+    """ Owns, updates, and draws all the playing Animations """
+
+    def __init__(self, capacity: int = constants.ANIMATION_POOL_CAPACITY,
+                 policy: PoolExhaustionPolicy = PoolExhaustionPolicy.RECYCLE_OLDEST) -> None:
+        """
+        :param capacity: the most Animations that can play at once
+        :param policy: PoolExhaustionPolicy
+        """
+        self.capacity: int = capacity
+        self.policy: PoolExhaustionPolicy = policy
+        # playing Animations, oldest first (also the draw order) - a deque, so recycling the oldest is O(1)
+        self.active: deque[Animation] = deque()
+        # finished Animations waiting to be reused (created on demand, up to capacity)
+        self.free: list[Animation] = []
+        # stats for the dev overlay
+        self.high_water: int = 0
+        self.exhausted_count: int = 0
+        # one shared level cleared message font, rather than one per Animation
+        self.font_logo: pygame.font = None
+
+    def spawn(self, duration: int, rect: pygame.rect, color: Color, fade: bool = False,
+              v_vel: Vector2 = None, v_acc: Vector2 = None, images: list[pygame.image] = None,
+              is_ball: bool = False, is_lvl_clr_msg: bool = False) -> Animation | None:
+        """
+        Start an Animation (the params are as for Animation.__init__())
+
+        :return: the Animation, or None if the pool was exhausted and the policy dropped it
+        """
+        if self.free:
+            anim = self.free.pop()
+            anim.reset(duration, rect, color, fade, v_vel, v_acc, images, is_ball, is_lvl_clr_msg)
+        elif len(self.active) < self.capacity:
+            anim = Animation(duration, rect, color, fade, v_vel, v_acc, images, is_ball, is_lvl_clr_msg)
+        else:
+            self.exhausted_count += 1
+            if self.policy == PoolExhaustionPolicy.DROP_NEW:
+                return None
+            anim = self.active.popleft()
+            anim.reset(duration, rect, color, fade, v_vel, v_acc, images, is_ball, is_lvl_clr_msg)
+
+        if is_lvl_clr_msg:
+            if self.font_logo is None:
+                self.font_logo = pygame.font.Font(None, 100)
+            anim.font_logo = self.font_logo
+
+        self.active.append(anim)
+        self.high_water = max(self.high_water, len(self.active))
+        return anim
+
+    def update(self, gs: GameState, ps: PlayerState, lb: Leaderboard, gset: GameSettings) -> None:
+        """
+        Update every playing Animation, returning the finished ones to the free list
+
+        :param gs: GameState
+        :param ps: PlayerState
+        :param lb: Leaderboard
+        :param gset: GameSettings
+        :return:
+        """
+        still_playing: deque[Animation] = deque()
+        for anim in self.active:
+            anim.update_wo(gs, ps, lb, gset)
+            if anim.should_remove():
+                self.free.append(anim)
+            else:
+                still_playing.append(anim)
+        self.active = still_playing
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """
+        Draw every playing Animation, oldest first
+
+        :param screen:
+        :return:
+        """
+        for anim in self.active:
+            anim.draw_wo(screen)
+
+    def clear(self) -> None:
+        """
+        Stop every playing Animation (on reset/level change)
+
+        :return:
+        """
+        self.free.extend(self.active)
+        self.active.clear()
+
+    def is_playing(self) -> bool:
+        """
+        Are any Animations still playing?
+
+        :return:
+        """
+        return len(self.active) > 0
@@ -9,6 +9,7 @@
     Module Description: This module defines and loads the various art and sound assets.
 """
 
+import asyncio
 import os
 import sys
 import pygame
@@ -103,11 +104,60 @@ MUSIC_PATHS = {}
 BRICK_SFX, LEFT_WALL_SFX, RIGHT_WALL_SFX, TOP_WALL_SFX, PADDLE_SFX = None, None, None, None, None
 BRICK_BOUNCE_SFX = None
 
+# the images drawn every frame, converted (and scaled) just once and shared by every GameWorld's objects (e.g. both
+# of the versus mode's worlds): {(source image id, size): (source image, prepared Surface)}
+prepared_images: dict = {}
+
+
+def get_prepared_image(image: pygame.Surface, size: tuple[int, int] = None) -> pygame.Surface:
+    """
+    The image converted for fast alpha blits (and scaled, if a size is given) - prepared on first use, then shared
+
+    :param image: a loaded image
+    :param size: (width, height) to scale to, or None
+    :return: the prepared Surface
+    """
+    key = (id(image), size)
+    cached = prepared_images.get(key)
+    if (cached is None) or (cached[0] is not image):
+        prepared = image if size is None else pygame.transform.scale(image, size)
+        cached = (image, prepared.convert_alpha())
+        prepared_images[key] = cached
+    return cached[1]
+
+
+def clear_prepared_images() -> None:
+    """
+    Drop the prepared images (they were converted to the old display's format)
+
+    :return:
+    """
+    prepared_images.clear()
+
+
 def load_assets():
     """
     Lazy load the assets
     :return:
     """
+    for _ in _load_asset_steps():
+        pass
+
+
+async def load_assets_async():
+    """
+    Awaitable load_assets() - yields to the event loop between each group of assets (for the browser build)
+    :return:
+    """
+    for _ in _load_asset_steps():
+        await asyncio.sleep(0)
+
+
+def _load_asset_steps():
+    """
+    Generator that loads the assets a group at a time, yielding after each group
+    :return:
+    """
     global BACKGROUND_IMG, BALL_IMG, PADDLE_IMG
     global BRK_YELLOW_IMG, BRK_BLUE_IMG, BRK_GREEN_IMG, BRK_RED_IMG
     global BRK_PINK_IMG, BRK_ORANGE_IMG, BRK_LTBLUE_IMG, BRK_PURPLE_IMG
@@ -136,6 +186,8 @@ def load_assets():
     BALL_IMG = pygame.image.load(asset_path(ART_DIR, BALL_FILENAME))
     PADDLE_IMG = pygame.image.load(asset_path(ART_DIR, PADDLE_FILENAME))
 
+    yield
+
     ANIMATE_BRICK_0_IMG = pygame.image.load(asset_path(ART_DIR, ANIMATE_BRICK_0_FILENAME))
     ANIMATE_BRICK_1_IMG = pygame.image.load(asset_path(ART_DIR, ANIMATE_BRICK_1_FILENAME))
     ANIMATE_BRICK_2_IMG = pygame.image.load(asset_path(ART_DIR, ANIMATE_BRICK_2_FILENAME))
@@ -154,9 +206,13 @@ def load_assets():
     ANIMATE_BRICK_15_IMG = pygame.image.load(asset_path(ART_DIR, ANIMATE_BRICK_15_FILENAME))
     ANIMATE_BRICK_16_IMG = pygame.image.load(asset_path(ART_DIR, ANIMATE_BRICK_16_FILENAME))
 
+    yield
+
     MUTE_ICON = pygame.image.load(asset_path(ART_DIR, MUTE_ICON_FILENAME))
     VOLUME_ICON = pygame.image.load(asset_path(ART_DIR, VOLUME_ICON_FILENAME))
 
+    yield
+
     BRICK_COLORS = [BRK_YELLOW_IMG, BRK_BLUE_IMG, BRK_GREEN_IMG, BRK_RED_IMG, BRK_PINK_IMG, BRK_ORANGE_IMG,
                     BRK_LTBLUE_IMG, BRK_PURPLE_IMG, BRK_TEAL_IMG, BRK_LAVENDER_IMG]
 
@@ -165,6 +221,8 @@ def load_assets():
                        ANIMATE_BRICK_9_IMG, ANIMATE_BRICK_10_IMG, ANIMATE_BRICK_11_IMG, ANIMATE_BRICK_12_IMG,
                        ANIMATE_BRICK_13_IMG, ANIMATE_BRICK_14_IMG, ANIMATE_BRICK_15_IMG, ANIMATE_BRICK_16_IMG]
 
+    yield
+
     # music
     MUSIC_PATHS[GameState.GameStateName.SPLASH] = asset_path(SOUND_DIR, SPLASH_MUSIC_FILENAME)
     MUSIC_PATHS[GameState.GameStateName.MENU_SCREEN] = asset_path(SOUND_DIR, MENU_MUSIC_FILENAME)
@@ -174,6 +232,7 @@ def load_assets():
     MUSIC_PATHS[GameState.GameStateName.LEADERBOARD] = asset_path(SOUND_DIR, MENU_MUSIC_FILENAME)
     MUSIC_PATHS[GameState.GameStateName.PLAYING] = asset_path(SOUND_DIR, GAME_MUSIC_FILENAME)
     MUSIC_PATHS[GameState.GameStateName.PAUSED] = asset_path(SOUND_DIR, GAME_MUSIC_FILENAME)
+    MUSIC_PATHS[GameState.GameStateName.VERSUS] = asset_path(SOUND_DIR, GAME_MUSIC_FILENAME)
     MUSIC_PATHS[GameState.GameStateName.GAME_OVER] = asset_path(SOUND_DIR, GAME_OVER_MUSIC_FILENAME)
     MUSIC_PATHS[GameState.GameStateName.GET_HIGH_SCORE] = asset_path(SOUND_DIR, SCORE_MUSIC_FILENAME)
     MUSIC_PATHS[GameState.GameStateName.READY_TO_LAUNCH] = asset_path(SOUND_DIR, GAME_MUSIC_FILENAME)
@@ -0,0 +1,187 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This autosave.py provides a global/singleton (like telemetry.py) crash-recovery autosave of
+                        the run in progress.  At most once every AUTOSAVE_INTERVAL_MS of play, the game thread takes
+                        a gamesnapshot (tens of microseconds) and drops it in a one-slot mailbox, and a worker
+                        thread compresses it and replaces the autosave file in the game data dir.  A snapshot
+                        that's unchanged since the last one isn't written again, and a newer snapshot replaces one
+                        still waiting, so the disk writes stay bounded however slow the disk is.  The game thread
+                        never waits on the disk.
+
+                        On the next launch, load() returns the saved run (if any) for the menu's resume entry, and
+                        discard() removes it once the run ends.
+"""
+
+import struct
+import threading
+import zlib
+
+import constants
+import gamesnapshot
+import persistence
+
+AUTOSAVE_FILENAME: str = 'autosave.bin'
+
+# file header: magic, format version, CRC-32 of the compressed snapshot that follows
+HEADER: struct.Struct = struct.Struct('<4sHI')
+MAGIC: bytes = b'SCAS'
+VERSION: int = 1
+
+# what the worker does with a mailbox entry other than a snapshot
+DISCARD: object = object()
+
+# False unless opted in (main.py), so the game loop's is_due() is just the one check
+enabled: bool = False
+interval_ms: int = constants.AUTOSAVE_INTERVAL_MS
+# when the next snapshot is due (pygame ticks), the last one handed to the worker, and whether a file may exist
+next_due_ms: int = 0
+last_submitted: bytes | None = None
+saved: bool = False
+
+# the worker's one-slot mailbox (None when empty), guarded by the condition
+condition: threading.Condition = threading.Condition()
+pending: bytes | object | None = None
+busy: bool = False
+worker: threading.Thread | None = None
+# stats for the benchmark/tests
+writes: int = 0
+skipped: int = 0
+
+
+def enable(on: bool = True) -> None:
+    """
+    Opt in (or out) of autosaving
+
+    :param on: True to autosave
+    :return:
+    """
+    global enabled
+    enabled = on
+
+
+def is_due(now_ms: int) -> bool:
+    """
+    Is it time for the next autosave?  (Called every playing frame, so it's kept trivial)
+
+    :param now_ms: pygame.time.get_ticks()
+    :return:
+    """
+    return enabled and (now_ms >= next_due_ms)
+
+
+def submit(data: bytes, now_ms: int) -> None:
+    """
+    Hand a snapshot of the run to the worker to save (replacing any still waiting), unless it's unchanged
+
+    :param data: from gamesnapshot.snapshot()
+    :param now_ms: pygame.time.get_ticks()
+    :return:
+    """
+    global next_due_ms, last_submitted, saved, skipped
+    next_due_ms = now_ms + interval_ms
+    if data == last_submitted:
+        skipped += 1
+        return
+    last_submitted = data
+    saved = True
+    _post(data)
+
+
+def discard() -> None:
+    """
+    The run is over, so remove its autosave (on the worker, after any write still waiting)
+
+    :return:
+    """
+    global last_submitted, saved
+    if not saved:
+        return
+    last_submitted = None
+    saved = False
+    _post(DISCARD)
+
+
+def _post(entry) -> None:
+    """
+    Put an entry in the worker's mailbox, starting the worker if needed
+
+    :param entry: snapshot bytes or DISCARD
+    :return:
+    """
+    global pending, worker
+    with condition:
+        pending = entry
+        if (worker is None) or (not worker.is_alive()):
+            worker = threading.Thread(target=_run_worker, daemon=True)
+            worker.start()
+        condition.notify_all()
+
+
+def _run_worker() -> None:
+    """
+    Worker thread target - write (or discard) whatever's in the mailbox, latest first
+
+    :return:
+    """
+    global pending, busy, writes
+    while True:
+        with condition:
+            while pending is None:
+                condition.wait()
+            entry, pending = pending, None
+            busy = True
+        try:
+            if entry is DISCARD:
+                persistence.remove_file(AUTOSAVE_FILENAME)
+            else:
+                packed = zlib.compress(entry, 1)
+                persistence.replace_bytes(HEADER.pack(MAGIC, VERSION, zlib.crc32(packed)) + packed,
+                                          AUTOSAVE_FILENAME)
+                writes += 1
+        except OSError:
+            # a failed autosave is just skipped - the next one tries again
+            pass
+        finally:
+            with condition:
+                busy = False
+                condition.notify_all()
+
+
+def wait(timeout: float = None) -> bool:
+    """
+    Wait for the mailbox to be written (before shutting down, in tests, etc.)
+
+    :param timeout: seconds, or None to wait until done
+    :return: True if it was all written
+    """
+    with condition:
+        return condition.wait_for(lambda: (pending is None) and (not busy), timeout)
+
+
+def load() -> bytes | None:
+    """
+    Read back the autosaved run, if there's a whole one
+
+    :return: the gamesnapshot bytes, or None
+    """
+    global saved
+    data = persistence.read_bytes(AUTOSAVE_FILENAME)
+    if (data is None) or (len(data) < HEADER.size):
+        return None
+    magic, version, crc = HEADER.unpack_from(data, 0)
+    packed = data[HEADER.size:]
+    if (magic != MAGIC) or (version != VERSION) or (zlib.crc32(packed) != crc):
+        return None
+    try:
+        snapshot = zlib.decompress(packed)
+        gamesnapshot.read_header(snapshot)
+    except (zlib.error, ValueError):
+        return None
+    saved = True
+    return snapshot
@@ -12,17 +12,16 @@
 import random as rnd
 import pygame
 
-import constants
-import obstacle
-import paddle
 import assets
+import constants
+import motionregistry
+import utils
 from constants import HEIGHT
 from gamesettings import GameSettings
 from gamestate import GameState
 from playerstate import PlayerState
 from leaderboard import Leaderboard
-from worldobject import WorldObject
-from motionmodels import MotionModels
+from worldobject import WorldObject, CollisionLayer
 
 
 class Ball(WorldObject, pygame.sprite.Sprite):
@@ -40,6 +39,8 @@ class Ball(WorldObject, pygame.sprite.Sprite):
 
         # general world object properties
         self.can_react: bool = True  # allow object to react to collisions with other objects
+        self.collision_layer = CollisionLayer.BALL
+        self.collision_mask = CollisionLayer.PADDLE | CollisionLayer.BRICK | CollisionLayer.OBSTACLE
         # ball settings
         self.radius: int = constants.BALL_RADIUS
         self.ball_rect: pygame.rect = self.radius * 2 ** 0.5
@@ -70,6 +71,11 @@ class Ball(WorldObject, pygame.sprite.Sprite):
         self.commanded_pos_x = 0
         self.freeze_ball: bool = False
 
+        # an extra (MULTI_BALL power-up) Ball is just lost below the window, without costing a life - and so is the
+        # Ball while there's an extra one to take over from it
+        self.extra: bool = False
+        self.lost: bool = False
+
     def update_wo(self, gs: GameState, ps: PlayerState, lb: Leaderboard, gset: GameSettings) -> None:
         """
         Update the WorldObject's pos, vel, acc, etc. (and possibly GameState)
@@ -82,95 +88,16 @@ class Ball(WorldObject, pygame.sprite.Sprite):
         """
         if (gs.cur_state == GameState.GameStateName.PLAYING) and (not self.freeze_ball):
 
-            ##############################################################
-            # perform the wall collision detection and overall position
-            # update for the SIMPLE_1 model
-            ##############################################################
-            if gs.motion_model == MotionModels.SIMPLE_1:
-
-                # ball collision wall left
-                if self.rect.centerx < self.radius:
-                    self.dx = -self.dx
-                    snd: pygame.mixer.Sound = pygame.mixer.Sound(assets.LEFT_WALL_SFX)
-                    snd.set_volume(gset.sfx_volume)
-                    pygame.mixer.find_channel(True).play(snd)
-                # ball collision wall right
-                if self.rect.centerx > constants.WIDTH - self.radius:
-                    self.dx = -self.dx
-                    snd: pygame.mixer.Sound = pygame.mixer.Sound(assets.RIGHT_WALL_SFX)
-                    snd.set_volume(gset.sfx_volume)
-                    pygame.mixer.find_channel(True).play(snd)
-                # ball collision wall top
-                if self.rect.centery < self.radius:
-                    self.dy = -self.dy
-                    snd: pygame.mixer.Sound = pygame.mixer.Sound(assets.TOP_WALL_SFX)
-                    snd.set_volume(gset.sfx_volume)
-                    pygame.mixer.find_channel(True).play(snd)
-
-                self.rect.x += self.speed * self.dx
-                self.rect.y += self.speed * self.dy
-
-                self.x = self.rect.x
-                self.y = self.rect.y
-
-            ##############################################################
-            # perform the wall collision detection and overall position
-            # update for the VECTOR models
-            ##############################################################
-            elif gs.motion_model == MotionModels.VECTOR_1:
-
-                # ball collision wall left
-                if self.primed_collision_wall_left and (self.v_pos.x < self.radius):
-                    self.primed_collision_wall_left = False
-                    self.v_vel_unit.x = -self.v_vel_unit.x
-                    self.v_vel.x = -self.v_vel.x
-                    snd: pygame.mixer.Sound = pygame.mixer.Sound(assets.LEFT_WALL_SFX)
-                    snd.set_volume(gset.sfx_volume)
-                    pygame.mixer.find_channel(True).play(snd)
-                # reset the latch allowing collision detection since the ball has moved fully away
-                if self.v_pos.x >= self.radius:
-                    self.primed_collision_wall_left = True
-
-                # ball collision wall right
-                if self.primed_collision_wall_right and (self.v_pos.x > (constants.WIDTH - self.radius)):
-                    self.primed_collision_wall_right = False
-                    self.v_vel_unit.x = -self.v_vel_unit.x
-                    self.v_vel.x = -self.v_vel.x
-                    snd: pygame.mixer.Sound = pygame.mixer.Sound(assets.RIGHT_WALL_SFX)
-                    snd.set_volume(gset.sfx_volume)
-                    pygame.mixer.find_channel(True).play(snd)
-                # reset the latch allowing collision detection since the ball has moved fully away
-                if self.v_pos.x <= (constants.WIDTH - self.radius):
-                    self.primed_collision_wall_right = True
-
-                # ball collision wall top
-                if self.primed_collision_wall_top and (self.v_pos.y < self.radius):
-                    self.primed_collision_wall_top = False
-                    self.v_vel_unit.y = -self.v_vel_unit.y
-                    self.v_vel.y = -self.v_vel.y
-                    snd: pygame.mixer.Sound = pygame.mixer.Sound(assets.TOP_WALL_SFX)
-                    snd.set_volume(gset.sfx_volume)
-                    pygame.mixer.find_channel(True).play(snd)
-                # reset the latch allowing collision detection since the ball
-                # has moved fully away
-                if self.v_pos.y >= self.radius:
-                    self.primed_collision_wall_top = True
-
-                # WORLD_GRAVITY_ACC: apply gravity, if any
-                if gs.gravity_acc_length > 0.0:
-                    self.v_vel += gs.v_gravity_acc * gs.tick_time * 1.0
-                    self.v_vel_unit = self.v_vel.normalize()
-
-                self.v_pos += self.v_vel * gs.tick_time * 1.0
-
-                self.rect.x = int(self.v_pos.x)
-                self.rect.y = int(self.v_pos.y)
-
-                self.x = self.rect.x
-                self.y = self.rect.y
+            # the wall bounces and position update are up to the current motion model
+            motionregistry.get_motion_model(gs.motion_model).integrate(self, gs)
 
         else:
-            self.move_to_x(self.commanded_pos_x)
+            self.move_to_x(self.commanded_pos_x, gs.paddle_width)
+
+        if self.extra:
+            # (the power-ups remove it)
+            self.lost = self.rect.top > constants.HEIGHT
+            return
 
         gs.cur_ball_x = self.x
 
@@ -180,18 +107,15 @@ class Ball(WorldObject, pygame.sprite.Sprite):
         # NOTE: don't care about the ball IF the level is already cleared (this can happen if waiting for an
         # Animation to complete)
         if self.rect.top > constants.HEIGHT:
-            if not gs.level_cleared:
-                ps.lives -= 1
+            if (not gs.level_cleared) and (gs.extra_balls_in_play > 0):
+                # an extra ball is still in play, so it takes over as the Ball (see PowerUps.update())
+                self.lost = True
+            elif not gs.level_cleared:
                 self.reset_position()
                 gs.cur_state = GameState.GameStateName.READY_TO_LAUNCH
 
                 # Displays game_over menu if user loses all of their lives
-                if ps.lives <= 0:
-                    # collects the player's initials if this is a high score
-                    if lb.is_high_score(ps.score):
-                        gs.cur_state = GameState.GameStateName.GET_HIGH_SCORE
-                    else:
-                        gs.cur_state = GameState.GameStateName.GAME_OVER
+                utils.lose_life(gs, ps, lb)
 
             else:
                 # stop the ball and ensure off-screen
@@ -209,7 +133,7 @@ class Ball(WorldObject, pygame.sprite.Sprite):
         if self.image is None:
             pygame.draw.circle(screen, constants.WHITE, self.rect.center, self.radius)
         else:
-            screen.blit(self.image.convert_alpha(), (self.rect.x - 4, self.rect.y - 3.15))
+            screen.blit(assets.get_prepared_image(self.image), (self.rect.x - 4, self.rect.y - 3.15))
 
     def reset_position(self) -> None:
         """
@@ -224,8 +148,6 @@ class Ball(WorldObject, pygame.sprite.Sprite):
         self.rect.x = self.commanded_pos_x
         self.rect.y = (constants.HEIGHT - constants.PAD_HEIGHT -
                        constants.PADDLE_START_POSITION_OFFSET - (constants.BALL_RADIUS * 3))
-        self.dx = rnd.choice([1, -1])
-        self.dy = -1
 
         # VECTOR motion models defaults
         self.v_pos = pygame.Vector2(self.commanded_pos_x,
@@ -234,9 +156,8 @@ class Ball(WorldObject, pygame.sprite.Sprite):
         self.rect.x = int(self.v_pos.x)
         self.rect.y = int(self.v_pos.y)
 
-        self.v_vel_unit = pygame.Vector2(1.0, 0.0)
-        self.v_vel_unit = self.v_vel_unit.rotate(rnd.choice([-45.0, -135.0]))
-        self.v_vel = self.v_vel_unit * self.speed_v
+        # launch direction/velocity for every model, so the model can still be switched mid-flight
+        motionregistry.launch(self)
 
     def detect_collision(self, wo: pygame.rect, gs: GameState, gset: GameSettings) -> None:
         """
@@ -247,108 +168,24 @@ class Ball(WorldObject, pygame.sprite.Sprite):
         :param gs: GameState
         :return:
         """
-        ##############################################################
-        # determine how/which direction to bounce after collision under
-        # the SIMPLE_1 model
-        ##############################################################
-        if gs.motion_model == MotionModels.SIMPLE_1:
-
-            if self.dx > 0:  # checks for horizontal ball collision
-                x_delta = self.rect.right - wo.rect.left
-            else:
-                x_delta = wo.rect.right - self.rect.left
+        # how/which direction to bounce is up to the current motion model
+        motionregistry.get_motion_model(gs.motion_model).reflect(self, wo, gs)
 
-            if self.dy > 0:  # checks for vertical ball collision
-                y_delta = self.rect.bottom - wo.rect.top
-            else:
-                y_delta = wo.rect.bottom - self.rect.top
-
-            if abs(x_delta - y_delta) < 10:
-                self.dx, self.dy = -self.dx, -self.dy
-            elif x_delta > y_delta:  # vertical collision
-                self.dy = -self.dy
-            elif y_delta > x_delta:  # horizontal collision
-                self.dx = -self.dx
-
-            if isinstance(wo, paddle.Paddle):
-                snd: pygame.mixer.Sound = pygame.mixer.Sound(assets.PADDLE_SFX)
-                snd.set_volume(gset.sfx_volume)
-                pygame.mixer.find_channel(True).play(snd)
-                if wo.delta_x * self.dx < 0:
-                    self.dx = -self.dx
-
-            if isinstance(wo, obstacle.Obstacle):
-                snd: pygame.mixer.Sound = pygame.mixer.Sound(assets.BRICK_BOUNCE_SFX)
-                snd.set_volume(gset.sfx_volume)
-                pygame.mixer.find_channel(True).play(snd)
-
-        ##############################################################
-        # determine how/which direction to bounce after collision under
-        # the VECTOR models
-        ##############################################################
-        elif gs.motion_model == MotionModels.VECTOR_1:
-
-            if self.v_vel_unit.x > 0:  # checks for horizontal ball collision
-                x_delta = self.rect.right - wo.rect.left
-            else:
-                x_delta = wo.rect.right - self.rect.left
-
-            if self.v_vel_unit.y > 0:  # checks for vertical ball collision
-                y_delta = self.rect.bottom - wo.rect.top
-            else:
-                y_delta = wo.rect.bottom - self.rect.top
-
-            if abs(x_delta - y_delta) < 10:
-                self.v_vel_unit.x = -self.v_vel_unit.x
-                self.v_vel.x = -self.v_vel.x
-                self.v_vel_unit.y = -self.v_vel_unit.y
-                self.v_vel.y = -self.v_vel.y
-            elif x_delta > y_delta:  # vertical collision
-                # elif y_delta > x_delta:  # vertical collision
-                self.v_vel_unit.y = -self.v_vel_unit.y
-                self.v_vel.y = -self.v_vel.y
-            elif y_delta > x_delta:  # horizontal collision
-                # elif x_delta > y_delta:  # horizontal collision
-                self.v_vel_unit.x = -self.v_vel_unit.x
-                self.v_vel.x = -self.v_vel.x
-
-            # PADDLE_IMPULSE: add an impulse to the ball's velocity when
-            # striking the paddle, similar to brick breaking
-            if isinstance(wo, paddle.Paddle) and (gs.paddle_impulse_vel_length > 0.0):
-                # add a 'push' straight up
-                v_impulse = pygame.Vector2(0.0, -gs.paddle_impulse_vel_length)
-                self.v_vel += v_impulse
-                self.speed_v = self.v_vel.magnitude()
-                gs.ball_speed_increased_ratio = self.speed_v / constants.BALL_SPEED_VECTOR
-                self.v_vel_unit = self.v_vel.normalize()
-
-            if isinstance(wo, paddle.Paddle):
-                snd: pygame.mixer.Sound = pygame.mixer.Sound(assets.PADDLE_SFX)
-                snd.set_volume(gset.sfx_volume)
-                pygame.mixer.find_channel(True).play(snd)
-                if wo.delta_x * self.v_vel_unit.x < 0:
-                    self.v_vel_unit.x = -self.v_vel_unit.x
-                    self.v_vel.x = -self.v_vel.x
-
-            if isinstance(wo, obstacle.Obstacle):
-                snd: pygame.mixer.Sound = pygame.mixer.Sound(assets.BRICK_BOUNCE_SFX)
-                snd.set_volume(gset.sfx_volume)
-                pygame.mixer.find_channel(True).play(snd)
-
-    def move_to_x(self, pos_x: int) -> None:
+    def move_to_x(self, pos_x: int, pad_width: int = constants.PAD_WIDTH) -> None:
         """
         Move ball_x to mouse_position
         Used when repositioning the ball when game is no longer in the
         PLAYING state
 
         :param pos_x: move Ball to this x position
+        :param pad_width: the Paddle's current width
         :return:
         """
         self.rect.x = pos_x
 
         # Check that the paddle is not going too far (off the screen)
-        self.rect.left = max(self.rect.left, constants.PAD_WIDTH // 2 - self.radius)
-        self.rect.right = min(self.rect.right, constants.WIDTH - constants.PAD_WIDTH // 2 + self.radius)
+        self.rect.left = max(self.rect.left, pad_width // 2 - self.radius)
+        self.rect.right = min(self.rect.right, constants.WIDTH - pad_width // 2 + self.radius)
 
         self.v_pos.x = self.rect.x
         self.x = self.rect.x
@@ -10,19 +10,18 @@
 """
 
 import pygame
-from pygame import Vector2
 
 import assets
-from animation import Animation
+import deferredsurfaces
+from animationpool import AnimationPool
 from constants import (BALL_RADIUS, EFFECT_BRICK_PLAIN_DESTROY_DURATION, EFFECT_BRICK_PLAIN_DESTROY_INFLATION,
                        EFFECT_BRICK_PLAIN_DESTROY_FADE, EFFECT_BRICK_IMAGE_DESTROY_DURATION,
-                       EFFECT_BRICK_IMAGE_DESTROY_INFLATION, EFFECT_BRICK_IMAGE_DESTROY_FADE,
-                       EFFECT_POWER_UP_DURATION, EFFECT_POWER_UP_DROP_ACC_Y, BLACK, WHITE)
+                       EFFECT_BRICK_IMAGE_DESTROY_INFLATION, EFFECT_BRICK_IMAGE_DESTROY_FADE, BLACK, WHITE)
 
 from gamesettings import GameSettings
 from playerstate import PlayerState
 from poweruptype import PowerUpType
-from worldobject import WorldObject
+from worldobject import WorldObject, CollisionLayer
 
 
 class Brick(WorldObject, pygame.sprite.Sprite):
@@ -44,6 +43,7 @@ class Brick(WorldObject, pygame.sprite.Sprite):
         """
         super().__init__()
         pygame.sprite.Sprite.__init__(self)
+        self.collision_layer = CollisionLayer.BRICK
 
         self.rect: pygame.rect = pygame.Rect(rect)
         self.color: pygame.color = color
@@ -54,16 +54,31 @@ class Brick(WorldObject, pygame.sprite.Sprite):
         self.bonus = bonus
         self.power_up: PowerUpType = power_up
 
-        if bonus > 0:
+        self.font_strength = None
+        if not deferredsurfaces.is_deferring():
+            self.realize_surfaces()
+
+    def realize_surfaces(self) -> None:
+        """
+        Create the scaled image and strength font (possibly deferred during a background level build)
+
+        :return:
+        """
+        self.image = deferredsurfaces.realize_image(self.image)
+        if self.bonus > 0 and self.font_strength is None:
             self.font_strength = pygame.font.Font(None, self.rect.height - 20)
-        else:
-            self.font_strength = None
 
     def _add_strength_indicator(self, screen: pygame.Surface) -> None:
         text_surface = self.font_strength.render(str(self.strength), True, BLACK)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
+    def _add_capsule_indicator(self, screen: pygame.Surface) -> None:
+        capsule_rect = pygame.Rect(0, 0, 30, 12)
+        capsule_rect.center = self.rect.center
+        pygame.draw.rect(screen, BLACK, capsule_rect.inflate(2, 2), 0, 7)
+        pygame.draw.rect(screen, WHITE, capsule_rect, 0, 6)
+
     def draw_wo(self, screen: pygame.Surface) -> None:
         """
         Draws the brick to the screen.
@@ -81,17 +96,23 @@ class Brick(WorldObject, pygame.sprite.Sprite):
                     pygame.draw.circle(screen, BLACK, self.rect.center, BALL_RADIUS + 1)
                     # then, the fill
                     pygame.draw.circle(screen, WHITE, self.rect.center, BALL_RADIUS)
-                case _:
+                case PowerUpType.NO_TYPE:
                     pass
+                case _:
+                    # the timed power-ups drop a capsule
+                    self._add_capsule_indicator(screen)
         else:
             screen.blit(self.image, self.rect)
             # draw any power-up overlay
             match self.power_up:
                 case PowerUpType.EXTRA_LIFE:
-                    screen.blit(assets.BALL_IMG.convert_alpha(),
+                    screen.blit(assets.get_prepared_image(assets.BALL_IMG),
                                 (self.rect.centerx - BALL_RADIUS + 2, self.rect.centery - BALL_RADIUS + 2))
-                case _:
+                case PowerUpType.NO_TYPE:
                     pass
+                case _:
+                    # the timed power-ups drop a capsule
+                    self._add_capsule_indicator(screen)
 
         if self.bonus > 0:
             self._add_strength_indicator(screen)
@@ -103,10 +124,6 @@ class Brick(WorldObject, pygame.sprite.Sprite):
         :return:
         """
         self.strength -= 1
-        if self.strength > 0:
-            snd: pygame.mixer.Sound = pygame.mixer.Sound(assets.BRICK_BOUNCE_SFX)
-            snd.set_volume(gset.sfx_volume)
-            pygame.mixer.find_channel(True).play(snd)
 
     def should_score(self) -> bool:
         return True
@@ -119,49 +136,28 @@ class Brick(WorldObject, pygame.sprite.Sprite):
         """
         return self.strength <= 0
 
-    def trigger_destruction_effect(self, world_objects: list[WorldObject], gset: GameSettings, ps: PlayerState) -> None:
+    def trigger_destruction_effect(self, animations: AnimationPool, gset: GameSettings, ps: PlayerState) -> None:
         """
         This is called to create and trigger the animation effect (for Brick destruction, in this case).
 
         :param gset: GameSettings
-        :param world_objects: list of WorldObjects
+        :param animations: the AnimationPool that plays the effects
         :return:
         """
 
         if self.image is None:
             # if a plain rect Brick, then the animation is a brief minor rect.inflation(), with a fade
-            world_objects.append(Animation(EFFECT_BRICK_PLAIN_DESTROY_DURATION,
-                                           self.rect.inflate(self.rect.width * EFFECT_BRICK_PLAIN_DESTROY_INFLATION,
-                                                             self.rect.height * EFFECT_BRICK_PLAIN_DESTROY_INFLATION),
-                                           self.color, is_ball=False, fade=EFFECT_BRICK_PLAIN_DESTROY_FADE))
+            animations.spawn(EFFECT_BRICK_PLAIN_DESTROY_DURATION,
+                             self.rect.inflate(self.rect.width * EFFECT_BRICK_PLAIN_DESTROY_INFLATION,
+                                               self.rect.height * EFFECT_BRICK_PLAIN_DESTROY_INFLATION),
+                             self.color, is_ball=False, fade=EFFECT_BRICK_PLAIN_DESTROY_FADE)
         else:
             # if an image Brick, the animation is an actual multi-frame image animation
-            world_objects.append(Animation(EFFECT_BRICK_IMAGE_DESTROY_DURATION,
-                                           self.rect.inflate(
-                                               self.rect.width * EFFECT_BRICK_IMAGE_DESTROY_INFLATION,
-                                               self.rect.height * EFFECT_BRICK_IMAGE_DESTROY_INFLATION),
-                                           self.color, is_ball=False, fade=EFFECT_BRICK_IMAGE_DESTROY_FADE,
-                                           images=assets.BRICK_ANIMATION))
-
-        # if power-up, handle properly
-        if self.power_up == PowerUpType.EXTRA_LIFE:
-            ps.lives += 1
-
-            # trigger an animation
-            if self.image is None:
-                # if a plain rect Brick, then the animation is a moving plain ball
-                world_objects.append(Animation(EFFECT_POWER_UP_DURATION,
-                                               self.rect,
-                                               self.color, is_ball=True, fade=True,
-                                               v_acc=Vector2(0.0, -1.0 * EFFECT_POWER_UP_DROP_ACC_Y)))
-            else:
-                # if an image Brick, the animation is a moving image ball
-                world_objects.append(Animation(EFFECT_POWER_UP_DURATION,
-                                               self.rect,
-                                               self.color, is_ball=True, fade=True,
-                                               v_acc=Vector2(0.0, -1.0 * EFFECT_POWER_UP_DROP_ACC_Y),
-                                               images=[assets.BALL_IMG]))
-                                               
-        snd: pygame.mixer.Sound = pygame.mixer.Sound(assets.BRICK_SFX)
-        snd.set_volume(gset.sfx_volume)
-        pygame.mixer.find_channel(True).play(snd)
+            animations.spawn(EFFECT_BRICK_IMAGE_DESTROY_DURATION,
+                             self.rect.inflate(
+                                 self.rect.width * EFFECT_BRICK_IMAGE_DESTROY_INFLATION,
+                                 self.rect.height * EFFECT_BRICK_IMAGE_DESTROY_INFLATION),
+                             self.color, is_ball=False, fade=EFFECT_BRICK_IMAGE_DESTROY_FADE,
+                             images=assets.BRICK_ANIMATION)
+
+        # (any power-up is released by the engine's PowerUps - see powerups.py)
@@ -0,0 +1,493 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Live broadcast of a cabinet's game to spectators (e.g. a lobby display), without capturing
+                        the screen.  Each frame the BroadcastServer encodes what changed in the GameWorld into one
+                        small binary message - the Ball and Paddle positions, the level objects destroyed or hit
+                        (by their index in the level's built order), and the score/lives/state when they change -
+                        and every BROADCAST_KEYFRAME_INTERVAL frames a keyframe of the whole world (the level as its
+                        LevelName and seed, plus each level object's strength, -1 once gone).  The message is
+                        encoded once and queued to every spectator's TCP stream, so the cost per spectator is a
+                        non-blocking send; a spectator that falls BROADCAST_MAX_BACKLOG_BYTES behind skips the
+                        deltas and picks up again at a keyframe.
+
+                        A SpectatorClient rebuilds the level from the keyframe's seed into its own GameWorld, applies
+                        the deltas, and draws it.
+
+                        python broadcast.py <host> [port]
+                        (views the game of a cabinet started with main.py --broadcast)
+"""
+
+import socket
+import struct
+import sys
+from array import array
+
+import pygame
+
+import assets
+import constants
+from brick import Brick
+from gamestate import GameState
+from gameworld import GameWorld
+from leveltheme import LevelTheme
+from levels import Levels
+from playerstate import PlayerState
+
+# each message on the stream: body size, then the body
+FRAME: struct.Struct = struct.Struct('<H')
+MESSAGE_KEYFRAME, MESSAGE_DELTA = 1, 2
+# type, frame, theme, LevelName, level seed, level object count, score, lives, level (number), cur_state,
+# ball (x, y), paddle x (then the level objects' strengths)
+KEYFRAME: struct.Struct = struct.Struct('<BIBHIHiiHBhhh')
+# type, frame, ball (x, y), paddle x, flags, level object change count (then the status, if flagged, and changes)
+DELTA: struct.Struct = struct.Struct('<BIhhhBB')
+DELTA_STATUS: int = 0x01
+# score, lives, level (number), cur_state
+STATUS: struct.Struct = struct.Struct('<iiHB')
+# level object index, its new strength (-1 once gone)
+CHANGE: struct.Struct = struct.Struct('<Hh')
+# a delta can list this many level object changes, more are sent as a keyframe
+MAX_CHANGES: int = 255
+GONE: int = -1
+
+# a spectator's socket reads this much at a time
+RECV_SIZE: int = 65536
+
+
+def get_strengths(gw: GameWorld) -> array:
+    """
+    :param gw: GameWorld
+    :return: each level object's strength (0 for an Obstacle), or GONE if it's no longer in the world
+    """
+    in_world = {id(wo) for wo in gw.world_objects}
+    return array('h', [getattr(wo, 'strength', 0) if id(wo) in in_world else GONE for wo in gw.level_objects])
+
+
+class Spectator:
+    """ One connected spectator's stream """
+
+    def __init__(self, sock: socket.socket) -> None:
+        """
+        :param sock: the spectator's connected stream socket
+        """
+        sock.setblocking(False)
+        self.sock: socket.socket = sock
+        # what's queued but not yet taken by the socket
+        self.pending: bytearray = bytearray()
+        # False until it's been sent a keyframe (deltas before one are no use to it)
+        self.synced: bool = False
+
+
+class BroadcastServer:
+    """ Encodes the game world's changes once per frame and streams them to any number of spectators """
+
+    def __init__(self, keyframe_interval: int = constants.BROADCAST_KEYFRAME_INTERVAL,
+                 max_backlog: int = constants.BROADCAST_MAX_BACKLOG_BYTES) -> None:
+        """
+        :param keyframe_interval: frames between keyframes
+        :param max_backlog: bytes a spectator may fall behind before it skips to the next keyframe
+        """
+        self.keyframe_interval: int = keyframe_interval
+        self.max_backlog: int = max_backlog
+        self.listener: socket.socket | None = None
+        self.spectators: list[Spectator] = []
+
+        # the frame count, and what the spectators were last sent (the deltas are against it)
+        self.frame: int = 0
+        self.frames_since_keyframe: int = 0
+        self.keyframe_due: bool = True
+        self.level_key: tuple | None = None
+        self.strengths: array = array('h')
+        self.positions: tuple[int, int, int] = (0, 0, 0)
+        self.status: tuple[int, int, int, int] = (0, 0, 0, 0)
+
+        # stats
+        self.messages: int = 0
+        self.keyframes: int = 0
+        self.bytes_encoded: int = 0
+        self.bytes_sent: int = 0
+        self.skipped: int = 0
+
+    def listen(self, port: int = constants.BROADCAST_PORT, host: str = '') -> None:
+        """
+        Take spectators' connections (accepted by publish())
+
+        :param port: the TCP port
+        :param host: the interface to listen on (all if '')
+        :return:
+        """
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind((host, port))
+        self.listener.listen()
+        self.listener.setblocking(False)
+
+    def accept(self) -> None:
+        """
+        Add the spectators waiting to connect
+
+        :return:
+        """
+        while self.listener is not None:
+            try:
+                sock, _ = self.listener.accept()
+            except OSError:
+                break
+            self.add_spectator(sock)
+
+    def add_spectator(self, sock: socket.socket) -> None:
+        """
+        :param sock: a spectator's connected stream socket (a keyframe is sent to it next frame)
+        :return:
+        """
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.max_backlog)
+        self.spectators.append(Spectator(sock))
+        self.keyframe_due = True
+
+    def publish(self, gw: GameWorld, gs: GameState, ps: PlayerState) -> None:
+        """
+        Send this frame's changes (or a keyframe) to the spectators - called once per frame
+
+        :param gw: GameWorld
+        :param gs: GameState
+        :param ps: PlayerState
+        :return:
+        """
+        self.frame += 1
+        self.accept()
+        if not self.spectators:
+            # nobody watching, so the next one starts from a keyframe
+            self.keyframe_due = True
+            return
+
+        # a spectator that skipped ahead (and has caught up) gets a keyframe to pick up from
+        if any((not spectator.synced) and (not spectator.pending) for spectator in self.spectators):
+            self.keyframe_due = True
+
+        message = self.encode(gw, gs, ps)
+        is_keyframe = (message is not None) and (message[FRAME.size] == MESSAGE_KEYFRAME)
+        for spectator in list(self.spectators):
+            if message is not None:
+                self.queue(spectator, message, is_keyframe)
+            self.flush(spectator)
+
+    def encode(self, gw: GameWorld, gs: GameState, ps: PlayerState) -> bytes | None:
+        """
+        This frame's message: a keyframe if one is due (or the level changed), otherwise a delta of what changed
+
+        :param gw: GameWorld
+        :param gs: GameState
+        :param ps: PlayerState
+        :return: the framed message, or None if nothing changed
+        """
+        # the GameWorld always places the Ball, then the Paddle
+        ball, paddle = gw.world_objects[0], gw.world_objects[1]
+        positions = (ball.rect.x, ball.rect.y, paddle.rect.x)
+        status = (ps.score, ps.lives, ps.level, gs.cur_state.value)
+        strengths = get_strengths(gw)
+        level_key = (ps.theme, gw.level_name, gw.level_seed, len(gw.level_objects))
+
+        self.frames_since_keyframe += 1
+        changes = []
+        if (not self.keyframe_due) and (level_key == self.level_key) and (strengths != self.strengths):
+            changes = [(i, strength) for i, (strength, sent) in enumerate(zip(strengths, self.strengths))
+                       if strength != sent]
+
+        if (self.keyframe_due or (level_key != self.level_key) or (len(changes) > MAX_CHANGES) or
+                (self.frames_since_keyframe >= self.keyframe_interval)):
+            body = (KEYFRAME.pack(MESSAGE_KEYFRAME, self.frame, ps.theme.value, gw.level_name.value, gw.level_seed,
+                                  len(strengths), *status[:2], status[2], status[3], *positions) +
+                    strengths.tobytes())
+            self.keyframe_due = False
+            self.frames_since_keyframe = 0
+            self.keyframes += 1
+        elif changes or (positions != self.positions) or (status != self.status):
+            flags = DELTA_STATUS if status != self.status else 0
+            parts = [DELTA.pack(MESSAGE_DELTA, self.frame, *positions, flags, len(changes))]
+            if flags & DELTA_STATUS:
+                parts.append(STATUS.pack(*status))
+            parts.extend(CHANGE.pack(i, strength) for i, strength in changes)
+            body = b''.join(parts)
+        else:
+            return None
+
+        self.level_key, self.strengths, self.positions, self.status = level_key, strengths, positions, status
+        message = FRAME.pack(len(body)) + body
+        self.messages += 1
+        self.bytes_encoded += len(message)
+        return message
+
+    def queue(self, spectator: Spectator, message: bytes, is_keyframe: bool) -> None:
+        """
+        Queue a message to a spectator, unless it can't use it (not synced yet) or is too far behind
+
+        :param spectator: Spectator
+        :param message: the framed message
+        :param is_keyframe: whether it's a keyframe
+        :return:
+        """
+        if (not spectator.synced) and (not is_keyframe):
+            return
+        if len(spectator.pending) + len(message) > self.max_backlog:
+            # skip ahead - whole messages only, so the stream stays framed - and pick up at a keyframe
+            spectator.synced = False
+            self.skipped += 1
+            return
+        spectator.pending += message
+        spectator.synced = True
+
+    def flush(self, spectator: Spectator) -> None:
+        """
+        Hand as much of the spectator's queue to its socket as it'll take without blocking
+
+        :param spectator: Spectator
+        :return:
+        """
+        if not spectator.pending:
+            return
+        try:
+            sent = spectator.sock.send(spectator.pending)
+        except BlockingIOError:
+            return
+        except OSError:
+            # gone
+            self.remove(spectator)
+            return
+        del spectator.pending[:sent]
+        self.bytes_sent += sent
+
+    def remove(self, spectator: Spectator) -> None:
+        """
+        :param spectator: a Spectator to disconnect
+        :return:
+        """
+        self.spectators.remove(spectator)
+        spectator.sock.close()
+
+    def close(self) -> None:
+        """
+        Disconnect every spectator and stop listening
+
+        :return:
+        """
+        for spectator in list(self.spectators):
+            self.remove(spectator)
+        if self.listener is not None:
+            self.listener.close()
+            self.listener = None
+
+
+class SpectatorClient:
+    """ Rebuilds a broadcast game from its stream into its own GameWorld, for drawing """
+
+    def __init__(self, sock: socket.socket) -> None:
+        """
+        :param sock: the connected stream socket
+        """
+        sock.setblocking(False)
+        self.sock: socket.socket = sock
+        self.buffer: bytearray = bytearray()
+        self.gw: GameWorld | None = None
+        self.gs: GameState = GameState()
+        self.ps: PlayerState = PlayerState()
+        self.frame: int = 0
+        self.synced: bool = False
+        self.closed: bool = False
+        self.font_status: pygame.font.Font | None = None
+
+        # stats
+        self.bytes_received: int = 0
+        self.messages: int = 0
+        self.keyframes: int = 0
+
+    def receive(self) -> int:
+        """
+        Read what's arrived and apply its whole messages
+
+        :return: how many messages were applied
+        """
+        while not self.closed:
+            try:
+                data = self.sock.recv(RECV_SIZE)
+            except BlockingIOError:
+                break
+            except OSError:
+                data = b''
+            if not data:
+                self.closed = True
+                break
+            self.buffer += data
+            self.bytes_received += len(data)
+
+        applied = 0
+        offset = 0
+        buffer = self.buffer
+        while len(buffer) - offset >= FRAME.size:
+            (size,) = FRAME.unpack_from(buffer, offset)
+            if len(buffer) - offset - FRAME.size < size:
+                break
+            self.apply(memoryview(buffer)[offset + FRAME.size:offset + FRAME.size + size])
+            offset += FRAME.size + size
+            applied += 1
+        del buffer[:offset]
+        self.messages += applied
+        return applied
+
+    def apply(self, body: memoryview) -> None:
+        """
+        Apply one message to the world
+
+        :param body: the message body
+        :return:
+        """
+        if body[0] == MESSAGE_KEYFRAME:
+            self.apply_keyframe(body)
+        elif self.synced and (body[0] == MESSAGE_DELTA):
+            self.apply_delta(body)
+
+    def apply_keyframe(self, body: memoryview) -> None:
+        """
+        Rebuild the whole world from a keyframe (the level from its seed, if it's not the one already built)
+
+        :param body: the keyframe body
+        :return:
+        """
+        (_, self.frame, theme_value, level_value, level_seed, level_count, score, lives, level, state_value,
+         ball_x, ball_y, paddle_x) = KEYFRAME.unpack_from(body, 0)
+        theme = LevelTheme(theme_value)
+        level_name = Levels.LevelName(level_value)
+        if (self.gw is None) or (self.ps.theme != theme):
+            self.gw = GameWorld(theme, level_name)
+            self.gw.build_level(level_name, level_seed)
+        elif ((self.gw.level_name != level_name) or (self.gw.level_seed != level_seed) or
+              (len(self.gw.level_objects) != level_count)):
+            self.gw.build_level(level_name, level_seed)
+        self.ps.theme = theme
+
+        strengths = array('h')
+        strengths.frombytes(body[KEYFRAME.size:KEYFRAME.size + (2 * level_count)])
+        level_objects = self.gw.level_objects
+        for wo, strength in zip(level_objects, strengths):
+            if isinstance(wo, Brick) and (strength != GONE):
+                wo.strength = strength
+        self.gw.world_objects = (self.gw.world_objects[:2] +
+                                 [wo for wo, strength in zip(level_objects, strengths) if strength != GONE])
+
+        self.set_positions(ball_x, ball_y, paddle_x)
+        self.set_status(score, lives, level, state_value)
+        self.synced = True
+        self.keyframes += 1
+
+    def apply_delta(self, body: memoryview) -> None:
+        """
+        Apply a delta's moves, status, and level object changes
+
+        :param body: the delta body
+        :return:
+        """
+        (_, self.frame, ball_x, ball_y, paddle_x, flags, change_count) = DELTA.unpack_from(body, 0)
+        offset = DELTA.size
+        self.set_positions(ball_x, ball_y, paddle_x)
+        if flags & DELTA_STATUS:
+            self.set_status(*STATUS.unpack_from(body, offset))
+            offset += STATUS.size
+
+        level_objects = self.gw.level_objects
+        for _ in range(change_count):
+            index, strength = CHANGE.unpack_from(body, offset)
+            offset += CHANGE.size
+            wo = level_objects[index]
+            if strength == GONE:
+                if wo in self.gw.world_objects:
+                    self.gw.world_objects.remove(wo)
+            elif isinstance(wo, Brick):
+                wo.strength = strength
+
+    def set_positions(self, ball_x: int, ball_y: int, paddle_x: int) -> None:
+        """
+        :param ball_x: the Ball's rect x
+        :param ball_y: the Ball's rect y
+        :param paddle_x: the Paddle's rect x
+        :return:
+        """
+        ball, paddle = self.gw.world_objects[0], self.gw.world_objects[1]
+        ball.rect.topleft = (ball_x, ball_y)
+        paddle.rect.x = paddle_x
+
+    def set_status(self, score: int, lives: int, level: int, state_value: int) -> None:
+        """
+        :param score: the player's score
+        :param lives: the player's lives
+        :param level: the level number
+        :param state_value: the GameStateName value
+        :return:
+        """
+        self.ps.score, self.ps.lives, self.ps.level = score, lives, level
+        self.gs.cur_state = GameState.GameStateName(state_value)
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """
+        Draw the broadcast world and the player's status (or a waiting message until the first keyframe)
+
+        :param screen: the backbuffer
+        :return:
+        """
+        if self.font_status is None:
+            self.font_status = pygame.font.Font(None, 36)
+        screen.fill(constants.BLACK)
+        if not self.synced:
+            text = "CONNECTION CLOSED" if self.closed else "WAITING FOR THE GAME..."
+        else:
+            for world_object in self.gw.world_objects:
+                world_object.draw_wo(screen)
+            text = (f"LIVE   Level: {self.ps.level}   Score: {self.ps.score}   Lives: {max(self.ps.lives, 0)}"
+                    f"   {self.gs.cur_state.name.replace('_', ' ')}")
+        image = self.font_status.render(text, True, constants.WHITE)
+        screen.blit(image, image.get_rect(midtop=(constants.WIDTH // 2, 10)))
+
+    def close(self) -> None:
+        """
+        :return:
+        """
+        self.sock.close()
+        self.closed = True
+
+
+def main() -> None:
+    """
+    Connect to a broadcasting cabinet and show its game until ESC or the window is closed
+
+    :return:
+    """
+    host = sys.argv[1] if len(sys.argv) > 1 else 'localhost'
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else constants.BROADCAST_PORT
+
+    pygame.init()
+    screen = pygame.display.set_mode((constants.WIDTH, constants.HEIGHT))
+    pygame.display.set_caption(f"{constants.GAME_NAME} - spectating {host}")
+    assets.load_assets()
+    client = SpectatorClient(socket.create_connection((host, port)))
+    clock = pygame.time.Clock()
+
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if (event.type == pygame.QUIT) or ((event.type == pygame.KEYDOWN) and (event.key == pygame.K_ESCAPE)):
+                running = False
+        client.receive()
+        client.draw(screen)
+        pygame.display.flip()
+        clock.tick(constants.INITIAL_FPS_SIMPLE)
+
+    client.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: The collision handling (the bounces, contact latching, and Brick damage/removal) shared by
+                        everything that runs a game world - the GameEngine, each side of a versus match, and the
+                        headless SmashEnv.  It's a mixin, so it sits below all of them in the imports.  The
+                        headless worlds (a versus side and SmashEnv) also share their Ball/Paddle step from here.
+"""
+
+import gameevents
+import telemetry
+from animationpool import AnimationPool
+from ball import Ball
+from constants import BALL_SPEED_VECTOR
+from gameevents import GameEventType
+from gamesettings import GameSettings
+from gamestate import GameState
+from gameworld import GameWorld
+from leaderboard import Leaderboard
+from paddle import Paddle
+from playerstate import PlayerState
+from powerups import PowerUps
+from worldobject import WorldObject, CollisionLayer
+
+
+class CollisionHandler:
+    """ Mixin handling a world's collisions - the class using it provides the attributes annotated below """
+
+    gw: GameWorld
+    gs: GameState
+    gset: GameSettings
+    ps: PlayerState
+    # the (reacting, other) WorldObject pairs in contact
+    contacts: set
+    animations: AnimationPool
+    power_ups: PowerUps
+    # the headless worlds' own Ball and Paddle, for step_ball_and_paddle()
+    ball: Ball
+    paddle: Paddle
+    lb: Leaderboard
+
+    def step_ball_and_paddle(self) -> None:
+        """
+        The same Ball/Paddle update and collision steps as the GameEngine's PLAYING frame (the Bricks never move,
+        so only those two are updated)
+
+        :return:
+        """
+        gs = self.gs
+        self.ball.commanded_pos_x = gs.paddle_pos_x
+        self.ball.update_wo(gs, self.ps, self.lb, self.gset)
+        self.handle_collisions_for(self.ball)
+        self.paddle.update_wo(gs, self.ps, self.lb, self.gset)
+
+    def handle_collisions_for(self, current_wo: WorldObject) -> None:
+        """
+        Test a reacting object against only the world objects on the layers in its collision mask
+        (so never itself, the Animations, etc.), and only handle the contacts that begin or end
+
+        :param current_wo: the reacting WorldObject
+        :return:
+        """
+        mask = current_wo.collision_mask
+        colliderect = current_wo.rect.colliderect
+        # narrow down to the objects touching it now (a snapshot, since Bricks can be removed while it's walked),
+        # plus the ones it was touching, so their contacts see the exit
+        # (the endless mode's bricks are in its field, which narrows them down to the rows this object overlaps)
+        candidates = self.gw.world_objects
+        if self.gw.brick_field is not None:
+            candidates = candidates + self.gw.brick_field.query(current_wo.rect)
+        touching = [wo for wo in candidates if (wo.collision_layer & mask) and colliderect(wo.rect)]
+        leaving = [other_wo for (reacting_wo, other_wo) in self.contacts
+                   if (reacting_wo is current_wo) and (other_wo not in touching)]
+        for other_wo in touching + leaving:
+            self.handle_collisions_between_worldobjects(current_wo, other_wo)
+
+    def handle_collisions_between_worldobjects(self, current_wo, other_wo):
+        """
+        Handle collisions between world objects
+        :param current_wo:
+        :param other_wo:
+        :return:
+        """
+        pair = (current_wo, other_wo)
+        if current_wo.rect.colliderect(other_wo.rect):
+            # a collision was detected - should we react to it?  this matters because two
+            # objects can overlap/collide across multiple looping collision checks - if
+            # we don't latch the contact, the object can bounce back and forth, getting trapped.
+            # So only the frame the contact begins (enters the contact set) reacts
+            if pair in self.contacts:
+                return
+            self.contacts.add(pair)
+            if other_wo.allow_collision():
+                if telemetry.enabled:
+                    if other_wo.collision_layer == CollisionLayer.BRICK:
+                        telemetry.record_brick_hit(*other_wo.rect.center)
+                    elif other_wo.collision_layer == CollisionLayer.PADDLE:
+                        telemetry.record_paddle_contact(current_wo.rect.centerx - other_wo.rect.centerx)
+                # bounce object properly -
+                # determining in which direction
+                # to bounce, based on approach
+                current_wo.detect_collision(other_wo, self.gs, self.gset)
+                # (the STICKY_PADDLE power-up may hold the ball)
+                if (other_wo.collision_layer == CollisionLayer.PADDLE) and isinstance(current_wo, Ball):
+                    self.power_ups.on_paddle_hit(current_wo)
+                if self.apply_hit(other_wo):
+                    current_wo.speed += .20
+                    # BALL_SPEED_STEP: adding to the ball speed, but diff logic for the
+                    # VECTOR models
+                    if isinstance(current_wo, Ball):
+                        current_wo.speed_v += self.gs.ball_speed_step
+                        self.gs.ball_speed_increased_ratio = current_wo.speed_v / BALL_SPEED_VECTOR
+                        current_wo.v_vel = current_wo.v_vel_unit * current_wo.speed_v
+
+        elif pair in self.contacts:
+            # this is the other side of the latch above - the contact has ended, so the pair
+            # can react again the next time they touch
+            self.contacts.discard(pair)
+
+    def apply_hit(self, wo: WorldObject) -> bool:
+        """
+        Damage a WorldObject that's been hit (by the ball, or a laser shot), scoring it and, once its strength has
+        run out, destroying it
+
+        :param wo: the WorldObject hit
+        :return: True if it was destroyed (and removed)
+        """
+        wo.add_collision(self.gset)
+        points: int = wo.value if wo.should_score() else 0
+        if wo.should_remove():
+            # trigger the special effect - the Brick spawns the appropriate Animation from the pool
+            wo.trigger_destruction_effect(self.animations, self.gset, self.ps)
+            # and release its power-up
+            self.power_ups.release(wo, self.animations, self.ps)
+
+            # the scoring, shake, and sound are handled by the event consumers at the end of the step
+            gameevents.emit(GameEventType.BRICK_DESTROYED, points=points + wo.bonus,
+                            strength=wo.strength_initial)
+
+            # now remove the actual Brick object (and its contacts, since they'll never separate) - from
+            # the endless mode's field, if it's there
+            if (self.gw.brick_field is None) or (not self.gw.brick_field.remove(wo)):
+                self.gw.world_objects.remove(wo)
+            for pair in [pair for pair in self.contacts if pair[1] is wo]:
+                self.contacts.discard(pair)
+            return True
+
+        if wo.should_score():
+            gameevents.emit(GameEventType.BRICK_DAMAGED, points=points)
+            # (the endless mode's field redraws the damaged Brick in its cached layer)
+            if self.gw.brick_field is not None:
+                self.gw.brick_field.redraw(wo)
+        return False
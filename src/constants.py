@@ -16,6 +16,10 @@ CLOSE_TO_ZERO = 0.00001 # for float comparisons to zero
 # width and height of game board
 WIDTH, HEIGHT = 1200, 800
 
+# the logical size above is drawn into a backbuffer; a display at least this many times larger gets the backbuffer
+# scaled up by a whole number (cheap nearest-pixel scaling), and any other size gets it smoothscaled to fit
+PRESENT_INTEGER_SCALE_MIN = 2
+
 INITIAL_FPS_SIMPLE = 60
 MAX_FPS_VECTOR = 250 # note this should work out to a whole number of clock.tick ms for the loop
 
@@ -24,10 +28,16 @@ SPLASH_TIME_SECS = 2
 PAD_WIDTH, PAD_HEIGHT = 150, 20
 PADDLE_START_POSITION_OFFSET = 10
 PADDLE_KEY_SPEED = 1.0 # base arrow key-control paddle speed
+PADDLE_INPUT_SMOOTHING = 0.0 # 0.0 (off) to <1.0: exponential smoothing of the mouse-driven paddle (smoother, but lags)
+PADDLE_INPUT_PREDICTION_MS = 0.0 # extrapolate the mouse-driven paddle this far ahead on its velocity (0.0 is off)
+PADDLE_INPUT_LATENCY_WINDOW = 120 # how many input-to-photon latency estimates the dev overlay averages
+PADDLE_INPUT_MAX_POLL_GAP_MS = 1000 // INITIAL_FPS_SIMPLE # a longer gap between polls (e.g. a pause) isn't an input window
 
 BALL_RADIUS = 15
 BALL_SPEED_SIMPLE = 6 # initial speed for SIMPLE_1 model
 BALL_SPEED_VECTOR = 0.55 # initial speed for VECTOR_1 model
+MOTION_SUBSTEP_MAX_DISTANCE = 2.0 # SUBSTEP_1 model: farthest (px) the ball may move in one integration sub-step
+MOTION_SUBSTEPS_MAX = 16 # SUBSTEP_1 model: cap on the sub-steps per frame (bounds the cost of very fast balls)
 
 BALL_SPEED_LEVEL_INCREMENT = 0.10 # incremental factor for initial ball speed upon level clear
 
@@ -47,18 +57,21 @@ LIGHT_BLUE = (0, 176, 240)
 RED = (255, 0, 0)
 DARK_RED = (200, 0, 0)
 ORANGE = (255, 100, 0)
+DARK_ORANGE = (200, 80, 0)
 YELLOW = (255, 255, 0)
 DARK_YELLOW = (200, 200, 0)
 GREEN = (0, 255, 0)
 DARK_GREEN = (0, 200, 0)
 PURPLE = (102, 51, 153)
 PINK = (254, 0, 127)
+DARK_PINK = (200, 0, 100)
 
 BRICK_SOLIDS = [DARK_BLUE, LIGHT_BLUE, RED, ORANGE, YELLOW, GREEN, PURPLE, PINK]
 
 START_SCORE = 0
 START_LIVES = 3
 LEADERBOARD_SIZE = 10
+LEADERBOARD_VISIBLE_ROWS = 10  # score rows shown at once on the leaderboard screen (more scroll)
 SCORE_INITIALS_MAX = 3
 
 SLIDER_WIDTH = 700
@@ -84,5 +97,66 @@ EFFECT_BRICK_IMAGE_DESTROY_FADE = False # fade the destroyed Brick?
 EFFECT_POWER_UP_DURATION = 2000 # lifetime of fading power-up image, in ms
 EFFECT_POWER_UP_DROP_ACC_Y = 0.00025 # y-comp of power-up image dropping acceleration
 
+POWER_UP_CAPSULE_WIDTH = 50 # size of the falling power-up capsules...
+POWER_UP_CAPSULE_HEIGHT = 20 # ...
+POWER_UP_CAPSULE_FALL_SPEED = 0.2 # how fast the capsules fall, in px per ms
+POWER_UP_DURATION_MS = 10000 # how long each caught timed power-up lasts (catching another while active adds its own)
+POWER_UP_WIDE_PADDLE_SCALE = 1.5 # the WIDE_PADDLE power-up's paddle width, as a multiple of PAD_WIDTH
+POWER_UP_SLOW_BALL_SCALE = 0.6 # the SLOW_BALL power-up scales the ball speeds by this
+POWER_UP_MULTI_BALL_COUNT = 2 # how many extra balls each MULTI_BALL power-up adds...
+POWER_UP_MULTI_BALL_MAX = 8 # ...up to this many extra balls at once
+POWER_UP_MULTI_BALL_ANGLE = 30 # the extra balls head off this many degrees apart
+POWER_UP_STICKY_HOLD_MS = 2000 # a ball caught by the STICKY_PADDLE launches itself after this long (or on SPACE)
+
+LASER_FIRE_INTERVAL_MS = 150 # the LASER paddle fires a shot from each cannon this often
+LASER_SPEED = 0.9 # how fast the laser shots rise, in px per ms
+LASER_POOL_CAPACITY = 1024 # the most laser shots in flight at once (a shot past this isn't fired)
+LASER_COLUMN_WIDTH = 20 # the width of the laser hit test's brick columns, in px
+LASER_SHOT_WIDTH = 4 # size of a drawn laser shot...
+LASER_SHOT_HEIGHT = 12 # ...
+
+ANIMATION_POOL_CAPACITY = 64 # the most Animation effects that can play at once (the oldest is recycled past this)
+
 LEVEL_CLEARED_DURATION = 3500 # how long to display the fading 'Level Cleared' message
 LEVEL_CLEARED_SHAKE_MAGNITUDE = 40 # how much of a final shake to trigger
+
+LEVEL_PREBUILD_REALIZE_PER_FRAME = 3 # how many pre-built level objects get their Surfaces/Fonts created per frame
+
+PROFILER_WINDOW_FRAMES = 240 # how many frames of span timings the profiler keeps (ring buffers)
+PROFILER_SUMMARY_INTERVAL = 15 # rebuild the profiler's percentile summary every this many frames
+PROFILER_DUMP_FILENAME = 'frame_profile' # CTRL+t writes <name>_<timestamp>.csv/.json to the game data dir
+
+AUTOSAVE_INTERVAL_MS = 3000 # the run in progress is autosaved (for crash recovery) at most this often
+
+VERSUS_STEP_MS = 1000 // MAX_FPS_VECTOR # versus mode's worlds both advance in fixed steps of this many ms
+VERSUS_MAX_STEPS_PER_FRAME = 12 # versus mode runs at most this many steps per frame (after a stall, the rest is dropped)
+VERSUS_VIEW_SCALE = 0.5 # each versus mode world is shown at this fraction of its full size, side-by-side
+
+NET_PORT = 47650 # linked cabinets exchange their versus mode inputs over UDP on this port
+NET_INPUT_DELAY_TICKS = 6 # a player's input takes effect this many versus steps later (time for it to reach the peer)
+NET_MAX_ROLLBACK_TICKS = 30 # how many steps the simulation may run ahead on predicted peer input (0 is pure lockstep)
+NET_MAX_INPUTS_PER_PACKET = 64 # how many unacknowledged inputs each packet re-sends (so a lost packet costs nothing)
+NET_SYNC_INTERVAL_TICKS = 25 # linked cabinets compare gameplay checksums every this many steps (to detect a desync)
+
+BROADCAST_PORT = 47651 # spectators (e.g. a lobby display) connect to a broadcasting cabinet on this TCP port
+BROADCAST_KEYFRAME_INTERVAL = 120 # the broadcast sends a whole-world keyframe every this many frames (between them, deltas)
+BROADCAST_MAX_BACKLOG_BYTES = 65536 # a spectator this far behind skips the deltas and catches up at the next keyframe
+
+ENDLESS_TOP_Y = 120 # endless mode's top brick row sits here (the levels' top grid margin)
+ENDLESS_ROW_PITCH = 55 # endless mode's rows are this far apart (the levels' brick row pitch)
+ENDLESS_MAX_ROWS = 8 # endless mode's rows pushed down past this many drop off - costing a life if bricks are left
+ENDLESS_START_ROWS = 4 # an endless run starts with this many rows
+ENDLESS_ROW_INTERVAL_MS = 10000 # a new endless row streams in this often, on level 1
+ENDLESS_ROW_INTERVAL_STEP_MS = 500 # the endless row interval gets this much shorter each level...
+ENDLESS_ROW_INTERVAL_MIN_MS = 3000 # ...down to this
+ENDLESS_ROWS_PER_LEVEL = 5 # the endless level goes up (with the ball speed) every this many new rows
+
+TELEMETRY_CELL_SIZE = 25 # telemetry brick hits are counted per screen grid cell of this many px square
+TELEMETRY_PADDLE_BINS = 16 # telemetry paddle contact x-offsets are counted in this many bins across the paddle
+
+ENV_FRAME_SKIP = 4 # SmashEnv game frames (of 1000 / MAX_FPS_VECTOR ms) per step, each with the step's action
+ENV_MAX_STEPS = 15000 # SmashEnv episodes are truncated after this many steps (a stuck ball can bounce forever)
+ENV_BRICK_CELL_SIZE = 50 # the SmashEnv observation's brick bitmap has a bit per screen grid cell this many px square
+
+PIXEL_OBS_SIZE = (84, 84) # the default PixelRenderer frame size (the usual size for vision-based agents)
+FRAME_RING_SLOTS = 4 # how many of the latest frames a shared memory FrameRing keeps (e.g. for frame stacking)
@@ -0,0 +1,85 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Lets level building run off the main thread by deferring the Surface/Font work.  While
+                        deferring, scaled images are recorded as PendingImages and WorldObjects skip creating
+                        their fonts, so the objects can be 'realized' later (on the main thread) a few at a time.
+"""
+
+import threading
+from contextlib import contextmanager
+
+import pygame
+
+# deferral is tracked per thread, so the main thread keeps building normally (CTRL+l, reset_game, etc.)
+# while a worker thread is pre-building the next level
+_local = threading.local()
+
+
+class PendingImage:
+    """ Records a pygame.transform.scale() that must still be performed on the main thread """
+
+    def __init__(self, image: pygame.Surface, size: tuple[int, int]) -> None:
+        self.image: pygame.Surface = image
+        self.size: tuple[int, int] = size
+
+    def realize(self) -> pygame.Surface:
+        """
+        Perform the recorded scaling
+
+        :return: the scaled Surface
+        """
+        return pygame.transform.scale(self.image, self.size)
+
+
+def is_deferring() -> bool:
+    """
+    Is the current thread deferring its Surface work?
+
+    :return:
+    """
+    return getattr(_local, 'deferring', False)
+
+
+@contextmanager
+def deferring():
+    """
+    Context manager that defers the Surface/Font work of any WorldObjects built on this thread
+
+    :return:
+    """
+    _local.deferring = True
+    try:
+        yield
+    finally:
+        _local.deferring = False
+
+
+def scale(image: pygame.Surface, size: tuple[int, int]):
+    """
+    Scale the image now, or record the scaling for later if deferring
+
+    :param image: source image
+    :param size: target (width, height)
+    :return: the scaled Surface or a PendingImage
+    """
+    if is_deferring():
+        return PendingImage(image, size)
+    return pygame.transform.scale(image, size)
+
+
+def realize_image(image):
+    """
+    Resolve a possibly-pending image
+
+    :param image: a Surface, PendingImage, or None
+    :return: a Surface or None
+    """
+    if isinstance(image, PendingImage):
+        return image.realize()
+    return image
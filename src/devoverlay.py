@@ -0,0 +1,105 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: The developer overlay (CTRL+d) - the frame rate and physics tuning, the Animation pool
+                        usage, the input latency, and the profiler's per-span timings and frame-time graph.  It's
+                        mixed into the UserInterface, drawing with its screen and font.
+"""
+
+import pygame
+
+import constants
+from animationpool import AnimationPool
+from gamestate import GameState
+from paddleinput import PaddleInput
+from profiler import FrameProfiler
+
+
+class DevOverlayMixin:
+    """ Mixin drawing the UserInterface's developer overlay """
+
+    screen: pygame.Surface
+    font_dev_overlay: pygame.font.Font
+
+    def draw_dev_overlay(self, gs: GameState, profiler: FrameProfiler = None, animations: AnimationPool = None,
+                         paddle_input: PaddleInput = None) -> None:
+        """
+        Show the developer overlay
+
+        :param gs: GameState
+        :param profiler: if provided, also show the per-span timings and frame-time graph
+        :param animations: if provided, also show the Animation pool usage
+        :param paddle_input: if provided, also show the input-to-photon latency and input filtering
+        :return:
+        """
+        str_build = (f"FPS: {gs.fps_avg:>6.1f}  "
+                     f"LoopTime(ms): {gs.loop_time_avg:>4.1f}  "
+                     f"MotionModel: {gs.motion_model.name}  "
+                     f"Auto-Play: {gs.auto_play}")
+        dev_overlay1 = self.font_dev_overlay.render(str_build, True, constants.GREEN)
+
+        str_build = (f"PaddleImpulse: {gs.paddle_impulse_vel_length:>4.2f}  "
+                     f"Gravity: {gs.gravity_acc_length:>7.5f}  "
+                     f"SpeedStep: {gs.ball_speed_step:>6.3f}")
+        dev_overlay2 = self.font_dev_overlay.render(str_build, True, constants.GREEN)
+
+        self.screen.blit(dev_overlay1, ((constants.WIDTH - dev_overlay1.get_width()) / 2,
+                                        constants.HEIGHT - dev_overlay1.get_height() - 5))
+        self.screen.blit(dev_overlay2, ((constants.WIDTH - dev_overlay2.get_width()) / 2,
+                                        constants.HEIGHT - dev_overlay2.get_height() - 24))
+
+        if animations is not None:
+            str_build = (f"AnimPool: {len(animations.active)}/{animations.capacity}  "
+                         f"HighWater: {animations.high_water}  "
+                         f"Exhausted: {animations.exhausted_count} ({animations.policy.name})")
+            dev_overlay3 = self.font_dev_overlay.render(str_build, True, constants.GREEN)
+            self.screen.blit(dev_overlay3, ((constants.WIDTH - dev_overlay3.get_width()) / 2,
+                                            constants.HEIGHT - dev_overlay3.get_height() - 43))
+
+        if paddle_input is not None:
+            latency_mean, latency_max = paddle_input.get_latency_ms()
+            str_build = (f"InputLatency(ms): {latency_mean:>5.1f} (max {latency_max:>5.1f})  "
+                         f"Smoothing: {paddle_input.smoothing:>4.2f}  "
+                         f"Prediction(ms): {paddle_input.prediction_ms:>4.1f}")
+            dev_overlay4 = self.font_dev_overlay.render(str_build, True, constants.GREEN)
+            self.screen.blit(dev_overlay4, ((constants.WIDTH - dev_overlay4.get_width()) / 2,
+                                            constants.HEIGHT - dev_overlay4.get_height() - 62))
+
+        if profiler is not None:
+            self.draw_profiler_overlay(profiler)
+
+    def draw_profiler_overlay(self, profiler: FrameProfiler) -> None:
+        """
+        Show the profiler's per-span timing table (ms) and a graph of recent frame times
+
+        :param profiler: FrameProfiler
+        :return:
+        """
+        line_y = 60
+        header = self.font_dev_overlay.render(f"{'span':<10}{'mean':>7}{'p50':>7}{'p95':>7}{'p99':>7}{'max':>7}",
+                                              True, constants.GREEN)
+        self.screen.blit(header, (10, line_y))
+        for name, stats in profiler.get_summary().items():
+            line_y += header.get_height()
+            str_build = (f"{name:<10}{stats['mean']:>7.2f}{stats['p50']:>7.2f}{stats['p95']:>7.2f}"
+                         f"{stats['p99']:>7.2f}{stats['max']:>7.2f}")
+            self.screen.blit(self.font_dev_overlay.render(str_build, True, constants.GREEN), (10, line_y))
+
+        # frame-time graph, scaled so the frame budget line sits halfway up
+        graph_rect = pygame.Rect(constants.WIDTH - constants.PROFILER_WINDOW_FRAMES - 10, 60,
+                                 constants.PROFILER_WINDOW_FRAMES, 80)
+        budget_ms = 1000.0 / constants.INITIAL_FPS_SIMPLE
+        ms_to_px = (graph_rect.height / 2) / budget_ms
+        pygame.draw.rect(self.screen, constants.LIGHT_GRAY, graph_rect, 1)
+        pygame.draw.line(self.screen, constants.YELLOW, (graph_rect.left, graph_rect.centery),
+                         (graph_rect.right - 1, graph_rect.centery))
+        frame_times = profiler.frame_times_ms()
+        if len(frame_times) >= 2:
+            points = [(graph_rect.left + i, graph_rect.bottom - 1 - min(graph_rect.height - 1, int(t * ms_to_px)))
+                      for i, t in enumerate(frame_times)]
+            pygame.draw.lines(self.screen, constants.GREEN, False, points)
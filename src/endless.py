@@ -0,0 +1,237 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the endless mode.  Instead of levels, rows of bricks stream in from the top on a
+                        timer (and right away once the field is cleared), pushing the rows already there down.  A
+                        row pushed past ENDLESS_MAX_ROWS drops off, and costs a life if it still holds bricks.  The
+                        rows are cut from the theme's procedurally built levels, one after another.
+
+                        Since a run can go on for as long as the player keeps up, nothing here grows or rescans
+                        with it: the EndlessField holds the rows itself (not gw.world_objects), so the collision
+                        test only looks at the rows the ball overlaps, the count of breakable bricks left is kept
+                        up as they're removed (instead of searching the world every frame), and the rows are drawn
+                        from a cached layer that's only touched where something changed - a removed or damaged
+                        brick, or a scroll down by a row for a new one.
+"""
+
+import itertools
+import random
+from collections import deque
+from collections.abc import Iterator
+
+import pygame
+
+import utils
+from ball import Ball
+from brick import Brick
+from constants import (WIDTH, BLACK, BALL_SPEED_VECTOR, BALL_SPEED_SIMPLE, BALL_SPEED_LEVEL_INCREMENT,
+                       ENDLESS_TOP_Y, ENDLESS_ROW_PITCH, ENDLESS_MAX_ROWS, ENDLESS_START_ROWS,
+                       ENDLESS_ROW_INTERVAL_MS, ENDLESS_ROW_INTERVAL_STEP_MS, ENDLESS_ROW_INTERVAL_MIN_MS,
+                       ENDLESS_ROWS_PER_LEVEL)
+from gamestate import GameState
+from gameworld import GameWorld
+from leaderboard import Leaderboard
+from leveltheme import LevelTheme
+from levels import Levels
+from playerstate import PlayerState
+from worldobject import WorldObject
+
+
+def generate_rows(level_theme: LevelTheme, seed: int) -> Iterator[list[WorldObject]]:
+    """
+    The endless supply of rows: the theme's levels, in their usual order, each built with its own seed (from this
+    one) and cut into its rows of Bricks and Obstacles, bottom row first (so each layout streams in the right way up)
+
+    :param level_theme: whose levels to build
+    :param seed: seeds the whole supply, so the same seed streams the same rows
+    :return:
+    """
+    rng = random.Random(seed)
+    for level_num in itertools.count(1):
+        level_objects: list[WorldObject] = []
+        Levels.build_level(level_objects, Levels.get_level_name_from_num(level_theme, level_num),
+                           rng.getrandbits(32))
+        rows: dict[int, list[WorldObject]] = {}
+        for wo in level_objects:
+            rows.setdefault(wo.rect.y, []).append(wo)
+        for row_y in sorted(rows, reverse=True):
+            yield rows[row_y]
+
+
+def get_row_interval(level: int) -> int:
+    """
+    How often a new row streams in on a level
+
+    :param level: the endless level (from 1)
+    :return: the interval, in ms
+    """
+    return max(ENDLESS_ROW_INTERVAL_MS - ((level - 1) * ENDLESS_ROW_INTERVAL_STEP_MS), ENDLESS_ROW_INTERVAL_MIN_MS)
+
+
+class EndlessField:
+    """ The rows of an endless run's bricks, which take the place of a GameWorld's level """
+
+    def __init__(self, gw: GameWorld, level_theme: LevelTheme, seed: int = None) -> None:
+        """
+        Clear the GameWorld's level and take its place (as gw.brick_field), starting with ENDLESS_START_ROWS rows
+
+        :param gw: the run's GameWorld
+        :param level_theme: whose levels the rows are cut from
+        :param seed: the seed for the rows (a new one from the random module if None)
+        """
+        self.gw: GameWorld = gw
+        self.seed: int = random.getrandbits(32) if seed is None else seed
+        self.row_source: Iterator[list[WorldObject]] = generate_rows(level_theme, self.seed)
+
+        # the rows, top row first - row i sits at ENDLESS_TOP_Y + (i * ENDLESS_ROW_PITCH)
+        self.rows: deque[list[WorldObject]] = deque()
+        # how many breakable Bricks are left (so a cleared field is noticed without a search)
+        self.brick_count: int = 0
+        self.rows_streamed: int = 0
+        self.rows_dropped: int = 0
+        self.next_row_ms: int = ENDLESS_ROW_INTERVAL_MS
+
+        # the rows as drawn (opaque, over the black background), and the screen Surface it was made for
+        self.layer: pygame.Surface | None = None
+        self.layer_screen: pygame.Surface | None = None
+
+        gw.swap_level([], gw.level_name, gw.level_seed)
+        gw.brick_field = self
+        for _ in range(ENDLESS_START_ROWS):
+            self.add_row()
+
+    def add_row(self) -> list[WorldObject]:
+        """
+        Stream in the next row at the top, shifting the others down a row
+
+        :return: any row pushed off the bottom (empty if none)
+        """
+        new_row = next(self.row_source)
+        for row in self.rows:
+            for wo in row:
+                wo.rect.y += ENDLESS_ROW_PITCH
+        for wo in new_row:
+            wo.rect.y = ENDLESS_TOP_Y
+        self.rows.appendleft(new_row)
+        self.rows_streamed += 1
+        self.brick_count += sum(1 for wo in new_row if isinstance(wo, Brick))
+
+        if self.layer is not None:
+            # the rows already drawn just move down, leaving the new row's band to draw
+            self.layer.scroll(0, ENDLESS_ROW_PITCH)
+            self.layer.fill(BLACK, (0, ENDLESS_TOP_Y, WIDTH, ENDLESS_ROW_PITCH))
+            for wo in new_row:
+                wo.draw_wo(self.layer)
+
+        if len(self.rows) <= ENDLESS_MAX_ROWS:
+            return []
+        # (already scrolled off the bottom of the layer)
+        dropped = self.rows.pop()
+        self.brick_count -= sum(1 for wo in dropped if isinstance(wo, Brick))
+        self.rows_dropped += 1
+        return dropped
+
+    def query(self, rect: pygame.Rect) -> list[WorldObject]:
+        """
+        The broadphase: the objects in just the rows the rect overlaps
+
+        :param rect: e.g. the Ball's
+        :return: those rows' objects
+        """
+        first = max((rect.top - ENDLESS_TOP_Y) // ENDLESS_ROW_PITCH, 0)
+        last = min((rect.bottom - 1 - ENDLESS_TOP_Y) // ENDLESS_ROW_PITCH, len(self.rows) - 1)
+        if first > last:
+            return []
+        if first == last:
+            return self.rows[first]
+        return [wo for row_num in range(first, last + 1) for wo in self.rows[row_num]]
+
+    def remove(self, wo: WorldObject) -> bool:
+        """
+        Remove a destroyed brick from its row (and from the drawn layer)
+
+        :param wo: the object
+        :return: whether it was in the field
+        """
+        row_num = (wo.rect.y - ENDLESS_TOP_Y) // ENDLESS_ROW_PITCH
+        if (not 0 <= row_num < len(self.rows)) or (wo not in self.rows[row_num]):
+            return False
+        self.rows[row_num].remove(wo)
+        if isinstance(wo, Brick):
+            self.brick_count -= 1
+        if self.layer is not None:
+            self.layer.fill(BLACK, wo.rect)
+        return True
+
+    def redraw(self, wo: WorldObject) -> None:
+        """
+        Redraw a changed (e.g. damaged) object in the drawn layer
+
+        :param wo: the object
+        :return:
+        """
+        if self.layer is not None:
+            self.layer.fill(BLACK, wo.rect)
+            wo.draw_wo(self.layer)
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """
+        Draw the rows - the whole layer is only rendered the first time (and for a new screen), then just blitted
+
+        :param screen: the screen
+        :return:
+        """
+        if self.layer_screen is not screen:
+            self.layer = pygame.Surface((WIDTH, ENDLESS_TOP_Y + (ENDLESS_MAX_ROWS * ENDLESS_ROW_PITCH)), 0, screen)
+            self.layer_screen = screen
+            self.layer.fill(BLACK)
+            for row in self.rows:
+                for wo in row:
+                    wo.draw_wo(self.layer)
+        screen.blit(self.layer, (0, 0))
+
+    def update(self, elapsed_ms: int, gs: GameState, ps: PlayerState, lb: Leaderboard) -> None:
+        """
+        Stream in a row when it's time, or right away if the field's been cleared, going up a level every
+        ENDLESS_ROWS_PER_LEVEL rows and taking a life for bricks pushed off the bottom
+
+        :param elapsed_ms: the frame's time
+        :param gs: GameState
+        :param ps: PlayerState
+        :param lb: Leaderboard, for whether a finished run gets a high score
+        :return:
+        """
+        self.next_row_ms -= elapsed_ms
+        if (self.brick_count > 0) and (self.next_row_ms > 0):
+            return
+
+        dropped = self.add_row()
+        level = 1 + ((self.rows_streamed - ENDLESS_START_ROWS) // ENDLESS_ROWS_PER_LEVEL)
+        if level != ps.level:
+            ps.level = level
+            self.speed_up_ball(gs, ps)
+        self.next_row_ms = get_row_interval(ps.level)
+
+        if any(isinstance(wo, Brick) for wo in dropped):
+            utils.lose_life(gs, ps, lb)
+
+    def speed_up_ball(self, gs: GameState, ps: PlayerState) -> None:
+        """
+        Set the Ball to the level's speed, as for a new level (but without interrupting the play) - still slowed by
+        a running SLOW_BALL power-up, which puts the level's speed back when it ends
+
+        :param gs: GameState
+        :param ps: PlayerState
+        :return:
+        """
+        for wo in self.gw.world_objects:
+            if isinstance(wo, Ball):
+                wo.speed_v = (BALL_SPEED_VECTOR + (ps.level * BALL_SPEED_LEVEL_INCREMENT)) * gs.ball_speed_scale
+                gs.ball_speed_increased_ratio = wo.speed_v / BALL_SPEED_VECTOR
+                wo.v_vel = wo.v_vel_unit * wo.speed_v
+                wo.speed = (BALL_SPEED_SIMPLE + (ps.level * BALL_SPEED_LEVEL_INCREMENT)) * gs.ball_speed_scale
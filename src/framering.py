@@ -0,0 +1,100 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: A ring buffer of fixed-size frames in multiprocessing.shared_memory, so a worker process
+                        can publish rendered frames that other processes read in place.  The header holds the count
+                        of frames published, and frame n lives in slot n % slots, so the latest slots frames can be
+                        read back (e.g. for frame stacking).  There's no locking: one process publishes, and the
+                        readers only read frames the publisher is done with (the SubprocVectorEnv lockstep).
+
+                        A FrameRing pickles as its shared memory name, so it can be handed to a spawned worker.
+"""
+
+import struct
+from multiprocessing import shared_memory
+
+import constants
+
+HEADER: struct.Struct = struct.Struct('<Q')  # frames published so far
+
+
+class FrameRing:
+    """ Fixed-size frames in a shared memory ring """
+
+    def __init__(self, frame_size: int, slots: int = constants.FRAME_RING_SLOTS, name: str = None) -> None:
+        """
+        :param frame_size: bytes per frame
+        :param slots: how many frames the ring holds
+        :param name: attach to this existing ring, else create a new one
+        """
+        self.frame_size: int = frame_size
+        self.slots: int = slots
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=HEADER.size + (slots * frame_size))
+            HEADER.pack_into(self.shm.buf, 0, 0)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name: str = self.shm.name
+
+    def __reduce__(self):
+        """
+        Pickle as the name, attaching to the same shared memory when unpickled
+
+        :return:
+        """
+        return FrameRing, (self.frame_size, self.slots, self.name)
+
+    def get_count(self) -> int:
+        """
+        :return: how many frames have been published
+        """
+        return HEADER.unpack_from(self.shm.buf, 0)[0]
+
+    def publish(self, frame) -> int:
+        """
+        Copy the frame into the next slot, then count it as published
+
+        :param frame: frame_size bytes (any buffer, e.g. a PixelRenderer view)
+        :return: the frame's number
+        """
+        count = self.get_count()
+        offset = HEADER.size + ((count % self.slots) * self.frame_size)
+        self.shm.buf[offset:offset + self.frame_size] = frame
+        HEADER.pack_into(self.shm.buf, 0, count + 1)
+        return count
+
+    def get_frame(self, number: int = None) -> memoryview:
+        """
+        A published frame, in place (it's overwritten slots frames later)
+
+        :param number: the frame's number (default the latest)
+        :return: a view of the frame's bytes
+        """
+        count = self.get_count()
+        if number is None:
+            number = count - 1
+        if not (max(0, count - self.slots) <= number < count):
+            raise IndexError(f"frame {number} isn't in the ring (frames {max(0, count - self.slots)} to {count - 1})")
+        offset = HEADER.size + ((number % self.slots) * self.frame_size)
+        return self.shm.buf[offset:offset + self.frame_size]
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory (any views of its frames must be released first)
+
+        :return:
+        """
+        self.shm.close()
+
+    def unlink(self) -> None:
+        """
+        Free the shared memory (by its creator, once every process is done with it)
+
+        :return:
+        """
+        self.shm.unlink()
@@ -7,39 +7,59 @@
     Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
 
     Module Description: This brings together the various modules that make up the game (GameWorld,
-                        GameState, UI, etc.) and runs the main game loop.
+                        GameState, UI, etc.) and runs the main game loop.  The collision handling, the main loop
+                        itself, the other game modes, and the save states are mixed in from collisions.py,
+                        gameloop.py, gamemodes.py, and savestates.py.
 """
 
+from datetime import datetime
 from sys import exit
+from time import perf_counter_ns
 import pygame
 
 import utils
 import persistence
 import assets
-from animation import Animation
+import autosave
+import gameevents
+import lasers
+import motionregistry
+import powerups
+import presenter
+import telemetry
+from animationpool import AnimationPool
 from ball import Ball
 from brick import Brick
+from collisions import CollisionHandler
+from gameloop import GameLoopMixin
+from gamemodes import GameModesMixin
+from gameevents import GameEventType
 from gamesettings import GameSettings
 from leveltheme import LevelTheme
 from paddle import Paddle
+from paddleinput import PaddleInput
+from worldobject import WorldObject
 from constants import (WIDTH, HEIGHT, INITIAL_FPS_SIMPLE, GAME_NAME,
                        PAD_WIDTH, START_LIVES, START_SCORE, BALL_SPEED_VECTOR, BALL_SPEED_SIMPLE,
                        BALL_SPEED_LEVEL_INCREMENT, BLACK, SPLASH_TIME_SECS,
                        PADDLE_IMPULSE_INCREMENT, WORLD_GRAVITY_ACC_INCREMENT,
-                       BALL_SPEED_STEP_INCREMENT, MAX_FPS_VECTOR, SCORE_INITIALS_MAX,
+                       BALL_SPEED_STEP_INCREMENT, SCORE_INITIALS_MAX,
                        MUSIC_VOLUME_STEP, SLIDER_WIDTH, KNOB_RADIUS, LIGHT_GRAY, SFX_VOLUME_STEP, CLOSE_TO_ZERO,
                        SHAKE_OFFSET_BASE, SHAKE_STRENGTH_THRESHOLD, LEVEL_CLEARED_DURATION,
-                       LEVEL_CLEARED_SHAKE_MAGNITUDE)
+                       LEVEL_CLEARED_SHAKE_MAGNITUDE, PROFILER_DUMP_FILENAME, LEADERBOARD_VISIBLE_ROWS)
 from levels import Levels
+from levelprebuilder import LevelPrebuilder
+from profiler import FrameProfiler
+from savestates import SaveStatesMixin
+from sfxplayer import SfxPlayer
 from gameworld import GameWorld
 from userinterface import UserInterface
 from playerstate import PlayerState
 from leaderboard import Leaderboard
 from gamestate import GameState
-from motionmodels import MotionModels
 
 
-class GameEngine:
+class GameEngine(CollisionHandler, GameModesMixin, GameLoopMixin, SaveStatesMixin):
     """ The main engine that drives the game loop """
 
     def __init__(self, lb: Leaderboard, ps: PlayerState, gw: GameWorld, gs: GameState, gset: GameSettings, ui: UserInterface) -> None:
@@ -86,6 +106,41 @@ class GameEngine:
         self.current_music_path = None
         self.dragging_bgm_slider = False
         self.dragging_sfx_slider = False
+        # set by run_loop_async(), which awaits the end of the shutdown (see clean_shutdown())
+        self.defer_shutdown: bool = False
+
+        # builds the next level in the background while the level-cleared animation plays
+        self.level_prebuilder: LevelPrebuilder = LevelPrebuilder()
+
+        # per-subsystem frame timings for the dev overlay (and CTRL+t dumps)
+        self.profiler: FrameProfiler = FrameProfiler()
+
+        # the (reacting object, other object) pairs touching now - a pair only reacts when the contact begins,
+        # then is latched until they separate
+        self.contacts: set[tuple[WorldObject, WorldObject]] = set()
+
+        # the Animation effects, kept out of gw.world_objects so they're never collision tested
+        self.animations: AnimationPool = AnimationPool()
+
+        # the released power-ups' falling capsules and timed effects (see powerups.py)
+        self.power_ups: powerups.PowerUps = powerups.PowerUps(self.contacts)
+        # the LASER power-up's shots in flight (see lasers.py)
+        self.lasers: lasers.LaserPool = lasers.LaserPool()
+
+        # drains the frame's mouse/key input for the paddle ahead of the physics step
+        self.paddle_input: PaddleInput = PaddleInput()
+
+        # voices the GameEvents emitted by the physics step (starting from an empty event bus)
+        self.sfx_player: SfxPlayer = SfxPlayer()
+        gameevents.clear()
+
+        # the level's first frame for the CTRL+r instant retry, and the run offered to resume (see savestates.py)
+        self.level_start_snapshot = None
+        self.resume_data = None
+
+        # the two player match and spectator broadcast, once started (see gamemodes.py)
+        self.versus = None
+        self.broadcaster = None
 
     def reset_game(self) -> None:
         """
@@ -93,9 +148,16 @@ class GameEngine:
         
         :return:
         """
+        self.level_prebuilder.cancel()
+        gameevents.clear()
+        self.animations.clear()
+        self.contacts.clear()
+        self.power_ups.reset(self.gs)
+        self.lasers.clear()
         # does python run auto garbage collection so it's OK to just
         # assign a new gw?
         self.gw = GameWorld(self.ps.theme)
+        telemetry.begin_level(Levels.get_level_name_from_num(self.ps.theme, 1))
         self.fps = INITIAL_FPS_SIMPLE
         self.gs.cur_state = GameState.GameStateName.READY_TO_LAUNCH
         self.gs.cur_ball_x = (WIDTH // 2) - (PAD_WIDTH // 2)
@@ -103,6 +165,7 @@ class GameEngine:
         self.ps.score = START_SCORE
         self.ps.level = 1
         self.gs.level_cleared = False
+        self.level_start_snapshot = None
         pygame.mouse.set_visible(False)  # Hide the cursor when game restarts
         pygame.mixer.music.stop()
         self.current_music_path = None
@@ -115,8 +178,19 @@ class GameEngine:
         
         :return:
         """
-        self.gw.remove_obstacles()
-        self.gw.remove_bricks()
+        # the power-ups end with the level (before the ball speed is reset)
+        self.power_ups.clear(self.gw, self.gs)
+        self.lasers.clear()
+
+        next_level = Levels.get_level_name_from_num(self.ps.theme, self.ps.level)
+        # use the pre-built level if it's the one wanted, otherwise build it now
+        prebuilt_objects = self.level_prebuilder.take(next_level)
+        if prebuilt_objects is not None:
+            self.gw.swap_level(prebuilt_objects, next_level, self.level_prebuilder.seed)
+        else:
+            # builds the next level (NOTE this doesn't actually increment the level num)
+            self.gw.build_level(next_level)
+        telemetry.begin_level(next_level)
 
         for wo in self.gw.world_objects:
             if isinstance(wo, Ball):
@@ -125,10 +199,9 @@ class GameEngine:
                 self.gs.ball_speed_increased_ratio = wo.speed_v / BALL_SPEED_VECTOR
                 wo.v_vel = wo.v_vel_unit * wo.speed_v
                 wo.speed = BALL_SPEED_SIMPLE + (self.ps.level * BALL_SPEED_LEVEL_INCREMENT)
-        # builds the next level (NOTE this doesn't actually increment the level num)
-        next_level = Levels.get_level_name_from_num(self.ps.theme, self.ps.level)
-        Levels.build_level(self.gw.world_objects, next_level)
         self.gs.level_cleared = False
+        self.contacts.clear()
+        self.level_start_snapshot = None
 
         self.fps = INITIAL_FPS_SIMPLE
         self.gs.cur_state = GameState.GameStateName.READY_TO_LAUNCH
@@ -140,22 +213,26 @@ class GameEngine:
         :return:
         """
 
-        # best to quit and then start fresh with set_mode() (helps avoid the exception with failed renderer
-        # from using SCALED flag)
+        # best to quit and then start fresh with set_mode()
         pygame.display.quit()
 
-        try:
-            # create the FULLSCREEN with SCALED flag to fix the slightly off-center display
-            self.screen = pygame.display.set_mode((WIDTH, HEIGHT),
-                                                  flags=0 if not self.gset.is_fullscreen else (pygame.FULLSCREEN | pygame.SCALED) )
-        except Exception as ex:
-            # if problem with renderer, just exclude the SCALED flag as a fallback
-            pygame.display.quit()
-            self.screen = pygame.display.set_mode((WIDTH, HEIGHT),
-                                                  flags=0 if not self.gset.is_fullscreen else pygame.FULLSCREEN)
+        # the game always draws into the logical WIDTH x HEIGHT backbuffer, which the presenter fits to the
+        # fullscreen display's (or resized window's) actual size
+        self.use_backbuffer(presenter.set_mode(self.gset.is_fullscreen))
+        pygame.display.set_caption(GAME_NAME)
 
+    def use_backbuffer(self, backbuffer: pygame.Surface) -> None:
+        """
+        Draw into this backbuffer from now on
+
+        :param backbuffer: from the presenter
+        :return:
+        """
+        self.screen = backbuffer
         self.ui.screen = self.screen
-        pygame.display.set_caption(GAME_NAME)
+        # the cached screens and images were converted to the old display's format
+        self.ui.invalidate_static_screens()
+        assets.clear_prepared_images()
 
     def draw_world_and_status(self) -> None:
         """
@@ -172,30 +249,59 @@ class GameEngine:
         # right
         pygame.draw.line(self.screen, LIGHT_GRAY, (WIDTH - 1, 0), (WIDTH - 1, HEIGHT - 1), thickness)
 
+        # draw the endless mode's rows of bricks (from their cached layer)
+        if self.gw.brick_field is not None:
+            self.gw.brick_field.draw(self.screen)
+
         # draw every game object
         for world_object in self.gw.world_objects:
             world_object.draw_wo(self.screen)
+        self.power_ups.draw(self.screen)
+        self.lasers.draw(self.screen)
+        self.animations.draw(self.screen)
 
-        # get the shake offset and draw the shifted screen
+        # get the shake offset and shift the screen in place (same result as blitting the screen onto itself, but
+        # without the full-screen copy)
         if self.gs.shake_screen_brick:
             shake_offset = utils.get_shaking_offset(self.gs)
-            self.screen.blit(self.screen, shake_offset)
+            self.screen.scroll(*shake_offset)
 
         # draw any status overlays
         self.ui.draw_status(self.ps.lives, self.ps.score, self.ps.level)
 
     def clean_shutdown(self) -> None:
+        """
+        Stop the game, store the leaderboard and settings, and quit - under run_loop_async(), the loop ends first and
+        the rest is awaited by clean_shutdown_async()
+
+        :return:
+        """
         pygame.mixer.music.stop()
         self.current_music_path = None
         self.gs.running = False
         self.gs.cur_state = GameState.GameStateName.GAME_OVER
 
+        # record the level in progress, if telemetry is on
+        telemetry.end_level(False)
+
+        if self.defer_shutdown:
+            return
+
         # store leaderboard
         self.lb.store(persistence.LEADERBOARD_FILENAME)
         self.gset.store(persistence.SETTINGS_FILENAME)
+        self.finish_shutdown()
+        exit()
+
+    def finish_shutdown(self) -> None:
+        """
+        Wait for the background writes, then quit pygame
 
+        :return:
+        """
+        telemetry.wait()
+        autosave.wait()
         pygame.quit()
-        exit()
 
     def play_music(self):
         """
@@ -256,7 +362,9 @@ class GameEngine:
                 pygame.mouse.set_visible(True)
                 for event in events:
                     if event.type == pygame.MOUSEBUTTONDOWN:
-                        if self.ui.start_classic_button_rect.collidepoint(event.pos):
+                        if (self.resume_data is not None) and self.ui.resume_button_rect.collidepoint(event.pos):
+                            self.resume_game()
+                        elif self.ui.start_classic_button_rect.collidepoint(event.pos):
                             self.ps.theme = LevelTheme.CLASSIC
                             self.reset_game()
                             self.gs.cur_state = GameState.GameStateName.READY_TO_LAUNCH
@@ -264,6 +372,10 @@ class GameEngine:
                             self.ps.theme = LevelTheme.MODERN
                             self.reset_game()
                             self.gs.cur_state = GameState.GameStateName.READY_TO_LAUNCH
+                        elif self.ui.versus_button_rect.collidepoint(event.pos):
+                            self.start_versus()
+                        elif self.ui.endless_button_rect.collidepoint(event.pos):
+                            self.start_endless()
                         elif self.ui.credits_button_rect.collidepoint(event.pos):
                             self.gs.cur_state = GameState.GameStateName.CREDITS
                         elif self.ui.settings_button_rect.collidepoint(event.pos):
@@ -306,7 +418,20 @@ class GameEngine:
                 for event in events:
                     if event.type == pygame.MOUSEBUTTONDOWN:
                         if self.ui.back_button_rect.collidepoint(event.pos):
+                            self.ui.leaderboard_first_row = 0
                             self.gs.cur_state = GameState.GameStateName.MENU_SCREEN
+                    elif event.type == pygame.MOUSEWHEEL:
+                        self.ui.scroll_leaderboard(-event.y, self.lb)
+                    elif event.type == pygame.KEYDOWN:
+                        match event.key:
+                            case pygame.K_UP:
+                                self.ui.scroll_leaderboard(-1, self.lb)
+                            case pygame.K_DOWN:
+                                self.ui.scroll_leaderboard(1, self.lb)
+                            case pygame.K_PAGEUP:
+                                self.ui.scroll_leaderboard(-LEADERBOARD_VISIBLE_ROWS, self.lb)
+                            case pygame.K_PAGEDOWN:
+                                self.ui.scroll_leaderboard(LEADERBOARD_VISIBLE_ROWS, self.lb)
 
             ##############################################################
             # display settings screen
@@ -406,9 +531,7 @@ class GameEngine:
                 # check for a changed SFX volume, if so, play a sample sound
                 ##########################
                 if abs(self.gset.sfx_volume - old_sfx_vol) > CLOSE_TO_ZERO:
-                    snd: pygame.mixer.Sound = pygame.mixer.Sound(assets.PADDLE_SFX)
-                    snd.set_volume(self.gset.sfx_volume)
-                    pygame.mixer.find_channel(True).play(snd)
+                    self.sfx_player.play(assets.PADDLE_SFX, self.gset.sfx_volume)
 
             ##############################################################
             # display the PLAYING gameplay screen
@@ -416,17 +539,33 @@ class GameEngine:
             case GameState.GameStateName.PLAYING | GameState.GameStateName.READY_TO_LAUNCH:
                 # Hide the mouse again when transitioning away from the start screen.
                 pygame.mouse.set_visible(False)
+
+                # keep the level's first frame for the CTRL+r instant retry (not for the endless mode, which has
+                # no levels to retry)
+                if (self.level_start_snapshot is None) and (self.gw.brick_field is None):
+                    self.level_start_snapshot = self.snapshot()
+
                 # update all objects in GameWorld
 
-                mouse_pos = pygame.mouse.get_pos()
+                # drain this frame's mouse/key input before the physics step, so it moves the paddle this frame
+                self.profiler.begin('input')
+                mouse_x = self.paddle_input.sample(events, self.gs, self.gset, perf_counter_ns())
+                self.profiler.end('input')
+
+                if self.gs.cur_state == GameState.GameStateName.PLAYING:
+                    telemetry.add_play_time(self.gs.tick_time)
 
                 if self.gset.paddle_under_auto_control:
                     # detect mouse motion, since that should shift paddle control from keys back to the mouse
-                    if mouse_pos[0] != self.gs.last_mouse_pos_x:
+                    if mouse_x != self.gs.last_mouse_pos_x:
                         # mouse is moving
                         self.gset.paddle_under_mouse_control = True
 
-                self.gs.last_mouse_pos_x = mouse_pos[0]
+                self.gs.last_mouse_pos_x = mouse_x
+
+                # stream in the endless mode's rows
+                if (self.gw.brick_field is not None) and (self.gs.cur_state == GameState.GameStateName.PLAYING):
+                    self.gw.brick_field.update(self.gs.tick_time, self.gs, self.ps, self.lb)
 
                 for current_wo in self.gw.world_objects:
 
@@ -436,7 +575,7 @@ class GameEngine:
                         if self.gs.auto_play:
                             current_wo.commanded_pos_x = self.gs.cur_ball_x
                         elif self.gset.paddle_under_mouse_control:
-                            current_wo.commanded_pos_x = mouse_pos[0]
+                            current_wo.commanded_pos_x = mouse_x
                             if self.gset.paddle_under_auto_control:
                                 self.gset.paddle_under_mouse_control = False
 
@@ -449,18 +588,35 @@ class GameEngine:
                     # test for collisions between world_objects, but ignore
                     # objects that can't be affected (for performance)
                     if current_wo.can_react:
-                        for other_wo in self.gw.world_objects:
-                            # don't check for collisions with self
-                            if current_wo is not other_wo:
-                                self.handle_collisions_between_worldobjects(current_wo, other_wo)
+                        self.profiler.begin('collision')
+                        self.handle_collisions_for(current_wo)
+                        self.profiler.end('collision')
+
+                # the Animations just play out, returning to the pool when done
+                self.animations.update(self.gs, self.ps, self.lb, self.gset)
+
+                # the power-up capsules fall and the timed effects run out, and the laser shots fly - and a lost
+                # ball ends them all
+                if self.gs.cur_state == GameState.GameStateName.READY_TO_LAUNCH:
+                    if self.power_ups.is_active():
+                        self.power_ups.clear(self.gw, self.gs)
+                    self.lasers.clear()
+                else:
+                    self.power_ups.update(self.gw, self.gs)
+                    self.profiler.begin('collision')
+                    self.lasers.update(self.gw, self.gs, self.apply_hit)
+                    self.profiler.end('collision')
 
-                    # remove the Animation object from world if it's run its course
-                    if isinstance(current_wo, Animation):
-                        if current_wo.should_remove():
-                            self.gw.world_objects.remove(current_wo)
+                # let the audio, shake, and scoring systems consume this step's events
+                self.dispatch_game_events()
+
+                # hand a snapshot of the run to the background autosave, when it's due
+                self.autosave_run()
 
                 # draw all objects in GameWorld
+                self.profiler.begin('draw')
                 self.draw_world_and_status()
+                self.profiler.end('draw')
 
                 # note this is the way the player enters the gameplay
                 # screen, in a pending, ready to launch mode, with the
@@ -469,22 +625,37 @@ class GameEngine:
                     self.ui.draw_game_intro()
 
                 # set latch to ignore ball below screen once all Bricks cleared (mostly so that Animations
-                # can complete without penalty if the player stops reflecting the Ball)
-                if (not self.gs.level_cleared) and (not any(isinstance(wo, Brick) for wo in self.gw.world_objects)):
+                # can complete without penalty if the player stops reflecting the Ball) - the endless mode's field
+                # is never cleared, it just streams in more rows
+                if ((self.gw.brick_field is None) and (not self.gs.level_cleared) and
+                        (not any(isinstance(wo, Brick) for wo in self.gw.world_objects))):
                     # add a level-cleared animation
-                    self.gw.world_objects.append(Animation(LEVEL_CLEARED_DURATION,
-                                                           (0, 0, WIDTH, HEIGHT),
-                                                           BLACK, fade=True, is_lvl_clr_msg=True))
+                    self.animations.spawn(LEVEL_CLEARED_DURATION, (0, 0, WIDTH, HEIGHT),
+                                          BLACK, fade=True, is_lvl_clr_msg=True)
                     # trigger the big, final brick cleared shake
-                    utils.start_shake(self.gs, LEVEL_CLEARED_SHAKE_MAGNITUDE)
+                    gameevents.emit(GameEventType.LEVEL_CLEARED)
 
                     self.gs.level_cleared = True
+                    telemetry.end_level(True)
+
+                    # start building the next level while the level-cleared animation plays
+                    self.level_prebuilder.start(Levels.get_level_name_from_num(self.ps.theme, self.ps.level + 1))
+
+                # spread the pre-built level's Surface/Font creation across the animation frames
+                if self.gs.level_cleared:
+                    self.level_prebuilder.step()
 
                 # don't advance to the next level until all bricks are gone AND animations have completed
-                if self.gs.level_cleared and (not any(isinstance(wo, Animation) for wo in self.gw.world_objects)):
+                if self.gs.level_cleared and (not self.animations.is_playing()):
                     self.ps.level += 1
                     self.next_level()
 
+            ##############################################################
+            # display the two player VERSUS match
+            ##############################################################
+            case GameState.GameStateName.VERSUS:
+                self.run_versus_frame(events)
+
             ##############################################################
             # display the PAUSED popup over the frozen gameplay
             ##############################################################
@@ -513,6 +684,8 @@ class GameEngine:
                 # getting the rects for the UI buttons for later collision
                 # detection (button pressing)
                 self.high_score_enter_btn = self.ui.draw_get_high_score()
+                # the run is over, so there's nothing to resume
+                autosave.discard()
 
             ##############################################################
             # display the GAME_OVER popup over the frozen gameplay
@@ -523,52 +696,42 @@ class GameEngine:
                 # getting the rects for the UI buttons for later collision
                 # detection (button pressing)
                 self.restart_game_button, self.main_menu_button, self.quit_game_button = self.ui.draw_game_over_menu()
+                autosave.discard()
 
-    def handle_collisions_between_worldobjects(self, current_wo, other_wo):
+    def dispatch_game_events(self) -> None:
         """
-        Handle collisions between world objects
-        :param current_wo:
-        :param other_wo:
+        Consume the GameEvents emitted since the last call - voices the sounds (each at most once), adds up the
+        score, and starts the strongest shake requested
+
         :return:
         """
-        if current_wo.rect.colliderect(other_wo.rect):
-            # a collision was detected - should we react to it?  this matters because two
-            # objects can overlap/collide across multiple looping collision checks - if
-            # we don't deactivate the collision detection, the object can bounce back and
-            # forth, getting trapped
-            if other_wo.allow_collision():
-                # bounce object properly -
-                # determining in which direction
-                # to bounce, based on approach
-                current_wo.detect_collision(other_wo, self.gs, self.gset)
-                other_wo.add_collision(self.gset)
-                if other_wo.should_score():
-                    self.ps.score += other_wo.value
-                if other_wo.should_remove():
-                    self.ps.score += other_wo.bonus
-
-                    # trigger the special effect - the Brick adds the appropriate Animation object to the world
-                    other_wo.trigger_destruction_effect(self.gw.world_objects, self.gset, self.ps)
-
-                    # if this Brick is strong enough for the shake, get that started
-                    if other_wo.strength_initial >= SHAKE_STRENGTH_THRESHOLD:
-                        utils.start_shake(self.gs, other_wo.strength_initial * SHAKE_OFFSET_BASE)
-
-                    # now remove the actual Brick object
-                    self.gw.world_objects.remove(other_wo)
-
-                    current_wo.speed += .20
-                    # BALL_SPEED_STEP: adding to the ball speed, but diff logic for the
-                    # VECTOR models
-                    if isinstance(current_wo, Ball):
-                        current_wo.speed_v += self.gs.ball_speed_step
-                        self.gs.ball_speed_increased_ratio = current_wo.speed_v / BALL_SPEED_VECTOR
-                        current_wo.v_vel = current_wo.v_vel_unit * current_wo.speed_v
+        events = gameevents.drain()
+        if not events:
+            return
 
-        else:
-            # this is the other side of the allow_collision logic above, since
-            # not colliding now, it resets the latch or 'primed for collision' flag
-            other_wo.prime_for_collision()
+        self.sfx_player.play_events(events, self.gset.sfx_volume)
+
+        shake_strength: int = 0
+        for event in events:
+            self.ps.score += event.points
+            match event.event_type:
+                case GameEventType.BRICK_DESTROYED:
+                    # if this Brick was strong enough for the shake, get that started
+                    if event.strength >= SHAKE_STRENGTH_THRESHOLD:
+                        shake_strength = max(shake_strength, event.strength * SHAKE_OFFSET_BASE)
+                case GameEventType.LEVEL_CLEARED:
+                    shake_strength = max(shake_strength, LEVEL_CLEARED_SHAKE_MAGNITUDE)
+                case GameEventType.WALL_HIT_LEFT:
+                    telemetry.record_wall_bounce(telemetry.WALL_LEFT)
+                case GameEventType.WALL_HIT_RIGHT:
+                    telemetry.record_wall_bounce(telemetry.WALL_RIGHT)
+                case GameEventType.WALL_HIT_TOP:
+                    telemetry.record_wall_bounce(telemetry.WALL_TOP)
+                case _:
+                    pass
+
+        if shake_strength > 0:
+            utils.start_shake(self.gs, shake_strength)
 
     def handle_events(self, events):
         ##############################################################
@@ -578,6 +741,10 @@ class GameEngine:
             if event.type == pygame.QUIT:
                 self.clean_shutdown()
 
+            # the window was resized, so re-fit the backbuffer to it
+            if event.type == pygame.VIDEORESIZE:
+                self.use_backbuffer(presenter.resize())
+
             if event.type == pygame.KEYDOWN:
                 # toggle PAUSE GameState with ESCAPE key press
                 if event.key == pygame.K_ESCAPE:
@@ -595,6 +762,9 @@ class GameEngine:
                 if event.key == pygame.K_SPACE:
                     if self.gs.cur_state == GameState.GameStateName.READY_TO_LAUNCH:
                         self.gs.cur_state = GameState.GameStateName.PLAYING
+                    elif self.gs.cur_state == GameState.GameStateName.PLAYING:
+                        # launch any ball held by the STICKY_PADDLE power-up
+                        self.power_ups.launch_caught_balls()
 
                 # detect the CTRL+d key combo to toggle the dev overlay
                 # calculation and display
@@ -644,11 +814,7 @@ class GameEngine:
                 # detect the CTRL+m key combo to cycle through the various motion models
                 if event.key == pygame.K_m:
                     if event.mod & pygame.KMOD_CTRL:
-                        match self.gs.motion_model:
-                            case MotionModels.SIMPLE_1:
-                                self.gs.motion_model = MotionModels.VECTOR_1
-                            case MotionModels.VECTOR_1:
-                                self.gs.motion_model = MotionModels.SIMPLE_1
+                        self.gs.motion_model = motionregistry.get_next_model_name(self.gs.motion_model)
 
                 # detect the CTRL+'=' and CTRL+'-' key combos to adjust music volume
                 if event.key == pygame.K_EQUALS:
@@ -663,9 +829,7 @@ class GameEngine:
 
                             # check for a changed SFX volume, if so, play a sample sound
                             if (self.gs.cur_state == GameState.GameStateName.SETTINGS) and (abs(self.gset.sfx_volume - old_sfx_vol) > CLOSE_TO_ZERO):
-                                snd: pygame.mixer.Sound = pygame.mixer.Sound(assets.PADDLE_SFX)
-                                snd.set_volume(self.gset.sfx_volume)
-                                pygame.mixer.find_channel(True).play(snd)
+                                self.sfx_player.play(assets.PADDLE_SFX, self.gset.sfx_volume)
 
                         else:
                             self.gset.bgm_sounds = True
@@ -687,9 +851,7 @@ class GameEngine:
 
                             # check for a changed SFX volume, if so, play a sample sound
                             if (self.gs.cur_state == GameState.GameStateName.SETTINGS) and (abs(self.gset.sfx_volume - old_sfx_vol) > CLOSE_TO_ZERO):
-                                snd: pygame.mixer.Sound = pygame.mixer.Sound(assets.PADDLE_SFX)
-                                snd.set_volume(self.gset.sfx_volume)
-                                pygame.mixer.find_channel(True).play(snd)
+                                self.sfx_player.play(assets.PADDLE_SFX, self.gset.sfx_volume)
 
                         else:
                             self.gset.music_volume -= MUSIC_VOLUME_STEP
@@ -698,12 +860,25 @@ class GameEngine:
                                 self.gset.bgm_sounds = False
                             pygame.mixer.music.set_volume(self.gset.music_volume)
 
-                # detect the CTRL+l to force-load next level in sequence
-                if event.key == pygame.K_l:
+                # detect the CTRL+t to dump the frame profiler's timings for offline analysis
+                if event.key == pygame.K_t:
                     if event.mod & pygame.KMOD_CTRL:
+                        self.dump_profile()
+
+                # detect the CTRL+l to force-load next level in sequence (the endless mode has no levels to load)
+                if event.key == pygame.K_l:
+                    if (event.mod & pygame.KMOD_CTRL) and (self.gw.brick_field is None):
                         self.ps.level += 1
                         self.next_level()
 
+                # detect the CTRL+r to instantly retry the current level from its start
+                if event.key == pygame.K_r:
+                    if event.mod & pygame.KMOD_CTRL:
+                        if ((self.level_start_snapshot is not None) and
+                                ((self.gs.cur_state == GameState.GameStateName.PLAYING) or
+                                 (self.gs.cur_state == GameState.GameStateName.READY_TO_LAUNCH))):
+                            self.restore(self.level_start_snapshot)
+
                 # handle initials textbox input
                 if self.gs.cur_state == GameState.GameStateName.GET_HIGH_SCORE:
                     if (event.key == pygame.K_RETURN) or (event.key == pygame.K_KP_ENTER):
@@ -719,7 +894,11 @@ class GameEngine:
                     ((self.gs.cur_state == GameState.GameStateName.PAUSED) or
                      (self.gs.cur_state == GameState.GameStateName.GAME_OVER))):
                 if self.restart_game_button.collidepoint(event.pos):
-                    self.reset_game()
+                    # an endless run restarts as another endless run
+                    if self.gw.brick_field is not None:
+                        self.start_endless()
+                    else:
+                        self.reset_game()
                 if self.quit_game_button.collidepoint(event.pos):
                     self.clean_shutdown()
                 if self.main_menu_button.collidepoint(event.pos):
@@ -731,60 +910,12 @@ class GameEngine:
                     self.lb.add_score(self.ps, self.ui)
                     self.gs.cur_state = GameState.GameStateName.GAME_OVER
 
-    def run_loop(self) -> None:
+    def dump_profile(self) -> None:
         """
-        Runs the main game loop
+        Writes the frame profiler's windowed timings to the game data dir as both CSV and JSON
 
         :return:
         """
-
-        while self.gs.running:
-            # fill the screen with black as a good default
-            self.screen.fill(BLACK)
-            self.play_music()
-
-            # get all events from queue for handling
-            events = pygame.event.get()
-
-            self.handle_gamestate(events)
-
-            self.handle_events(events)
-
-            # get the continuously pressed keys, rather than single key press events
-            pressed_keys = pygame.key.get_pressed()
-            if not self.gset.paddle_under_mouse_control or self.gset.paddle_under_auto_control:
-                if pressed_keys[pygame.K_LEFT]:
-                    self.gs.paddle_under_key_control_left = True
-                elif pressed_keys[pygame.K_RIGHT]:
-                    self.gs.paddle_under_key_control_right = True
-
-            # draw the developer overlay, if requested
-            if self.gs.show_dev_overlay:
-                self.ui.draw_dev_overlay(self.gs)
-
-            ##############################################################
-            # update screen
-            ##############################################################
-            pygame.display.flip()
-
-            # choose from the available motion models; note that SIMPLE models
-            # use clock.tick(fps) to force the motion update logic to the
-            # frame rate - VECTOR models decouple the frame rate from the
-            # dT motion logic
-            if self.gs.motion_model == MotionModels.SIMPLE_1:
-                self.gs.tick_time = self.clock.tick(self.fps)
-            elif self.gs.motion_model == MotionModels.VECTOR_1:
-                # removing the fps arg (rather, setting it to 0) allows pygame
-                # to run this loop at full speed
-                # self.gs.tick_time = self.clock.tick(MAX_FPS_VECTOR)
-                self.gs.tick_time = self.clock.tick_busy_loop(MAX_FPS_VECTOR)
-
-            # don't bother calculating these running dev averages unless wanted
-            if self.gs.show_dev_overlay:
-                self.gs.fps_avg, self.gs.loop_time_avg = utils.calculate_timing_averages(self.clock.get_fps(),
-                                                                                         self.clock.get_time())
-
-        ##############################################################
-        # close down cleanly
-        ##############################################################
-        pygame.quit()
+        base_name = f"{PROFILER_DUMP_FILENAME}_{datetime.now():%Y%m%d_%H%M%S}"
+        persistence.store_text(self.profiler.to_csv(), base_name + '.csv')
+        persistence.store_text(self.profiler.to_json(), base_name + '.json')
@@ -0,0 +1,81 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This gameevents.py provides a global/singleton (like utils.py) game-event bus.  The physics
+                        code (Ball, Brick, GameEngine collisions) just emits typed GameEvents here, and the audio,
+                        shake, and scoring systems drain and consume them once per frame.
+"""
+
+from enum import Enum, auto
+
+
+class GameEventType(Enum):
+    """ The kinds of gameplay events the physics step reports """
+
+    WALL_HIT_LEFT = auto()
+    WALL_HIT_RIGHT = auto()
+    WALL_HIT_TOP = auto()
+    PADDLE_HIT = auto()
+    OBSTACLE_BOUNCE = auto()
+    BRICK_DAMAGED = auto()
+    BRICK_DESTROYED = auto()
+    POWER_UP = auto()
+    LEVEL_CLEARED = auto()
+
+
+class GameEvent:
+    """ A single gameplay event with its (optional) payload """
+
+    def __init__(self, event_type: GameEventType, points: int = 0, strength: int = 0, power_up=None) -> None:
+        """
+        :param event_type: GameEventType
+        :param points: score earned by the event
+        :param strength: initial strength of the Brick involved (drives the shake)
+        :param power_up: PowerUpType collected, if any
+        """
+        self.event_type: GameEventType = event_type
+        self.points: int = points
+        self.strength: int = strength
+        self.power_up = power_up
+
+
+# the events emitted since the last drain()
+pending: list[GameEvent] = []
+
+
+def emit(event_type: GameEventType, points: int = 0, strength: int = 0, power_up=None) -> None:
+    """
+    Queue an event for this frame's consumers
+
+    :param event_type: GameEventType
+    :param points: score earned by the event
+    :param strength: initial strength of the Brick involved
+    :param power_up: PowerUpType collected, if any
+    :return:
+    """
+    pending.append(GameEvent(event_type, points, strength, power_up))
+
+
+def drain() -> list[GameEvent]:
+    """
+    Take every queued event, leaving the bus empty
+
+    :return: the events, oldest first
+    """
+    global pending
+    events, pending = pending, []
+    return events
+
+
+def clear() -> None:
+    """
+    Drop any queued events (on reset, level change, etc.)
+
+    :return:
+    """
+    pending.clear()
@@ -0,0 +1,156 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: The GameEngine's main game loop - each frame, and its pacing: clock-paced by the motion model
+                        on the desktop (run_loop()), or as a coroutine for the pygbag/browser build (run_loop_async()),
+                        which yields to the event loop every frame and awaits the end of the shutdown.  It's a mixin,
+                        using the engine's state.
+"""
+
+import asyncio
+from time import perf_counter_ns
+
+import pygame
+
+import motionregistry
+import persistence
+import presenter
+import utils
+from constants import BLACK
+
+
+class GameLoopMixin:
+    """ Mixin running the GameEngine's frames """
+
+    # set by run_loop_async(), which awaits the end of the shutdown (see GameEngine.clean_shutdown())
+    defer_shutdown: bool
+
+    def run_frame(self) -> None:
+        """
+        Runs a single frame of the game loop (everything but the frame pacing)
+
+        :return:
+        """
+        # fill the screen with black as a good default
+        self.screen.fill(BLACK)
+        self.profiler.begin('music')
+        self.play_music()
+        self.profiler.end('music')
+
+        # get all events from queue for handling
+        events = presenter.map_events(pygame.event.get())
+
+        self.profiler.begin('gamestate')
+        self.handle_gamestate(events)
+        self.profiler.end('gamestate')
+
+        self.profiler.begin('events')
+        self.handle_events(events)
+        self.profiler.end('events')
+
+        # send the spectators this frame's changes
+        self.publish_broadcast()
+
+        # draw the developer overlay, if requested
+        if self.gs.show_dev_overlay:
+            self.ui.draw_dev_overlay(self.gs, self.profiler, self.animations, self.paddle_input)
+
+        ##############################################################
+        # update screen
+        ##############################################################
+        self.profiler.begin('flip')
+        presenter.present()
+        self.profiler.end('flip')
+        self.paddle_input.record_present(perf_counter_ns())
+
+    def end_frame(self) -> None:
+        """
+        Closes out the frame's timing stats (after the frame pacing)
+
+        :return:
+        """
+        # don't bother calculating these running dev averages unless wanted
+        if self.gs.show_dev_overlay:
+            self.gs.fps_avg, self.gs.loop_time_avg = utils.calculate_timing_averages(self.clock.get_fps(),
+                                                                                     self.clock.get_time())
+
+        self.profiler.end_frame()
+
+    def get_target_fps(self) -> float:
+        """
+        The frame rate the current motion model runs at
+
+        :return:
+        """
+        target_fps = motionregistry.get_motion_model(self.gs.motion_model).get_target_fps()
+        return self.fps if target_fps is None else target_fps
+
+    def run_loop(self) -> None:
+        """
+        Runs the main game loop
+
+        :return:
+        """
+
+        while self.gs.running:
+            self.run_frame()
+
+            # the motion model paces the frame; note that SIMPLE models
+            # use clock.tick(fps) to force the motion update logic to the
+            # frame rate - VECTOR models decouple the frame rate from the
+            # dT motion logic
+            self.gs.tick_time = motionregistry.get_motion_model(self.gs.motion_model).tick(self.clock, self.get_target_fps())
+
+            self.end_frame()
+
+        ##############################################################
+        # close down cleanly
+        ##############################################################
+        pygame.quit()
+
+    async def run_loop_async(self) -> None:
+        """
+        Runs the main game loop as a coroutine (for the pygbag/browser build) - it yields to the event loop every
+        frame and paces the frames by sleeping rather than busy-waiting
+
+        :return:
+        """
+        # QUIT ends the loop, so the settings/leaderboard are stored by awaitable steps below
+        self.defer_shutdown = True
+        # the browser build has no threads, so the next level is pre-built in steps on this loop
+        self.level_prebuilder.threaded = False
+        frame_start_ns: int = perf_counter_ns()
+
+        while self.gs.running:
+            self.run_frame()
+
+            # sleep off the rest of the frame (always at least a sleep(0), so the event loop gets a turn)
+            frame_ns = 1_000_000_000 / self.get_target_fps()
+            remaining_ns = frame_start_ns + frame_ns - perf_counter_ns()
+            await asyncio.sleep(max(0.0, remaining_ns / 1e9))
+            frame_start_ns = perf_counter_ns()
+
+            self.gs.tick_time = self.clock.tick()
+            self.end_frame()
+
+        ##############################################################
+        # close down cleanly
+        ##############################################################
+        await self.clean_shutdown_async()
+
+    async def clean_shutdown_async(self) -> None:
+        """
+        The end of clean_shutdown() for run_loop_async(), with the stores awaited
+
+        :return:
+        """
+        if self.gs.running:
+            self.clean_shutdown()
+        await self.lb.store_async(persistence.LEADERBOARD_FILENAME)
+        await self.gset.store_async(persistence.SETTINGS_FILENAME)
+        self.finish_shutdown()
@@ -0,0 +1,109 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: The GameEngine's entry points into the other ways to play - the two player versus match,
+                        the versus match linked with another cabinet, the endless run, and the spectator broadcast -
+                        and their per frame steps.  It's a mixin, so the modes' modules stay out of the engine's.
+"""
+
+import pygame
+
+import broadcast
+import endless
+import netplay
+import versus
+from constants import BROADCAST_PORT
+from gamestate import GameState
+from leveltheme import LevelTheme
+
+
+class GameModesMixin:
+    """ Mixin starting and running the GameEngine's other modes - it uses the engine's state and profiler """
+
+    # the two player match, while in the VERSUS GameState
+    versus: versus.VersusMatch | netplay.NetSession | None
+    # streams the game to spectators, once started (see start_broadcast())
+    broadcaster: broadcast.BroadcastServer | None
+    current_music_path: str | None
+
+    def start_versus(self) -> None:
+        """
+        Start a two player versus match (see versus.py) on the first MODERN level
+
+        :return:
+        """
+        self.level_prebuilder.cancel()
+        self.versus = versus.VersusMatch(LevelTheme.MODERN, gset=self.gset)
+        self.gs.cur_state = GameState.GameStateName.VERSUS
+        pygame.mixer.music.stop()
+        self.current_music_path = None
+
+    def start_netplay(self, player: int, remote_host: str) -> None:
+        """
+        Start a versus match linked over UDP with another cabinet (see netplay.py), each cabinet's player steering
+        their own side
+
+        :param player: the local player, 1 (left side) or 2 (right side)
+        :param remote_host: the other cabinet's host name or address
+        :return:
+        """
+        self.level_prebuilder.cancel()
+        self.versus = netplay.NetSession(player, netplay.UdpTransport(remote_host), level_theme=LevelTheme.MODERN,
+                                         gset=self.gset)
+        self.gs.cur_state = GameState.GameStateName.VERSUS
+        pygame.mixer.music.stop()
+        self.current_music_path = None
+
+    def start_endless(self) -> None:
+        """
+        Start an endless run (see endless.py) - rows of MODERN bricks stream in from the top until the lives run out
+
+        :return:
+        """
+        self.ps.theme = LevelTheme.MODERN
+        self.reset_game()
+        endless.EndlessField(self.gw, self.ps.theme)
+        self.gs.cur_state = GameState.GameStateName.READY_TO_LAUNCH
+
+    def start_broadcast(self, port: int = BROADCAST_PORT) -> None:
+        """
+        Stream the game to spectators (see broadcast.py), who connect on the port
+
+        :param port: the TCP port
+        :return:
+        """
+        self.broadcaster = broadcast.BroadcastServer()
+        self.broadcaster.listen(port)
+
+    def run_versus_frame(self, events: list) -> None:
+        """
+        One frame of the VERSUS match, back to the menu once it's over
+
+        :param events: this frame's pygame events
+        :return:
+        """
+        pygame.mouse.set_visible(False)
+        self.profiler.begin('versus')
+        game_events = self.versus.run_frame(events, self.screen, self.gs.tick_time)
+        self.profiler.end('versus')
+        # both worlds' sounds, each at most once a frame
+        self.sfx_player.play_events(game_events, self.gset.sfx_volume)
+        if self.versus.done:
+            self.versus = None
+            self.gs.cur_state = GameState.GameStateName.MENU_SCREEN
+
+    def publish_broadcast(self) -> None:
+        """
+        Send the spectators this frame's changes, if broadcasting
+
+        :return:
+        """
+        if self.broadcaster is not None:
+            self.profiler.begin('broadcast')
+            self.broadcaster.publish(self.gw, self.gs, self.ps)
+            self.profiler.end('broadcast')
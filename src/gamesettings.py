@@ -44,6 +44,17 @@ class GameSettings:
             gset = GameSettings()
         return gset
 
+    @classmethod
+    async def create_persisted_object_async(cls):
+        """
+        Awaitable create_persisted_object() (for the browser build)
+        :return:
+        """
+        gset = await persistence.read_object_async(persistence.SETTINGS_FILENAME)
+        if gset is None:
+            gset = GameSettings()
+        return gset
+
     @classmethod
     def load(cls, filename: str):
         """
@@ -59,4 +70,12 @@ class GameSettings:
         :param filename:
         :return:
         """
-        persistence.store_object(self, filename)
\ No newline at end of file
+        persistence.store_object(self, filename)
+
+    async def store_async(self, filename: str):
+        """
+        Awaitable store() (for the browser build)
+        :param filename:
+        :return:
+        """
+        await persistence.store_object_async(self, filename)
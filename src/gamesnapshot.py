@@ -0,0 +1,287 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Captures the game at an instant (GameWorld + GameState + PlayerState, plus the engine's
+                        contact latches and playing Animations) as a compact bytes snapshot, and restores it.  No
+                        pygame objects are pickled - the snapshot is packed structs of the Ball/Paddle kinematics,
+                        the game/player state, the random module's state, and the level as its LevelName and seed
+                        (see GameWorld.level_seed) plus each level object's presence and strength.  Restoring into
+                        the GameWorld that's still playing that level just re-adds/re-strengthens its own objects,
+                        otherwise the level is rebuilt from its seed first (e.g. in a new process).
+
+                        Used for the instant level retry (CTRL+r), the SmashEnv's look-ahead search, and any
+                        crash recovery.
+"""
+
+import random
+import struct
+from array import array
+
+import pygame
+from pygame import Color, Vector2
+
+import assets
+import utils
+from animationpool import AnimationPool
+from ball import Ball
+from brick import Brick
+from gamestate import GameState
+from gameworld import GameWorld
+from leveltheme import LevelTheme
+from levels import Levels
+from motionmodels import MotionModels
+from obstacle import Obstacle
+from paddle import Paddle
+from playerstate import PlayerState
+
+MAGIC: bytes = b'SCSN'
+VERSION: int = 1
+
+# magic, version, LevelName, level seed, level object count, contact count, Animation count
+HEADER: struct.Struct = struct.Struct('<4sHHIHHH')
+# lives, score, theme, level
+PLAYER: struct.Struct = struct.Struct('<iiBH')
+# cur_state, motion_model, tick_time, gravity unit (x, y), gravity acc (x, y), gravity acc length, paddle impulse,
+# ball speed step, ball speed increased ratio, cur_ball_x, last_mouse_pos_x, level_cleared, shake_screen_brick,
+# shake_strength, shake offset indices (x, y), paddle_pos_x, paddle key control (left, right)
+GAME: struct.Struct = struct.Struct('<BBi2d2d5di??iHHd??')
+# v_pos, v_vel, v_vel_unit, (x, y), speed_v, speed, (dx, dy), rect, wall collision primes (left, right, top),
+# commanded_pos_x, freeze_ball
+BALL: struct.Struct = struct.Struct('<2d2d2d2ddd2i4i???d?')
+# rect, commanded_pos_x, delta_x, prev_x
+PADDLE: struct.Struct = struct.Struct('<4idii')
+# duration, elapsed ms, rect, v_pos, v_vel, v_acc, color (r, g, b), fade, is_ball, is_cleared_msg, images code
+ANIMATION: struct.Struct = struct.Struct('<Ii4i2d2d2d3B???B')
+# random module state version, has a gauss_next, gauss_next (then the generator's 625 words)
+RNG: struct.Struct = struct.Struct('<B?d')
+RNG_WORDS: int = 625
+
+# the Animations' image lists are shared asset lists, recorded by which one
+IMAGES_NONE, IMAGES_BRICK, IMAGES_BALL = 0, 1, 2
+
+# contact latch objects are recorded by these codes (then 2 + the index in the GameWorld's level_objects)
+CODE_BALL, CODE_PADDLE = 0, 1
+
+
+def find_ball_and_paddle(gw: GameWorld) -> tuple[Ball, Paddle]:
+    """
+    :param gw: GameWorld
+    :return: its Ball and Paddle
+    """
+    ball = paddle = None
+    for wo in gw.world_objects:
+        if isinstance(wo, Ball):
+            ball = wo
+        elif isinstance(wo, Paddle):
+            paddle = wo
+        if (ball is not None) and (paddle is not None):
+            break
+    return ball, paddle
+
+
+def get_images_code(images: list | None) -> int:
+    """
+    :param images: an Animation's images
+    :return: which shared asset list they are
+    """
+    if images is None:
+        return IMAGES_NONE
+    if images is assets.BRICK_ANIMATION:
+        return IMAGES_BRICK
+    if (len(images) == 1) and (images[0] is assets.BALL_IMG):
+        return IMAGES_BALL
+    return IMAGES_NONE
+
+
+def snapshot(gw: GameWorld, gs: GameState, ps: PlayerState, contacts: set = None,
+             animations: AnimationPool = None) -> bytes:
+    """
+    Capture the game
+
+    :param gw: GameWorld
+    :param gs: GameState
+    :param ps: PlayerState
+    :param contacts: the engine's contact latches (optional)
+    :param animations: the engine's AnimationPool (optional)
+    :return: the snapshot
+    """
+    ball, paddle = find_ball_and_paddle(gw)
+    level_objects = gw.level_objects
+
+    # which level objects are still in the world, and their strengths
+    in_world = {id(wo) for wo in gw.world_objects}
+    present = bytes(id(wo) in in_world for wo in level_objects)
+    strengths = array('h', (getattr(wo, 'strength', 0) for wo in level_objects))
+
+    # the contact latches, for the objects that have a code
+    codes = {id(ball): CODE_BALL, id(paddle): CODE_PADDLE}
+    for i, wo in enumerate(level_objects):
+        codes[id(wo)] = 2 + i
+    pairs = array('H')
+    for reacting_wo, other_wo in (contacts or ()):
+        reacting_code, other_code = codes.get(id(reacting_wo)), codes.get(id(other_wo))
+        if (reacting_code is not None) and (other_code is not None):
+            pairs.append(reacting_code)
+            pairs.append(other_code)
+
+    parts = [HEADER.pack(MAGIC, VERSION, gw.level_name.value, gw.level_seed, len(level_objects), len(pairs) // 2,
+                         len(animations.active) if animations is not None else 0),
+             PLAYER.pack(ps.lives, ps.score, ps.theme.value, ps.level),
+             GAME.pack(gs.cur_state.value, gs.motion_model.value, gs.tick_time, *gs.v_gravity_unit,
+                       *gs.v_gravity_acc, gs.gravity_acc_length, gs.paddle_impulse_vel_length, gs.ball_speed_step,
+                       gs.ball_speed_increased_ratio, gs.cur_ball_x, gs.last_mouse_pos_x, gs.level_cleared,
+                       gs.shake_screen_brick, gs.shake_strength, gs.shake_off_index_x, gs.shake_off_index_y,
+                       gs.paddle_pos_x, gs.paddle_under_key_control_left, gs.paddle_under_key_control_right),
+             BALL.pack(*ball.v_pos, *ball.v_vel, *ball.v_vel_unit, ball.x, ball.y, ball.speed_v, ball.speed,
+                       ball.dx, ball.dy, *ball.rect, ball.primed_collision_wall_left,
+                       ball.primed_collision_wall_right, ball.primed_collision_wall_top, ball.commanded_pos_x,
+                       ball.freeze_ball),
+             PADDLE.pack(*paddle.rect, paddle.commanded_pos_x, paddle.delta_x, paddle.prev_x),
+             present, strengths.tobytes(), pairs.tobytes()]
+
+    if animations is not None:
+        now = pygame.time.get_ticks()
+        for anim in animations.active:
+            parts.append(ANIMATION.pack(anim.duration, int(now - anim.start_ticks), *anim.rect, *anim.v_pos,
+                                        *anim.v_vel, *anim.v_acc, *tuple(anim.color)[:3], anim.fade, anim.is_ball,
+                                        anim.is_cleared_msg, get_images_code(anim.images)))
+
+    rng_version, rng_words, gauss_next = random.getstate()
+    parts.append(RNG.pack(rng_version, gauss_next is not None, gauss_next or 0.0))
+    parts.append(array('I', rng_words).tobytes())
+    return b''.join(parts)
+
+
+def read_header(data: bytes) -> tuple[int, int, int, int, int]:
+    """
+    Check and read a snapshot's header
+
+    :param data: from snapshot()
+    :return: (LevelName value, level seed, level object count, contact count, Animation count)
+    """
+    if len(data) < HEADER.size + PLAYER.size:
+        raise ValueError("not a SmashCore snapshot (too short)")
+    (magic, version, *header) = HEADER.unpack_from(data, 0)
+    if (magic != MAGIC) or (version != VERSION):
+        raise ValueError("not a SmashCore snapshot (or an unsupported version)")
+    return tuple(header)
+
+
+def read_summary(data: bytes) -> dict:
+    """
+    What run a snapshot is of, without restoring it (e.g. for a resume menu entry)
+
+    :param data: from snapshot()
+    :return: the level_name, theme, level (number), score, and lives
+    """
+    level_value = read_header(data)[0]
+    lives, score, theme_value, level = PLAYER.unpack_from(data, HEADER.size)
+    return {'level_name': Levels.LevelName(level_value), 'theme': LevelTheme(theme_value), 'level': level,
+            'score': score, 'lives': lives}
+
+
+def restore(data: bytes, gw: GameWorld, gs: GameState, ps: PlayerState, contacts: set = None,
+            animations: AnimationPool = None) -> None:
+    """
+    Put the game back to the snapshot (in place)
+
+    :param data: from snapshot()
+    :param gw: GameWorld
+    :param gs: GameState
+    :param ps: PlayerState
+    :param contacts: the engine's contact latches, replaced with the snapshot's (optional)
+    :param animations: the engine's AnimationPool, replaced with the snapshot's Animations (optional)
+    :return:
+    """
+    (level_value, level_seed, level_count, pair_count, animation_count) = read_header(data)
+    offset = HEADER.size
+
+    level_name = Levels.LevelName(level_value)
+    if ((gw.level_name != level_name) or (gw.level_seed != level_seed) or
+            (len(gw.level_objects) != level_count)):
+        gw.build_level(level_name, level_seed)
+
+    (ps.lives, ps.score, theme_value, ps.level) = PLAYER.unpack_from(data, offset)
+    ps.theme = LevelTheme(theme_value)
+    offset += PLAYER.size
+
+    game = GAME.unpack_from(data, offset)
+    offset += GAME.size
+    gs.cur_state = GameState.GameStateName(game[0])
+    gs.motion_model = MotionModels(game[1])
+    gs.tick_time = game[2]
+    gs.v_gravity_unit.update(game[3], game[4])
+    gs.v_gravity_acc.update(game[5], game[6])
+    (gs.gravity_acc_length, gs.paddle_impulse_vel_length, gs.ball_speed_step, gs.ball_speed_increased_ratio,
+     gs.cur_ball_x, gs.last_mouse_pos_x, gs.level_cleared, gs.shake_screen_brick, gs.shake_strength,
+     gs.shake_off_index_x, gs.shake_off_index_y, gs.paddle_pos_x, gs.paddle_under_key_control_left,
+     gs.paddle_under_key_control_right) = game[7:]
+    if gs.shake_strength > 0:
+        gs.shake_table_x, gs.shake_table_y = utils.get_shake_tables(gs, gs.shake_strength)
+
+    ball, paddle = find_ball_and_paddle(gw)
+    values = BALL.unpack_from(data, offset)
+    offset += BALL.size
+    ball.v_pos.update(values[0], values[1])
+    ball.v_vel.update(values[2], values[3])
+    ball.v_vel_unit.update(values[4], values[5])
+    (ball.x, ball.y, ball.speed_v, ball.speed, ball.dx, ball.dy) = values[6:12]
+    ball.rect.update(values[12:16])
+    (ball.primed_collision_wall_left, ball.primed_collision_wall_right, ball.primed_collision_wall_top,
+     ball.commanded_pos_x, ball.freeze_ball) = values[16:]
+
+    values = PADDLE.unpack_from(data, offset)
+    offset += PADDLE.size
+    paddle.rect.update(values[0:4])
+    (paddle.commanded_pos_x, paddle.delta_x, paddle.prev_x) = values[4:]
+
+    # the level objects still in the world, in their built order, after everything else
+    present = data[offset:offset + level_count]
+    offset += level_count
+    strengths = array('h')
+    strengths.frombytes(data[offset:offset + (2 * level_count)])
+    offset += 2 * level_count
+    level_objects = gw.level_objects
+    for wo, strength in zip(level_objects, strengths):
+        if isinstance(wo, Brick):
+            wo.strength = strength
+    gw.world_objects = ([wo for wo in gw.world_objects if not isinstance(wo, (Brick, Obstacle))] +
+                        [wo for wo, is_present in zip(level_objects, present) if is_present])
+
+    pairs = array('H')
+    pairs.frombytes(data[offset:offset + (4 * pair_count)])
+    offset += 4 * pair_count
+    if contacts is not None:
+        objects = [ball, paddle] + level_objects
+        contacts.clear()
+        contacts.update((objects[pairs[i]], objects[pairs[i + 1]]) for i in range(0, len(pairs), 2))
+
+    now = pygame.time.get_ticks()
+    if animations is not None:
+        animations.clear()
+    for _ in range(animation_count):
+        values = ANIMATION.unpack_from(data, offset)
+        offset += ANIMATION.size
+        if animations is None:
+            continue
+        (duration, elapsed, pos_x, pos_y, vel_x, vel_y, acc_x, acc_y,
+         fade, is_ball, is_cleared_msg, images_code) = (values[0], values[1], *values[6:12], *values[15:])
+        images = {IMAGES_BRICK: assets.BRICK_ANIMATION, IMAGES_BALL: [assets.BALL_IMG]}.get(images_code)
+        anim = animations.spawn(duration, values[2:6], Color(*values[12:15]), fade=fade,
+                                v_vel=Vector2(vel_x, vel_y), v_acc=Vector2(acc_x, acc_y), images=images,
+                                is_ball=is_ball, is_lvl_clr_msg=is_cleared_msg)
+        if anim is not None:
+            anim.v_pos.update(pos_x, pos_y)
+            anim.start_ticks = now - elapsed
+            anim.cur_ticks = now
+
+    rng_version, has_gauss, gauss_next = RNG.unpack_from(data, offset)
+    offset += RNG.size
+    rng_words = array('I')
+    rng_words.frombytes(data[offset:offset + (4 * RNG_WORDS)])
+    random.setstate((rng_version, tuple(rng_words), gauss_next if has_gauss else None))
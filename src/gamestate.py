@@ -8,6 +8,7 @@
 
     Module Description: Consolidate the game state flags and parameters into a single class.
 """
+from array import array
 from enum import Enum, auto
 import pygame
 import constants
@@ -30,6 +31,7 @@ class GameState:
         GET_HIGH_SCORE = auto()
         HOW_TO_PLAY = auto()
         SETTINGS = auto()
+        VERSUS = auto()
 
 
     def __init__(self) -> None:
@@ -43,6 +45,10 @@ class GameState:
         self.motion_model: MotionModels = MotionModels.VECTOR_1
         self.tick_time: int = 0
         self.cur_ball_x: int = (constants.WIDTH // 2) - (constants.PAD_WIDTH // 2) # used for the auto-play mode that matches paddle pos to the ball pos
+        self.paddle_width: int = constants.PAD_WIDTH # the Paddle's current width (the WIDE_PADDLE power-up changes it)
+        self.paddle_laser: bool = False # whether the Paddle is armed by the LASER power-up (so it fires)
+        self.ball_speed_scale: float = 1.0 # the ball speeds' factor while the SLOW_BALL power-up runs (1.0 otherwise)
+        self.extra_balls_in_play: int = 0 # the MULTI_BALL power-up's extra balls in play (a lost Ball hands over to one)
         self.gravity_acc_length: float = constants.WORLD_GRAVITY_ACC
         self.v_gravity_unit: pygame.Vector2 = pygame.Vector2(0.0, 1.0)
         self.v_gravity_acc: pygame.Vector2 = self.v_gravity_unit * self.gravity_acc_length
@@ -63,6 +69,11 @@ class GameState:
         # these are the shake offset values to sequence through -- better to hard-code these up front, rather than trying to calculate
         self.shake_offsets_x = [5, 5, 3, -4, -1, -3, -2, -2, 3, 4, 1, 2, 0, -1, -2, -3, -2, 1, 0, 5, 2, 1, 0, -1, -2, -1, 0, 0]
         self.shake_offsets_y = [5, -5, 0, -3, -3, 1, 1, 0, 4, -2, 1, -2, 1, 1, 2, 3, -2, -1, 4, 2, 2, -1, 2, 3, 2, -1, 0, 0]
+        # the offset lists scaled to integer pixel offsets, {strength: (x offsets, y offsets)}, built once per strength
+        # by utils.start_shake(), and the pair being sequenced through now
+        self.shake_tables: dict[int, tuple[array, array]] = {}
+        self.shake_table_x: array = array('h')
+        self.shake_table_y: array = array('h')
 
         self.paddle_pos_x: int = 0  # used at READY_TO_LAUNCH to keep ball on paddle
 
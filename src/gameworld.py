@@ -42,8 +42,18 @@ class GameWorld:
         self.world_objects.append(Paddle(constants.RED, constants.PAD_WIDTH, constants.PAD_HEIGHT,
                                          image=assets.PADDLE_IMG if level_theme == LevelTheme.MODERN else None))
 
+        # the level's own objects (Bricks and Obstacles) as built, and what rebuilds them exactly - a snapshot
+        # only records the level's changes since it was built
+        self.level_name: Levels.LevelName | None = None
+        self.level_seed: int = 0
+        self.level_objects: list[WorldObject] = []
+
+        # in the endless mode, the EndlessField (see endless.py) that holds the rows of Bricks instead of
+        # world_objects - None otherwise
+        self.brick_field = None
+
         # set up the initial bricks level
-        Levels.build_level(self.world_objects, Levels.get_level_name_from_num(level_theme, 1) if level_name is None else level_name)
+        self.build_level(Levels.get_level_name_from_num(level_theme, 1) if level_name is None else level_name)
 
     def remove_obstacles(self) -> None:
         """
@@ -65,3 +75,31 @@ class GameWorld:
         wo_to_keep = [wo for wo in self.world_objects if
                       not isinstance(wo, Brick)]
         self.world_objects = wo_to_keep
+
+    def build_level(self, level_name: Levels.LevelName, seed: int = None) -> None:
+        """
+        Replaces any remaining bricks and obstacles with a newly built level
+
+        :param level_name: LevelName to build
+        :param seed: the level's seed (a new one if None)
+        :return:
+        """
+        level_objects: list[WorldObject] = []
+        seed = Levels.build_level(level_objects, level_name, seed)
+        self.swap_level(level_objects, level_name, seed)
+
+    def swap_level(self, level_objects: list[WorldObject], level_name: Levels.LevelName, seed: int) -> None:
+        """
+        Replaces any remaining bricks and obstacles with a (pre-built) level's objects in a single step
+
+        :param level_objects: the new level's WorldObjects
+        :param level_name: the level's LevelName
+        :param seed: the seed it was built with
+        :return:
+        """
+        wo_to_keep = [wo for wo in self.world_objects if
+                      not isinstance(wo, (Brick, Obstacle))]
+        self.world_objects = wo_to_keep + level_objects
+        self.level_objects = list(level_objects)
+        self.level_name = level_name
+        self.level_seed = seed
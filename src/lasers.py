@@ -0,0 +1,217 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: The LASER power-up's shots.  While the paddle is armed, it fires a shot from each cannon
+                        every LASER_FIRE_INTERVAL_MS, straight up until it hits a Brick or Obstacle (or leaves the
+                        window).  There can be hundreds in flight, so they aren't WorldObjects in the collision
+                        loop: the LaserPool keeps them in fixed-capacity parallel arrays (a spent shot is swapped
+                        with the last live one, so the live shots are always the first count entries), and moves
+                        and hit tests them all in one pass per step.  The hit test looks up the shot's column in an
+                        index of the level's bricks, split into LASER_COLUMN_WIDTH wide columns and sorted lowest
+                        first, so a shot only checks the few bricks it's under, stopping at the first it reaches.
+                        The index is rebuilt only when the level's objects change.
+"""
+
+from array import array
+from collections.abc import Callable
+
+import pygame
+
+from constants import (WIDTH, RED, LASER_FIRE_INTERVAL_MS, LASER_SPEED, LASER_POOL_CAPACITY, LASER_COLUMN_WIDTH,
+                       LASER_SHOT_WIDTH, LASER_SHOT_HEIGHT)
+from gamestate import GameState
+from gameworld import GameWorld
+from worldobject import WorldObject, CollisionLayer
+
+# the columns the window's width is split into for the hit test
+COLUMNS: int = (WIDTH + LASER_COLUMN_WIDTH - 1) // LASER_COLUMN_WIDTH
+
+# the shots stop at these (the Ball, Paddle, and effects are passed through)
+TARGET_LAYERS: int = CollisionLayer.BRICK | CollisionLayer.OBSTACLE
+
+
+class LaserPool:
+    """ The laser shots in flight, and the column index of the level's bricks they're tested against """
+
+    def __init__(self, capacity: int = LASER_POOL_CAPACITY) -> None:
+        """
+        :param capacity: the most shots in flight at once
+        """
+        self.capacity: int = capacity
+        # each shot's center x and top y - only the first count entries are live
+        self.xs: array = array('f', bytes(4 * capacity))
+        self.ys: array = array('f', bytes(4 * capacity))
+        self.count: int = 0
+        # how long until the armed paddle fires again, in ms
+        self.fire_ms: int = 0
+        # stats for the dev overlay
+        self.high_water: int = 0
+        self.exhausted_count: int = 0
+
+        # the Bricks and Obstacles over each column, lowest (greatest bottom) first
+        self.columns: list[list[WorldObject]] = [[] for _ in range(COLUMNS)]
+        # what the index was built from (see get_index_key())
+        self.index_key: tuple | None = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def spawn(self, x: float, y: float) -> bool:
+        """
+        Fire a shot
+
+        :param x: its center x
+        :param y: its top y
+        :return: False if the pool is full (so it isn't fired)
+        """
+        if self.count >= self.capacity:
+            self.exhausted_count += 1
+            return False
+        self.xs[self.count] = x
+        self.ys[self.count] = y
+        self.count += 1
+        self.high_water = max(self.high_water, self.count)
+        return True
+
+    def fire(self, paddle: WorldObject) -> None:
+        """
+        Fire a shot from each of the paddle's cannons (where Paddle.draw_wo() draws them)
+
+        :param paddle: the Paddle
+        :return:
+        """
+        self.spawn(paddle.rect.left + 7, paddle.rect.y - 8)
+        self.spawn(paddle.rect.right - 7, paddle.rect.y - 8)
+
+    def clear(self) -> None:
+        """
+        Drop every shot (and the index, which may be of an old GameWorld)
+
+        :return:
+        """
+        self.count = 0
+        self.fire_ms = 0
+        self.index_key = None
+
+    @staticmethod
+    def get_index_key(gw: GameWorld) -> tuple:
+        """
+        What the index depends on: the GameWorld's objects (which only change by adding or removing some, or a
+        new level) and the endless mode's rows (which scroll down as they stream in)
+
+        :param gw: GameWorld
+        :return:
+        """
+        field = gw.brick_field
+        return (id(gw.world_objects), len(gw.world_objects),
+                None if field is None else field.rows_streamed, None if field is None else field.brick_count)
+
+    def build_index(self, gw: GameWorld) -> None:
+        """
+        Sort the GameWorld's Bricks and Obstacles (and the endless mode's) into the columns they're over
+
+        :param gw: GameWorld
+        :return:
+        """
+        targets = [wo for wo in gw.world_objects if wo.collision_layer & TARGET_LAYERS]
+        if gw.brick_field is not None:
+            targets.extend(wo for row in gw.brick_field.rows for wo in row)
+        targets.sort(key=lambda wo: wo.rect.bottom, reverse=True)
+
+        for column in self.columns:
+            column.clear()
+        for wo in targets:
+            for column_num in range(max(wo.rect.left // LASER_COLUMN_WIDTH, 0),
+                                    min((wo.rect.right - 1) // LASER_COLUMN_WIDTH, COLUMNS - 1) + 1):
+                self.columns[column_num].append(wo)
+        self.index_key = self.get_index_key(gw)
+
+    def remove_from_index(self, wo: WorldObject) -> None:
+        """
+        Take a destroyed object out of its columns
+
+        :param wo: the object
+        :return:
+        """
+        for column_num in range(max(wo.rect.left // LASER_COLUMN_WIDTH, 0),
+                                min((wo.rect.right - 1) // LASER_COLUMN_WIDTH, COLUMNS - 1) + 1):
+            self.columns[column_num].remove(wo)
+
+    def update(self, gw: GameWorld, gs: GameState, on_hit: Callable[[WorldObject], bool]) -> None:
+        """
+        Fire from the armed paddle, then move every shot up, ending those that hit something or leave the window
+
+        :param gw: GameWorld
+        :param gs: GameState
+        :param on_hit: called with each object hit, returning whether it was destroyed (e.g. GameEngine.apply_hit)
+        :return:
+        """
+        if gs.cur_state != GameState.GameStateName.PLAYING:
+            return
+
+        if gs.paddle_laser:
+            if self.fire_ms <= 0:
+                self.fire(gw.world_objects[1])
+                self.fire_ms += LASER_FIRE_INTERVAL_MS
+            self.fire_ms -= gs.tick_time
+        else:
+            # (fires right away when next armed)
+            self.fire_ms = 0
+
+        if self.count == 0:
+            return
+        if self.index_key != self.get_index_key(gw):
+            self.build_index(gw)
+
+        xs, ys, columns = self.xs, self.ys, self.columns
+        rise = LASER_SPEED * gs.tick_time
+        destroyed = False
+        i = 0
+        while i < self.count:
+            x = xs[i]
+            y_from = ys[i]
+            y_to = y_from - rise
+            hit = None
+            for wo in columns[int(x) // LASER_COLUMN_WIDTH]:
+                rect = wo.rect
+                if rect.bottom <= y_to:
+                    # (this and the rest of the column are beyond the shot's reach this step)
+                    break
+                if (rect.top <= y_from) and (rect.left <= x < rect.right):
+                    hit = wo
+                    break
+
+            if hit is not None:
+                if on_hit(hit):
+                    self.remove_from_index(hit)
+                    destroyed = True
+            elif y_to + LASER_SHOT_HEIGHT > 0:
+                ys[i] = y_to
+                i += 1
+                continue
+
+            # the shot is spent - swap in the last live one (and test it next)
+            self.count -= 1
+            xs[i] = xs[self.count]
+            ys[i] = ys[self.count]
+
+        if destroyed:
+            # the index was kept up with the destroyed objects, so it's still good for the world as it is now
+            self.index_key = self.get_index_key(gw)
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """
+        Draw the shots in flight
+
+        :param screen: the screen
+        :return:
+        """
+        xs, ys = self.xs, self.ys
+        half_width = LASER_SHOT_WIDTH // 2
+        for i in range(self.count):
+            screen.fill(RED, (int(xs[i]) - half_width, int(ys[i]), LASER_SHOT_WIDTH, LASER_SHOT_HEIGHT))
@@ -19,6 +19,28 @@ class Leaderboard:
 
     def __init__(self):
         self.l_top_scores: list[Score] = []
+        # bumped on every change to the scores, so views (and the UI's rendered rows) know when to rebuild
+        self.version: int = 0
+        self.sorted_scores: list[Score] = []
+        self.sorted_version: int = -1
+
+    def __getstate__(self):
+        """
+        Pickle only the scores and version (the sorted view is rebuilt on demand)
+        :return:
+        """
+        return {'l_top_scores': self.l_top_scores, 'version': self.version}
+
+    def __setstate__(self, state):
+        """
+        Restore a pickled leaderboard (older files were stored before the version counter existed)
+        :param state:
+        :return:
+        """
+        self.__dict__.update(state)
+        self.__dict__.setdefault('version', 0)
+        self.sorted_scores = []
+        self.sorted_version = -1
 
     @classmethod
     def create_persisted_object(cls):
@@ -31,6 +53,17 @@ class Leaderboard:
             lb = Leaderboard()
         return lb
 
+    @classmethod
+    async def create_persisted_object_async(cls):
+        """
+        Awaitable create_persisted_object() (for the browser build)
+        :return:
+        """
+        lb = await persistence.read_object_async(persistence.LEADERBOARD_FILENAME)
+        if lb is None:
+            lb = Leaderboard()
+        return lb
+
     @classmethod
     def load(cls, filename: str):
         """
@@ -48,6 +81,14 @@ class Leaderboard:
         """
         persistence.store_object(self, filename)
 
+    async def store_async(self, filename: str):
+        """
+        Awaitable store() (for the browser build)
+        :param filename:
+        :return:
+        """
+        await persistence.store_object_async(self, filename)
+
     def is_high_score(self, score: int) -> bool:
         """
         Tests if score is within the top high scores
@@ -78,3 +119,21 @@ class Leaderboard:
 
         # ensure in proper order
         self.l_top_scores.sort()
+        self.mark_changed()
+
+    def mark_changed(self) -> None:
+        """
+        Bump the version after changing l_top_scores (add_score() does this itself)
+        :return:
+        """
+        self.version += 1
+
+    def get_sorted_scores(self) -> list[Score]:
+        """
+        The scores, highest first.  This view is only re-sorted when the version changes.
+        :return:
+        """
+        if self.sorted_version != self.version:
+            self.sorted_scores = sorted(self.l_top_scores, key=lambda scr: scr.score, reverse=True)
+            self.sorted_version = self.version
+        return self.sorted_scores
@@ -0,0 +1,176 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Builds the next level's WorldObjects ahead of time (during the level-cleared animation), so
+                        that the level transition doesn't cause a single long frame.  The pure-data part of the
+                        build runs on a worker thread and the Surface/Font work is spread across main thread frames.
+                        Where there are no threads (the pygbag/browser build), the pure-data part is instead built
+                        in one main thread step, on the frame after the pre-build starts.
+"""
+
+import logging
+import random
+import sys
+import threading
+
+import pygame
+
+import constants
+import deferredsurfaces
+from levels import Levels
+from worldobject import WorldObject
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# what a level build can raise (a bad level definition, or a Surface/Font failure) - anything else is a bug, so
+# it isn't swallowed here
+BUILD_ERRORS: tuple = (ValueError, TypeError, IndexError, KeyError, pygame.error)
+
+# the browser (pygbag/WASM) build has no threads
+THREADS_AVAILABLE: bool = sys.platform != "emscripten"
+
+
+class LevelPrebuilder:
+    """ Pre-builds a single level's WorldObjects, ready to be swapped into the GameWorld """
+
+    def __init__(self, threaded: bool = THREADS_AVAILABLE) -> None:
+        """
+        :param threaded: build on a worker thread (otherwise in a step() on the main thread)
+        """
+        self.threaded: bool = threaded
+        self.level_name: Levels.LevelName = None
+        # the seed the level is built with (chosen up front, on the main thread)
+        self.seed: int = 0
+        self.staged_objects: list[WorldObject] = []
+        self.realized_count: int = 0
+        self.thread: threading.Thread = None
+        # set when the level is still to be built by the next step() (if not threaded)
+        self.build_pending: bool = False
+        # set if the worker hit an error, so the level is built the normal way instead
+        self.failed: bool = False
+
+    def start(self, level_name: Levels.LevelName) -> None:
+        """
+        Begin pre-building the level on a worker thread, or by the next step() if there are no threads (ignored if
+        already pre-building this level)
+
+        :param level_name: LevelName to build
+        :return:
+        """
+        if self.level_name == level_name:
+            return
+
+        self.cancel()
+        self.level_name = level_name
+        self.seed = random.getrandbits(32)
+        # a new list for each build, so a canceled (still running) thread can't touch the next build
+        self.staged_objects = []
+        if self.threaded:
+            try:
+                self.thread = threading.Thread(target=self._build, args=(self.staged_objects, level_name, self.seed),
+                                               daemon=True)
+                self.thread.start()
+                return
+            except RuntimeError:
+                # (can't start a thread here, so don't try again)
+                self.threaded = False
+                self.thread = None
+        self.build_pending = True
+
+    def _build(self, staged_objects: list[WorldObject], level_name: Levels.LevelName, seed: int) -> None:
+        """
+        Worker thread target (or step()'s build, without threads) - builds the level with all Surface/Font work
+        deferred
+
+        :param staged_objects: list to receive the built WorldObjects
+        :param level_name: LevelName to build
+        :param seed: the level's seed
+        :return:
+        """
+        try:
+            with deferredsurfaces.deferring():
+                Levels.build_level(staged_objects, level_name, seed)
+        except BUILD_ERRORS:
+            logger.exception("pre-building %s failed, it will be built when it's needed", level_name)
+            # only flag the failure if this build hasn't been canceled/replaced
+            if self.staged_objects is staged_objects:
+                self.failed = True
+
+    def is_building(self) -> bool:
+        """
+        Is the worker thread still running?
+
+        :return:
+        """
+        return self.thread is not None and self.thread.is_alive()
+
+    def is_ready(self) -> bool:
+        """
+        Have all pre-built objects been fully realized?
+
+        :return:
+        """
+        return ((self.level_name is not None) and (not self.is_building()) and (not self.build_pending) and
+                (self.realized_count >= len(self.staged_objects)))
+
+    def step(self, count: int = constants.LEVEL_PREBUILD_REALIZE_PER_FRAME) -> None:
+        """
+        Called once per frame on the main thread to realize a few of the pre-built objects
+
+        :param count: max objects to realize this frame
+        :return:
+        """
+        if self.level_name is None or self.is_building() or self.failed:
+            return
+        if self.build_pending:
+            # the build is this frame's work, the realizing starts on the next
+            self.build_pending = False
+            self._build(self.staged_objects, self.level_name, self.seed)
+            return
+
+        end = min(self.realized_count + count, len(self.staged_objects))
+        for wo in self.staged_objects[self.realized_count:end]:
+            wo.realize_surfaces()
+        self.realized_count = end
+
+    def take(self, level_name: Levels.LevelName) -> list[WorldObject] | None:
+        """
+        Hand over the pre-built objects for the level, finishing any remaining work first
+
+        :param level_name: the LevelName actually wanted
+        :return: the level's WorldObjects, or None if a different (or no) level was being pre-built, or it failed
+        """
+        if self.level_name != level_name:
+            self.cancel()
+            return None
+
+        if self.thread is not None:
+            self.thread.join()
+        if self.build_pending:
+            self.build_pending = False
+            self._build(self.staged_objects, self.level_name, self.seed)
+        if self.failed:
+            self.cancel()
+            return None
+        self.step(len(self.staged_objects))
+        staged_objects = self.staged_objects
+        self.cancel()
+        return staged_objects
+
+    def cancel(self) -> None:
+        """
+        Drop any pre-build in progress (a running worker just finishes into its own, now orphaned, list)
+
+        :return:
+        """
+        self.level_name = None
+        self.staged_objects = []
+        self.realized_count = 0
+        self.thread = None
+        self.build_pending = False
+        self.failed = False
@@ -10,20 +10,37 @@
                         and then built-up in buildLevel.
 """
 
-from random import randrange as rnd
-from random import choice, sample
+import random
+import threading
 from enum import Enum
 from typing import Any
 
 import pygame
 import constants
 import assets
+import deferredsurfaces
 from leveltheme import LevelTheme
 from brick import Brick
 from obstacle import Obstacle
 from poweruptype import PowerUpType
 from worldobject import WorldObject
 
+# each thread building levels (the main thread, the LevelPrebuilder's) draws the random layouts from its own
+# generator, seeded per build, so a level can be rebuilt exactly from its seed
+_local = threading.local()
+
+
+def get_level_rng() -> random.Random:
+    """
+    The current thread's level layout generator
+
+    :return:
+    """
+    rng = getattr(_local, 'rng', None)
+    if rng is None:
+        rng = _local.rng = random.Random()
+    return rng
+
 
 class Levels:
     """ This supplies the level building logic """
@@ -108,14 +125,19 @@ class Levels:
         return level_name
 
     @staticmethod
-    def build_level(gw_list: list[WorldObject], level_name: LevelName) -> None:
+    def build_level(gw_list: list[WorldObject], level_name: LevelName, seed: int = None) -> int:
         """
         Build the specified level.
 
         :param gw_list: list[WorldObject]
         :param level_name: LevelName
-        :return:
+        :param seed: the seed for any random layout (a new one from the random module if None)
+        :return: the seed, which rebuilds the same level
         """
+        if seed is None:
+            seed = random.getrandbits(32)
+        rng = get_level_rng()
+        rng.seed(seed)
 
         match level_name:
             case Levels.LevelName.CLASSIC_RANDOM_1:
@@ -130,8 +152,8 @@ class Levels:
                 for i in range(columns):
                     for j in range(rows):
                         brk_x, brk_y = (grid_margins[0] + pos_x * i, grid_margins[1] + pos_y * j)
-                        random_score = rnd(1, 11)
-                        random_color = choice(constants.BRICK_SOLIDS)
+                        random_score = rng.randrange(1, 11)
+                        random_color = rng.choice(constants.BRICK_SOLIDS)
                         gw_list.append(Brick(pygame.Rect(brk_x, brk_y, brk_width, brk_height), random_color, random_score))
 
             case Levels.LevelName.CLASSIC_SOLID_ROWS_1:
@@ -152,10 +174,10 @@ class Levels:
                 for i in range(columns):
                     for j in range(rows):
                         brk_x, brk_y = (grid_margins[0] + pos_x * i, grid_margins[1] + pos_y * j)
-                        random_color = choice(constants.BRICK_SOLIDS)
-                        random_brick = choice(assets.BRICK_COLORS)
-                        scaled_brick = pygame.transform.scale(random_brick, (brk_width, brk_height))
-                        random_score = rnd(1, 11)
+                        random_color = rng.choice(constants.BRICK_SOLIDS)
+                        random_brick = rng.choice(assets.BRICK_COLORS)
+                        scaled_brick = deferredsurfaces.scale(random_brick, (brk_width, brk_height))
+                        random_score = rng.randrange(1, 11)
                         gw_list.append(Brick(pygame.Rect(brk_x, brk_y, brk_width, brk_height),
                                              random_color, random_score, image=scaled_brick))
 
@@ -228,7 +250,8 @@ class Levels:
                           constants.GREEN, constants.LIGHT_BLUE]
                 multiplier_bricks = [(0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5),
                                      (6, 4), (7, 3), (8, 2), (9, 1), (10, 0)]
-                power_ups: list[list[Any]] = [[4, 3, PowerUpType.EXTRA_LIFE]]
+                power_ups: list[list[Any]] = [[4, 3, PowerUpType.EXTRA_LIFE], [1, 3, PowerUpType.WIDE_PADDLE],
+                                              [9, 3, PowerUpType.MULTI_BALL]]
                 Levels.generate_grid_level(gw_list=gw_list,
                                            rows=len(colors),
                                            row_colors=colors,
@@ -240,7 +263,8 @@ class Levels:
                           constants.GREEN, constants.LIGHT_BLUE]
                 multiplier_bricks = [(0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5),
                                      (6, 4), (7, 3), (8, 2), (9, 1), (10, 0)]
-                power_ups: list[list[Any]] = [[4, 3, PowerUpType.EXTRA_LIFE]]
+                power_ups: list[list[Any]] = [[4, 3, PowerUpType.EXTRA_LIFE], [1, 3, PowerUpType.WIDE_PADDLE],
+                                              [9, 3, PowerUpType.MULTI_BALL]]
                 Levels.generate_grid_level(gw_list=gw_list,
                                            rows=len(colors),
                                            use_random_imgs=True,
@@ -254,7 +278,8 @@ class Levels:
                                   (7, 0), (7, 1), (7, 2), (7, 3), (7, 4), (7, 5)]
                 multiplier_bricks = [(4, 0), (5, 0), (6, 0), (4, 1), (4, 2), (5, 2),
                                   (6, 2), (6, 3), (6, 4), (5, 4), (4, 4)]
-                power_ups: list[list[Any]] = [[5, 3, PowerUpType.EXTRA_LIFE]]
+                power_ups: list[list[Any]] = [[5, 3, PowerUpType.EXTRA_LIFE], [1, 2, PowerUpType.SLOW_BALL],
+                                              [9, 2, PowerUpType.STICKY_PADDLE]]
                 Levels.generate_grid_level(gw_list=gw_list,
                                            rows=len(colors),
                                            row_colors=colors,
@@ -269,7 +294,8 @@ class Levels:
                                   (7, 0), (7, 1), (7, 2), (7, 3), (7, 4), (7, 5)]
                 multiplier_bricks = [(4, 0), (5, 0), (6, 0), (4, 1), (4, 2), (5, 2),
                                   (6, 2), (6, 3), (6, 4), (5, 4), (4, 4)]
-                power_ups: list[list[Any]] = [[5, 3, PowerUpType.EXTRA_LIFE]]
+                power_ups: list[list[Any]] = [[5, 3, PowerUpType.EXTRA_LIFE], [1, 2, PowerUpType.SLOW_BALL],
+                                              [9, 2, PowerUpType.STICKY_PADDLE]]
                 Levels.generate_grid_level(gw_list=gw_list,
                                            rows=len(colors),
                                            use_random_imgs=True,
@@ -280,7 +306,8 @@ class Levels:
             case Levels.LevelName.CLASSIC_UNBREAKABLE_2:
                 unbreakable = [(2, 2), (3, 2), (7, 2), (8, 2),
                                   (2, 3), (3, 3), (7, 3), (8, 3)]
-                power_ups: list[list[Any]] = [[2, 1, PowerUpType.EXTRA_LIFE]]
+                power_ups: list[list[Any]] = [[2, 1, PowerUpType.EXTRA_LIFE], [5, 2, PowerUpType.LASER],
+                                              [8, 1, PowerUpType.WIDE_PADDLE]]
                 Levels.generate_grid_level(gw_list=gw_list, rows=5,
                                            unbreakable=unbreakable,
                                            power_ups=power_ups)
@@ -288,7 +315,8 @@ class Levels:
             case Levels.LevelName.MODERN_UNBREAKABLE_2:
                 unbreakable = [(2, 2), (3, 2), (7, 2), (8, 2),
                                   (2, 3), (3, 3), (7, 3), (8, 3)]
-                power_ups: list[list[Any]] = [[2, 1, PowerUpType.EXTRA_LIFE]]
+                power_ups: list[list[Any]] = [[2, 1, PowerUpType.EXTRA_LIFE], [5, 2, PowerUpType.LASER],
+                                              [8, 1, PowerUpType.WIDE_PADDLE]]
                 Levels.generate_grid_level(gw_list=gw_list, rows=5,
                                            use_random_imgs=True,
                                            unbreakable=unbreakable,
@@ -328,6 +356,8 @@ class Levels:
             case _:
                 pass
 
+        return seed
+
     @staticmethod
     def generate_grid_level(gw_list: list[WorldObject],
                             rows: int = 5,
@@ -383,10 +413,10 @@ class Levels:
             rows = min(rows, len(row_img_colors))
 
         if row_colors is None:
-            row_colors = sample(constants.BRICK_SOLIDS, rows)
+            row_colors = get_level_rng().sample(constants.BRICK_SOLIDS, rows)
         # assign random images, else use colors
         if use_random_imgs and row_img_colors is None:
-            row_img_colors = sample(assets.BRICK_COLORS, rows)
+            row_img_colors = get_level_rng().sample(assets.BRICK_COLORS, rows)
 
         # generate columns, rows of bricks
         for i in range(columns):
@@ -408,7 +438,7 @@ class Levels:
                 # brick is 10X value and 5X strength
                 if strong_bricks is not None and (i, j) in strong_bricks:
                     if row_img_colors is not None:
-                        strong_brick = pygame.transform.scale(
+                        strong_brick = deferredsurfaces.scale(
                             assets.BRK_GOLD_IMG, (brk_width, brk_height))
                         gw_list.append(Brick(brk_rect,
                                              row_color,
@@ -425,7 +455,7 @@ class Levels:
                 # obstacle bricks
                 elif unbreakable is not None and (i, j) in unbreakable:
                     if row_img_colors is not None:
-                        scaled_image = pygame.transform.scale(assets.BRK_OBSTACLE_IMG, (brk_width, brk_height))
+                        scaled_image = deferredsurfaces.scale(assets.BRK_OBSTACLE_IMG, (brk_width, brk_height))
                         gw_list.append(Obstacle(brk_rect, row_color, scaled_image))
                     else:
                         gw_list.append(Obstacle(brk_rect, constants.GRAY, text="X X X"))
@@ -442,7 +472,7 @@ class Levels:
 
                     # apply the power-up type to this Brick as it's added to the GW
                     if row_img_colors is not None:
-                        scaled_image = pygame.transform.scale(
+                        scaled_image = deferredsurfaces.scale(
                             row_img_colors[j], (brk_width, brk_height))
                         gw_list.append(Brick(brk_rect, row_color,
                                              value=value, image=scaled_image,
@@ -9,9 +9,14 @@
     Module Description: This is the entry point for SmashCore, a breakout style game.
 """
 
+import asyncio
+import sys
+
 import pygame
 
 import assets
+import autosave
+import telemetry
 from gamesettings import GameSettings
 from leaderboard import Leaderboard
 from gamestate import GameState
@@ -20,11 +25,37 @@ from userinterface import UserInterface
 from gameworld import GameWorld
 from gameengine import GameEngine
 
+LINK_USAGE: str = "usage: main.py --link <1|2> <the other cabinet's host>"
+
+
+def get_link_args(argv: list[str]) -> tuple[int, str] | None:
+    """
+    Get the --link arguments
+
+    :param argv: the command line
+    :return: (the local player, the other cabinet's host), or None if they're missing or bad
+    """
+    link_arg = argv.index("--link")
+    try:
+        player, remote_host = int(argv[link_arg + 1]), argv[link_arg + 2]
+    except (IndexError, ValueError):
+        return None
+    return (player, remote_host) if player in (1, 2) else None
+
+
 def main() -> None:
     """
     Initializes pygame, loads the assets, initializes all dependencies, and loads/creates the leaderboard
     :return:
     """
+    # link with another cabinet for a networked versus match: --link <1|2> <the other cabinet's host>
+    link_args = None
+    if "--link" in sys.argv:
+        link_args = get_link_args(sys.argv)
+        if link_args is None:
+            print(LINK_USAGE)
+            return
+
     # mixer configuration settings
     pygame.mixer.pre_init(44100, -16, 2, 128)
     pygame.init()
@@ -40,8 +71,54 @@ def main() -> None:
 
     ge = GameEngine(lb, ps, gw, gs, gset, ui)
 
+    # autosave the run in progress (on a worker thread), and offer to resume one a crash cut short
+    if "--no-autosave" not in sys.argv:
+        autosave.enable()
+        ge.offer_resume(autosave.load())
+
+    if link_args is not None:
+        ge.start_netplay(*link_args)
+
+    # stream the game to spectators (view it with broadcast.py)
+    if "--broadcast" in sys.argv:
+        ge.start_broadcast()
+
     # run the main game loop -- this returns when done
     ge.run_loop()
 
+
+async def main_async() -> None:
+    """
+    The asyncio version of main() for the pygbag/browser build - the asset loading, persisted object loading,
+    and main game loop are all awaited, so the browser's event loop keeps running
+    :return:
+    """
+    # mixer configuration settings
+    pygame.mixer.pre_init(44100, -16, 2, 128)
+    pygame.init()
+
+    # setup various game objects
+    await assets.load_assets_async()
+    ui = UserInterface()
+    gset = await GameSettings.create_persisted_object_async()
+    gs = GameState()
+    gw = GameWorld()
+    ps = PlayerState()
+    lb = await Leaderboard.create_persisted_object_async()
+
+    ge = GameEngine(lb, ps, gw, gs, gset, ui)
+
+    # run the main game loop -- this returns when done
+    await ge.run_loop_async()
+
+
 if __name__ == "__main__":
-    main()
+    # opt in to recording the per-level telemetry (view it with telemetryheatmap.py)
+    if "--telemetry" in sys.argv:
+        telemetry.enable()
+
+    # the browser (pygbag) build must run under asyncio; it can also be selected on the desktop with --async
+    if sys.platform == "emscripten" or "--async" in sys.argv:
+        asyncio.run(main_async())
+    else:
+        main()
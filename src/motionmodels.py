@@ -21,3 +21,7 @@ class MotionModels(Enum):
     # motion calculations using POS/VEL/ACC vectors and the clock.tick() returned delta time, so the motion is unlinked
     # from the frame rate - can set a MAX_FPS_VECTOR to limit the fps a bit (rather than letting it run all out)
     VECTOR_1: Enum = auto()
+
+    # the VECTOR_1 state and bounces, but integrated in short semi-implicit Euler sub-steps (velocity first, then
+    # position) with mirrored wall bounces, so it stays stable at high ball speeds and gravity
+    SUBSTEP_1: Enum = auto()
@@ -0,0 +1,363 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This motionregistry.py provides a global/singleton (like utils.py) registry of the Ball
+                        motion models.  Each MotionModel implements the integrate (move and bounce off the walls),
+                        reflect (bounce off a WorldObject), and launch steps, plus its frame pacing, so adding a
+                        model means adding a MotionModels value and registering its MotionModel here.
+"""
+
+import math
+import random as rnd
+
+import pygame
+
+import constants
+import gameevents
+import obstacle
+import paddle
+from gameevents import GameEventType
+from gamestate import GameState
+from motionmodels import MotionModels
+
+
+class MotionModel:
+    """ The interface for a Ball motion model """
+
+    def integrate(self, ball, gs: GameState) -> None:
+        """
+        Move the ball one frame (gs.tick_time), bouncing it off the walls
+
+        :param ball: Ball
+        :param gs: GameState
+        :return:
+        """
+
+    def reflect(self, ball, wo, gs: GameState) -> None:
+        """
+        Bounce the ball off a WorldObject it has just struck
+
+        :param ball: Ball
+        :param wo: the WorldObject struck
+        :param gs: GameState
+        :return:
+        """
+
+    def launch(self, ball) -> None:
+        """
+        Set the ball's starting direction/velocity for this model's state
+
+        :param ball: Ball
+        :return:
+        """
+
+    def get_target_fps(self) -> float | None:
+        """
+        The frame rate this model runs at
+
+        :return: None if its motion is per frame, so it runs at the GameEngine's (SIMPLE) frame rate
+        """
+        return constants.MAX_FPS_VECTOR
+
+    def tick(self, clock: pygame.time.Clock, fps: float) -> int:
+        """
+        Pace the frame
+
+        :param clock: the GameEngine's Clock
+        :param fps: the frame rate to pace it to (GameEngine.get_target_fps())
+        :return: the ms since the last frame
+        """
+        # removing the fps arg (rather, setting it to 0) allows pygame to run this loop at full speed
+        return clock.tick_busy_loop(fps)
+
+
+class SimpleMotion(MotionModel):
+    """
+    SIMPLE_1: initial motion code with simplified calculations and clock.tick(fps) to time the update loop
+    """
+
+    def integrate(self, ball, gs: GameState) -> None:
+        # ball collision wall left
+        if ball.rect.centerx < ball.radius:
+            ball.dx = -ball.dx
+            gameevents.emit(GameEventType.WALL_HIT_LEFT)
+        # ball collision wall right
+        if ball.rect.centerx > constants.WIDTH - ball.radius:
+            ball.dx = -ball.dx
+            gameevents.emit(GameEventType.WALL_HIT_RIGHT)
+        # ball collision wall top
+        if ball.rect.centery < ball.radius:
+            ball.dy = -ball.dy
+            gameevents.emit(GameEventType.WALL_HIT_TOP)
+
+        ball.rect.x += ball.speed * ball.dx
+        ball.rect.y += ball.speed * ball.dy
+
+        ball.x = ball.rect.x
+        ball.y = ball.rect.y
+
+    def reflect(self, ball, wo, gs: GameState) -> None:
+        if ball.dx > 0:  # checks for horizontal ball collision
+            x_delta = ball.rect.right - wo.rect.left
+        else:
+            x_delta = wo.rect.right - ball.rect.left
+
+        if ball.dy > 0:  # checks for vertical ball collision
+            y_delta = ball.rect.bottom - wo.rect.top
+        else:
+            y_delta = wo.rect.bottom - ball.rect.top
+
+        if abs(x_delta - y_delta) < 10:
+            ball.dx, ball.dy = -ball.dx, -ball.dy
+        elif x_delta > y_delta:  # vertical collision
+            ball.dy = -ball.dy
+        elif y_delta > x_delta:  # horizontal collision
+            ball.dx = -ball.dx
+
+        if isinstance(wo, paddle.Paddle):
+            gameevents.emit(GameEventType.PADDLE_HIT)
+            if wo.delta_x * ball.dx < 0:
+                ball.dx = -ball.dx
+
+        if isinstance(wo, obstacle.Obstacle):
+            gameevents.emit(GameEventType.OBSTACLE_BOUNCE)
+
+    def launch(self, ball) -> None:
+        ball.dx = rnd.choice([1, -1])
+        ball.dy = -1
+
+    def get_target_fps(self) -> float | None:
+        return None
+
+    def tick(self, clock: pygame.time.Clock, fps: float) -> int:
+        # SIMPLE models use clock.tick(fps) to force the motion update logic to the frame rate
+        return clock.tick(fps)
+
+
+class VectorMotion(MotionModel):
+    """
+    VECTOR_1: motion calculations using POS/VEL/ACC vectors and the clock.tick() returned delta time, so the motion
+    is unlinked from the frame rate
+    """
+
+    def integrate(self, ball, gs: GameState) -> None:
+        # ball collision wall left
+        if ball.primed_collision_wall_left and (ball.v_pos.x < ball.radius):
+            ball.primed_collision_wall_left = False
+            ball.v_vel_unit.x = -ball.v_vel_unit.x
+            ball.v_vel.x = -ball.v_vel.x
+            gameevents.emit(GameEventType.WALL_HIT_LEFT)
+        # reset the latch allowing collision detection since the ball has moved fully away
+        if ball.v_pos.x >= ball.radius:
+            ball.primed_collision_wall_left = True
+
+        # ball collision wall right
+        if ball.primed_collision_wall_right and (ball.v_pos.x > (constants.WIDTH - ball.radius)):
+            ball.primed_collision_wall_right = False
+            ball.v_vel_unit.x = -ball.v_vel_unit.x
+            ball.v_vel.x = -ball.v_vel.x
+            gameevents.emit(GameEventType.WALL_HIT_RIGHT)
+        # reset the latch allowing collision detection since the ball has moved fully away
+        if ball.v_pos.x <= (constants.WIDTH - ball.radius):
+            ball.primed_collision_wall_right = True
+
+        # ball collision wall top
+        if ball.primed_collision_wall_top and (ball.v_pos.y < ball.radius):
+            ball.primed_collision_wall_top = False
+            ball.v_vel_unit.y = -ball.v_vel_unit.y
+            ball.v_vel.y = -ball.v_vel.y
+            gameevents.emit(GameEventType.WALL_HIT_TOP)
+        # reset the latch allowing collision detection since the ball
+        # has moved fully away
+        if ball.v_pos.y >= ball.radius:
+            ball.primed_collision_wall_top = True
+
+        # WORLD_GRAVITY_ACC: apply gravity, if any
+        if gs.gravity_acc_length > 0.0:
+            ball.v_vel += gs.v_gravity_acc * gs.tick_time * 1.0
+            ball.v_vel_unit = ball.v_vel.normalize()
+
+        ball.v_pos += ball.v_vel * gs.tick_time * 1.0
+
+        ball.rect.x = int(ball.v_pos.x)
+        ball.rect.y = int(ball.v_pos.y)
+
+        ball.x = ball.rect.x
+        ball.y = ball.rect.y
+
+    def reflect(self, ball, wo, gs: GameState) -> None:
+        if ball.v_vel_unit.x > 0:  # checks for horizontal ball collision
+            x_delta = ball.rect.right - wo.rect.left
+        else:
+            x_delta = wo.rect.right - ball.rect.left
+
+        if ball.v_vel_unit.y > 0:  # checks for vertical ball collision
+            y_delta = ball.rect.bottom - wo.rect.top
+        else:
+            y_delta = wo.rect.bottom - ball.rect.top
+
+        if abs(x_delta - y_delta) < 10:
+            ball.v_vel_unit.x = -ball.v_vel_unit.x
+            ball.v_vel.x = -ball.v_vel.x
+            ball.v_vel_unit.y = -ball.v_vel_unit.y
+            ball.v_vel.y = -ball.v_vel.y
+        elif x_delta > y_delta:  # vertical collision
+            ball.v_vel_unit.y = -ball.v_vel_unit.y
+            ball.v_vel.y = -ball.v_vel.y
+        elif y_delta > x_delta:  # horizontal collision
+            ball.v_vel_unit.x = -ball.v_vel_unit.x
+            ball.v_vel.x = -ball.v_vel.x
+
+        # PADDLE_IMPULSE: add an impulse to the ball's velocity when
+        # striking the paddle, similar to brick breaking
+        if isinstance(wo, paddle.Paddle) and (gs.paddle_impulse_vel_length > 0.0):
+            # add a 'push' straight up
+            v_impulse = pygame.Vector2(0.0, -gs.paddle_impulse_vel_length)
+            ball.v_vel += v_impulse
+            ball.speed_v = ball.v_vel.magnitude()
+            gs.ball_speed_increased_ratio = ball.speed_v / constants.BALL_SPEED_VECTOR
+            ball.v_vel_unit = ball.v_vel.normalize()
+
+        if isinstance(wo, paddle.Paddle):
+            gameevents.emit(GameEventType.PADDLE_HIT)
+            if wo.delta_x * ball.v_vel_unit.x < 0:
+                ball.v_vel_unit.x = -ball.v_vel_unit.x
+                ball.v_vel.x = -ball.v_vel.x
+
+        if isinstance(wo, obstacle.Obstacle):
+            gameevents.emit(GameEventType.OBSTACLE_BOUNCE)
+
+    def launch(self, ball) -> None:
+        ball.v_vel_unit = pygame.Vector2(1.0, 0.0)
+        ball.v_vel_unit = ball.v_vel_unit.rotate(rnd.choice([-45.0, -135.0]))
+        ball.v_vel = ball.v_vel_unit * ball.speed_v
+
+
+class SubstepMotion(VectorMotion):
+    """
+    SUBSTEP_1: the VECTOR_1 state and bounces, but each frame is integrated in sub-steps (semi-implicit Euler - the
+    velocity is updated before the position) short enough that the ball never moves more than
+    MOTION_SUBSTEP_MAX_DISTANCE per sub-step, and the walls mirror the ball back rather than latching.  The energy
+    drift under gravity shrinks with the sub-step, so this stays stable at high speed_v and gravity.
+    """
+
+    def integrate(self, ball, gs: GameState) -> None:
+        dt = gs.tick_time * 1.0
+        speed = ball.v_vel.magnitude()
+        substeps = min(constants.MOTION_SUBSTEPS_MAX,
+                       max(1, math.ceil((speed * dt) / constants.MOTION_SUBSTEP_MAX_DISTANCE)))
+        h = dt / substeps
+        v_gravity_step = gs.v_gravity_acc * h if gs.gravity_acc_length > 0.0 else None
+
+        radius = ball.radius
+        right_wall = constants.WIDTH - radius
+        v_pos = ball.v_pos
+        v_vel = ball.v_vel
+        for _ in range(substeps):
+            if v_gravity_step is not None:
+                v_vel += v_gravity_step
+            v_pos += v_vel * h
+
+            # mirror the ball back off any wall it's crossed (so no latches are needed), with the normal speed
+            # picking up the work gravity does over the mirrored distance so the bounce keeps the energy
+            if v_pos.x < radius:
+                shift = 2 * (radius - v_pos.x)
+                v_pos.x += shift
+                if v_vel.x < 0:
+                    gameevents.emit(GameEventType.WALL_HIT_LEFT)
+                v_vel.x = SubstepMotion.get_mirrored_speed(v_vel.x, gs.v_gravity_acc.x, shift)
+            elif v_pos.x > right_wall:
+                shift = 2 * (right_wall - v_pos.x)
+                v_pos.x += shift
+                if v_vel.x > 0:
+                    gameevents.emit(GameEventType.WALL_HIT_RIGHT)
+                v_vel.x = -SubstepMotion.get_mirrored_speed(v_vel.x, gs.v_gravity_acc.x, shift)
+            if v_pos.y < radius:
+                shift = 2 * (radius - v_pos.y)
+                v_pos.y += shift
+                if v_vel.y < 0:
+                    gameevents.emit(GameEventType.WALL_HIT_TOP)
+                v_vel.y = SubstepMotion.get_mirrored_speed(v_vel.y, gs.v_gravity_acc.y, shift)
+
+        if v_vel.length_squared() > 0.0:
+            ball.v_vel_unit = v_vel.normalize()
+
+        ball.rect.x = int(v_pos.x)
+        ball.rect.y = int(v_pos.y)
+
+        ball.x = ball.rect.x
+        ball.y = ball.rect.y
+
+    @staticmethod
+    def get_mirrored_speed(vel: float, gravity_acc: float, shift: float) -> float:
+        """
+        The speed along a wall's normal after mirroring the ball's position by shift (energy conserving)
+
+        :param vel: velocity component along the normal, before the bounce
+        :param gravity_acc: gravity component along the normal
+        :param shift: signed distance the position was mirrored along the normal
+        :return: the (non-negative) speed away from the wall
+        """
+        return math.sqrt(max(0.0, vel * vel + 2.0 * gravity_acc * shift))
+
+
+# the registered models, in CTRL+m cycle order
+models: dict[MotionModels, MotionModel] = {}
+
+
+def register(model_name: MotionModels, model: MotionModel) -> None:
+    """
+    Add (or replace) a motion model
+
+    :param model_name: MotionModels value
+    :param model: its MotionModel
+    :return:
+    """
+    models[model_name] = model
+
+
+def get_motion_model(model_name: MotionModels) -> MotionModel:
+    """
+    Look up a registered motion model
+
+    :param model_name: MotionModels value
+    :return: its MotionModel
+    """
+    return models[model_name]
+
+
+def get_next_model_name(model_name: MotionModels) -> MotionModels:
+    """
+    The model after this one in the registry (wrapping around), for the CTRL+m cycle
+
+    :param model_name: MotionModels value
+    :return: the next MotionModels value
+    """
+    names = list(models)
+    return names[(names.index(model_name) + 1) % len(names)]
+
+
+def launch(ball) -> None:
+    """
+    Launch the ball in every registered model's state (each distinct launch() just once), so the model can
+    still be switched mid-flight
+
+    :param ball: Ball
+    :return:
+    """
+    launched = set()
+    for model in models.values():
+        launch_fn = type(model).launch
+        if launch_fn not in launched:
+            launched.add(launch_fn)
+            model.launch(ball)
+
+
+register(MotionModels.SIMPLE_1, SimpleMotion())
+register(MotionModels.VECTOR_1, VectorMotion())
+register(MotionModels.SUBSTEP_1, SubstepMotion())
@@ -0,0 +1,556 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Networked versus play between two linked cabinets.  Each cabinet runs the whole VersusMatch
+                        (both worlds) and only the players' paddle inputs cross the network, so the two copies stay
+                        identical as long as they step the same inputs from the same random state: deterministic
+                        lockstep over the match's fixed VERSUS_STEP_MS steps.
+
+                        A local input is scheduled NET_INPUT_DELAY_TICKS steps ahead (the input delay), which gives
+                        it time to reach the peer before that step is simulated.  Every packet re-sends the inputs
+                        the peer hasn't acknowledged yet, so a lost packet is covered by the next, and the peer's
+                        inputs are kept by step number, so packets arriving late or out of order (the jitter) just
+                        fill in.  When the peer's input for a step still hasn't arrived, the session predicts it
+                        (the peer's last paddle x) for up to NET_MAX_ROLLBACK_TICKS steps, snapshotting the match
+                        before each predicted step; a wrong prediction rolls the match back to that snapshot and
+                        re-runs the steps since with the real inputs.  With NET_MAX_ROLLBACK_TICKS at 0 it's pure
+                        lockstep - the session stalls until the input arrives.  The cabinets also swap gameplay
+                        checksums every NET_SYNC_INTERVAL_TICKS steps to detect a desync.
+
+                        The transport is anything with send(bytes)/receive() -> list[bytes]/close(): UdpTransport
+                        for the LAN, or a LoopbackLink's in-process ends, with simulated latency, jitter, and loss,
+                        for trying both sessions on one machine.  The sessions count their packets and bytes, stalls,
+                        rollbacks, and the time spent re-running steps.
+"""
+
+import heapq
+import random
+import socket
+import struct
+from contextlib import contextmanager
+from time import perf_counter_ns
+
+import pygame
+
+import constants
+import versus
+from gameevents import GameEvent
+from gamesettings import GameSettings
+from leveltheme import LevelTheme
+from levels import Levels
+
+MAGIC: bytes = b'SN'
+VERSION: int = 1
+
+# packet header: magic, version, sender's player number, match seed (player 1's, 0 until known), ack (the sender
+# has all of the receiver's inputs before this step), sync step and its gameplay checksum (0 if none), the first
+# step of the inputs that follow, and their count
+HEADER: struct.Struct = struct.Struct('<2sBBIIIIIB')
+# one step's input: paddle x (world coords), flags
+INPUT: struct.Struct = struct.Struct('<HB')
+INPUT_LAUNCH: int = 0x01
+
+# UDP datagrams are read into a buffer this big (well over the largest packet)
+MAX_PACKET_SIZE: int = 2048
+
+
+class UdpTransport:
+    """ Non-blocking UDP datagrams to and from the other cabinet """
+
+    def __init__(self, remote_host: str, remote_port: int = constants.NET_PORT,
+                 local_port: int = constants.NET_PORT) -> None:
+        """
+        :param remote_host: the other cabinet's host name or address
+        :param remote_port: the other cabinet's port
+        :param local_port: the port to receive on (0 for any free port)
+        """
+        self.remote_addr: tuple[str, int] = (socket.gethostbyname(remote_host), remote_port)
+        self.sock: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+        self.sock.bind(('', local_port))
+
+    def send(self, data: bytes) -> None:
+        """
+        Send a packet to the other cabinet (best effort)
+
+        :param data: the packet
+        :return:
+        """
+        try:
+            self.sock.sendto(data, self.remote_addr)
+        except OSError:
+            # e.g. the other cabinet isn't up yet - the next packet re-sends these inputs anyway
+            pass
+
+    def receive(self) -> list[bytes]:
+        """
+        The packets from the other cabinet that arrived since the last call
+
+        :return:
+        """
+        packets: list[bytes] = []
+        while True:
+            try:
+                data, addr = self.sock.recvfrom(MAX_PACKET_SIZE)
+            except BlockingIOError:
+                break
+            except ConnectionResetError:
+                # (Windows) an earlier send found nobody listening - not a problem for this packet
+                continue
+            except OSError:
+                break
+            if addr[0] == self.remote_addr[0]:
+                packets.append(data)
+        return packets
+
+    def close(self) -> None:
+        """
+        :return:
+        """
+        self.sock.close()
+
+
+class LoopbackLink:
+    """ An in-process stand-in for the network between two sessions, with simulated latency, jitter, and loss """
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, loss: float = 0.0, seed: int = 0) -> None:
+        """
+        :param latency_ms: every packet's one-way delay
+        :param jitter_ms: plus a random extra delay up to this (so packets can also arrive out of order)
+        :param loss: the chance (0.0 to 1.0) each packet is dropped
+        :param seed: for the jitter and loss, so a run is reproducible
+        """
+        self.latency_ms: float = latency_ms
+        self.jitter_ms: float = jitter_ms
+        self.loss: float = loss
+        self.rng: random.Random = random.Random(seed)
+        # the link's clock, moved on by the harness (advance())
+        self.now_ms: float = 0.0
+        # per end, a heap of (delivery time, send order, packet)
+        self.inboxes: tuple[list, list] = ([], [])
+        self.sent: int = 0
+        self.dropped: int = 0
+        self.ends: tuple[LoopbackTransport, LoopbackTransport] = (LoopbackTransport(self, 0), LoopbackTransport(self, 1))
+
+    def advance(self, ms: float) -> None:
+        """
+        Move the link's clock on
+
+        :param ms: elapsed time
+        :return:
+        """
+        self.now_ms += ms
+
+    def post(self, index: int, data: bytes) -> None:
+        """
+        Send a packet toward an end - dropped, or delivered after the latency and jitter
+
+        :param index: the receiving end (0 or 1)
+        :param data: the packet
+        :return:
+        """
+        self.sent += 1
+        if self.rng.random() < self.loss:
+            self.dropped += 1
+            return
+        deliver_ms = self.now_ms + self.latency_ms + self.rng.uniform(0.0, self.jitter_ms)
+        heapq.heappush(self.inboxes[index], (deliver_ms, self.sent, data))
+
+    def collect(self, index: int) -> list[bytes]:
+        """
+        The packets due at an end by now, in arrival order
+
+        :param index: the receiving end (0 or 1)
+        :return:
+        """
+        inbox = self.inboxes[index]
+        packets: list[bytes] = []
+        while inbox and (inbox[0][0] <= self.now_ms):
+            packets.append(heapq.heappop(inbox)[2])
+        return packets
+
+
+class LoopbackTransport:
+    """ One end of a LoopbackLink """
+
+    def __init__(self, link: LoopbackLink, index: int) -> None:
+        """
+        :param link: the LoopbackLink
+        :param index: this end (0 or 1)
+        """
+        self.link: LoopbackLink = link
+        self.index: int = index
+
+    def send(self, data: bytes) -> None:
+        """
+        :param data: the packet, for the other end
+        :return:
+        """
+        self.link.post(1 - self.index, data)
+
+    def receive(self) -> list[bytes]:
+        """
+        :return: the packets for this end that have arrived
+        """
+        return self.link.collect(self.index)
+
+    def close(self) -> None:
+        """
+        :return:
+        """
+
+
+class NetSession:
+    """ One cabinet's side of a linked versus match - the local VersusMatch, kept in lockstep with the peer's """
+
+    def __init__(self, player: int, transport, seed: int = None, level_theme: LevelTheme = LevelTheme.MODERN,
+                 level_name: Levels.LevelName = None, gset: GameSettings = None,
+                 input_delay: int = constants.NET_INPUT_DELAY_TICKS,
+                 max_rollback: int = constants.NET_MAX_ROLLBACK_TICKS) -> None:
+        """
+        :param player: the local player, 1 (left side, picks the seed) or 2 (right side)
+        :param transport: UdpTransport, LoopbackTransport, or the like
+        :param seed: the match's random seed (player 1 picks one if None, player 2 learns player 1's if None)
+        :param level_theme: LevelTheme (both cabinets must use the same)
+        :param level_name: the level to play (None is the theme's first level)
+        :param gset: GameSettings (defaults if None)
+        :param input_delay: steps between a local input and the step it's applied to
+        :param max_rollback: steps the match may run on predicted peer input (0 for pure lockstep)
+        """
+        if player not in (1, 2):
+            raise ValueError(f"the player must be 1 or 2, not {player}")
+        self.player: int = player
+        self.remote_player: int = 3 - player
+        self.transport = transport
+        self.level_theme: LevelTheme = level_theme
+        self.level_name: Levels.LevelName = level_name
+        self.gset: GameSettings = gset
+        self.input_delay: int = input_delay
+        self.max_rollback: int = max_rollback
+
+        if (seed is None) and (player == 1):
+            seed = random.getrandbits(32)
+        self.seed: int | None = seed
+        # the match's own random module state (the game code uses the global random module), swapped in while it runs
+        self.rng_state: tuple | None = None
+        self.match: versus.VersusMatch | None = None
+
+        # each player's inputs by step: (paddle x, launch) - both players' first input_delay steps are neutral
+        neutral = (constants.WIDTH // 2, False)
+        self.inputs: dict[int, dict[int, tuple[int, bool]]] = {1: dict.fromkeys(range(input_delay), neutral),
+                                                               2: dict.fromkeys(range(input_delay), neutral)}
+        # all of the peer's inputs before this step are here, and the peer has all of ours before peer_ack
+        self.remote_next: int = input_delay
+        self.peer_ack: int = input_delay
+        self.local_next: int = input_delay
+        # the steps run on a predicted peer input: step -> (the prediction, the match snapshot from before the step)
+        self.predicted: dict[int, tuple[tuple[int, bool], bytes]] = {}
+        # gameplay checksums after each sync step - ours, and the peer's still to compare
+        self.checksums: dict[int, int] = {}
+        self.peer_checksums: dict[int, int] = {}
+
+        # the fixed-step scheduler's unspent time, and the local player's input for the next step
+        self.accumulator_ms: int = 0
+        self.local_x: int = constants.WIDTH // 2
+        self.launch_pressed: bool = False
+        self.connected: bool = False
+        self.done: bool = False
+        self.font_status: pygame.font.Font | None = None
+
+        # stats
+        self.packets_sent: int = 0
+        self.packets_received: int = 0
+        self.bytes_sent: int = 0
+        self.bytes_received: int = 0
+        self.stalls: int = 0
+        self.rollbacks: int = 0
+        self.resimulated_ticks: int = 0
+        self.resimulate_ns: int = 0
+        self.resimulate_max_ns: int = 0
+        self.syncs_checked: int = 0
+        self.desyncs: int = 0
+
+        if self.seed is not None:
+            self.start()
+
+    def start(self) -> None:
+        """
+        Build the match from the seed (the same on both cabinets)
+
+        :return:
+        """
+        self.rng_state = random.Random(self.seed).getstate()
+        with self.own_random():
+            self.match = versus.VersusMatch(self.level_theme, self.level_name, self.gset)
+
+    @contextmanager
+    def own_random(self):
+        """
+        Run the match on its own random state, leaving the global random module's as it was
+
+        :return:
+        """
+        saved = random.getstate()
+        random.setstate(self.rng_state)
+        try:
+            yield
+        finally:
+            self.rng_state = random.getstate()
+            random.setstate(saved)
+
+    def update(self, elapsed_ms: int) -> list[GameEvent]:
+        """
+        Exchange inputs with the peer and run the steps the elapsed time adds up to (as far as the peer's inputs, or
+        the prediction window, allow)
+
+        :param elapsed_ms: time since the last frame (the loop's tick_time)
+        :return: the new steps' GameEvents, for the sound (re-run steps aren't voiced again)
+        """
+        self.receive()
+        events: list[GameEvent] = []
+        if self.match is not None:
+            step_ms = constants.VERSUS_STEP_MS
+            self.accumulator_ms = min(self.accumulator_ms + elapsed_ms,
+                                      step_ms * constants.VERSUS_MAX_STEPS_PER_FRAME)
+            with self.own_random():
+                self.reconcile()
+                while (self.accumulator_ms >= step_ms) and (self.match.winner is None):
+                    tick = self.match.steps
+                    if (tick >= self.remote_next) and ((tick - self.remote_next) >= self.max_rollback):
+                        # waiting on the peer's input
+                        self.stalls += 1
+                        break
+                    self.accumulator_ms -= step_ms
+                    # this step's local input is for input_delay steps from now
+                    self.inputs[self.player][tick + self.input_delay] = (self.local_x, self.launch_pressed)
+                    self.local_next = tick + self.input_delay + 1
+                    self.launch_pressed = False
+                    events += self.simulate(tick)
+            self.check_sync()
+            self.prune()
+        self.send()
+        return events
+
+    def simulate(self, tick: int) -> list[GameEvent]:
+        """
+        Run one step of the match with both players' inputs for it (predicting the peer's if it hasn't arrived)
+
+        :param tick: the step (the match's steps so far)
+        :return: the step's GameEvents
+        """
+        remote_input = self.inputs[self.remote_player].get(tick)
+        if remote_input is None:
+            # the peer's last paddle x, but no launch
+            remote_input = (self.inputs[self.remote_player][self.remote_next - 1][0], False)
+            self.predicted[tick] = (remote_input, self.match.snapshot())
+        step_inputs = {self.player: self.inputs[self.player][tick], self.remote_player: remote_input}
+
+        controls = []
+        for side in self.match.sides:
+            paddle_x, launch = step_inputs[side.player]
+            if launch:
+                side.launch()
+            controls.append((paddle_x, False, False))
+        events = self.match.step(tuple(controls))
+
+        if self.match.steps % constants.NET_SYNC_INTERVAL_TICKS == 0:
+            self.checksums[self.match.steps] = self.match.get_checksum()
+        return events
+
+    def reconcile(self) -> None:
+        """
+        Check the predicted steps against the peer's inputs that have since arrived - the right ones are confirmed,
+        and the first wrong one rolls the match back to its snapshot and re-runs the steps since
+
+        :return:
+        """
+        if not self.predicted:
+            return
+        remote_inputs = self.inputs[self.remote_player]
+        wrong_tick = None
+        for tick in sorted(self.predicted):
+            if tick >= self.remote_next:
+                break
+            if remote_inputs[tick] != self.predicted[tick][0]:
+                wrong_tick = tick
+                break
+            del self.predicted[tick]
+        if wrong_tick is None:
+            return
+
+        start_ns = perf_counter_ns()
+        end_tick = self.match.steps
+        self.match.restore(self.predicted[wrong_tick][1])
+        self.predicted.clear()
+        for tick in range(wrong_tick, end_tick):
+            if self.match.winner is not None:
+                break
+            # these steps' sounds were already played
+            self.simulate(tick)
+        elapsed_ns = perf_counter_ns() - start_ns
+        self.rollbacks += 1
+        self.resimulated_ticks += end_tick - wrong_tick
+        self.resimulate_ns += elapsed_ns
+        self.resimulate_max_ns = max(self.resimulate_max_ns, elapsed_ns)
+
+    def get_sync_point(self) -> tuple[int, int]:
+        """
+        The latest step whose checksum is final here (every input before it is real, not predicted)
+
+        :return: (step, checksum), or (0, 0) if none yet
+        """
+        final = [tick for tick in self.checksums if tick <= self.remote_next]
+        if not final:
+            return 0, 0
+        tick = max(final)
+        return tick, self.checksums[tick]
+
+    def check_sync(self) -> None:
+        """
+        Compare the peer's checksums with ours once they're final here too
+
+        :return:
+        """
+        for tick in [tick for tick in self.peer_checksums if (tick <= self.remote_next) and (tick in self.checksums)]:
+            self.syncs_checked += 1
+            if self.peer_checksums.pop(tick) != self.checksums[tick]:
+                self.desyncs += 1
+
+    def prune(self) -> None:
+        """
+        Drop the inputs and checksums that can't be needed again (everything well before the oldest step still in
+        play: re-sent, predicted from, or re-run)
+
+        :return:
+        """
+        oldest = min(self.peer_ack, self.remote_next - 1, self.match.steps, *self.predicted)
+        if oldest - min(self.inputs[self.player], default=oldest) > constants.NET_MAX_INPUTS_PER_PACKET * 4:
+            for player_inputs in self.inputs.values():
+                for tick in [tick for tick in player_inputs if tick < oldest]:
+                    del player_inputs[tick]
+            keep_from = oldest - (constants.NET_SYNC_INTERVAL_TICKS * 4)
+            for tick in [tick for tick in self.checksums if tick < keep_from]:
+                del self.checksums[tick]
+
+    def send(self) -> None:
+        """
+        Send the peer the local inputs it hasn't acknowledged (oldest first), our ack, and a sync checksum
+
+        :return:
+        """
+        first = self.peer_ack
+        count = max(0, min(self.local_next - first, constants.NET_MAX_INPUTS_PER_PACKET))
+        sync_tick, sync_crc = self.get_sync_point()
+        packet = bytearray(HEADER.size + (count * INPUT.size))
+        HEADER.pack_into(packet, 0, MAGIC, VERSION, self.player, self.seed or 0, self.remote_next, sync_tick,
+                         sync_crc, first, count)
+        local_inputs = self.inputs[self.player]
+        for i in range(count):
+            paddle_x, launch = local_inputs[first + i]
+            INPUT.pack_into(packet, HEADER.size + (i * INPUT.size), paddle_x, INPUT_LAUNCH if launch else 0)
+        self.transport.send(bytes(packet))
+        self.packets_sent += 1
+        self.bytes_sent += len(packet)
+
+    def receive(self) -> None:
+        """
+        Take in the peer's packets - its inputs (in any order, duplicates ignored), ack, checksum, and the seed
+
+        :return:
+        """
+        remote_inputs = self.inputs[self.remote_player]
+        for data in self.transport.receive():
+            self.packets_received += 1
+            self.bytes_received += len(data)
+            if len(data) < HEADER.size:
+                continue
+            magic, version, player, seed, ack, sync_tick, sync_crc, first, count = HEADER.unpack_from(data, 0)
+            if ((magic != MAGIC) or (version != VERSION) or (player != self.remote_player) or
+                    (len(data) < HEADER.size + (count * INPUT.size))):
+                continue
+            self.connected = True
+            if (self.match is None) and (player == 1):
+                self.seed = seed
+                self.start()
+
+            self.peer_ack = min(max(self.peer_ack, ack), self.local_next)
+            for i in range(count):
+                tick = first + i
+                if (tick >= self.remote_next) and (tick not in remote_inputs):
+                    paddle_x, flags = INPUT.unpack_from(data, HEADER.size + (i * INPUT.size))
+                    remote_inputs[tick] = (paddle_x, bool(flags & INPUT_LAUNCH))
+            while self.remote_next in remote_inputs:
+                self.remote_next += 1
+            if sync_tick > 0:
+                self.peer_checksums[sync_tick] = sync_crc
+
+    def get_stats(self) -> dict:
+        """
+        :return: the session's traffic, stall, rollback, and desync counts
+        """
+        seconds = max(self.match.steps if self.match else 0, 1) * constants.VERSUS_STEP_MS / 1000
+        return {'ticks': self.match.steps if self.match else 0,
+                'packets_sent': self.packets_sent, 'bytes_sent': self.bytes_sent,
+                'packets_received': self.packets_received, 'bytes_received': self.bytes_received,
+                'bytes_sent_per_sec': self.bytes_sent / seconds, 'stalls': self.stalls, 'rollbacks': self.rollbacks,
+                'resimulated_ticks': self.resimulated_ticks, 'resimulate_ms': self.resimulate_ns / 1e6,
+                'resimulate_max_ms': self.resimulate_max_ns / 1e6, 'syncs_checked': self.syncs_checked,
+                'desyncs': self.desyncs}
+
+    def handle_input(self, events: list) -> None:
+        """
+        The local player's mouse (steers their side), click or SPACE (launches), and ESC to leave
+
+        :param events: this frame's (logical coords) pygame events
+        :return:
+        """
+        view_x = 0 if self.player == 1 else constants.WIDTH - versus.VIEW_WIDTH
+        decided = (self.match is not None) and (self.match.winner is not None)
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                world_x = (event.pos[0] - view_x) * constants.WIDTH / versus.VIEW_WIDTH
+                self.local_x = int(min(max(world_x, 0), constants.WIDTH))
+            elif (event.type == pygame.MOUSEBUTTONDOWN) or ((event.type == pygame.KEYDOWN) and
+                                                            (event.key == pygame.K_SPACE)):
+                if decided:
+                    self.done = True
+                else:
+                    self.launch_pressed = True
+            elif (event.type == pygame.KEYDOWN) and (event.key == pygame.K_ESCAPE):
+                self.done = True
+
+    def run_frame(self, events: list, screen: pygame.Surface, elapsed_ms: int) -> list[GameEvent]:
+        """
+        A whole linked versus frame: input, the network exchange and steps, and the drawing (the same interface as
+        VersusMatch.run_frame())
+
+        :param events: this frame's (logical coords) pygame events
+        :param screen: the backbuffer
+        :param elapsed_ms: time since the last frame (the loop's tick_time)
+        :return: the new steps' GameEvents, for the sound
+        """
+        self.handle_input(events)
+        game_events = self.update(elapsed_ms)
+
+        if self.font_status is None:
+            self.font_status = pygame.font.Font(None, 36)
+        if self.match is None:
+            status = f"WAITING FOR PLAYER {self.remote_player}..."
+        else:
+            self.match.draw(screen)
+            status = f"LINKED - YOU ARE PLAYER {self.player}"
+            if self.desyncs > 0:
+                status += " - OUT OF SYNC"
+            elif (self.match.winner is None) and (self.match.steps >= self.remote_next + self.max_rollback):
+                status += " - WAITING FOR THE LINK"
+        versus.VersusMatch.draw_centered(screen, self.font_status, status, constants.WIDTH // 2,
+                                         constants.HEIGHT - 40)
+
+        if self.done:
+            self.transport.close()
+        return game_events
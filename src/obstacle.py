@@ -10,7 +10,8 @@
 """
 import pygame
 import constants
-from worldobject import WorldObject
+import deferredsurfaces
+from worldobject import WorldObject, CollisionLayer
 
 
 class Obstacle(WorldObject):
@@ -29,15 +30,25 @@ class Obstacle(WorldObject):
         :param value: The score value of the brick.
         """
         super().__init__()
+        self.collision_layer = CollisionLayer.OBSTACLE
 
         self.rect: pygame.rect = pygame.Rect(rect)
         self.color: pygame.color = color
         self.image: pygame.image = image
         self.text: str = text
-        if self.text.strip != "":
+        self.font_text = None
+        if not deferredsurfaces.is_deferring():
+            self.realize_surfaces()
+
+    def realize_surfaces(self) -> None:
+        """
+        Create the scaled image and text font (possibly deferred during a background level build)
+
+        :return:
+        """
+        self.image = deferredsurfaces.realize_image(self.image)
+        if self.text.strip != "" and self.font_text is None:
             self.font_text = pygame.font.Font(None, self.rect.height - 20)
-        else:
-            self.font_text = None
 
     def draw_wo(self, screen: pygame.Surface) -> None:
         """
@@ -11,12 +11,13 @@
 
 import pygame
 
+import assets
 import constants
 from gamesettings import GameSettings
 from gamestate import GameState
 from playerstate import PlayerState
 from leaderboard import Leaderboard
-from worldobject import WorldObject
+from worldobject import WorldObject, CollisionLayer
 
 
 class Paddle(WorldObject, pygame.sprite.Sprite):
@@ -32,6 +33,7 @@ class Paddle(WorldObject, pygame.sprite.Sprite):
         :param image:
         """
         super().__init__()
+        self.collision_layer = CollisionLayer.PADDLE
 
         # Set starting location for paddle in the bottom center of screen
         self.rect: pygame.rect = pygame.Rect([((constants.WIDTH / 2) - (width / 2)),
@@ -46,6 +48,22 @@ class Paddle(WorldObject, pygame.sprite.Sprite):
         self.delta_x: int = 0
         self.prev_x: int = self.rect.x
 
+        # the LASER power-up arms the paddle (drawn with its cannons)
+        self.laser: bool = False
+
+    def set_width(self, width: int) -> None:
+        """
+        Resize the Paddle (e.g. for the WIDE_PADDLE power-up), keeping it centered where it is and on the screen
+
+        :param width: the new width
+        :return:
+        """
+        centerx = self.rect.centerx
+        self.rect.width = width
+        self.rect.centerx = centerx
+        self.rect.left = max(self.rect.left, 0)
+        self.rect.right = min(self.rect.right, constants.WIDTH)
+
     def update_wo(self, gs: GameState, ps: PlayerState, lb: Leaderboard, gset: GameSettings) -> None:
         """
         Update the Paddle's pos
@@ -72,6 +90,8 @@ class Paddle(WorldObject, pygame.sprite.Sprite):
         gs.paddle_under_key_control_right = False
 
         gs.paddle_pos_x = self.commanded_pos_x
+        gs.paddle_width = self.rect.width
+        gs.paddle_laser = self.laser
         self.move_to_x(self.commanded_pos_x)
 
         # detects if the paddle is moving to the right or to the left for both keyboard and mouse controls
@@ -91,14 +111,16 @@ class Paddle(WorldObject, pygame.sprite.Sprite):
         :param screen:
         :return:
         """
+        if self.laser:
+            # the laser cannons, one at each end
+            for cannon_x in (self.rect.left + 4, self.rect.right - 10):
+                pygame.draw.rect(screen, constants.LIGHT_GRAY, (cannon_x, self.rect.y - 8, 6, 10))
+
         if self.image is None:
             pygame.draw.rect(screen, self.color, self.rect, 0, 7)
         else:
-            paddle_scale = pygame.transform.scale(self.image,
-                                                  [constants.PAD_WIDTH + 5,
-                                                   constants.PAD_HEIGHT + 5])
-            screen.blit(paddle_scale.convert_alpha(),
-                        (self.rect.x - 2.2, self.rect.y - 1.1))
+            paddle_scale = assets.get_prepared_image(self.image, (self.rect.width + 5, self.rect.height + 5))
+            screen.blit(paddle_scale, (self.rect.x - 2.2, self.rect.y - 1.1))
 
     def move_left(self, pixels: int) -> None:
         """
@@ -120,7 +142,7 @@ class Paddle(WorldObject, pygame.sprite.Sprite):
         """
         self.rect.x += pixels
         # Check that the paddle is not going too far (off the screen)
-        self.rect.x = min(self.rect.x, constants.WIDTH - constants.PAD_WIDTH)
+        self.rect.x = min(self.rect.x, constants.WIDTH - self.rect.width)
 
     def move_to_x(self, posx: int) -> None:
         """
@@ -0,0 +1,130 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: The paddle input stage.  Once per PLAYING frame, before the physics step, it drains the
+                        frame's mouse and arrow key input, timestamps it, applies the optional prediction and
+                        smoothing to the mouse position, and sets the arrow key flags for this same frame's
+                        Paddle update.  It also estimates the input-to-photon latency (input to display flip)
+                        for the dev overlay.
+"""
+
+import pygame
+
+import constants
+import presenter
+from gamesettings import GameSettings
+from gamestate import GameState
+from profiler import RingTimings
+
+
+class PaddleInput:
+    """ Turns the frame's mouse/keyboard input into the Paddle commands, and tracks the input latency """
+
+    def __init__(self, smoothing: float = constants.PADDLE_INPUT_SMOOTHING,
+                 prediction_ms: float = constants.PADDLE_INPUT_PREDICTION_MS) -> None:
+        """
+        :param smoothing: 0.0 (off) to <1.0, exponential smoothing of the mouse x (higher is smoother, but lags)
+        :param prediction_ms: extrapolate the mouse x this far ahead along its measured velocity (0.0 is off)
+        """
+        self.smoothing: float = smoothing
+        self.prediction_ms: float = prediction_ms
+
+        # the previous poll, which bounds when this frame's queued input actually happened
+        self.poll_ns: int = 0
+        # the last raw mouse sample, its (estimated) time, and the velocity (px/ms) measured between samples
+        self.raw_x: int | None = None
+        self.raw_ns: int = 0
+        self.vel_x: float = 0.0
+        self.filtered_x: float = 0.0
+
+        # estimated time of the oldest input not yet shown on screen (None if there's none waiting)
+        self.pending_input_ns: int | None = None
+        self.latency_ns: RingTimings = RingTimings(constants.PADDLE_INPUT_LATENCY_WINDOW)
+
+    def sample(self, events: list, gs: GameState, gset: GameSettings, now_ns: int) -> int:
+        """
+        Take the frame's input: set the arrow key flags for this frame and work out the mouse-commanded x
+
+        :param events: this frame's pygame events
+        :param gs: GameState
+        :param gset: GameSettings
+        :param now_ns: perf_counter_ns() of this poll
+        :return: the (predicted/smoothed) mouse x to command the Paddle to
+        """
+        # queued input happened sometime since the last poll, so call it the middle of that window - unless the
+        # polling stopped for longer than a frame (paused, or the first poll), when it's just the latest input
+        if self.poll_ns and ((now_ns - self.poll_ns) <= constants.PADDLE_INPUT_MAX_POLL_GAP_MS * 1_000_000):
+            input_ns = (self.poll_ns + now_ns) // 2
+        else:
+            input_ns = now_ns
+        self.poll_ns = now_ns
+
+        key_down_left = key_down_right = moved = False
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                moved = True
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_LEFT:
+                    key_down_left = True
+                elif event.key == pygame.K_RIGHT:
+                    key_down_right = True
+
+        # the held keys, plus any tapped (pressed and released) since the last frame, move the paddle this frame
+        if not gset.paddle_under_mouse_control or gset.paddle_under_auto_control:
+            pressed_keys = pygame.key.get_pressed()
+            if pressed_keys[pygame.K_LEFT] or key_down_left:
+                gs.paddle_under_key_control_left = True
+            elif pressed_keys[pygame.K_RIGHT] or key_down_right:
+                gs.paddle_under_key_control_right = True
+        if key_down_left or key_down_right:
+            self.mark_input(input_ns)
+
+        # the mouse position is the latest state (the MOUSEMOTION events just say it moved)
+        mouse_x = presenter.get_mouse_pos()[0]
+        if self.raw_x is None:
+            self.raw_x, self.raw_ns, self.filtered_x = mouse_x, input_ns, float(mouse_x)
+        elif moved or (mouse_x != self.raw_x):
+            elapsed_ms = (input_ns - self.raw_ns) / 1e6
+            self.vel_x = (mouse_x - self.raw_x) / elapsed_ms if elapsed_ms > 0.0 else 0.0
+            self.raw_x, self.raw_ns = mouse_x, input_ns
+            self.mark_input(input_ns)
+        else:
+            self.vel_x = 0.0
+
+        target_x = mouse_x + (self.vel_x * self.prediction_ms)
+        self.filtered_x += (1.0 - self.smoothing) * (target_x - self.filtered_x)
+        return round(self.filtered_x)
+
+    def mark_input(self, input_ns: int) -> None:
+        """
+        Note input that's waiting to be shown (keeping the oldest)
+
+        :param input_ns: estimated time of the input
+        :return:
+        """
+        if self.pending_input_ns is None:
+            self.pending_input_ns = input_ns
+
+    def record_present(self, now_ns: int) -> None:
+        """
+        The frame was just flipped to the display, so any input it used is now on screen
+
+        :param now_ns: perf_counter_ns() just after the flip
+        :return:
+        """
+        if self.pending_input_ns is not None:
+            self.latency_ns.add(now_ns - self.pending_input_ns)
+            self.pending_input_ns = None
+
+    def get_latency_ms(self) -> tuple[float, float]:
+        """
+        The recent input-to-photon latency estimates
+
+        :return: (mean, max) in ms
+        """
+        return self.latency_ns.mean() / 1e6, self.latency_ns.max() / 1e6
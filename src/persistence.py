@@ -9,6 +9,7 @@
     Module Description: This handles persisting and reading back various game/player data/objects to/from disk
 """
 
+import asyncio
 import os.path
 import pickle
 import platform
@@ -86,3 +87,135 @@ def read_object(filename: str):
 
     except FileNotFoundError:
         pass
+
+
+def store_text(text: str, filename: str) -> str:
+    """
+    Store plain text (CSV, JSON, etc.) in the game data dir
+
+    :param text: the text to store
+    :param filename: the filename to store text to
+    :return: the full path written
+    """
+
+    if GAME_DATA_PATH is None:
+        find_game_data_path()
+
+    path = os.path.join(GAME_DATA_PATH, filename)
+
+    os.makedirs(GAME_DATA_PATH, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file_out:
+        file_out.write(text)
+    return path
+
+
+
+def append_bytes(data: bytes, filename: str) -> str:
+    """
+    Append binary data to a file in the game data dir (created if needed)
+
+    :param data: the bytes to append
+    :param filename: the filename to append to
+    :return: the full path written
+    """
+
+    if GAME_DATA_PATH is None:
+        find_game_data_path()
+
+    path = os.path.join(GAME_DATA_PATH, filename)
+
+    os.makedirs(GAME_DATA_PATH, exist_ok=True)
+    with open(path, 'ab') as file_out:
+        file_out.write(data)
+    return path
+
+
+def replace_bytes(data: bytes, filename: str) -> str:
+    """
+    Store binary data in the game data dir, replacing the file in one step (written to a temp file first, so a
+    crash mid-write leaves the old file whole)
+
+    :param data: the bytes to store
+    :param filename: the filename to store to
+    :return: the full path written
+    """
+
+    if GAME_DATA_PATH is None:
+        find_game_data_path()
+
+    path = os.path.join(GAME_DATA_PATH, filename)
+
+    os.makedirs(GAME_DATA_PATH, exist_ok=True)
+    with open(path + '.tmp', 'wb') as file_out:
+        file_out.write(data)
+    os.replace(path + '.tmp', path)
+    return path
+
+
+def read_bytes(filename: str) -> bytes | None:
+    """
+    Read a binary file from the game data dir
+
+    :param filename: name of the file to read
+    :return: its contents, or None if there's no such file
+    """
+
+    if GAME_DATA_PATH is None:
+        find_game_data_path()
+
+    try:
+        with open(os.path.join(GAME_DATA_PATH, filename), 'rb') as file_in:
+            return file_in.read()
+    except FileNotFoundError:
+        return None
+
+
+def remove_file(filename: str) -> None:
+    """
+    Delete a file from the game data dir (if it's there)
+
+    :param filename: name of the file to delete
+    :return:
+    """
+
+    if GAME_DATA_PATH is None:
+        find_game_data_path()
+
+    try:
+        os.remove(os.path.join(GAME_DATA_PATH, filename))
+    except FileNotFoundError:
+        pass
+
+
+async def store_object_async(obj: object, filename: str):
+    """
+    Awaitable store_object() - pickling and writing are separate steps, yielding to the event loop in between
+    (for the browser build's run_loop_async())
+
+    :param obj: the object to store
+    :param filename: the filename to store object to
+    :return:
+    """
+
+    data: bytes = pickle.dumps(obj)
+    await asyncio.sleep(0)
+
+    if GAME_DATA_PATH is None:
+        find_game_data_path()
+
+    path = os.path.join(GAME_DATA_PATH, filename)
+
+    os.makedirs(GAME_DATA_PATH, exist_ok=True)
+    with open(path, 'wb') as file_out:
+        file_out.write(data)
+
+
+async def read_object_async(filename: str):
+    """
+    Awaitable read_object() - yields to the event loop before reading
+
+    :param filename: name of the file to read
+    :return:
+    """
+    await asyncio.sleep(0)
+    return read_object(filename)
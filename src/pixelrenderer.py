@@ -0,0 +1,75 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Offscreen renderer of pixel observations for vision-based agents.  It draws a GameWorld's
+                        objects into its own full-size canvas (never the display), scales that (nearest pixel) into
+                        a reused frame Surface of the observation size, optionally as grayscale, and exposes the
+                        frame's pixels as a zero-copy memoryview (the Surface buffer protocol, so no numpy is
+                        needed - numpy.frombuffer() can wrap it if it's installed).
+
+                        The frame is only ever written by pygame.transform, which works on the Surface while the
+                        view keeps it locked, so the same view stays valid (and current) across renders.
+"""
+
+import pygame
+
+import constants
+from gameworld import GameWorld
+
+
+class PixelRenderer:
+    """ Draws GameWorlds into a reusable offscreen frame, viewed without copying """
+
+    def __init__(self, size: tuple[int, int] = constants.PIXEL_OBS_SIZE, grayscale: bool = True) -> None:
+        """
+        :param size: (width, height) of the frame
+        :param grayscale: True for a byte per pixel, else the 32-bit pixels
+        """
+        # the Bricks/Obstacles draw text
+        pygame.font.init()
+        self.size: tuple[int, int] = tuple(size)
+        self.grayscale: bool = grayscale
+        full_size = self.size == (constants.WIDTH, constants.HEIGHT)
+
+        self.canvas: pygame.Surface = pygame.Surface((constants.WIDTH, constants.HEIGHT), 0, 32)
+        # grayscale converts the scaled canvas (or the canvas itself, at full size) into the frame
+        self.scaled: pygame.Surface | None = None
+        if grayscale and not full_size:
+            self.scaled = pygame.Surface(self.size, 0, 32)
+        self.frame: pygame.Surface = pygame.Surface(self.size, 0, 32)
+
+        # 32-bit pixels have a pitch of exactly width * 4, so every 4th byte (any color byte, once gray) is a
+        # row-major byte per pixel
+        self.pixels: memoryview = memoryview(self.frame.get_buffer())
+        if grayscale:
+            self.view: memoryview = self.pixels[self.frame.get_shifts()[0] // 8::4]
+        else:
+            self.view: memoryview = self.pixels
+        self.frame_size: int = len(self.view)
+
+    def render(self, gw: GameWorld) -> memoryview:
+        """
+        Draw the GameWorld's objects into the frame
+
+        :param gw: GameWorld (CLASSIC, or MODERN once a display mode is set, since its images convert_alpha())
+        :return: the frame's pixels - height rows of width bytes (grayscale) or 32-bit pixels (in the byte order
+                 of frame.get_shifts()), the same view every time
+        """
+        canvas = self.canvas
+        canvas.fill(constants.BLACK)
+        for world_object in gw.world_objects:
+            world_object.draw_wo(canvas)
+
+        if self.grayscale:
+            source = canvas
+            if self.scaled is not None:
+                source = pygame.transform.scale(canvas, self.size, self.scaled)
+            pygame.transform.grayscale(source, self.frame)
+        else:
+            pygame.transform.scale(canvas, self.size, self.frame)
+        return self.view
@@ -0,0 +1,435 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the power-up framework.  A destroyed Brick's power-up is released here: EXTRA_LIFE
+                        takes effect right away, and the timed power-ups (WIDE_PADDLE, SLOW_BALL, MULTI_BALL,
+                        LASER, and STICKY_PADDLE) drop a capsule that the player has to catch with the paddle.
+                        Each caught capsule is a timed effect lasting POWER_UP_DURATION_MS - catching another of
+                        the same kind while it's active adds its own, and the power-up ends with the last one.
+
+                        The timed effects are kept in an EffectScheduler, a min-heap by end time, so a frame only
+                        peeks at the soonest ending one rather than checking every active effect - the cost stays
+                        the same however many effects are running, and each one that ends costs O(log n).
+"""
+
+import heapq
+import itertools
+
+import pygame
+from pygame import Vector2
+
+import assets
+import gameevents
+from animationpool import AnimationPool
+from ball import Ball
+from constants import (HEIGHT, BLACK, LIGHT_BLUE, GREEN, ORANGE, RED, YELLOW, PAD_WIDTH, BALL_SPEED_VECTOR,
+                       EFFECT_POWER_UP_DURATION, EFFECT_POWER_UP_DROP_ACC_Y, POWER_UP_CAPSULE_WIDTH,
+                       POWER_UP_CAPSULE_HEIGHT, POWER_UP_CAPSULE_FALL_SPEED, POWER_UP_DURATION_MS,
+                       POWER_UP_WIDE_PADDLE_SCALE, POWER_UP_SLOW_BALL_SCALE, POWER_UP_MULTI_BALL_COUNT,
+                       POWER_UP_MULTI_BALL_MAX, POWER_UP_MULTI_BALL_ANGLE, POWER_UP_STICKY_HOLD_MS)
+from gameevents import GameEventType
+from gamestate import GameState
+from gameworld import GameWorld
+from playerstate import PlayerState
+from poweruptype import PowerUpType
+
+# each timed power-up's capsule: (color, letter)
+CAPSULE_LOOKS: dict[PowerUpType, tuple[tuple[int, int, int], str]] = {
+    PowerUpType.WIDE_PADDLE: (LIGHT_BLUE, 'W'),
+    PowerUpType.SLOW_BALL: (GREEN, 'S'),
+    PowerUpType.MULTI_BALL: (ORANGE, 'M'),
+    PowerUpType.LASER: (RED, 'L'),
+    PowerUpType.STICKY_PADDLE: (YELLOW, 'C'),
+}
+
+
+class Capsule:
+    """ A falling power-up capsule, waiting to be caught by the paddle """
+
+    def __init__(self, center: tuple[int, int], power_up: PowerUpType) -> None:
+        """
+        :param center: where it starts (the destroyed Brick's center)
+        :param power_up: the timed PowerUpType it holds
+        """
+        self.rect: pygame.Rect = pygame.Rect(0, 0, POWER_UP_CAPSULE_WIDTH, POWER_UP_CAPSULE_HEIGHT)
+        self.rect.center = center
+        self.y: float = self.rect.y
+        self.power_up: PowerUpType = power_up
+
+
+class EffectScheduler:
+    """ The running timed effects, in a min-heap by end time """
+
+    def __init__(self) -> None:
+        # (end ms, tie-breaking sequence number, PowerUpType) - the soonest ending is always heap[0]
+        self.heap: list[tuple[int, int, PowerUpType]] = []
+        self.sequence = itertools.count()
+        # how many of each kind are running
+        self.counts: dict[PowerUpType, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def schedule(self, effect: PowerUpType, end_ms: int) -> bool:
+        """
+        Add a running effect
+
+        :param effect: the PowerUpType
+        :param end_ms: when it ends
+        :return: True if it's the only one of its kind running (so the power-up has just started)
+        """
+        heapq.heappush(self.heap, (end_ms, next(self.sequence), effect))
+        count = self.counts.get(effect, 0) + 1
+        self.counts[effect] = count
+        return count == 1
+
+    def expire(self, now_ms: int) -> list[PowerUpType]:
+        """
+        Drop the effects that have ended by now
+
+        :param now_ms: the time now
+        :return: the kinds that have no more running (so those power-ups have just ended)
+        """
+        heap = self.heap
+        ended = []
+        while heap and (heap[0][0] <= now_ms):
+            effect = heapq.heappop(heap)[2]
+            count = self.counts[effect] - 1
+            if count == 0:
+                del self.counts[effect]
+                ended.append(effect)
+            else:
+                self.counts[effect] = count
+        return ended
+
+    def is_active(self, effect: PowerUpType) -> bool:
+        """
+        :param effect: the PowerUpType
+        :return: whether any of its kind is running
+        """
+        return effect in self.counts
+
+    def get_active(self) -> list[PowerUpType]:
+        """
+        :return: the kinds running
+        """
+        return list(self.counts)
+
+    def clear(self) -> None:
+        """
+        Drop every effect
+
+        :return:
+        """
+        self.heap.clear()
+        self.counts.clear()
+
+
+class PowerUps:
+    """ The released power-ups: the falling capsules, and the timed effects of the caught ones """
+
+    def __init__(self, contacts: set, timed: bool = True) -> None:
+        """
+        :param contacts: the engine's contact latches (a removed ball's contacts go from them)
+        :param timed: whether the timed power-ups drop capsules (otherwise only the instant ones are released)
+        """
+        self.contacts: set = contacts
+        self.timed: bool = timed
+        self.capsules: list[Capsule] = []
+        self.scheduler: EffectScheduler = EffectScheduler()
+        # the power-ups' own clock, which only runs during play (so a pause doesn't run down the effects)
+        self.now_ms: int = 0
+        self.extra_balls: list[Ball] = []
+        # the balls held by the STICKY_PADDLE: (Ball, when it launches itself)
+        self.caught_balls: list[tuple[Ball, int]] = []
+        # the capsules' letters, rendered once
+        self.labels: dict[PowerUpType, pygame.Surface] = {}
+
+    def is_active(self) -> bool:
+        """
+        :return: whether anything is falling or running
+        """
+        return bool(self.capsules or self.scheduler.counts or self.extra_balls)
+
+    def release(self, wo, animations: AnimationPool, ps: PlayerState) -> None:
+        """
+        Release a destroyed Brick's power-up
+
+        :param wo: the destroyed Brick
+        :param animations: the AnimationPool, for the EXTRA_LIFE effect
+        :param ps: PlayerState
+        :return:
+        """
+        match wo.power_up:
+            case PowerUpType.EXTRA_LIFE:
+                ps.lives += 1
+
+                # a ball floats up from the Brick (an image one, for an image Brick)
+                animations.spawn(EFFECT_POWER_UP_DURATION, wo.rect, wo.color, is_ball=True, fade=True,
+                                 v_acc=Vector2(0.0, -1.0 * EFFECT_POWER_UP_DROP_ACC_Y),
+                                 images=None if wo.image is None else [assets.BALL_IMG])
+
+                gameevents.emit(GameEventType.POWER_UP, power_up=wo.power_up)
+            case power_up if self.timed and (power_up in CAPSULE_LOOKS):
+                self.capsules.append(Capsule(wo.rect.center, power_up))
+            case _:
+                pass
+
+    def update(self, gw: GameWorld, gs: GameState) -> None:
+        """
+        Drop the capsules (starting the power-up of any caught by the paddle), then remove the balls that are lost,
+        end the effects that are over, and let go of any held ball due to launch
+
+        :param gw: GameWorld
+        :param gs: GameState
+        :return:
+        """
+        if gs.cur_state != GameState.GameStateName.PLAYING:
+            return
+        self.now_ms += gs.tick_time
+
+        if self.capsules:
+            paddle_rect = gw.world_objects[1].rect
+            fall = POWER_UP_CAPSULE_FALL_SPEED * gs.tick_time
+            falling = []
+            for capsule in self.capsules:
+                capsule.y += fall
+                capsule.rect.y = int(capsule.y)
+                if capsule.rect.colliderect(paddle_rect):
+                    self.activate(capsule.power_up, gw, gs)
+                    gameevents.emit(GameEventType.POWER_UP, power_up=capsule.power_up)
+                elif capsule.rect.top <= HEIGHT:
+                    falling.append(capsule)
+            self.capsules = falling
+
+        # a lost Ball hands over to an extra ball still in play, and the lost extra balls go (before a MULTI_BALL
+        # running out takes the rest)
+        if self.extra_balls:
+            if gw.world_objects[0].lost:
+                self.promote_extra_ball(gw)
+            lost = [ball for ball in self.extra_balls if ball.lost]
+            if lost:
+                self.remove_extra_balls(gw, lost)
+
+        for effect in self.scheduler.expire(self.now_ms):
+            self.end_effect(effect, gw, gs)
+
+        if self.caught_balls and (self.caught_balls[0][1] <= self.now_ms):
+            self.launch_caught_balls()
+
+        gs.extra_balls_in_play = len(self.extra_balls)
+
+    def activate(self, effect: PowerUpType, gw: GameWorld, gs: GameState,
+                 duration_ms: int = POWER_UP_DURATION_MS) -> None:
+        """
+        Start a timed effect
+
+        :param effect: the PowerUpType
+        :param gw: GameWorld
+        :param gs: GameState
+        :param duration_ms: how long it lasts
+        :return:
+        """
+        if self.scheduler.schedule(effect, self.now_ms + duration_ms):
+            self.start_effect(effect, gw, gs)
+        # every MULTI_BALL adds its balls
+        if effect == PowerUpType.MULTI_BALL:
+            self.add_extra_balls(gw)
+            gs.extra_balls_in_play = len(self.extra_balls)
+
+    def start_effect(self, effect: PowerUpType, gw: GameWorld, gs: GameState) -> None:
+        """
+        A power-up has started
+
+        :param effect: the PowerUpType
+        :param gw: GameWorld
+        :param gs: GameState
+        :return:
+        """
+        paddle = gw.world_objects[1]
+        match effect:
+            case PowerUpType.WIDE_PADDLE:
+                paddle.set_width(int(PAD_WIDTH * POWER_UP_WIDE_PADDLE_SCALE))
+                gs.paddle_width = paddle.rect.width
+            case PowerUpType.SLOW_BALL:
+                self.scale_ball_speeds(gw, gs, POWER_UP_SLOW_BALL_SCALE)
+                gs.ball_speed_scale = POWER_UP_SLOW_BALL_SCALE
+            case PowerUpType.LASER:
+                paddle.laser = True
+                gs.paddle_laser = True
+            case _:
+                pass
+
+    def end_effect(self, effect: PowerUpType, gw: GameWorld, gs: GameState) -> None:
+        """
+        A power-up has ended, so undo it
+
+        :param effect: the PowerUpType
+        :param gw: GameWorld
+        :param gs: GameState
+        :return:
+        """
+        paddle = gw.world_objects[1]
+        match effect:
+            case PowerUpType.WIDE_PADDLE:
+                paddle.set_width(PAD_WIDTH)
+                gs.paddle_width = paddle.rect.width
+            case PowerUpType.SLOW_BALL:
+                self.scale_ball_speeds(gw, gs, 1.0 / POWER_UP_SLOW_BALL_SCALE)
+                gs.ball_speed_scale = 1.0
+            case PowerUpType.MULTI_BALL:
+                self.remove_extra_balls(gw, list(self.extra_balls))
+            case PowerUpType.LASER:
+                paddle.laser = False
+                gs.paddle_laser = False
+            case PowerUpType.STICKY_PADDLE:
+                self.launch_caught_balls()
+            case _:
+                pass
+
+    def clear(self, gw: GameWorld, gs: GameState) -> None:
+        """
+        End every power-up and drop the falling capsules (a lost ball or a new level ends them)
+
+        :param gw: GameWorld
+        :param gs: GameState
+        :return:
+        """
+        for effect in self.scheduler.get_active():
+            self.end_effect(effect, gw, gs)
+        self.reset(gs)
+
+    def reset(self, gs: GameState) -> None:
+        """
+        Forget every power-up, without undoing them (for a new GameWorld)
+
+        :param gs: GameState (its power-up state is reset too)
+        :return:
+        """
+        self.capsules.clear()
+        self.scheduler.clear()
+        self.extra_balls.clear()
+        self.caught_balls.clear()
+        gs.ball_speed_scale = 1.0
+        gs.extra_balls_in_play = 0
+
+    def on_paddle_hit(self, ball: Ball) -> None:
+        """
+        A ball has bounced off the paddle - the STICKY_PADDLE holds it there until the player launches it (SPACE),
+        or for POWER_UP_STICKY_HOLD_MS
+
+        :param ball: the Ball
+        :return:
+        """
+        if self.scheduler.is_active(PowerUpType.STICKY_PADDLE) and (not ball.freeze_ball):
+            ball.freeze_ball = True
+            self.caught_balls.append((ball, self.now_ms + POWER_UP_STICKY_HOLD_MS))
+
+    def launch_caught_balls(self) -> None:
+        """
+        Let go of the balls held by the STICKY_PADDLE (they carry on with their bounce)
+
+        :return:
+        """
+        for ball, _ in self.caught_balls:
+            ball.freeze_ball = False
+        self.caught_balls.clear()
+
+    def add_extra_balls(self, gw: GameWorld) -> None:
+        """
+        Add MULTI_BALL's extra balls, splitting off from the Ball at spreading angles
+
+        :param gw: GameWorld
+        :return:
+        """
+        ball = gw.world_objects[0]
+        for i in range(min(POWER_UP_MULTI_BALL_COUNT, POWER_UP_MULTI_BALL_MAX - len(self.extra_balls))):
+            extra = Ball(ball.rect.x, ball.rect.y, image=ball.image)
+            extra.extra = True
+            extra.rect = ball.rect.copy()
+            extra.x, extra.y = ball.x, ball.y
+            extra.v_pos = Vector2(ball.v_pos)
+            # alternating sides, each pair further out
+            angle = POWER_UP_MULTI_BALL_ANGLE * ((i // 2) + 1) * (1 if (i % 2) == 0 else -1)
+            extra.v_vel_unit = ball.v_vel_unit.rotate(angle)
+            extra.speed_v = ball.speed_v
+            extra.v_vel = extra.v_vel_unit * extra.speed_v
+            extra.speed = ball.speed
+            extra.dx = ball.dx if (i % 2) == 0 else -ball.dx
+            extra.dy = ball.dy
+            gw.world_objects.append(extra)
+            self.extra_balls.append(extra)
+
+    def promote_extra_ball(self, gw: GameWorld) -> None:
+        """
+        The Ball was lost while extra balls were in play, so the first still in play takes over as the Ball
+        (world_objects[0]) - unless they've all been lost too, when the Ball is lost as usual on its next update
+
+        :param gw: GameWorld
+        :return:
+        """
+        ball = gw.world_objects[0]
+        ball.lost = False
+        in_play = [extra for extra in self.extra_balls if not extra.lost]
+        if not in_play:
+            return
+        successor = in_play[0]
+        self.remove_extra_balls(gw, [ball])
+        gw.world_objects.remove(successor)
+        gw.world_objects.insert(0, successor)
+        self.extra_balls.remove(successor)
+        successor.extra = False
+
+    def remove_extra_balls(self, gw: GameWorld, balls: list[Ball]) -> None:
+        """
+        Take balls out of the world (extra balls, or a lost Ball an extra one has taken over from)
+
+        :param gw: GameWorld
+        :param balls: which ones (their contacts go too)
+        :return:
+        """
+        gone = {id(ball) for ball in balls}
+        gw.world_objects = [wo for wo in gw.world_objects if id(wo) not in gone]
+        self.extra_balls = [ball for ball in self.extra_balls if id(ball) not in gone]
+        self.caught_balls = [caught for caught in self.caught_balls if id(caught[0]) not in gone]
+        for pair in [pair for pair in self.contacts if id(pair[0]) in gone]:
+            self.contacts.discard(pair)
+
+    @staticmethod
+    def scale_ball_speeds(gw: GameWorld, gs: GameState, scale: float) -> None:
+        """
+        Scale every ball's speed (in each motion model's terms)
+
+        :param gw: GameWorld
+        :param gs: GameState
+        :param scale: the factor
+        :return:
+        """
+        for wo in gw.world_objects:
+            if isinstance(wo, Ball):
+                wo.speed *= scale
+                wo.speed_v *= scale
+                wo.v_vel = wo.v_vel_unit * wo.speed_v
+        gs.ball_speed_increased_ratio = gw.world_objects[0].speed_v / BALL_SPEED_VECTOR
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """
+        Draw the falling capsules
+
+        :param screen: the screen
+        :return:
+        """
+        for capsule in self.capsules:
+            color, letter = CAPSULE_LOOKS[capsule.power_up]
+            pygame.draw.rect(screen, BLACK, capsule.rect.inflate(2, 2), 0, POWER_UP_CAPSULE_HEIGHT // 2)
+            pygame.draw.rect(screen, color, capsule.rect, 0, POWER_UP_CAPSULE_HEIGHT // 2)
+            label = self.labels.get(capsule.power_up)
+            if label is None:
+                label = pygame.font.Font(None, POWER_UP_CAPSULE_HEIGHT + 4).render(letter, True, BLACK)
+                self.labels[capsule.power_up] = label
+            screen.blit(label, label.get_rect(center=capsule.rect.center))
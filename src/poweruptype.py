@@ -17,4 +17,9 @@ class PowerUpType(Enum):
     EXTRA_LIFE = auto()
     PTS_100 = auto()
     PTS_500 = auto()
-    PTS_1000 = auto()
\ No newline at end of file
+    PTS_1000 = auto()
+    WIDE_PADDLE = auto()
+    SLOW_BALL = auto()
+    MULTI_BALL = auto()
+    LASER = auto()
+    STICKY_PADDLE = auto()
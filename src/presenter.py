@@ -0,0 +1,156 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This presenter.py provides a global/singleton (like gameevents.py) resolution-independent
+                        display.  The game always draws into the logical WIDTH x HEIGHT backbuffer, which is
+                        presented to whatever size the window/fullscreen display is: directly if it's the logical
+                        size, else scaled (centered, letterboxed) straight into a cached subsurface of the display
+                        - by a whole number with the cheap nearest-pixel scale on displays at least
+                        PRESENT_INTEGER_SCALE_MIN times the logical size, otherwise with smoothscale.  Mouse
+                        positions are mapped back to logical coordinates.
+"""
+
+import pygame
+
+import constants
+
+DIRECT, INTEGER, SMOOTH = 'direct', 'integer', 'smooth'
+
+# the display Surface and the logical backbuffer drawn into (the same Surface for DIRECT)
+window: pygame.Surface | None = None
+backbuffer: pygame.Surface | None = None
+mode: str = DIRECT
+# where the scaled frame lands on the display, and the cached display subsurface it's scaled into
+dest_rect: pygame.Rect = pygame.Rect(0, 0, constants.WIDTH, constants.HEIGHT)
+dest_surface: pygame.Surface | None = None
+
+
+def set_mode(fullscreen: bool) -> pygame.Surface:
+    """
+    Open the display - fullscreen at the desktop size, or a resizable window at the logical size
+
+    :param fullscreen: True for fullscreen
+    :return: the backbuffer to draw into
+    """
+    global backbuffer
+    # any old backbuffer was converted to the old display's format
+    backbuffer = None
+    if fullscreen:
+        surface = pygame.display.set_mode((0, 0), flags=pygame.FULLSCREEN)
+        return use_display(surface, surface.get_size())
+    return use_display(pygame.display.set_mode((constants.WIDTH, constants.HEIGHT), flags=pygame.RESIZABLE),
+                       (constants.WIDTH, constants.HEIGHT))
+
+
+def resize() -> pygame.Surface:
+    """
+    Re-fit the backbuffer to the resized window (on a VIDEORESIZE)
+
+    :return: the backbuffer to draw into (a new one if the present path changed)
+    """
+    surface = pygame.display.get_surface()
+    return use_display(surface, surface.get_size())
+
+
+def use_display(surface: pygame.Surface, size: tuple[int, int]) -> pygame.Surface:
+    """
+    Choose the present path for the display's size and cache its Surfaces
+
+    :param surface: the display Surface
+    :param size: its (width, height)
+    :return: the backbuffer to draw into
+    """
+    global window, backbuffer, mode, dest_rect, dest_surface
+
+    window = surface
+    scale = min(size[0] / constants.WIDTH, size[1] / constants.HEIGHT)
+
+    if tuple(size) == (constants.WIDTH, constants.HEIGHT):
+        mode = DIRECT
+    elif scale >= constants.PRESENT_INTEGER_SCALE_MIN:
+        mode = INTEGER
+        scale = int(scale)
+    else:
+        mode = SMOOTH
+
+    if mode == DIRECT:
+        backbuffer = window
+        dest_surface = None
+        dest_rect = pygame.Rect(0, 0, constants.WIDTH, constants.HEIGHT)
+    else:
+        if (backbuffer is None) or (backbuffer is window):
+            # in the display's pixel format, so the scaling doesn't convert every pixel
+            backbuffer = pygame.Surface((constants.WIDTH, constants.HEIGHT), 0, window)
+        dest_rect = pygame.Rect(0, 0, int(constants.WIDTH * scale), int(constants.HEIGHT * scale))
+        dest_rect.center = (size[0] // 2, size[1] // 2)
+        # the letterbox bars are never drawn over, so they're cleared just once
+        window.fill(constants.BLACK)
+        dest_surface = window.subsurface(dest_rect)
+    return backbuffer
+
+
+def present() -> None:
+    """
+    Put the backbuffer's frame on the display
+
+    :return:
+    """
+    if mode == INTEGER:
+        pygame.transform.scale(backbuffer, dest_rect.size, dest_surface)
+    elif mode == SMOOTH:
+        pygame.transform.smoothscale(backbuffer, dest_rect.size, dest_surface)
+    pygame.display.flip()
+
+
+def to_logical(pos) -> tuple[int, int]:
+    """
+    Map a display position to the backbuffer's (logical) coordinates
+
+    :param pos: (x, y) on the display
+    :return: (x, y) in the logical WIDTH x HEIGHT
+    """
+    if mode == DIRECT:
+        return pos
+    return (((pos[0] - dest_rect.x) * constants.WIDTH) // dest_rect.width,
+            ((pos[1] - dest_rect.y) * constants.HEIGHT) // dest_rect.height)
+
+
+def to_window(pos) -> tuple[int, int]:
+    """
+    Map a logical position to the display's coordinates
+
+    :param pos: (x, y) in the logical WIDTH x HEIGHT
+    :return: (x, y) on the display
+    """
+    if mode == DIRECT:
+        return pos
+    return (dest_rect.x + (pos[0] * dest_rect.width) // constants.WIDTH,
+            dest_rect.y + (pos[1] * dest_rect.height) // constants.HEIGHT)
+
+
+def get_mouse_pos() -> tuple[int, int]:
+    """
+    pygame.mouse.get_pos(), in logical coordinates
+
+    :return: (x, y)
+    """
+    return to_logical(pygame.mouse.get_pos())
+
+
+def map_events(events: list) -> list:
+    """
+    Map the mouse events' positions to logical coordinates (in place)
+
+    :param events: the frame's pygame events
+    :return: the same events
+    """
+    if mode != DIRECT:
+        for event in events:
+            if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION):
+                event.pos = to_logical(event.pos)
+    return events
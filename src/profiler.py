@@ -0,0 +1,190 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: A lightweight frame profiler.  Named spans are timed with perf_counter_ns, accumulated over
+                        each frame, and pushed into fixed-size ring buffers (with running sums) so the dev overlay
+                        can show the mean, percentiles and max per subsystem, plus a frame-time graph.
+"""
+
+import json
+from time import perf_counter_ns
+
+import constants
+
+
+class RingTimings:
+    """ A fixed-capacity ring buffer of timing samples with a running sum (O(1) mean) """
+
+    def __init__(self, capacity: int = constants.PROFILER_WINDOW_FRAMES) -> None:
+        self.capacity: int = capacity
+        self.samples: list[int] = [0] * capacity
+        self.index: int = 0
+        self.count: int = 0
+        self.total: int = 0
+
+    def add(self, value: int) -> None:
+        """
+        Add a sample, overwriting the oldest once full
+
+        :param value: the sample
+        :return:
+        """
+        self.total += value - self.samples[self.index]
+        self.samples[self.index] = value
+        self.index = (self.index + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def mean(self) -> float:
+        """
+        Running mean of the current window
+
+        :return:
+        """
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def ordered(self) -> list[int]:
+        """
+        The samples in the window, oldest first
+
+        :return:
+        """
+        if self.count < self.capacity:
+            return self.samples[:self.count]
+        return self.samples[self.index:] + self.samples[:self.index]
+
+    def percentiles(self, pcts: tuple = (50, 95, 99)) -> list[int]:
+        """
+        Nearest-rank percentiles of the current window (sorts a copy, so don't call every frame)
+
+        :param pcts: percentiles wanted
+        :return: one value per requested percentile
+        """
+        if self.count == 0:
+            return [0] * len(pcts)
+        window = sorted(self.samples[:self.count])
+        return [window[min(self.count - 1, (p * self.count) // 100)] for p in pcts]
+
+    def max(self) -> int:
+        """
+        Max of the current window
+
+        :return:
+        """
+        return max(self.samples[:self.count]) if self.count > 0 else 0
+
+
+class FrameProfiler:
+    """ Times named spans per frame and keeps a rolling window of the per-frame totals """
+
+    FRAME: str = 'frame'
+
+    def __init__(self, window: int = constants.PROFILER_WINDOW_FRAMES) -> None:
+        self.window: int = window
+        self.rings: dict[str, RingTimings] = {FrameProfiler.FRAME: RingTimings(window)}
+        # the ns accumulated by each span during the current frame
+        self.frame_ns: dict[str, int] = {}
+        self.span_start_ns: dict[str, int] = {}
+        self.frame_start_ns: int = perf_counter_ns()
+        self.frames: int = 0
+        # the percentile summary is only rebuilt every few frames, since it sorts each window
+        self.summary: dict[str, dict[str, float]] = {}
+        self.summary_frame: int = -constants.PROFILER_SUMMARY_INTERVAL
+
+    def begin(self, name: str) -> None:
+        """
+        Start timing a span (spans may be begun/ended several times in one frame, the times add up)
+
+        :param name: span name
+        :return:
+        """
+        self.span_start_ns[name] = perf_counter_ns()
+
+    def end(self, name: str) -> None:
+        """
+        Stop timing a span
+
+        :param name: span name
+        :return:
+        """
+        elapsed = perf_counter_ns() - self.span_start_ns[name]
+        self.frame_ns[name] = self.frame_ns.get(name, 0) + elapsed
+
+    def end_frame(self) -> None:
+        """
+        Close out the frame - push every span's accumulated time (and the whole frame time) into its ring
+
+        :return:
+        """
+        now = perf_counter_ns()
+        self.rings[FrameProfiler.FRAME].add(now - self.frame_start_ns)
+        self.frame_start_ns = now
+
+        for name, ring in self.rings.items():
+            if name != FrameProfiler.FRAME:
+                ring.add(self.frame_ns.get(name, 0))
+        for name, elapsed in self.frame_ns.items():
+            if name not in self.rings:
+                # a span first seen partway through is zero-filled back to the window's first frame, so every
+                # ring's samples line up frame for frame (a row of the CSV dump is one frame)
+                ring = RingTimings(self.window)
+                for _ in range(self.rings[FrameProfiler.FRAME].count - 1):
+                    ring.add(0)
+                ring.add(elapsed)
+                self.rings[name] = ring
+        self.frame_ns.clear()
+        self.frames += 1
+
+    def get_summary(self) -> dict[str, dict[str, float]]:
+        """
+        Per-span stats in ms (mean, p50, p95, p99, max), rebuilt at most every PROFILER_SUMMARY_INTERVAL frames
+
+        :return:
+        """
+        if (self.frames - self.summary_frame) >= constants.PROFILER_SUMMARY_INTERVAL:
+            self.summary = {}
+            for name, ring in self.rings.items():
+                p50, p95, p99 = ring.percentiles()
+                self.summary[name] = {'mean': ring.mean() / 1e6,
+                                      'p50': p50 / 1e6, 'p95': p95 / 1e6, 'p99': p99 / 1e6,
+                                      'max': ring.max() / 1e6}
+            self.summary_frame = self.frames
+        return self.summary
+
+    def frame_times_ms(self) -> list[float]:
+        """
+        The windowed whole-frame times in ms, oldest first (for the frame-time graph)
+
+        :return:
+        """
+        return [t / 1e6 for t in self.rings[FrameProfiler.FRAME].ordered()]
+
+    def to_csv(self) -> str:
+        """
+        Dump the raw windowed samples (ns), one column per span and one row per frame, oldest frame first
+
+        :return:
+        """
+        names = list(self.rings.keys())
+        columns = [self.rings[name].ordered() for name in names]
+        rows = [','.join(names)]
+        for row in zip(*columns):
+            rows.append(','.join(str(value) for value in row))
+        return '\n'.join(rows) + '\n'
+
+    def to_json(self) -> str:
+        """
+        Dump the stats summary plus the raw windowed samples (ns)
+
+        :return:
+        """
+        self.summary_frame = -constants.PROFILER_SUMMARY_INTERVAL
+        return json.dumps({'frames': self.frames,
+                           'summary_ms': self.get_summary(),
+                           'samples_ns': {name: ring.ordered() for name, ring in self.rings.items()}},
+                          indent=2)
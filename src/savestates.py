@@ -0,0 +1,100 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: The GameEngine's save states - snapshotting and restoring the game (see gamesnapshot.py) for
+                        the CTRL+r instant retry, the background autosave, and resuming an autosaved run from the
+                        start screen.  It's a mixin, using the engine's state.
+"""
+
+import pygame
+
+import autosave
+import gameevents
+import gamesnapshot
+import telemetry
+from gamestate import GameState
+
+
+class SaveStatesMixin:
+    """ Mixin snapshotting, restoring, and autosaving the GameEngine's game """
+
+    # the snapshot of the current level's first frame, for the CTRL+r instant retry (taken on that frame)
+    level_start_snapshot: bytes | None
+    # an autosaved run the start screen offers to resume (see offer_resume())
+    resume_data: bytes | None
+    # where a resumed run was paused from (see GameEngine.handle_events())
+    prev_state: GameState.GameStateName | None
+    mouse_pos: tuple[int, int] | None
+
+    def snapshot(self) -> bytes:
+        """
+        Capture the game's current state (see gamesnapshot.py)
+
+        :return: the snapshot
+        """
+        return gamesnapshot.snapshot(self.gw, self.gs, self.ps, self.contacts, self.animations)
+
+    def restore(self, data: bytes) -> None:
+        """
+        Put the game back to a snapshot(), dropping any pending level build and events
+
+        :param data: from snapshot()
+        :return:
+        """
+        self.level_prebuilder.cancel()
+        gameevents.clear()
+        self.power_ups.clear(self.gw, self.gs)
+        self.lasers.clear()
+        gamesnapshot.restore(data, self.gw, self.gs, self.ps, self.contacts, self.animations)
+        telemetry.begin_level(self.gw.level_name)
+
+    def autosave_run(self) -> None:
+        """
+        Hand a snapshot of the run to the background autosave (at most every AUTOSAVE_INTERVAL_MS) - a snapshot
+        only records a level's changes, so the endless mode's streamed rows aren't autosaved
+
+        :return:
+        """
+        now_ms = pygame.time.get_ticks()
+        if (self.gw.brick_field is None) and autosave.is_due(now_ms):
+            self.profiler.begin('autosave')
+            autosave.submit(self.snapshot(), now_ms)
+            self.profiler.end('autosave')
+
+    def offer_resume(self, data: bytes | None) -> None:
+        """
+        Offer an autosaved run (autosave.load()) as the start screen's resume entry
+
+        :param data: the run's snapshot, or None for no resume entry
+        :return:
+        """
+        self.resume_data = data
+        if data is None:
+            self.ui.resume_text = None
+        else:
+            summary = gamesnapshot.read_summary(data)
+            self.ui.resume_text = (f"RESUME {summary['theme'].name} LEVEL {summary['level']} - "
+                                   f"SCORE {summary['score']}")
+
+    def resume_game(self) -> None:
+        """
+        Pick up the offered autosaved run where it left off, starting PAUSED so the player can get ready
+
+        :return:
+        """
+        data = self.resume_data
+        self.offer_resume(None)
+        # a new game in the run's theme (for the Ball/Paddle images), then put back the run's state
+        self.ps.theme = gamesnapshot.read_summary(data)['theme']
+        self.reset_game()
+        self.restore(data)
+
+        self.prev_state = self.gs.cur_state
+        self.gs.cur_state = GameState.GameStateName.PAUSED
+        self.mouse_pos = pygame.mouse.get_pos()
+        pygame.mouse.set_visible(True)
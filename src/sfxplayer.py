@@ -0,0 +1,87 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: The audio system that voices the frame's GameEvents.  Sounds are loaded once and cached,
+                        and each distinct sound is played at most once per frame (so a multi-brick hit is one
+                        voiced sound).  Headless runs just disable it.
+"""
+
+import pygame
+
+import assets
+from gameevents import GameEvent, GameEventType
+
+
+class SfxPlayer:
+    """ Plays the sound effects for the GameEvents, once per frame """
+
+    def __init__(self, enabled: bool = True) -> None:
+        """
+        :param enabled: False to skip all audio (headless runs)
+        """
+        self.enabled: bool = enabled
+        # the Sound objects, keyed by asset path, created on first use (the mixer must be initialized by then)
+        self.sounds: dict[str, pygame.mixer.Sound] = {}
+
+    @staticmethod
+    def get_sfx_path(event_type: GameEventType):
+        """
+        The sound effect voiced for an event type
+
+        :param event_type: GameEventType
+        :return: the asset path, or None if the event is silent
+        """
+        match event_type:
+            case GameEventType.WALL_HIT_LEFT:
+                return assets.LEFT_WALL_SFX
+            case GameEventType.WALL_HIT_RIGHT:
+                return assets.RIGHT_WALL_SFX
+            case GameEventType.WALL_HIT_TOP:
+                return assets.TOP_WALL_SFX
+            case GameEventType.PADDLE_HIT:
+                return assets.PADDLE_SFX
+            case GameEventType.OBSTACLE_BOUNCE | GameEventType.BRICK_DAMAGED:
+                return assets.BRICK_BOUNCE_SFX
+            case GameEventType.BRICK_DESTROYED:
+                return assets.BRICK_SFX
+            case _:
+                return None
+
+    def play(self, sfx_path: str, volume: float) -> None:
+        """
+        Play a single sound effect on any channel (stealing the oldest if they're all busy)
+
+        :param sfx_path: asset path of the sound
+        :param volume: 0.0 to 1.0
+        :return:
+        """
+        if not self.enabled:
+            return
+        snd = self.sounds.get(sfx_path)
+        if snd is None:
+            snd = pygame.mixer.Sound(sfx_path)
+            self.sounds[sfx_path] = snd
+        snd.set_volume(volume)
+        pygame.mixer.find_channel(True).play(snd)
+
+    def play_events(self, events: list[GameEvent], volume: float) -> None:
+        """
+        Voice the frame's events, playing each distinct sound only once
+
+        :param events: this frame's GameEvents
+        :param volume: 0.0 to 1.0
+        :return:
+        """
+        if not self.enabled:
+            return
+        voiced: set[str] = set()
+        for event in events:
+            sfx_path = SfxPlayer.get_sfx_path(event.event_type)
+            if (sfx_path is not None) and (sfx_path not in voiced):
+                voiced.add(sfx_path)
+                self.play(sfx_path, volume)
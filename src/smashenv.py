@@ -0,0 +1,431 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: A headless, Gym-style (reset(seed)/step(action)) environment for training paddle agents.  A
+                        SmashEnv runs the GameWorld's Ball/Paddle/Bricks with the GameEngine's shared collision handling,
+                        but no display, sound, or Animations.  The action moves the paddle like the arrow keys, the
+                        reward is the PlayerState.score gained, and the observation is a compact array('f'): the
+                        ball position and velocity, the paddle x, and a brick bitmap.  An episode ends when the
+                        lives run out or the level is cleared.
+
+                        SmashVectorEnv steps N SmashEnvs in lockstep in this process, and SubprocVectorEnv splits
+                        them across worker processes.  Both take/return flat arrays (N rows of OBS_SIZE for the
+                        observations) and reset a finished env automatically.  SubprocVectorEnv can also have its
+                        workers render pixel observations (PixelRenderer), published into a shared memory FrameRing
+                        per env and read in place.
+
+                        The game code uses the (global) random module, so reset(seed) seeds it: a seeded run is
+                        reproducible for the same number of envs per process.  snapshot()/restore() save and return
+                        to a point in an episode (random state included), e.g. for a look-ahead search.
+"""
+
+import multiprocessing
+import os
+import random
+from array import array
+
+import pygame
+
+import constants
+import gameevents
+import gamesnapshot
+from animationpool import AnimationPool
+from brick import Brick
+from collisions import CollisionHandler
+from framering import FrameRing
+from gamesettings import GameSettings
+from gamestate import GameState
+from gameworld import GameWorld
+from leaderboard import Leaderboard
+from levels import Levels
+from leveltheme import LevelTheme
+from pixelrenderer import PixelRenderer
+from playerstate import PlayerState
+from powerups import PowerUps
+
+ACTION_STAY, ACTION_LEFT, ACTION_RIGHT = 0, 1, 2
+NUM_ACTIONS: int = 3
+
+BRICK_COLS: int = constants.WIDTH // constants.ENV_BRICK_CELL_SIZE
+BRICK_ROWS: int = constants.HEIGHT // constants.ENV_BRICK_CELL_SIZE
+# ball x, y, vel x, vel y, paddle x, then a 0.0/1.0 per brick bitmap cell (row major)
+STATE_SIZE: int = 5
+OBS_SIZE: int = STATE_SIZE + (BRICK_COLS * BRICK_ROWS)
+
+
+class SmashEnv(CollisionHandler):
+    """ One headless game, stepped by an agent's actions (with the engine's collision handling) """
+
+    def __init__(self, level_theme: LevelTheme = LevelTheme.CLASSIC, level_name: Levels.LevelName = None,
+                 frame_skip: int = constants.ENV_FRAME_SKIP, max_steps: int = constants.ENV_MAX_STEPS) -> None:
+        """
+        :param level_theme: LevelTheme (MODERN needs assets.load_assets() first, for the images)
+        :param level_name: the level to play (None is the theme's first level)
+        :param frame_skip: game frames per step, all with the step's action
+        :param max_steps: truncate the episode after this many steps
+        """
+        # the strong Bricks make a Font for their strength
+        pygame.font.init()
+        self.level_theme: LevelTheme = level_theme
+        self.level_name: Levels.LevelName = level_name
+        self.frame_skip: int = frame_skip
+        self.max_steps: int = max_steps
+
+        # an empty Leaderboard (the Ball checks it at game over) and default settings
+        self.lb: Leaderboard = Leaderboard()
+        self.gset: GameSettings = GameSettings()
+        self.ps: PlayerState = PlayerState()
+        self.gs: GameState = GameState()
+        self.gw: GameWorld | None = None
+        self.ball = None
+        self.paddle = None
+        # what the shared collision handling expects of the engine
+        self.contacts: set = set()
+        self.animations: AnimationPool = AnimationPool()
+        # only the instant power-ups (the timed ones' capsules and effects aren't part of a snapshot)
+        self.power_ups: PowerUps = PowerUps(self.contacts, timed=False)
+
+        self.steps: int = 0
+        # the brick bitmap is only rebuilt when the world's object count changes (a Brick was removed)
+        self.bitmap: array = array('f', bytes(4 * (OBS_SIZE - STATE_SIZE)))
+        self.world_size: int = -1
+
+    def reset(self, seed: int = None) -> tuple[array, dict]:
+        """
+        Start a new episode
+
+        :param seed: seeds the random module (for the level build and ball launches), if given
+        :return: (observation, info)
+        """
+        if seed is not None:
+            random.seed(seed)
+        gameevents.clear()
+        self.contacts.clear()
+        self.animations.clear()
+
+        self.ps = PlayerState()
+        self.ps.theme = self.level_theme
+        self.gs = GameState()
+        self.gs.cur_state = GameState.GameStateName.PLAYING
+        self.gs.tick_time = 1000 // constants.MAX_FPS_VECTOR
+        self.gw = GameWorld(self.level_theme, self.level_name)
+        # the GameWorld always places the Ball, then the Paddle
+        self.ball, self.paddle = self.gw.world_objects[0], self.gw.world_objects[1]
+
+        self.steps = 0
+        self.world_size = -1
+        return self.get_observation(), self.get_info()
+
+    def step(self, action: int) -> tuple[array, float, bool, bool, dict]:
+        """
+        Run frame_skip game frames with the action
+
+        :param action: ACTION_STAY, ACTION_LEFT, or ACTION_RIGHT
+        :return: (observation, reward, terminated, truncated, info)
+        """
+        start_score = self.ps.score
+        terminated = False
+        for _ in range(self.frame_skip):
+            self.run_frame(action)
+            terminated = (self.ps.lives <= 0) or self.gs.level_cleared
+            if terminated:
+                break
+        self.steps += 1
+        truncated = (not terminated) and (self.steps >= self.max_steps)
+        return self.get_observation(), float(self.ps.score - start_score), terminated, truncated, self.get_info()
+
+    def run_frame(self, action: int) -> None:
+        """
+        One game frame - the Ball/Paddle step (see CollisionHandler.step_ball_and_paddle()), then the scoring
+
+        :param action: ACTION_STAY, ACTION_LEFT, or ACTION_RIGHT
+        :return:
+        """
+        gs = self.gs
+        if action == ACTION_LEFT:
+            gs.paddle_under_key_control_left = True
+        elif action == ACTION_RIGHT:
+            gs.paddle_under_key_control_right = True
+
+        self.step_ball_and_paddle()
+
+        # the scoring half of the engine's event dispatch
+        for event in gameevents.drain():
+            self.ps.score += event.points
+
+        if len(self.gw.world_objects) != self.world_size:
+            self.update_bricks()
+
+        # an agent can't press SPACE, so a lost ball relaunches right away
+        if (gs.cur_state == GameState.GameStateName.READY_TO_LAUNCH) and (self.ps.lives > 0):
+            gs.cur_state = GameState.GameStateName.PLAYING
+
+    def update_bricks(self) -> None:
+        """
+        Rebuild the brick bitmap, and check for the level being cleared
+
+        :return:
+        """
+        self.world_size = len(self.gw.world_objects)
+        bitmap = self.bitmap
+        for i in range(len(bitmap)):
+            bitmap[i] = 0.0
+        cleared = True
+        cell = constants.ENV_BRICK_CELL_SIZE
+        for wo in self.gw.world_objects:
+            if isinstance(wo, Brick):
+                cleared = False
+                col = min(max(wo.rect.centerx // cell, 0), BRICK_COLS - 1)
+                row = min(max(wo.rect.centery // cell, 0), BRICK_ROWS - 1)
+                bitmap[row * BRICK_COLS + col] = 1.0
+        if cleared:
+            self.gs.level_cleared = True
+
+    def get_observation(self) -> array:
+        """
+        The agent's view of the game
+
+        :return: array('f') of OBS_SIZE - ball x, y (0.0 to 1.0 of the screen), ball vel x, y (in initial ball
+                 speeds), paddle x (0.0 to 1.0), then the brick bitmap
+        """
+        if len(self.gw.world_objects) != self.world_size:
+            self.update_bricks()
+        ball = self.ball
+        obs = array('f', (ball.rect.centerx / constants.WIDTH, ball.rect.centery / constants.HEIGHT,
+                          ball.v_vel.x / constants.BALL_SPEED_VECTOR, ball.v_vel.y / constants.BALL_SPEED_VECTOR,
+                          self.paddle.rect.centerx / constants.WIDTH))
+        obs.extend(self.bitmap)
+        return obs
+
+    def get_info(self) -> dict:
+        """
+        :return: the episode's score, lives, and steps so far
+        """
+        return {'score': self.ps.score, 'lives': self.ps.lives, 'steps': self.steps}
+
+    def snapshot(self) -> bytes:
+        """
+        Capture the episode at this step (see gamesnapshot.py)
+
+        :return: the snapshot, with the step count on the end
+        """
+        return (gamesnapshot.snapshot(self.gw, self.gs, self.ps, self.contacts) +
+                self.steps.to_bytes(4, 'little'))
+
+    def restore(self, data: bytes) -> None:
+        """
+        Return the episode to a snapshot() (of this env, or another with the same level_theme)
+
+        :param data: from snapshot()
+        :return:
+        """
+        gameevents.clear()
+        gamesnapshot.restore(data[:-4], self.gw, self.gs, self.ps, self.contacts)
+        self.steps = int.from_bytes(data[-4:], 'little')
+        self.world_size = -1
+
+
+class SmashVectorEnv:
+    """ N SmashEnvs stepped in lockstep, in this process """
+
+    def __init__(self, num_envs: int, **env_kwargs) -> None:
+        """
+        :param num_envs: how many SmashEnvs
+        :param env_kwargs: passed to each SmashEnv
+        """
+        self.num_envs: int = num_envs
+        self.envs: list[SmashEnv] = [SmashEnv(**env_kwargs) for _ in range(num_envs)]
+
+    def reset(self, seed: int = None) -> tuple[array, list[dict]]:
+        """
+        Reset every env (env i with seed + i)
+
+        :param seed: optional base seed
+        :return: (observations, infos) - num_envs rows of OBS_SIZE
+        """
+        observations = array('f')
+        infos = []
+        for i, env in enumerate(self.envs):
+            obs, info = env.reset(None if seed is None else seed + i)
+            observations.extend(obs)
+            infos.append(info)
+        return observations, infos
+
+    def step(self, actions) -> tuple[array, array, bytes, bytes, list[dict]]:
+        """
+        Step every env with its action.  A finished env is reset, returning its new episode's first observation
+        (its last one is in its info as 'final_observation')
+
+        :param actions: a sequence of num_envs actions
+        :return: (observations, rewards, terminated, truncated, infos) - observations is num_envs rows of
+                 OBS_SIZE, rewards an array('f'), terminated/truncated a byte (0/1) per env
+        """
+        observations = array('f')
+        rewards = array('f', bytes(4 * self.num_envs))
+        terminated = bytearray(self.num_envs)
+        truncated = bytearray(self.num_envs)
+        infos = []
+        for i, env in enumerate(self.envs):
+            obs, rewards[i], terminated[i], truncated[i], info = env.step(actions[i])
+            if terminated[i] or truncated[i]:
+                info['final_observation'] = obs
+                obs, _ = env.reset()
+            observations.extend(obs)
+            infos.append(info)
+        return observations, rewards, bytes(terminated), bytes(truncated), infos
+
+    def close(self) -> None:
+        """
+        Nothing to release in process
+
+        :return:
+        """
+
+
+def run_worker(conn, num_envs: int, env_kwargs: dict, rings: list[FrameRing] = None,
+               pixel_size: tuple[int, int] = None, grayscale: bool = True) -> None:
+    """
+    A SubprocVectorEnv worker process: runs its share of the envs as a SmashVectorEnv, answering the parent's
+    ('reset', seed), ('step', actions bytes), and ('close', None) commands
+
+    :param conn: this worker's end of the Pipe
+    :param num_envs: how many of the envs this worker runs
+    :param env_kwargs: passed to each SmashEnv
+    :param rings: if rendering pixels, a FrameRing per env to publish its frames into
+    :param pixel_size: the frames' (width, height)
+    :param grayscale: grayscale or 32-bit frames
+    :return:
+    """
+    vector_env = SmashVectorEnv(num_envs, **env_kwargs)
+    renderer = PixelRenderer(pixel_size, grayscale) if rings else None
+    while True:
+        command, data = conn.recv()
+        if command == 'reset':
+            observations, infos = vector_env.reset(data)
+        elif command == 'step':
+            observations, rewards, terminated, truncated, infos = vector_env.step(data)
+        # every env's frame is published before the reply, so the parent only reads finished frames
+        if (renderer is not None) and (command != 'close'):
+            for env, ring in zip(vector_env.envs, rings):
+                ring.publish(renderer.render(env.gw))
+        if command == 'reset':
+            conn.send((observations.tobytes(), infos))
+        elif command == 'step':
+            conn.send((observations.tobytes(), rewards.tobytes(), terminated, truncated, infos))
+        else:
+            conn.close()
+            return
+
+
+class SubprocVectorEnv:
+    """ N SmashEnvs stepped in lockstep, split across worker processes (the same interface as SmashVectorEnv) """
+
+    def __init__(self, num_envs: int, num_workers: int = None, pixel_size: tuple[int, int] = None,
+                 grayscale: bool = True, **env_kwargs) -> None:
+        """
+        :param num_envs: how many SmashEnvs
+        :param num_workers: how many worker processes (default one per CPU, at most num_envs)
+        :param pixel_size: if given, the workers also render (width, height) pixel frames (see get_frames())
+        :param grayscale: grayscale (a byte per pixel) or 32-bit frames
+        :param env_kwargs: passed to each SmashEnv
+        """
+        self.num_envs: int = num_envs
+        self.rings: list[FrameRing] = []
+        if pixel_size is not None:
+            frame_size = pixel_size[0] * pixel_size[1] * (1 if grayscale else 4)
+            self.rings = [FrameRing(frame_size) for _ in range(num_envs)]
+        num_workers = min(num_envs, num_workers or os.cpu_count() or 1)
+        # as even a split as possible - each worker's (first env index, env count)
+        self.chunks: list[tuple[int, int]] = []
+        start = 0
+        for i in range(num_workers):
+            count = (num_envs - start) // (num_workers - i)
+            self.chunks.append((start, count))
+            start += count
+
+        self.conns = []
+        self.workers = []
+        for start, count in self.chunks:
+            parent_conn, child_conn = multiprocessing.Pipe()
+            worker = multiprocessing.Process(target=run_worker, daemon=True,
+                                             args=(child_conn, count, env_kwargs, self.rings[start:start + count],
+                                                   pixel_size, grayscale))
+            worker.start()
+            child_conn.close()
+            self.conns.append(parent_conn)
+            self.workers.append(worker)
+
+    def reset(self, seed: int = None) -> tuple[array, list[dict]]:
+        """
+        Reset every env (env i with seed + i)
+
+        :param seed: optional base seed
+        :return: (observations, infos) - num_envs rows of OBS_SIZE
+        """
+        for conn, (start, _) in zip(self.conns, self.chunks):
+            conn.send(('reset', None if seed is None else seed + start))
+        observations = array('f')
+        infos = []
+        for conn in self.conns:
+            obs_bytes, worker_infos = conn.recv()
+            observations.frombytes(obs_bytes)
+            infos.extend(worker_infos)
+        return observations, infos
+
+    def step(self, actions) -> tuple[array, array, bytes, bytes, list[dict]]:
+        """
+        Step every env with its action (all the workers at once), resetting the finished ones
+
+        :param actions: a sequence of num_envs actions
+        :return: (observations, rewards, terminated, truncated, infos), as SmashVectorEnv.step()
+        """
+        actions = bytes(actions)
+        for conn, (start, count) in zip(self.conns, self.chunks):
+            conn.send(('step', actions[start:start + count]))
+        observations = array('f')
+        rewards = array('f')
+        terminated = bytearray()
+        truncated = bytearray()
+        infos = []
+        for conn in self.conns:
+            obs_bytes, reward_bytes, worker_terminated, worker_truncated, worker_infos = conn.recv()
+            observations.frombytes(obs_bytes)
+            rewards.frombytes(reward_bytes)
+            terminated += worker_terminated
+            truncated += worker_truncated
+            infos.extend(worker_infos)
+        return observations, rewards, bytes(terminated), bytes(truncated), infos
+
+    def get_frames(self, age: int = 0) -> list[memoryview]:
+        """
+        Each env's pixel frame, read in place from its FrameRing (so only valid until the ring's slots wrap around
+        to it again)
+
+        :param age: 0 for the latest frames (of the last reset()/step()), 1 for the ones before, etc. (up to the
+                    ring's slots - 1)
+        :return: a view per env (see PixelRenderer.render() for the layout)
+        """
+        return [ring.get_frame(ring.get_count() - 1 - age) for ring in self.rings]
+
+    def close(self) -> None:
+        """
+        Stop the worker processes, and free the frame rings (release any views from get_frames() first)
+
+        :return:
+        """
+        for conn in self.conns:
+            conn.send(('close', None))
+            conn.close()
+        for worker in self.workers:
+            worker.join()
+        for ring in self.rings:
+            ring.close()
+            ring.unlink()
+        self.conns = []
+        self.workers = []
+        self.rings = []
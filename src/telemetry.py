@@ -0,0 +1,214 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This telemetry.py provides a global/singleton (like gameevents.py) opt-in recorder of the
+                        per-level gameplay stats used to tune the level layouts: brick hits by screen grid cell,
+                        paddle contact x-offsets, wall bounces, time-to-clear, and lives lost.  The counts go
+                        into preallocated arrays and, at each level end, a worker thread compresses and appends
+                        them to the telemetry file as one columnar record (see telemetryheatmap.py to view them).
+"""
+
+import struct
+import threading
+import zlib
+from array import array
+
+import constants
+import persistence
+
+TELEMETRY_FILENAME: str = 'telemetry.bin'
+
+# record header: magic, format version, LevelName value, cleared?, play ms to clear/end, lives lost,
+# grid columns, grid rows, paddle offset bins, length of the compressed columns that follow
+HEADER: struct.Struct = struct.Struct('<4sHHHIHHHHI')
+MAGIC: bytes = b'SCTL'
+VERSION: int = 1
+
+GRID_COLS: int = constants.WIDTH // constants.TELEMETRY_CELL_SIZE
+GRID_ROWS: int = constants.HEIGHT // constants.TELEMETRY_CELL_SIZE
+PADDLE_BINS: int = constants.TELEMETRY_PADDLE_BINS
+# the paddle offsets binned run from the ball centered over either paddle end
+PADDLE_OFFSET_RANGE: int = constants.PAD_WIDTH + (2 * constants.BALL_RADIUS)
+WALLS: int = 3  # left, right, top
+WALL_LEFT, WALL_RIGHT, WALL_TOP = range(WALLS)
+
+# False unless opted in (main.py --telemetry), so every record_*() is just the one check
+enabled: bool = False
+
+# the current level's counts - allocated once, and zeroed in place for each level
+brick_hits: array = array('I', bytes(4 * GRID_COLS * GRID_ROWS))
+paddle_offsets: array = array('I', bytes(4 * PADDLE_BINS))
+wall_bounces: array = array('I', bytes(4 * WALLS))
+level_value: int = 0
+play_ms: int = 0
+lives_lost: int = 0
+in_level: bool = False
+
+# the last level end's background append (if still running)
+flush_thread: threading.Thread | None = None
+
+
+def enable(on: bool = True) -> None:
+    """
+    Opt in (or out) of recording
+
+    :param on: True to record
+    :return:
+    """
+    global enabled
+    enabled = on
+
+
+def begin_level(level_name) -> None:
+    """
+    Start counting a new level (ending any level still in progress, as not cleared)
+
+    :param level_name: Levels.LevelName
+    :return:
+    """
+    global level_value, play_ms, lives_lost, in_level
+    if not enabled:
+        return
+    if in_level:
+        end_level(False)
+    brick_hits[:] = array('I', bytes(4 * GRID_COLS * GRID_ROWS))
+    paddle_offsets[:] = array('I', bytes(4 * PADDLE_BINS))
+    wall_bounces[:] = array('I', bytes(4 * WALLS))
+    level_value = level_name.value
+    play_ms = 0
+    lives_lost = 0
+    in_level = True
+
+
+def record_brick_hit(x: int, y: int) -> None:
+    """
+    Count a ball hit on the brick at (x, y)
+
+    :param x: brick center x
+    :param y: brick center y
+    :return:
+    """
+    if enabled:
+        col = min(max(x // constants.TELEMETRY_CELL_SIZE, 0), GRID_COLS - 1)
+        row = min(max(y // constants.TELEMETRY_CELL_SIZE, 0), GRID_ROWS - 1)
+        brick_hits[row * GRID_COLS + col] += 1
+
+
+def record_paddle_contact(offset_x: int) -> None:
+    """
+    Count a ball contact with the paddle
+
+    :param offset_x: ball center x minus paddle center x
+    :return:
+    """
+    if enabled:
+        index = ((offset_x * PADDLE_BINS) // PADDLE_OFFSET_RANGE) + (PADDLE_BINS // 2)
+        paddle_offsets[min(max(index, 0), PADDLE_BINS - 1)] += 1
+
+
+def record_wall_bounce(wall: int) -> None:
+    """
+    Count a wall bounce
+
+    :param wall: WALL_LEFT, WALL_RIGHT, or WALL_TOP
+    :return:
+    """
+    if enabled:
+        wall_bounces[wall] += 1
+
+
+def record_life_lost() -> None:
+    """
+    Count a life lost on this level
+
+    :return:
+    """
+    global lives_lost
+    if enabled:
+        lives_lost += 1
+
+
+def add_play_time(tick_ms: int) -> None:
+    """
+    Add a PLAYING frame's time to this level's time-to-clear
+
+    :param tick_ms: the frame's ms
+    :return:
+    """
+    global play_ms
+    if enabled:
+        play_ms += tick_ms
+
+
+def end_level(cleared: bool) -> None:
+    """
+    Close out the level, appending its record to the telemetry file on a worker thread
+
+    :param cleared: True if the level was cleared (rather than the game ending/restarting)
+    :return:
+    """
+    global in_level, flush_thread
+    if not (enabled and in_level):
+        return
+    in_level = False
+    # snapshot the counts (a quick copy) so the next level can reuse the arrays while this one is written
+    header = (level_value, int(cleared), int(play_ms), lives_lost)
+    columns = brick_hits.tobytes() + paddle_offsets.tobytes() + wall_bounces.tobytes()
+    wait()
+    flush_thread = threading.Thread(target=_append_record, args=(header, columns), daemon=True)
+    flush_thread.start()
+
+
+def _append_record(header: tuple, columns: bytes) -> None:
+    """
+    Worker thread target - compress and append one level's record
+
+    :param header: (LevelName value, cleared, play ms, lives lost)
+    :param columns: the raw count columns
+    :return:
+    """
+    packed = zlib.compress(columns)
+    persistence.append_bytes(HEADER.pack(MAGIC, VERSION, *header, GRID_COLS, GRID_ROWS, PADDLE_BINS, len(packed))
+                             + packed, TELEMETRY_FILENAME)
+
+
+def wait(timeout: float = None) -> None:
+    """
+    Wait for the last level's record to be written (before shutting down, in tests, etc.)
+
+    :param timeout: seconds, or None to wait until done
+    :return:
+    """
+    if flush_thread is not None:
+        flush_thread.join(timeout)
+
+
+def read_records(data: bytes) -> list[dict]:
+    """
+    Parse the telemetry file's records
+
+    :param data: the file contents
+    :return: one dict per level played, with the header values and the count columns as arrays
+    """
+    records = []
+    offset = 0
+    while offset + HEADER.size <= len(data):
+        (magic, version, level, cleared, level_play_ms, level_lives_lost,
+         cols, rows, bins, packed_len) = HEADER.unpack_from(data, offset)
+        if magic != MAGIC or version != VERSION:
+            break
+        offset += HEADER.size
+        columns = array('I')
+        columns.frombytes(zlib.decompress(data[offset:offset + packed_len]))
+        offset += packed_len
+        cells = cols * rows
+        records.append({'level': level, 'cleared': bool(cleared), 'play_ms': level_play_ms,
+                        'lives_lost': level_lives_lost, 'cols': cols, 'rows': rows,
+                        'brick_hits': columns[:cells], 'paddle_offsets': columns[cells:cells + bins],
+                        'wall_bounces': columns[cells + bins:]})
+    return records
@@ -0,0 +1,139 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: Offline viewer for the telemetry recorded with main.py --telemetry.  Sums the records of
+                        each LevelName and renders one PNG per level: the brick hit heatmap over the screen, the
+                        paddle contact x-offset histogram, and the level's plays/clears/time/lives/wall totals.
+
+                        python telemetryheatmap.py [telemetry file] [output dir]
+                        (defaults to the telemetry file in the game data dir, writing to the working dir)
+"""
+
+import os
+import sys
+from array import array
+
+import pygame
+
+import constants
+import persistence
+import telemetry
+from levels import Levels
+
+HISTOGRAM_HEIGHT: int = 120
+STATS_HEIGHT: int = 60
+
+
+def sum_by_level(records: list[dict]) -> dict:
+    """
+    Add up the records of each LevelName
+
+    :param records: from telemetry.read_records()
+    :return: LevelName -> the summed record (plus plays/clears counts)
+    """
+    levels = {}
+    for record in records:
+        level_name = Levels.LevelName(record['level'])
+        total = levels.get(level_name)
+        if total is None:
+            total = {'plays': 0, 'clears': 0, 'clear_ms': 0, 'lives_lost': 0,
+                     'cols': record['cols'], 'rows': record['rows'],
+                     'brick_hits': array('I', bytes(len(record['brick_hits']) * 4)),
+                     'paddle_offsets': array('I', bytes(len(record['paddle_offsets']) * 4)),
+                     'wall_bounces': array('I', bytes(len(record['wall_bounces']) * 4))}
+            levels[level_name] = total
+        total['plays'] += 1
+        total['lives_lost'] += record['lives_lost']
+        if record['cleared']:
+            total['clears'] += 1
+            total['clear_ms'] += record['play_ms']
+        for column in ('brick_hits', 'paddle_offsets', 'wall_bounces'):
+            for i, count in enumerate(record[column]):
+                total[column][i] += count
+    return levels
+
+
+def get_heat_color(heat: float) -> tuple[int, int, int]:
+    """
+    Black -> red -> yellow -> white ramp
+
+    :param heat: 0.0 to 1.0
+    :return: RGB
+    """
+    return (min(255, int(heat * 3 * 255)), min(255, max(0, int((heat * 3 - 1) * 255))),
+            min(255, max(0, int((heat * 3 - 2) * 255))))
+
+
+def render_level(level_name: Levels.LevelName, total: dict, font: pygame.font.Font) -> pygame.Surface:
+    """
+    Draw one level's heatmap, paddle histogram, and stats
+
+    :param level_name: LevelName
+    :param total: the summed record
+    :param font: for the stats text
+    :return: the rendered Surface
+    """
+    cell = constants.TELEMETRY_CELL_SIZE
+    cols, rows = total['cols'], total['rows']
+    surface = pygame.Surface((cols * cell, rows * cell + HISTOGRAM_HEIGHT + STATS_HEIGHT))
+    surface.fill(constants.BLACK)
+
+    hottest = max(total['brick_hits']) or 1
+    for i, hits in enumerate(total['brick_hits']):
+        if hits:
+            pygame.draw.rect(surface, get_heat_color(hits / hottest),
+                             ((i % cols) * cell, (i // cols) * cell, cell - 1, cell - 1))
+
+    # the paddle offset histogram, left paddle end to right
+    top = rows * cell
+    bins = total['paddle_offsets']
+    tallest = max(bins) or 1
+    bin_width = surface.get_width() // len(bins)
+    for i, count in enumerate(bins):
+        bar_height = (HISTOGRAM_HEIGHT - 10) * count // tallest
+        pygame.draw.rect(surface, constants.GREEN, (i * bin_width + 2, top + HISTOGRAM_HEIGHT - bar_height,
+                                                    bin_width - 4, bar_height))
+
+    walls = total['wall_bounces']
+    clear_secs = total['clear_ms'] / total['clears'] / 1000 if total['clears'] else 0.0
+    lines = [f"{level_name.name}  played {total['plays']}  cleared {total['clears']}  "
+             f"mean time to clear {clear_secs:.1f}s  lives lost {total['lives_lost']}",
+             f"wall bounces  left {walls[telemetry.WALL_LEFT]}  right {walls[telemetry.WALL_RIGHT]}  "
+             f"top {walls[telemetry.WALL_TOP]}  (brick hits max {hottest} per cell)"]
+    for i, line in enumerate(lines):
+        surface.blit(font.render(line, True, constants.WHITE), (10, top + HISTOGRAM_HEIGHT + 8 + i * 24))
+    return surface
+
+
+def main() -> None:
+    """
+    Read the telemetry file and write a heatmap PNG per LevelName
+
+    :return:
+    """
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+    else:
+        persistence.find_game_data_path()
+        path = os.path.join(persistence.GAME_DATA_PATH, telemetry.TELEMETRY_FILENAME)
+    out_dir = sys.argv[2] if len(sys.argv) > 2 else '.'
+
+    with open(path, 'rb') as file_in:
+        records = telemetry.read_records(file_in.read())
+
+    pygame.init()
+    font = pygame.font.SysFont("Courier", 18, True)
+    for level_name, total in sum_by_level(records).items():
+        out_path = os.path.join(out_dir, f"heatmap_{level_name.name}.png")
+        pygame.image.save(render_level(level_name, total, font), out_path)
+        print(f"{out_path}: {total['plays']} plays")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
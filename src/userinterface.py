@@ -14,14 +14,15 @@ import pygame
 
 import brick
 import constants
+import presenter
 import obstacle
+from devoverlay import DevOverlayMixin
 from gamesettings import GameSettings
-from gamestate import GameState
 from leaderboard import Leaderboard
 import assets
 
 
-class UserInterface:
+class UserInterface(DevOverlayMixin):
     """ This provides a number of different UI element drawing functions """
 
     def __init__(self) -> None:
@@ -39,7 +40,12 @@ class UserInterface:
         self.how_to_play_button_rect = None
         self.start_classic_button_rect = None
         self.start_modern_button_rect = None
+        self.resume_button_rect = None
+        self.versus_button_rect = None
+        self.endless_button_rect = None
         self.back_button_rect = None
+        # the start screen's resume entry label, if there's an autosaved run to resume
+        self.resume_text: str | None = None
 
         # Font setups
         # font - logo (splash screen fonts)
@@ -71,6 +77,21 @@ class UserInterface:
         self.background_balls = []
         self.background_bricks = []
         self.initialize_background_elements()
+        # cached renders of the static screens: {name: (inputs, hovered button index, Surface, button rects, rects)}
+        self.static_screens: dict[str, tuple] = {}
+        # the regions of the cached start screen layer that aren't transparent, and the (layer, opaque backdrop)
+        # built from it
+        self.start_layer_rects: list[pygame.Rect] = []
+        self.start_backdrop: tuple = (None, None)
+        # the leaderboard's rendered score rows {rank: Surface}, only rendered as they scroll into view and dropped
+        # when the leaderboard version changes
+        self.leaderboard_rows: dict[int, pygame.Surface] = {}
+        self.leaderboard_rows_version: int = -1
+        self.leaderboard_first_row: int = 0
+        # the settings screen's icon and knob Surfaces (scaled/converted once), and the slider bars they sit on
+        self.settings_widgets: dict[str, pygame.Surface] = {}
+        self.slider_bgm_rect = None
+        self.slider_sfx_rect = None
 
     def draw_button(self, btn_surface: pygame.Surface, x: int, y: int, width: int, height: int, color: pygame.color,
                     hover_color: pygame.color, action: Callable = None, corner_radius: int = 10) -> pygame.Rect:
@@ -88,7 +109,7 @@ class UserInterface:
         :param action: Function to call on click
         :return: pygame.Rect of the button
         """
-        mouse = pygame.mouse.get_pos()
+        mouse = presenter.get_mouse_pos()
         click = pygame.mouse.get_pressed()
         rect = pygame.Rect(x, y, width, height)
 
@@ -103,6 +124,53 @@ class UserInterface:
         self.surface.blit(btn_surface, text_rect)
         return rect
 
+    @staticmethod
+    def get_hovered_button(button_rects: list[pygame.Rect]) -> int:
+        """
+        Which of the buttons is the mouse over?
+
+        :param button_rects: the buttons' Rects
+        :return: index of the hovered button, or -1
+        """
+        mouse = presenter.get_mouse_pos()
+        for i, rect in enumerate(button_rects):
+            if (rect is not None) and rect.collidepoint(mouse):
+                return i
+        return -1
+
+    def get_static_screen(self, name: str, inputs: tuple, render: Callable, opaque: bool = True, *,
+                          rect_attrs: tuple[str, ...] = ()) -> pygame.Surface:
+        """
+        Get the cached render of a static screen, only re-rendering it when its inputs or hovered button change
+
+        :param name: screen name (cache key)
+        :param inputs: the values the screen's content depends on
+        :param render: draws the screen to self.surface and returns its button rects
+        :param opaque: the screen fills the whole surface, so it's cached in the (faster to blit) display format
+        :param rect_attrs: the Rect attributes the render sets that other screens also set (e.g. the pause menu's
+                           pad_btn_rect) - they're cached as rects, and put back whenever the screen is shown
+        :return: the rendered screen Surface
+        """
+        cached = self.static_screens.get(name)
+        if (cached is None) or (cached[0] != inputs) or (cached[1] != self.get_hovered_button(cached[3])):
+            button_rects = render()
+            rendered = self.surface.convert() if opaque else self.surface.copy()
+            cached = (inputs, self.get_hovered_button(button_rects), rendered, button_rects,
+                      {attr: getattr(self, attr) for attr in rect_attrs})
+            self.static_screens[name] = cached
+        for attr, rect in cached[4].items():
+            setattr(self, attr, rect)
+        return cached[2]
+
+    def invalidate_static_screens(self) -> None:
+        """
+        Drop all the cached static screens, so they're re-rendered on next draw
+
+        :return:
+        """
+        self.static_screens.clear()
+        self.settings_widgets.clear()
+
     def draw_back_button(self):
         # Back button
         back_width = 100
@@ -310,35 +378,18 @@ class UserInterface:
         level_display = self.font_status.render(f"Level: {level}", True, constants.WHITE)
         self.screen.blit(level_display, ((constants.WIDTH - level_display.get_width()) / 2, 10))
 
-    def draw_dev_overlay(self, gs: GameState) -> None:
-        """
-        Show the developer overlay
-
-        :param gs: GameState
-        :return:
-        """
-        str_build = (f"FPS: {gs.fps_avg:>6.1f}  "
-                     f"LoopTime(ms): {gs.loop_time_avg:>4.1f}  "
-                     f"MotionModel: {gs.motion_model.name}  "
-                     f"Auto-Play: {gs.auto_play}")
-        dev_overlay1 = self.font_dev_overlay.render(str_build, True, constants.GREEN)
-
-        str_build = (f"PaddleImpulse: {gs.paddle_impulse_vel_length:>4.2f}  "
-                     f"Gravity: {gs.gravity_acc_length:>7.5f}  "
-                     f"SpeedStep: {gs.ball_speed_step:>6.3f}")
-        dev_overlay2 = self.font_dev_overlay.render(str_build, True, constants.GREEN)
-
-        self.screen.blit(dev_overlay1, ((constants.WIDTH - dev_overlay1.get_width()) / 2,
-                                        constants.HEIGHT - dev_overlay1.get_height() - 5))
-        self.screen.blit(dev_overlay2, ((constants.WIDTH - dev_overlay2.get_width()) / 2,
-                                        constants.HEIGHT - dev_overlay2.get_height() - 24))
-
-    def draw_logo(self, logo_x, logo_y) -> None:
+    def draw_logo(self, logo_x, logo_y, surface: pygame.Surface = None) -> pygame.Rect:
         """
         Show the splash screen
 
-        :return:
+        :param logo_x: center x of the logo
+        :param logo_y: top y of the logo
+        :param surface: where to draw the logo (defaults to the screen)
+        :return: the Rect bounding the logo
         """
+        if surface is None:
+            surface = self.screen
+
         logo_color = constants.ORANGE
         text_color = constants.WHITE
         shadow_color = (100, 100, 100)
@@ -368,17 +419,20 @@ class UserInterface:
         line_start_x = text_smash_rect.x - 20
         line_end_x = text_core_shadow_rect.x + text_core_shadow_rect.width + 20
         line_y = text_core_shadow_rect.y + text_core_shadow_rect.height + 15
-        pygame.draw.line(self.screen, logo_color, (line_start_x, line_y), (line_end_x, line_y), 3)
+        pygame.draw.line(surface, logo_color, (line_start_x, line_y), (line_end_x, line_y), 3)
 
         text_logo_tagline = self.font_logo_tagline.render("The Retro Arcade Experience", True, (200, 200, 200))
         text_logo_tagline_rect = text_logo_tagline.get_rect(
             center=(logo_x, text_core_shadow_rect.y + text_core_shadow_rect.height + 40))
 
-        self.screen.blit(text_smash_shadow, text_smash_shadow_rect)
-        self.screen.blit(text_smash, text_smash_rect)
-        self.screen.blit(text_core_shadow, text_core_shadow_rect)
-        self.screen.blit(text_core, text_core_rect)
-        self.screen.blit(text_logo_tagline, text_logo_tagline_rect)
+        surface.blit(text_smash_shadow, text_smash_shadow_rect)
+        surface.blit(text_smash, text_smash_rect)
+        surface.blit(text_core_shadow, text_core_shadow_rect)
+        surface.blit(text_core, text_core_rect)
+        surface.blit(text_logo_tagline, text_logo_tagline_rect)
+
+        line_rect = pygame.Rect(line_start_x, line_y - 2, line_end_x - line_start_x, 5)
+        return text_smash_rect.unionall([text_core_shadow_rect, text_logo_tagline_rect, line_rect])
 
     def draw_splash_screen(self):
         self.draw_logo(constants.WIDTH // 2, constants.HEIGHT // 4)
@@ -449,43 +503,91 @@ class UserInterface:
 
     def draw_start_screen(self) -> None:
         """
-        Show the start screen
+        Show the start screen - only the background balls are drawn each frame, the bricks, buttons, and logo
+        come from a cached layer that's re-rendered when the hovered button changes
 
         :return:
         """
-        self.surface.fill((0, 0, 0, 200))
         self.update_background_elements()
+        layer = self.get_static_screen('start', (self.resume_text,), self._render_start_screen, opaque=False)
+
+        # the layer pre-composited over the (already black) screen, in the display format
+        if self.start_backdrop[0] is not layer:
+            backdrop = pygame.Surface((constants.WIDTH, constants.HEIGHT)).convert()
+            backdrop.fill(constants.BLACK)
+            backdrop.blit(layer, (0, 0))
+            self.start_backdrop = (layer, backdrop)
+        self.screen.blit(self.start_backdrop[1], (0, 0))
 
         for ball in self.background_balls:
-            self.surface.blit(ball['image'], ball['rect'])
+            self.screen.blit(ball['image'], ball['rect'])
+            # keep the balls behind the bricks, buttons, and logo by re-drawing those where they overlap
+            for rect in self.start_layer_rects:
+                overlap = ball['rect'].clip(rect)
+                if overlap.width > 0:
+                    self.screen.blit(layer, overlap, overlap)
+
+    def _render_start_screen(self) -> list[pygame.Rect]:
+        """
+        Render the static layer of the start screen (bricks, buttons, and logo) to the transparent surface
+
+        :return: the button rects
+        """
+        self.surface.fill((0, 0, 0, 0))
 
         for brick in self.background_bricks:
             self.surface.blit(brick['image'], brick['rect'])
 
+        # the play buttons share a row, centered
+        classic_text = self.font_menu_main.render("PLAY CLASSIC MODE", True, constants.BLACK)
+        modern_text = self.font_menu_main.render("PLAY MODERN MODE", True, constants.BLACK)
+        versus_text = self.font_menu_main.render("2 PLAYER VERSUS", True, constants.BLACK)
+        endless_text = self.font_menu_main.render("ENDLESS MODE", True, constants.BLACK)
+        button_gap = 20
+        button_height = classic_text.get_height() + 40
+        row_width = (sum(text.get_width() + 30 for text in (classic_text, modern_text, versus_text, endless_text)) +
+                     (3 * button_gap))
+        button_x = (constants.WIDTH - row_width) // 2
+
         # Draw Click to Play CLASSIC button
-        start_text = self.font_menu_main.render("PLAY CLASSIC MODE", True, constants.BLACK)
-        button_width = start_text.get_width() + 30
-        button_height = start_text.get_height() + 40
-        button_x = constants.WIDTH // 2 - button_width
-        self.start_classic_button_rect = self.draw_button(start_text, button_x,
-                                                          340, button_width,
+        self.start_classic_button_rect = self.draw_button(classic_text, button_x,
+                                                          340, classic_text.get_width() + 30,
                                                           button_height,
                                                           constants.GREEN, constants.DARK_GREEN)
 
         # Draw Click to Play MODERN button
-        start_text = self.font_menu_main.render("PLAY MODERN MODE", True, constants.BLACK)
-        button_width = start_text.get_width() + 30
-        button_height = start_text.get_height() + 40
-
-        self.start_modern_button_rect = self.draw_button(start_text, button_x * 2,
+        self.start_modern_button_rect = self.draw_button(modern_text, self.start_classic_button_rect.right + button_gap,
                                                          340,
-                                                         button_width, button_height,
+                                                         modern_text.get_width() + 30, button_height,
                                                          constants.LIGHT_BLUE, constants.DARK_BLUE)
 
+        # Draw the two player VERSUS button
+        self.versus_button_rect = self.draw_button(versus_text, self.start_modern_button_rect.right + button_gap,
+                                                   340,
+                                                   versus_text.get_width() + 30, button_height,
+                                                   constants.ORANGE, constants.DARK_ORANGE)
+
+        # Draw the ENDLESS mode button
+        self.endless_button_rect = self.draw_button(endless_text, self.versus_button_rect.right + button_gap,
+                                                    340,
+                                                    endless_text.get_width() + 30, button_height,
+                                                    constants.PINK, constants.DARK_PINK)
+
         sub_button_width = 250
         sub_button_height = 50
         sub_button_spacing = sub_button_height + 15
         sub_button_x = (constants.WIDTH - sub_button_width) // 2
+
+        # Draw the Resume button above the play buttons, if there's an autosaved run
+        self.resume_button_rect = None
+        if self.resume_text is not None:
+            resume_text = self.font_menu_sub.render(self.resume_text, True, constants.BLACK)
+            resume_width = resume_text.get_width() + 30
+            self.resume_button_rect = self.draw_button(resume_text, (constants.WIDTH - resume_width) // 2,
+                                                       self.start_classic_button_rect.y - sub_button_spacing,
+                                                       resume_width, sub_button_height,
+                                                       constants.GREEN, constants.DARK_GREEN)
+
         sub_button_y = self.start_modern_button_rect.y + self.start_modern_button_rect.height + sub_button_height  # Add or subtract to this to adjust sub_buttons y_position
         # Draw How to Play Button
         how_to_play_text = self.font_menu_sub.render("How to Play", True, constants.BLACK)
@@ -520,11 +622,32 @@ class UserInterface:
                                                        sub_button_width, sub_button_height,
                                                        constants.RED, constants.DARK_RED)
 
-        self.screen.blit(self.surface, (0, 0))
-        self.draw_logo(constants.WIDTH // 2, 30)
+        logo_rect = self.draw_logo(constants.WIDTH // 2, 30, self.surface)
+
+        self.start_layer_rects = [brick['rect'] for brick in self.background_bricks]
+        self.start_layer_rects += [self.start_classic_button_rect, self.start_modern_button_rect,
+                                   self.versus_button_rect, self.endless_button_rect, self.how_to_play_button_rect,
+                                   self.leader_button_rect, self.settings_button_rect, self.credits_button_rect,
+                                   self.quit_button_start_rect, logo_rect]
+        button_rects = [self.start_classic_button_rect, self.start_modern_button_rect, self.versus_button_rect,
+                        self.endless_button_rect, self.how_to_play_button_rect, self.leader_button_rect,
+                        self.settings_button_rect, self.credits_button_rect, self.quit_button_start_rect]
+        if self.resume_button_rect is not None:
+            self.start_layer_rects.append(self.resume_button_rect)
+            button_rects.append(self.resume_button_rect)
+
+        return button_rects
 
     def draw_how_to_play_screen(self) -> None:
         """Shows how to play information when button is clicked"""
+        self.screen.blit(self.get_static_screen('how_to_play', (), self._render_how_to_play_screen), (0, 0))
+
+    def _render_how_to_play_screen(self) -> list[pygame.Rect]:
+        """
+        Render the how to play screen to the surface
+
+        :return: the button rects
+        """
         self.surface.fill(constants.BLACK)
         text1_lines = [
             "GAMEPLAY INSTRUCTIONS",
@@ -564,16 +687,16 @@ class UserInterface:
         btn_text = self.font_menu_main.render("CLASSIC MODE", True, constants.BLACK)
         button_width = btn_text.get_width() + 20
         button_height = btn_text.get_height() + 20
-        self.draw_button(btn_text, 50, y2 + 50, button_width,
-                         button_height, constants.GREEN, constants.DARK_GREEN)
+        classic_btn_rect = self.draw_button(btn_text, 50, y2 + 50, button_width,
+                                            button_height, constants.GREEN, constants.DARK_GREEN)
 
         mode_text = self.font_h2p.render("Play the game with solid color bricks.", True, constants.WHITE)
         mode_text_rect = mode_text.get_rect(topleft=(button_width + 75, y2 + 50 + (btn_text.get_height() // 2)))
         self.surface.blit(mode_text, mode_text_rect)
 
         btn_text = self.font_menu_main.render("MODERN MODE", True, constants.BLACK)
-        self.draw_button(btn_text, 50, y2 + 125, button_width,
-                         button_height, constants.LIGHT_BLUE, constants.DARK_BLUE)
+        modern_btn_rect = self.draw_button(btn_text, 50, y2 + 125, button_width,
+                                           button_height, constants.LIGHT_BLUE, constants.DARK_BLUE)
 
         mode_text = self.font_h2p.render("Play the game with modern image bricks.", True, constants.WHITE)
         mode_text_rect = mode_text.get_rect(topleft=(button_width + 75, y2 + 125 + (btn_text.get_height() // 2)))
@@ -627,7 +750,8 @@ class UserInterface:
 
         # Back button
         self.draw_back_button()
-        self.screen.blit(self.surface, (0, 0))
+
+        return [classic_btn_rect, modern_btn_rect, self.back_button_rect]
 
     def draw_credits_screen(self) -> None:
         """
@@ -635,6 +759,14 @@ class UserInterface:
 
         :return:
         """
+        self.screen.blit(self.get_static_screen('credits', (), self._render_credits_screen), (0, 0))
+
+    def _render_credits_screen(self) -> list[pygame.Rect]:
+        """
+        Render the credits screen to the surface
+
+        :return: the button rects
+        """
         self.surface.fill(constants.BLACK)
 
         developers = ["DEVELOPERS", "", "Justin Cooke", "Ann Rauscher", "Camila Roxo", "Justin Smith", "Rex Vargas"]
@@ -649,48 +781,153 @@ class UserInterface:
         # Back button
         self.draw_back_button()
 
-        self.screen.blit(self.surface, (0, 0))
+        return [self.back_button_rect]
 
     def draw_leaderboard_screen(self, lb: Leaderboard) -> None:
         """
-        Show the leaderboard screen
+        Show the leaderboard screen (re-rendered only when the scores change or it's scrolled)
 
+        :param lb: Leaderboard
         :return:
         """
-        self.surface.fill(constants.BLACK)
+        self.scroll_leaderboard(0, lb)
+        inputs = (lb.version, self.leaderboard_first_row)
+        self.screen.blit(self.get_static_screen('leaderboard', inputs,
+                                                lambda: self._render_leaderboard_screen(lb)), (0, 0))
 
-        l_scores = ["HIGH SCORES", ""]
+    def scroll_leaderboard(self, rows: int, lb: Leaderboard) -> None:
+        """
+        Scroll the leaderboard screen's rows, clamped to the scores available
 
-        score_sorted = sorted(lb.l_top_scores, key=lambda scr: scr.score, reverse=True)
-        for scr in score_sorted:
+        :param rows: rows to scroll (negative scrolls up)
+        :param lb: Leaderboard
+        :return:
+        """
+        last_first_row = max(0, len(lb.l_top_scores) - constants.LEADERBOARD_VISIBLE_ROWS)
+        self.leaderboard_first_row = min(max(0, self.leaderboard_first_row + rows), last_first_row)
+
+    def get_leaderboard_row(self, lb: Leaderboard, rank: int) -> pygame.Surface:
+        """
+        Get the rendered text of a leaderboard score row, rendering it only the first time it's shown
+        for this leaderboard version
+
+        :param lb: Leaderboard
+        :param rank: index into the sorted (highest first) scores
+        :return: the row's text Surface
+        """
+        if self.leaderboard_rows_version != lb.version:
+            self.leaderboard_rows.clear()
+            self.leaderboard_rows_version = lb.version
+        row = self.leaderboard_rows.get(rank)
+        if row is None:
+            scr = lb.get_sorted_scores()[rank]
             str_build = (f"{scr.id}  "
                          f"{scr.score:>8d}   "
                          f"(level: {scr.level:>2d})")
-            l_scores.append(str_build)
+            row = self.font_leaderboard.render("  " + str_build, True, constants.WHITE)
+            self.leaderboard_rows[rank] = row
+        return row
+
+    def _render_leaderboard_screen(self, lb: Leaderboard) -> list[pygame.Rect]:
+        """
+        Render the leaderboard screen to the surface (only the visible rows are drawn)
+
+        :param lb: Leaderboard
+        :return: the button rects
+        """
+        self.surface.fill(constants.BLACK)
 
         y_offset = constants.HEIGHT // 6
-        for score_str in l_scores:
-            score_text = self.font_leaderboard.render("  " + score_str, True, constants.WHITE)
-            score_rect = score_text.get_rect(center=(constants.WIDTH // 2, y_offset))
-            self.surface.blit(score_text, score_rect)
+        title_text = self.font_leaderboard.render("  HIGH SCORES", True, constants.WHITE)
+        self.surface.blit(title_text, title_text.get_rect(center=(constants.WIDTH // 2, y_offset)))
+        y_offset += 100
+
+        num_scores = len(lb.l_top_scores)
+        last_row = min(num_scores, self.leaderboard_first_row + constants.LEADERBOARD_VISIBLE_ROWS)
+        for rank in range(self.leaderboard_first_row, last_row):
+            score_text = self.get_leaderboard_row(lb, rank)
+            self.surface.blit(score_text, score_text.get_rect(center=(constants.WIDTH // 2, y_offset)))
             y_offset += 50
 
+        # only boards longer than a page scroll, so show where we are
+        if num_scores > constants.LEADERBOARD_VISIBLE_ROWS:
+            position_text = self.font_h2p.render(f"{self.leaderboard_first_row + 1}-{last_row} of {num_scores}"
+                                                 f"   (mouse wheel or arrow keys to scroll)", True, constants.GRAY)
+            self.surface.blit(position_text,
+                              position_text.get_rect(bottomright=(constants.WIDTH - 20, constants.HEIGHT - 30)))
+
         # Back button
         self.draw_back_button()
 
-        # draw everything
-        self.screen.blit(self.surface, (0, 0))
+        return [self.back_button_rect]
 
     def draw_settings_screen(self, gset: GameSettings) -> None:
         """
-        Show the settings screen
+        Show the settings screen.  Everything but the slider knobs is a static layer (re-rendered only when a
+        toggle/icon changes), and the knobs are just blitted over it, so a slider drag only redraws the knob.
 
         :param gset: game settings
 
         :return:
         """
-        bg_sound = assets.VOLUME_ICON.convert_alpha() if gset.bgm_sounds and gset.music_volume > 0 else assets.MUTE_ICON.convert_alpha()
-        sfx_sound = assets.VOLUME_ICON.convert_alpha() if gset.sfx_sounds and gset.sfx_volume > 0 else assets.MUTE_ICON.convert_alpha()
+        inputs = (gset.is_fullscreen, gset.bgm_sounds and gset.music_volume > 0, gset.sfx_sounds and gset.sfx_volume > 0,
+                  gset.paddle_under_auto_control, gset.paddle_under_mouse_control)
+        self.screen.blit(self.get_static_screen('settings', inputs, lambda: self._render_settings_screen(gset),
+                                                rect_attrs=('graphics_btn_rect', 'vol_bgm_btn_rect',
+                                                            'vol_sfx_btn_rect', 'pad_btn_rect', 'back_button_rect',
+                                                            'slider_bgm_rect', 'slider_sfx_rect')), (0, 0))
+
+        self.knob_bg_rect = self.draw_slider_knob(self.slider_bgm_rect,
+                                                  gset.music_volume if gset.bgm_sounds else 0.0)
+        self.knob_sf_rect = self.draw_slider_knob(self.slider_sfx_rect,
+                                                  gset.sfx_volume if gset.sfx_sounds else 0.0)
+
+    def get_settings_widget(self, name: str) -> pygame.Surface:
+        """
+        Get one of the settings screen's icon/knob Surfaces, building it the first time it's needed
+
+        :param name: 'volume', 'mute', 'knob', or 'knob_hover'
+        :return: the widget Surface
+        """
+        widget = self.settings_widgets.get(name)
+        if widget is None:
+            knob_size = constants.KNOB_RADIUS * 2
+            match name:
+                case 'volume':
+                    widget = pygame.transform.scale(assets.VOLUME_ICON.convert_alpha(), (75, 75))
+                case 'mute':
+                    widget = pygame.transform.scale(assets.MUTE_ICON.convert_alpha(), (75, 75))
+                case _:
+                    widget = pygame.Surface((knob_size, knob_size), pygame.SRCALPHA)
+                    pygame.draw.rect(widget, constants.LIGHT_GRAY if name == 'knob_hover' else constants.GRAY,
+                                     widget.get_rect(), border_radius=constants.KNOB_RADIUS)
+            self.settings_widgets[name] = widget
+        return widget
+
+    def draw_slider_knob(self, slider_rect: pygame.Rect, volume: float) -> pygame.Rect:
+        """
+        Blit a slider's knob at its volume position
+
+        :param slider_rect: the slider bar's Rect
+        :param volume: 0.0 to 1.0
+        :return: the knob's Rect
+        """
+        knob_radius = constants.KNOB_RADIUS
+        knob_rect = pygame.Rect(slider_rect.x - knob_radius + int(volume * constants.SLIDER_WIDTH),
+                                slider_rect.centery - knob_radius, knob_radius * 2, knob_radius * 2)
+        knob = 'knob_hover' if knob_rect.collidepoint(presenter.get_mouse_pos()) else 'knob'
+        self.screen.blit(self.get_settings_widget(knob), knob_rect)
+        return knob_rect
+
+    def _render_settings_screen(self, gset: GameSettings) -> list[pygame.Rect]:
+        """
+        Render the static layer of the settings screen to the surface (everything except the slider knobs)
+
+        :param gset: game settings
+        :return: the button rects
+        """
+        bg_sound = self.get_settings_widget('volume' if gset.bgm_sounds and gset.music_volume > 0 else 'mute')
+        sfx_sound = self.get_settings_widget('volume' if gset.sfx_sounds and gset.sfx_volume > 0 else 'mute')
 
         self.surface.fill(constants.BLACK)
 
@@ -716,48 +953,31 @@ class UserInterface:
 
         #icon_width, icon_height default = 330, 50
         icon_width, icon_height = 75, 75
-        knob_radius = constants.KNOB_RADIUS
 
-        #draw the bgm volume icons and sliders to the surface
+        #draw the bgm volume icons and slider to the surface
         bg_icon_y = graphics_btn_lbl_y + icon_height
-        bg_sound = pygame.transform.scale(bg_sound, (icon_width, icon_height))
 
         bgm_text = self.font_settings.render('BGM Volume', True, constants.WHITE)
         self.surface.blit(bgm_text, bgm_text.get_rect(bottomleft=(left_align_x, bg_icon_y - 10)))
         self.vol_bgm_btn_rect = self.draw_button(bg_sound, left_align_x, bg_icon_y, icon_width, icon_height,
                                                  (0, 0, 0, 0), (200, 200, 200, 0))
 
-        slider_bg_x = self.vol_bgm_btn_rect.centerx + 75
-        slider_bg_y = self.vol_bgm_btn_rect.centery - (constants.SLIDER_HEIGHT // 2)
-        knob_bg_x = slider_bg_x - knob_radius + int(
-            gset.music_volume * constants.SLIDER_WIDTH) if gset.bgm_sounds else slider_bg_x - knob_radius
-        knob_bg_y = slider_bg_y + (constants.SLIDER_HEIGHT // 2) - knob_radius
-
-        slider_bgm_rect = pygame.Rect(slider_bg_x, slider_bg_y, constants.SLIDER_WIDTH, constants.SLIDER_HEIGHT)
-        pygame.draw.rect(self.surface, constants.WHITE, slider_bgm_rect, border_radius=20)
-        knob_bg = pygame.Surface((knob_radius * 2, knob_radius * 2), pygame.SRCALPHA)
-        self.knob_bg_rect = self.draw_button(knob_bg, knob_bg_x, knob_bg_y, knob_radius * 2, knob_radius * 2,
-                                             constants.GRAY, constants.LIGHT_GRAY, corner_radius=knob_radius)
+        self.slider_bgm_rect = pygame.Rect(self.vol_bgm_btn_rect.centerx + 75,
+                                           self.vol_bgm_btn_rect.centery - (constants.SLIDER_HEIGHT // 2),
+                                           constants.SLIDER_WIDTH, constants.SLIDER_HEIGHT)
+        pygame.draw.rect(self.surface, constants.WHITE, self.slider_bgm_rect, border_radius=20)
 
-        # draws the sfx volume icons and sliders to the surface
+        # draws the sfx volume icons and slider to the surface
         sfx_icon_y = bg_icon_y + icon_height + 100
-        sfx_sound = pygame.transform.scale(sfx_sound, (icon_width, icon_height))
         sfx_text = self.font_settings.render('SFX Volume', True, constants.WHITE)
         self.surface.blit(sfx_text, sfx_text.get_rect(bottomleft=(left_align_x, sfx_icon_y - 10)))
         self.vol_sfx_btn_rect = self.draw_button(sfx_sound, left_align_x, sfx_icon_y, icon_width, icon_height,
                                                  (0, 0, 0, 0), (200, 200, 200, 0))
 
-        slider_sf_x = self.vol_sfx_btn_rect.centerx + 75
-        slider_sf_y = self.vol_sfx_btn_rect.centery - (constants.SLIDER_HEIGHT // 2)
-        knob_sf_x = slider_sf_x - knob_radius + int(
-            gset.sfx_volume * constants.SLIDER_WIDTH) if gset.sfx_sounds else slider_sf_x - knob_radius
-        knob_sf_y = slider_sf_y + (constants.SLIDER_HEIGHT // 2) - knob_radius
-
-        slider_sfx_rect = pygame.Rect(slider_sf_x, slider_sf_y, constants.SLIDER_WIDTH, constants.SLIDER_HEIGHT)
-        pygame.draw.rect(self.surface, constants.WHITE, slider_sfx_rect, border_radius=20)
-        knob_sf = pygame.Surface((knob_radius * 2, knob_radius * 2), pygame.SRCALPHA)
-        self.knob_sf_rect = self.draw_button(knob_sf, knob_sf_x, knob_sf_y, knob_radius * 2, knob_radius * 2,
-                                             constants.GRAY, constants.LIGHT_GRAY, corner_radius=knob_radius)
+        self.slider_sfx_rect = pygame.Rect(self.vol_sfx_btn_rect.centerx + 75,
+                                           self.vol_sfx_btn_rect.centery - (constants.SLIDER_HEIGHT // 2),
+                                           constants.SLIDER_WIDTH, constants.SLIDER_HEIGHT)
+        pygame.draw.rect(self.surface, constants.WHITE, self.slider_sfx_rect, border_radius=20)
 
         pad_btn_lbl_y = sfx_icon_y + icon_height + 100
         pad_btn_lbl = self.font_settings.render('Paddle Control      ', True, constants.WHITE)
@@ -776,5 +996,5 @@ class UserInterface:
 
         self.draw_back_button()
 
-        # draw everything
-        self.screen.blit(self.surface, (0, 0))
+        return [self.graphics_btn_rect, self.vol_bgm_btn_rect, self.vol_sfx_btn_rect, self.pad_btn_rect,
+                self.back_button_rect]
@@ -12,14 +12,17 @@
                         without actually creating and passing around objects.
 """
 
-import collections
-import statistics
+from array import array
 
+import telemetry
 from gamestate import GameState
+from leaderboard import Leaderboard
+from playerstate import PlayerState
+from profiler import RingTimings
 
-# these are queues used to store the shifting window of recorded values for the dev overlay
-fps_q = collections.deque(maxlen=60)
-loop_time_q = collections.deque(maxlen=60)
+# these are ring buffers (with running sums) used to store the shifting window of recorded values for the dev overlay
+fps_q = RingTimings(60)
+loop_time_q = RingTimings(60)
 
 def calculate_timing_averages(fps: float, loop_time: float) -> tuple:
     """
@@ -30,9 +33,28 @@ def calculate_timing_averages(fps: float, loop_time: float) -> tuple:
     :param loop_time: loop time value to add to shifting queue
     :return:
     """
-    fps_q.appendleft(fps)
-    loop_time_q.appendleft(loop_time)
-    return statistics.mean(fps_q), statistics.mean(loop_time_q)
+    fps_q.add(fps)
+    loop_time_q.add(loop_time)
+    return fps_q.mean(), loop_time_q.mean()
+
+def lose_life(gs: GameState, ps: PlayerState, lb: Leaderboard) -> None:
+    """
+    Take a life (the Ball lost, or the endless mode's bricks pushed off the bottom), ending the game once they've
+    run out - collecting the player's initials if it's a high score
+
+    :param gs: GameState
+    :param ps: PlayerState
+    :param lb: Leaderboard
+    :return:
+    """
+    ps.lives -= 1
+    telemetry.record_life_lost()
+    if ps.lives <= 0:
+        telemetry.end_level(False)
+        if lb.is_high_score(ps.score):
+            gs.cur_state = GameState.GameStateName.GET_HIGH_SCORE
+        else:
+            gs.cur_state = GameState.GameStateName.GAME_OVER
 
 def start_shake(gs: GameState, strength: int) -> None:
     """
@@ -45,24 +67,41 @@ def start_shake(gs: GameState, strength: int) -> None:
 
     gs.shake_screen_brick = True
     gs.shake_strength = strength
+    gs.shake_table_x, gs.shake_table_y = get_shake_tables(gs, strength)
     # reset the indices into the lists with the offset shift values
     gs.shake_off_index_x = gs.shake_off_index_y = 0
 
+def get_shake_tables(gs: GameState, strength: int) -> tuple[array, array]:
+    """
+    Get the shake offsets scaled for a strength, as integer pixel offsets (scaled once, then cached)
+
+    :param gs: GameState
+    :param strength: the shake strength
+    :return: the x and y offset arrays
+    """
+
+    tables = gs.shake_tables.get(strength)
+    if tables is None:
+        tables = (array('h', (int(off * strength / 4) for off in gs.shake_offsets_x)),
+                  array('h', (int(off * strength / 4) for off in gs.shake_offsets_y)))
+        gs.shake_tables[strength] = tables
+    return tables
+
 def get_shaking_offset(gs: GameState) -> tuple[int, int]:
     """
-    This iterates over the GameState.shake_offsets_x/y lists to get decent offset values.
+    This iterates over the GameState.shake_table_x/y arrays to get decent offset values.
 
     :param gs: GameState
     :return: the offset in pixels
     """
 
     if gs.shake_screen_brick:
-        if ((gs.shake_off_index_x + 1) > len(gs.shake_offsets_x)) or ((gs.shake_off_index_y + 1) > len(gs.shake_offsets_y)):
+        if ((gs.shake_off_index_x + 1) > len(gs.shake_table_x)) or ((gs.shake_off_index_y + 1) > len(gs.shake_table_y)):
             gs.shake_screen_brick = False
             return 0, 0
         else:
-            off_x = gs.shake_offsets_x[gs.shake_off_index_x] * gs.shake_strength / 4
-            off_y = gs.shake_offsets_y[gs.shake_off_index_y] * gs.shake_strength / 4
+            off_x = gs.shake_table_x[gs.shake_off_index_x]
+            off_y = gs.shake_table_y[gs.shake_off_index_y]
             gs.shake_off_index_x += 1
             gs.shake_off_index_y += 1
             return off_x, off_y
@@ -0,0 +1,412 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: The two player versus mode.  Each player gets a VersusSide - their own GameWorld, with its
+                        own GameState, PlayerState, contacts, and Animations - and both play the same level layout
+                        (the second side is built from the first's level seed).  The VersusMatch advances both in the
+                        one game loop with a shared fixed-step scheduler: the frame's elapsed time is turned into
+                        whole VERSUS_STEP_MS steps, and each step updates both worlds back to back, so they stay in
+                        lockstep whatever the frame rate.  Player 1 steers with the mouse (click to launch), player 2
+                        with the LEFT/RIGHT arrow keys (SPACE to launch).
+
+                        Each world is drawn at full size, exactly as in the one player game, into one canvas shared
+                        by both sides, then scaled down into its half of the screen (a subsurface of the backbuffer).
+                        The Ball/Paddle/power-up images come from the shared assets.get_prepared_image() cache, so
+                        the second world costs no extra image conversions.  The first player to clear the level wins,
+                        or the one still playing once the other runs out of lives.
+"""
+
+import struct
+import zlib
+
+import pygame
+
+import constants
+import gameevents
+import gamesnapshot
+import utils
+from animationpool import AnimationPool
+from powerups import PowerUps
+from brick import Brick
+from collisions import CollisionHandler
+from gameevents import GameEvent, GameEventType
+from gamesettings import GameSettings
+from gamestate import GameState
+from gameworld import GameWorld
+from leaderboard import Leaderboard
+from levels import Levels
+from leveltheme import LevelTheme
+from playerstate import PlayerState
+
+# each side's view of its world, side-by-side and vertically centered
+VIEW_WIDTH: int = int(constants.WIDTH * constants.VERSUS_VIEW_SCALE)
+VIEW_HEIGHT: int = int(constants.HEIGHT * constants.VERSUS_VIEW_SCALE)
+VIEW_TOP: int = (constants.HEIGHT - VIEW_HEIGHT) // 2
+
+# VersusMatch.winner once the match is over and neither player won
+DRAW: int = 0
+
+# match snapshot header: steps, winner (-1 while playing), the first side's gamesnapshot size (the second follows)
+MATCH: struct.Struct = struct.Struct('<IbI')
+# per side checksum input: ball pos (x, y), vel (x, y), paddle x, score, lives, world object count, cur_state
+CHECKSUM: struct.Struct = struct.Struct('<4diiiIB')
+
+
+class VersusSide(CollisionHandler):
+    """ One player's world in a versus match, with the engine's collision handling """
+
+    def __init__(self, player: int, level_theme: LevelTheme, view_rect: pygame.Rect, gset: GameSettings,
+                 level_name: Levels.LevelName = None, seed: int = None) -> None:
+        """
+        :param player: 1 or 2
+        :param level_theme: LevelTheme (MODERN needs assets.load_assets() first, for the images)
+        :param view_rect: where this side's world is shown on the screen
+        :param gset: GameSettings (shared by both sides)
+        :param level_name: the level to play (None is the theme's first level)
+        :param seed: the level's seed, to build the same layout as the other side (a new one if None)
+        """
+        self.player: int = player
+        self.view_rect: pygame.Rect = view_rect
+        # an empty Leaderboard, since the Ball checks it when the lives run out
+        self.lb: Leaderboard = Leaderboard()
+        self.gset: GameSettings = gset
+        self.ps: PlayerState = PlayerState()
+        self.ps.theme = level_theme
+        self.gs: GameState = GameState()
+        self.gs.cur_state = GameState.GameStateName.READY_TO_LAUNCH
+        self.gs.tick_time = constants.VERSUS_STEP_MS
+
+        self.gw: GameWorld = GameWorld(level_theme, level_name)
+        if seed is not None:
+            self.gw.build_level(self.gw.level_name, seed)
+        # the GameWorld always places the Ball, then the Paddle
+        self.ball, self.paddle = self.gw.world_objects[0], self.gw.world_objects[1]
+
+        # what the shared collision handling expects of the engine
+        self.contacts: set = set()
+        self.animations: AnimationPool = AnimationPool()
+        # only the instant power-ups (the timed ones' capsules and effects aren't part of a match's snapshots)
+        self.power_ups: PowerUps = PowerUps(self.contacts, timed=False)
+
+        self.cleared: bool = False
+        # the status line, only re-rendered when it changes: (text, Surface)
+        self.hud: tuple[str, pygame.Surface | None] = ('', None)
+
+    def is_out(self) -> bool:
+        """
+        :return: True once this side's lives have run out
+        """
+        return self.ps.lives <= 0
+
+    def launch(self) -> None:
+        """
+        Launch the Ball, if it's waiting on the Paddle
+
+        :return:
+        """
+        if (self.gs.cur_state == GameState.GameStateName.READY_TO_LAUNCH) and (not self.is_out()):
+            self.gs.cur_state = GameState.GameStateName.PLAYING
+
+    def step(self, commanded_x: float | None, key_left: bool, key_right: bool) -> list[GameEvent]:
+        """
+        One fixed step - the Ball/Paddle step (see CollisionHandler.step_ball_and_paddle()), then this side's share
+        of the event dispatch
+
+        :param commanded_x: where the mouse puts the Paddle (world x), or None to leave it
+        :param key_left: LEFT held
+        :param key_right: RIGHT held
+        :return: the step's GameEvents, for the sound
+        """
+        if commanded_x is not None:
+            self.paddle.commanded_pos_x = commanded_x
+        self.gs.paddle_under_key_control_left = key_left
+        self.gs.paddle_under_key_control_right = key_right
+
+        self.step_ball_and_paddle()
+        self.animations.update(self.gs, self.ps, self.lb, self.gset)
+
+        # the event bus is shared by both sides, so it's drained after each side's step
+        events = gameevents.drain()
+        if events:
+            self.dispatch_game_events(events)
+        return events
+
+    def dispatch_game_events(self, events: list[GameEvent]) -> None:
+        """
+        The scoring and shake half of the engine's event dispatch, for this side
+
+        :param events: this side's step's GameEvents
+        :return:
+        """
+        shake_strength: int = 0
+        for event in events:
+            self.ps.score += event.points
+            if event.event_type == GameEventType.BRICK_DESTROYED:
+                if event.strength >= constants.SHAKE_STRENGTH_THRESHOLD:
+                    shake_strength = max(shake_strength, event.strength * constants.SHAKE_OFFSET_BASE)
+                self.cleared = not any(isinstance(wo, Brick) for wo in self.gw.world_objects)
+        if shake_strength > 0:
+            utils.start_shake(self.gs, shake_strength)
+
+    def draw(self, screen: pygame.Surface, canvas: pygame.Surface) -> None:
+        """
+        Draw the world at full size into the canvas, then scale it down into this side's view on the screen
+
+        :param screen: the backbuffer
+        :param canvas: a WIDTH x HEIGHT Surface in the screen's format (its contents are replaced)
+        :return:
+        """
+        canvas.fill(constants.BLACK)
+        for world_object in self.gw.world_objects:
+            world_object.draw_wo(canvas)
+        self.animations.draw(canvas)
+        if self.gs.shake_screen_brick:
+            canvas.scroll(*utils.get_shaking_offset(self.gs))
+
+        pygame.transform.scale(canvas, self.view_rect.size, screen.subsurface(self.view_rect))
+        pygame.draw.rect(screen, constants.LIGHT_GRAY, self.view_rect.inflate(2, 2), 1)
+
+    def draw_status(self, screen: pygame.Surface, font: pygame.font.Font) -> None:
+        """
+        Draw the player's score and lives above their view
+
+        :param screen: the backbuffer
+        :param font: the status line's Font
+        :return:
+        """
+        text = f"PLAYER {self.player}   Score: {self.ps.score}   Lives: {max(self.ps.lives, 0)}"
+        if text != self.hud[0]:
+            self.hud = (text, font.render(text, True, constants.WHITE))
+        image = self.hud[1]
+        screen.blit(image, (self.view_rect.centerx - image.get_width() // 2, self.view_rect.y - image.get_height() - 15))
+
+
+class VersusMatch:
+    """ Two VersusSides on the same level, advanced together by a shared fixed-step scheduler """
+
+    def __init__(self, level_theme: LevelTheme = LevelTheme.MODERN, level_name: Levels.LevelName = None,
+                 gset: GameSettings = None) -> None:
+        """
+        :param level_theme: LevelTheme (MODERN needs assets.load_assets() first, for the images)
+        :param level_name: the level to play (None is the theme's first level)
+        :param gset: GameSettings (defaults if None)
+        """
+        # the strong Bricks make a Font for their strength
+        pygame.font.init()
+        gset = GameSettings() if gset is None else gset
+        gameevents.clear()
+
+        left = pygame.Rect(0, VIEW_TOP, VIEW_WIDTH, VIEW_HEIGHT)
+        right = pygame.Rect(constants.WIDTH - VIEW_WIDTH, VIEW_TOP, VIEW_WIDTH, VIEW_HEIGHT)
+        first = VersusSide(1, level_theme, left, gset, level_name)
+        # the same layout for both players
+        second = VersusSide(2, level_theme, right, gset, first.gw.level_name, first.gw.level_seed)
+        self.sides: list[VersusSide] = [first, second]
+
+        # the scheduler's unspent time, and the steps run so far
+        self.accumulator_ms: int = 0
+        self.steps: int = 0
+        # player 1's Paddle x (world coords) from the last mouse motion, None until the mouse moves
+        self.mouse_x: float | None = None
+
+        # set once the match is over: the winning player (or DRAW), and whether to leave for the menu
+        self.winner: int | None = None
+        self.done: bool = False
+
+        # the canvas both worlds are drawn into at full size, made for (and kept with) the screen it's scaled onto
+        self.canvas: tuple[pygame.Surface | None, pygame.Surface | None] = (None, None)
+
+        self.font_status: pygame.font.Font = pygame.font.Font(None, 36)
+        self.font_result: pygame.font.Font = pygame.font.Font(None, 100)
+        self.font_prompt: pygame.font.Font = pygame.font.Font(None, 36)
+
+    def handle_input(self, events: list) -> None:
+        """
+        Player 1's mouse motion and clicks, player 2's SPACE, and ESC to leave
+
+        :param events: this frame's (logical coords) pygame events
+        :return:
+        """
+        first, second = self.sides
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                # from the left view to player 1's world
+                view = first.view_rect
+                world_x = (event.pos[0] - view.x) * constants.WIDTH / view.width
+                self.mouse_x = min(max(world_x, 0), constants.WIDTH)
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if self.winner is None:
+                    first.launch()
+                else:
+                    self.done = True
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    self.done = True
+                elif event.key == pygame.K_SPACE:
+                    if self.winner is None:
+                        second.launch()
+                    else:
+                        self.done = True
+
+    def advance(self, elapsed_ms: int, keys) -> list[GameEvent]:
+        """
+        Run the whole steps the elapsed time adds up to, both worlds each step
+
+        :param elapsed_ms: time since the last frame (the loop's tick_time)
+        :param keys: pygame.key.get_pressed() (or anything indexable by key)
+        :return: both sides' GameEvents, for the sound
+        """
+        step_ms = constants.VERSUS_STEP_MS
+        # drop what's past the cap rather than spiraling after a stall
+        self.accumulator_ms = min(self.accumulator_ms + elapsed_ms, step_ms * constants.VERSUS_MAX_STEPS_PER_FRAME)
+        if self.winner is not None:
+            return []
+
+        key_left, key_right = bool(keys[pygame.K_LEFT]), bool(keys[pygame.K_RIGHT])
+        events: list[GameEvent] = []
+        while (self.accumulator_ms >= step_ms) and (self.winner is None):
+            self.accumulator_ms -= step_ms
+            events += self.step(((self.mouse_x, False, False), (None, key_left, key_right)))
+        return events
+
+    def step(self, controls: tuple) -> list[GameEvent]:
+        """
+        One fixed step of both worlds, back to back (so neither gets ahead), then the match result
+
+        :param controls: per side, the (commanded x or None, key left, key right) for VersusSide.step()
+        :return: both sides' GameEvents
+        """
+        events: list[GameEvent] = []
+        for side, (commanded_x, key_left, key_right) in zip(self.sides, controls):
+            events += side.step(commanded_x, key_left, key_right)
+        self.steps += 1
+        self.update_result()
+        return events
+
+    def update_result(self) -> bool:
+        """
+        Decide the match, once either side has cleared the level or run out of lives - a level cleared beats one
+        still playing, which beats one out of lives, and the score breaks a tie
+
+        :return: True if the match is over
+        """
+        if self.winner is not None:
+            return True
+        if not any(side.cleared or side.is_out() for side in self.sides):
+            return False
+        contenders = ([side for side in self.sides if side.cleared] or
+                      [side for side in self.sides if not side.is_out()] or self.sides)
+        best_score = max(side.ps.score for side in contenders)
+        leaders = [side for side in contenders if side.ps.score == best_score]
+        self.winner = leaders[0].player if len(leaders) == 1 else DRAW
+        return True
+
+    def snapshot(self) -> bytes:
+        """
+        Capture the match (both sides' gamesnapshots, the step count, and the result)
+
+        :return: the snapshot
+        """
+        first, second = (gamesnapshot.snapshot(side.gw, side.gs, side.ps, side.contacts, side.animations)
+                         for side in self.sides)
+        return MATCH.pack(self.steps, -1 if self.winner is None else self.winner, len(first)) + first + second
+
+    def restore(self, data: bytes) -> None:
+        """
+        Put the match back to a snapshot()
+
+        :param data: from snapshot()
+        :return:
+        """
+        steps, winner, first_size = MATCH.unpack_from(data, 0)
+        parts = (data[MATCH.size:MATCH.size + first_size], data[MATCH.size + first_size:])
+        gameevents.clear()
+        for side, part in zip(self.sides, parts):
+            gamesnapshot.restore(part, side.gw, side.gs, side.ps, side.contacts, side.animations)
+            side.cleared = not any(isinstance(wo, Brick) for wo in side.gw.world_objects)
+        self.steps = steps
+        self.winner = None if winner < 0 else winner
+
+    def get_checksum(self) -> int:
+        """
+        A CRC-32 of the gameplay state that must match between linked copies of the match - the Balls, Paddles,
+        scores, lives, and object counts (not the Animations or shakes, which are only drawn)
+
+        :return:
+        """
+        crc = zlib.crc32(self.steps.to_bytes(4, 'little'))
+        for side in self.sides:
+            ball = side.ball
+            crc = zlib.crc32(CHECKSUM.pack(ball.v_pos.x, ball.v_pos.y, ball.v_vel.x, ball.v_vel.y,
+                                           side.paddle.rect.x, side.ps.score, side.ps.lives,
+                                           len(side.gw.world_objects), side.gs.cur_state.value), crc)
+        return crc
+
+    def get_canvas(self, screen: pygame.Surface) -> pygame.Surface:
+        """
+        The shared full size canvas, in the screen's format
+
+        :param screen: the backbuffer
+        :return:
+        """
+        if self.canvas[0] is not screen:
+            self.canvas = (screen, pygame.Surface((constants.WIDTH, constants.HEIGHT), 0, screen))
+        return self.canvas[1]
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """
+        Draw both sides, their status lines, and any launch prompt or result
+
+        :param screen: the backbuffer
+        :return:
+        """
+        canvas = self.get_canvas(screen)
+        for side in self.sides:
+            side.draw(screen, canvas)
+            side.draw_status(screen, self.font_status)
+
+        if self.winner is None:
+            prompts = ("CLICK TO LAUNCH", "PRESS SPACE TO LAUNCH")
+            for side, prompt in zip(self.sides, prompts):
+                if side.gs.cur_state == GameState.GameStateName.READY_TO_LAUNCH:
+                    self.draw_centered(screen, self.font_prompt, prompt, side.view_rect.centerx,
+                                       side.view_rect.bottom + 30)
+        else:
+            result = "DRAW!" if self.winner == DRAW else f"PLAYER {self.winner} WINS!"
+            self.draw_centered(screen, self.font_result, result, constants.WIDTH // 2, VIEW_TOP // 2)
+            self.draw_centered(screen, self.font_prompt, "CLICK OR PRESS SPACE FOR THE MENU", constants.WIDTH // 2,
+                               VIEW_TOP + VIEW_HEIGHT + 60)
+
+    @staticmethod
+    def draw_centered(screen: pygame.Surface, font: pygame.font.Font, text: str, x: int, y: int) -> None:
+        """
+        Draw a line of text centered on a point
+
+        :param screen: the backbuffer
+        :param font: Font
+        :param text: the text
+        :param x: center x
+        :param y: center y
+        :return:
+        """
+        image = font.render(text, True, constants.WHITE)
+        screen.blit(image, image.get_rect(center=(x, y)))
+
+    def run_frame(self, events: list, screen: pygame.Surface, elapsed_ms: int) -> list[GameEvent]:
+        """
+        A whole versus frame: input (player 2's held arrow keys included), the fixed steps, and the drawing
+
+        :param events: this frame's (logical coords) pygame events
+        :param screen: the backbuffer
+        :param elapsed_ms: time since the last frame (the loop's tick_time)
+        :return: both sides' GameEvents, for the sound
+        """
+        self.handle_input(events)
+        game_events = self.advance(elapsed_ms, pygame.key.get_pressed())
+        self.draw(screen)
+        return game_events
@@ -17,6 +17,20 @@ import leaderboard as lb_
 import gamesettings as gst_
 
 
+class CollisionLayer:
+    """
+    The collision layers a WorldObject can be on (and so the bits of the collision masks).  These are plain
+    int bits rather than an IntFlag, since they're tested in the collision inner loop and IntFlag ops are slow.
+    """
+
+    NONE = 0
+    BALL = 1
+    PADDLE = 2
+    BRICK = 4
+    OBSTACLE = 8
+    EFFECT = 16
+
+
 class WorldObject:
     """ This is a parent class for the specific world objects (Ball, Paddle, Bricks) """
 
@@ -27,7 +41,9 @@ class WorldObject:
         self.value: int = 0
         self.rect: pygame.rect = None
         self.can_react: bool = False  # can this object react to collisions with other objects?
-        self.primed_collision: bool = True
+        # the layer this object is on, and the layers it's tested against (only objects that can react have a mask)
+        self.collision_layer: int = CollisionLayer.NONE
+        self.collision_mask: int = CollisionLayer.NONE
         self.strength: int = 1
         self.strength_initial: int = self.strength
 
@@ -85,28 +101,26 @@ class WorldObject:
 
     def allow_collision(self) -> bool:
         """
-        Determines if this object can participate in a collision
+        Determines if this object can participate in a collision (the GameEngine only asks when a
+        contact begins, since it latches each touching pair until they separate)
 
         :return:
         """
-        if self.primed_collision:
-            self.primed_collision = False
-            return True
-        return False
+        return True
 
-    def prime_for_collision(self) -> None:
+    def realize_surfaces(self) -> None:
         """
-        Reset the latch to allow for future collisions
+        Create any Surface/Font resources that were deferred while this WorldObject was built
+        off the main thread (see deferredsurfaces)
 
         :return:
         """
-        self.primed_collision = True
 
-    def trigger_destruction_effect(self, world_objects, gset: gst_.GameSettings, ps: ps_.PlayerState) -> None:
+    def trigger_destruction_effect(self, animations, gset: gst_.GameSettings, ps: ps_.PlayerState) -> None:
         """
         This is called to create and trigger the animation effect.
 
         :param gset: GameSettings
-        :param world_objects: list of WorldObjects
+        :param animations: the AnimationPool that plays the effects
         :return:
         """
@@ -0,0 +1,77 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the AnimationPool class.
+"""
+from unittest.mock import MagicMock, patch
+
+import constants
+from animationpool import AnimationPool, PoolExhaustionPolicy
+
+
+def finish_all(pool: AnimationPool) -> None:
+    """
+    Run the pool's Animations past their lifetimes
+    """
+    with patch("pygame.time.get_ticks", return_value=1_000_000):
+        pool.update(MagicMock(tick_time=0), MagicMock(), MagicMock(), MagicMock())
+
+
+def test_finished_animations_are_reused():
+    """
+    Test a finished Animation goes back to the free list and is reset() for the next spawn
+    """
+    pool = AnimationPool(capacity=4)
+    first = pool.spawn(100, (10, 10, 20, 20), constants.RED, v_acc=(0.0, 1.0))
+    assert pool.is_playing()
+
+    finish_all(pool)
+    assert not pool.is_playing()
+    assert pool.free == [first]
+
+    second = pool.spawn(200, (50, 60, 30, 30), constants.GREEN)
+    assert second is first
+    assert second.duration == 200
+    assert (second.rect.x, second.rect.y) == (50, 60)
+    assert second.v_acc.y == 0.0
+    assert pool.free == []
+
+
+def test_exhaustion_policies():
+    """
+    Test a full pool either recycles its oldest Animation or drops the new one, and tracks the stats
+    """
+    pool = AnimationPool(capacity=2)
+    oldest = pool.spawn(100, (0, 0, 10, 10), constants.RED)
+    pool.spawn(100, (0, 0, 10, 10), constants.RED)
+    recycled = pool.spawn(300, (0, 0, 10, 10), constants.RED)
+    assert recycled is oldest
+    assert pool.active[-1] is recycled
+    assert len(pool.active) == 2
+    assert pool.exhausted_count == 1
+    assert pool.high_water == 2
+
+    pool.policy = PoolExhaustionPolicy.DROP_NEW
+    assert pool.spawn(100, (0, 0, 10, 10), constants.RED) is None
+    assert pool.exhausted_count == 2
+
+
+def test_level_cleared_font_shared():
+    """
+    Test the level cleared message Animations share the pool's one font
+    """
+    pool = AnimationPool()
+    with patch("pygame.font.Font") as mock_font:
+        first = pool.spawn(100, (0, 0, 10, 10), constants.BLACK, is_lvl_clr_msg=True)
+        second = pool.spawn(100, (0, 0, 10, 10), constants.BLACK, is_lvl_clr_msg=True)
+        mock_font.assert_called_once()
+    assert first.font_logo is second.font_logo
+
+    pool.clear()
+    assert not pool.is_playing()
+    assert len(pool.free) == 2
@@ -0,0 +1,98 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the crash-recovery autosave.
+"""
+import os
+from unittest.mock import patch
+
+import pytest
+
+import autosave
+import constants
+import gamesnapshot
+import persistence
+from leveltheme import LevelTheme
+from smashenv import SmashEnv, ACTION_LEFT
+
+
+@pytest.fixture(autouse=True)
+def autosave_on(tmp_path):
+    """
+    Autosave into a temporary game data dir, turning autosave back off afterwards
+    """
+    with patch.object(persistence, "GAME_DATA_PATH", str(tmp_path)):
+        autosave.enable()
+        autosave.next_due_ms = 0
+        autosave.last_submitted = None
+        yield tmp_path
+        autosave.wait()
+        autosave.enable(False)
+        autosave.saved = False
+
+
+def make_snapshot(steps: int) -> bytes:
+    """
+    A snapshot of a CLASSIC game some steps in
+    """
+    env = SmashEnv(LevelTheme.CLASSIC)
+    env.reset(seed=3)
+    for _ in range(steps):
+        env.step(ACTION_LEFT)
+    return gamesnapshot.snapshot(env.gw, env.gs, env.ps, env.contacts)
+
+
+def test_throttled_save_and_load(autosave_on):
+    """
+    Test a snapshot is only due once per interval, unchanged snapshots aren't rewritten, and load() reads back the
+    latest one written
+    """
+    first, second = make_snapshot(10), make_snapshot(20)
+    assert autosave.is_due(1000)
+    autosave.submit(first, 1000)
+    assert not autosave.is_due(1000 + constants.AUTOSAVE_INTERVAL_MS - 1)
+    assert autosave.is_due(1000 + constants.AUTOSAVE_INTERVAL_MS)
+
+    autosave.wait()
+    writes = autosave.writes
+    autosave.submit(first, 5000)
+    autosave.wait()
+    assert autosave.writes == writes
+    autosave.submit(second, 9000)
+    autosave.wait()
+    assert autosave.load() == second
+    assert gamesnapshot.read_summary(second)['theme'] == LevelTheme.CLASSIC
+
+
+def test_discard_and_damaged_files(autosave_on):
+    """
+    Test discard() removes the saved run, and a damaged file loads as nothing to resume
+    """
+    autosave.submit(make_snapshot(5), 0)
+    autosave.discard()
+    autosave.wait()
+    assert autosave.load() is None
+    assert not os.path.exists(os.path.join(autosave_on, autosave.AUTOSAVE_FILENAME))
+
+    autosave.submit(make_snapshot(5), 0)
+    autosave.wait()
+    path = os.path.join(autosave_on, autosave.AUTOSAVE_FILENAME)
+    with open(path, 'rb') as file_in:
+        data = bytearray(file_in.read())
+    data[-1] ^= 0xFF
+    with open(path, 'wb') as file_out:
+        file_out.write(data)
+    assert autosave.load() is None
+
+
+def test_disabled_is_never_due():
+    """
+    Test that with autosave off, the game loop's check never asks for a snapshot
+    """
+    autosave.enable(False)
+    assert not autosave.is_due(10 ** 9)
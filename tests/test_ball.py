@@ -16,7 +16,7 @@ from pygame import Vector2
 
 from paddle import Paddle
 from ball import Ball
-from constants import BALL_RADIUS, BALL_SPEED_SIMPLE, WIDTH, HEIGHT, WHITE
+from constants import BALL_RADIUS, BALL_SPEED_SIMPLE, WIDTH, HEIGHT, WHITE, PAD_WIDTH
 from gamestate import GameState
 from motionmodels import MotionModels
 
@@ -68,6 +68,8 @@ def gamestate():
             self.v_gravity_acc = Vector2(0, 0)
             self.tick_time = 1
             self.cur_ball_x = 0
+            self.paddle_width = PAD_WIDTH
+            self.extra_balls_in_play = 0
             self.level_cleared = False
     return GameState()
 
@@ -222,6 +224,56 @@ def test_update_wo_gravity_application_vector(mock_mixer, ball, gamestate, games
     assert ball.v_vel.y > initial_velocity # gravity should increase y velocity
 
 
+
+@mock.patch('pygame.mixer')
+def test_update_wo_substep_mirrors_off_left_wall(mock_mixer, ball, gamestate, gamesettings):
+    """
+    Test the SUBSTEP_1 model mirrors the ball back inside the left wall and reverses it
+    :param ball:
+    :param gamestate:
+    :return:
+    """
+    gs = gamestate
+    gs.cur_state = GameState.GameStateName.PLAYING
+    gs.motion_model = MotionModels.SUBSTEP_1
+    gs.tick_time = 4
+    ball.v_pos = Vector2(BALL_RADIUS + 1, 300)
+    ball.v_vel = Vector2(-2.0, 0.0)  # 8 px this frame, so 4 sub-steps
+
+    ball.update_wo(gs, None, None, gamesettings)
+
+    assert ball.v_vel.x == 2.0  # bounced
+    assert ball.v_pos.x == pytest.approx(BALL_RADIUS + 7)  # 1 px in and 7 px back out
+    assert ball.v_vel_unit.x > 0
+
+
+def test_update_wo_substep_energy_drift_small(ball, gamestate, gamesettings):
+    """
+    Test the SUBSTEP_1 model keeps the ball's energy under strong gravity within a small fraction of VECTOR_1's drift
+    :param ball:
+    :param gamestate:
+    :return:
+    """
+    def energy_drift(model: MotionModels) -> float:
+        gs = gamestate
+        gs.cur_state = GameState.GameStateName.PLAYING
+        gs.motion_model = model
+        gs.gravity_acc_length = 0.002
+        gs.v_gravity_acc = Vector2(0, 0.002)
+        gs.tick_time = 4
+        ball.v_pos = Vector2(WIDTH // 2, HEIGHT // 2)
+        ball.v_vel = Vector2(1.5, -1.5)
+        ball.rect.y = HEIGHT // 2
+
+        def energy() -> float:
+            return 0.5 * ball.v_vel.length_squared() + 0.002 * (HEIGHT - ball.v_pos.y)
+        start = energy()
+        for _ in range(100):
+            ball.update_wo(gs, None, None, gamesettings)
+        return abs(energy() - start) / start
+
+    assert energy_drift(MotionModels.SUBSTEP_1) < energy_drift(MotionModels.VECTOR_1) / 4
+
 def test_update_wo_game_state_ready_to_launch(ball, gamestate, gamesettings):
     """
     Test ball position on READY_TO_LAUNCH state
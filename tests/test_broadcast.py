@@ -0,0 +1,196 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the spectator broadcast.
+"""
+import socket
+
+import pygame
+
+import constants
+from brick import Brick
+from broadcast import BroadcastServer, SpectatorClient, FRAME, DELTA, MESSAGE_DELTA, get_strengths
+from gamestate import GameState
+from gameworld import GameWorld
+from leveltheme import LevelTheme
+from levels import Levels
+from playerstate import PlayerState
+
+
+def make_game() -> tuple:
+    """
+    A CLASSIC game (no images needed), on its first level
+    """
+    gw = GameWorld(LevelTheme.CLASSIC)
+    gs = GameState()
+    gs.cur_state = GameState.GameStateName.PLAYING
+    ps = PlayerState()
+    ps.theme = LevelTheme.CLASSIC
+    return gw, gs, ps
+
+
+def connect(server: BroadcastServer) -> SpectatorClient:
+    """
+    A spectator on one end of a socket pair, the server on the other
+    """
+    server_end, client_end = socket.socketpair()
+    server.add_spectator(server_end)
+    return SpectatorClient(client_end)
+
+
+def assert_same_world(client: SpectatorClient, gw: GameWorld, ps: PlayerState) -> None:
+    """
+    The spectator's world matches the game's: the level, what's left of it, the Ball/Paddle, and the status
+    """
+    assert (client.gw.level_name, client.gw.level_seed) == (gw.level_name, gw.level_seed)
+    assert get_strengths(client.gw) == get_strengths(gw)
+    assert [tuple(wo.rect) for wo in client.gw.world_objects] == [tuple(wo.rect) for wo in gw.world_objects]
+    assert (client.ps.score, client.ps.lives, client.ps.level) == (ps.score, ps.lives, ps.level)
+
+
+def test_keyframe_then_deltas_rebuild_the_world():
+    """
+    Test a spectator is rebuilt from the first keyframe, then kept in step by small deltas of the moves, hits, and
+    destroyed bricks, with nothing sent for a frame without changes
+    """
+    gw, gs, ps = make_game()
+    server = BroadcastServer()
+    client = connect(server)
+    server.publish(gw, gs, ps)
+    assert client.receive() == 1 and client.synced
+    assert client.gw is not gw
+    assert_same_world(client, gw, ps)
+
+    bricks = [wo for wo in gw.world_objects if isinstance(wo, Brick)]
+    gw.world_objects[0].rect.move_ip(7, -9)
+    gw.world_objects[1].rect.x += 30
+    bricks[0].strength += 2
+    gw.world_objects.remove(bricks[1])
+    ps.score += 10
+    sent = server.bytes_encoded
+    server.publish(gw, gs, ps)
+    assert client.receive() == 1
+    assert_same_world(client, gw, ps)
+    assert client.gs.cur_state == GameState.GameStateName.PLAYING
+    # a delta, not a keyframe
+    assert server.keyframes == 1 and server.bytes_encoded - sent < 50
+
+    server.publish(gw, gs, ps)
+    assert client.receive() == 0 and server.messages == 2
+
+
+def test_keyframes_periodically_and_on_a_new_level():
+    """
+    Test a keyframe goes out every keyframe_interval frames and when the level changes, and a late spectator
+    only starts from one
+    """
+    gw, gs, ps = make_game()
+    server = BroadcastServer(keyframe_interval=10)
+    first = connect(server)
+    for i in range(25):
+        gw.world_objects[0].rect.x = i
+        server.publish(gw, gs, ps)
+    assert server.keyframes == 3
+
+    late = connect(server)
+    gw.world_objects[0].rect.x += 1
+    server.publish(gw, gs, ps)
+    assert server.keyframes == 4
+
+    gw.build_level(Levels.LevelName.CLASSIC_SOLID_ROWS_1)
+    ps.level = 2
+    server.publish(gw, gs, ps)
+    assert server.keyframes == 5
+    for client in (first, late):
+        client.receive()
+        assert_same_world(client, gw, ps)
+
+
+def test_slow_spectator_skips_to_a_keyframe():
+    """
+    Test a spectator that isn't reading has a bounded backlog - it skips the deltas it can't take and catches up
+    from a keyframe - without holding back the others
+    """
+    gw, gs, ps = make_game()
+    server = BroadcastServer(max_backlog=4096)
+    slow, fast = connect(server), connect(server)
+    bricks = [wo for wo in gw.world_objects if isinstance(wo, Brick)]
+    for i in range(2000):
+        gw.world_objects[0].rect.x = i % constants.WIDTH
+        bricks[i % len(bricks)].strength = (i % 3) + 1
+        server.publish(gw, gs, ps)
+        fast.receive()
+    assert server.skipped > 0
+    assert all(len(spectator.pending) <= 4096 for spectator in server.spectators)
+    assert_same_world(fast, gw, ps)
+
+    # once it reads again, it's brought back in step
+    for _ in range(100):
+        slow.receive()
+        server.publish(gw, gs, ps)
+    slow.receive()
+    assert_same_world(slow, gw, ps)
+
+
+def test_gone_spectator_is_dropped():
+    """
+    Test a spectator that disconnects is removed, and the broadcast goes on for the rest
+    """
+    gw, gs, ps = make_game()
+    server = BroadcastServer()
+    gone, staying = connect(server), connect(server)
+    server.publish(gw, gs, ps)
+    gone.close()
+    for i in range(3):
+        gw.world_objects[0].rect.x = i
+        server.publish(gw, gs, ps)
+    assert len(server.spectators) == 1
+    staying.receive()
+    assert_same_world(staying, gw, ps)
+
+
+def test_stream_split_anywhere_is_reassembled():
+    """
+    Test messages split across reads are only applied once whole
+    """
+    gw, gs, ps = make_game()
+    server = BroadcastServer()
+    message = server.encode(gw, gs, ps)
+    gw.world_objects[0].rect.x += 3
+    delta = server.encode(gw, gs, ps)
+    assert delta[FRAME.size] == MESSAGE_DELTA and len(delta) == FRAME.size + DELTA.size
+
+    sender, receiver = socket.socketpair()
+    client = SpectatorClient(receiver)
+    stream = message + delta
+    for cut in (1, len(message) - 1, len(message) + 3):
+        client.buffer.clear()
+        client.messages = 0
+        sender.sendall(stream[:cut])
+        client.receive()
+        sender.sendall(stream[cut:])
+        client.receive()
+        assert client.messages == 2
+    assert_same_world(client, gw, ps)
+
+
+def test_client_draws_the_world():
+    """
+    Test the spectator draws a waiting message until synced, then the world
+    """
+    pygame.init()
+    gw, gs, ps = make_game()
+    server = BroadcastServer()
+    client = connect(server)
+    screen = pygame.Surface((constants.WIDTH, constants.HEIGHT))
+    client.draw(screen)
+    server.publish(gw, gs, ps)
+    client.receive()
+    client.draw(screen)
+    brick = next(wo for wo in client.gw.world_objects if isinstance(wo, Brick))
+    assert screen.get_at(brick.rect.center)[:3] == tuple(brick.color)[:3]
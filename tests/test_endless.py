@@ -0,0 +1,174 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the endless mode.
+"""
+import itertools
+from unittest import mock
+
+import pygame
+
+import constants
+from ball import Ball
+from brick import Brick
+from endless import EndlessField, generate_rows, get_row_interval
+from gamestate import GameState
+from gameworld import GameWorld
+from leaderboard import Leaderboard
+from leveltheme import LevelTheme
+from playerstate import PlayerState
+
+
+def make_run(seed: int = 495) -> tuple:
+    """
+    An endless run of CLASSIC rows (no images needed), in play
+    """
+    gw = GameWorld(LevelTheme.CLASSIC)
+    field = EndlessField(gw, LevelTheme.CLASSIC, seed)
+    gs = GameState()
+    gs.cur_state = GameState.GameStateName.PLAYING
+    ps = PlayerState()
+    lb = mock.MagicMock(Leaderboard)
+    lb.is_high_score.return_value = False
+    return gw, field, gs, ps, lb
+
+
+def row_key(row: list) -> list:
+    """
+    What tells rows apart: each object's type, x, and color
+    """
+    return [(type(wo).__name__, wo.rect.x, tuple(wo.color)) for wo in row]
+
+
+def test_rows_come_from_the_levels_bottom_row_first():
+    """
+    Test the row supply cuts whole levels into rows, bottom row first, and the same seed streams the same rows
+    """
+    rows = list(itertools.islice(generate_rows(LevelTheme.CLASSIC, 7), 12))
+    assert all(len({wo.rect.y for wo in row}) == 1 for row in rows)
+    # the first level's rows, from the bottom up
+    assert rows[0][0].rect.y > rows[1][0].rect.y > rows[2][0].rect.y > rows[3][0].rect.y
+    again = list(itertools.islice(generate_rows(LevelTheme.CLASSIC, 7), 12))
+    assert [row_key(row) for row in rows] == [row_key(row) for row in again]
+    other = list(itertools.islice(generate_rows(LevelTheme.CLASSIC, 8), 12))
+    assert [row_key(row) for row in rows] != [row_key(row) for row in other]
+
+
+def test_field_replaces_the_level():
+    """
+    Test the field takes the level's place - the world keeps only its Ball and Paddle, and the field starts with
+    its rows stacked down from the top
+    """
+    gw, field, gs, ps, lb = make_run()
+    assert gw.brick_field is field
+    assert [type(wo).__name__ for wo in gw.world_objects] == ['Ball', 'Paddle']
+    assert len(field.rows) == constants.ENDLESS_START_ROWS
+    for row_num, row in enumerate(field.rows):
+        assert all(wo.rect.y == constants.ENDLESS_TOP_Y + (row_num * constants.ENDLESS_ROW_PITCH) for wo in row)
+    assert field.brick_count == sum(isinstance(wo, Brick) for row in field.rows for wo in row)
+
+
+def test_rows_stream_in_on_the_timer_and_drop_off():
+    """
+    Test a row streams in each interval, pushing the others down, and a row pushed past the last drops off,
+    costing a life for the bricks left in it
+    """
+    gw, field, gs, ps, lb = make_run()
+    top_row = field.rows[0]
+    field.update(constants.ENDLESS_ROW_INTERVAL_MS - 1, gs, ps, lb)
+    assert field.rows_streamed == constants.ENDLESS_START_ROWS
+    field.update(1, gs, ps, lb)
+    assert field.rows_streamed == constants.ENDLESS_START_ROWS + 1
+    assert field.rows[1] is top_row
+    assert top_row[0].rect.y == constants.ENDLESS_TOP_Y + constants.ENDLESS_ROW_PITCH
+
+    while len(field.rows) < constants.ENDLESS_MAX_ROWS:
+        field.update(field.next_row_ms, gs, ps, lb)
+    assert (ps.lives, field.rows_dropped) == (constants.START_LIVES, 0)
+    bottom_row = field.rows[-1]
+    field.update(field.next_row_ms, gs, ps, lb)
+    assert len(field.rows) == constants.ENDLESS_MAX_ROWS and bottom_row not in field.rows
+    assert (ps.lives, field.rows_dropped) == (constants.START_LIVES - 1, 1)
+    assert field.brick_count == sum(isinstance(wo, Brick) for row in field.rows for wo in row)
+
+    # the run's over once the lives run out
+    while ps.lives > 0:
+        field.update(field.next_row_ms, gs, ps, lb)
+    assert gs.cur_state == GameState.GameStateName.GAME_OVER
+
+
+def test_cleared_field_streams_a_row_right_away():
+    """
+    Test removing bricks keeps the count of what's left, and a cleared field gets its next row without waiting
+    """
+    gw, field, gs, ps, lb = make_run()
+    bricks = [wo for row in field.rows for wo in row if isinstance(wo, Brick)]
+    assert not field.remove(gw.world_objects[0])
+    for brick in bricks:
+        assert field.remove(brick)
+    assert field.brick_count == 0
+    field.update(1, gs, ps, lb)
+    assert field.rows_streamed == constants.ENDLESS_START_ROWS + 1
+    assert field.next_row_ms == get_row_interval(ps.level)
+
+
+def test_levels_speed_up_the_rows_and_the_ball():
+    """
+    Test the level goes up every ENDLESS_ROWS_PER_LEVEL rows, with a faster ball and a shorter row interval
+    """
+    gw, field, gs, ps, lb = make_run()
+    ball = next(wo for wo in gw.world_objects if isinstance(wo, Ball))
+    speed_v = ball.speed_v
+    for _ in range(constants.ENDLESS_ROWS_PER_LEVEL):
+        field.update(field.next_row_ms, gs, ps, lb)
+    assert ps.level == 2
+    assert ball.speed_v > speed_v
+    assert field.next_row_ms == get_row_interval(2) < get_row_interval(1)
+    assert get_row_interval(1000) == constants.ENDLESS_ROW_INTERVAL_MIN_MS
+
+
+def test_query_only_returns_the_overlapped_rows():
+    """
+    Test the broadphase hands back just the rows a rect overlaps
+    """
+    gw, field, gs, ps, lb = make_run()
+    top = constants.ENDLESS_TOP_Y
+    pitch = constants.ENDLESS_ROW_PITCH
+    assert field.query(pygame.Rect(0, 0, 20, 20)) == []
+    assert field.query(pygame.Rect(0, top + 5, 20, 20)) == field.rows[0]
+    spanning = field.query(pygame.Rect(0, top + pitch - 10, 20, 20))
+    assert spanning == field.rows[0] + field.rows[1]
+    below = top + (len(field.rows) * pitch) + 10
+    assert field.query(pygame.Rect(0, below, 20, 20)) == []
+
+
+def test_cached_layer_matches_drawing_the_rows():
+    """
+    Test the layer, only touched where something changed, draws the same as drawing every row directly
+    """
+    pygame.init()
+    gw, field, gs, ps, lb = make_run()
+    screen = pygame.Surface((constants.WIDTH, constants.HEIGHT))
+    field.draw(screen)
+
+    bricks = [wo for row in field.rows for wo in row if isinstance(wo, Brick)]
+    field.remove(bricks[0])
+    bricks[1].color = constants.WHITE
+    field.redraw(bricks[1])
+    for _ in range(3):
+        field.update(field.next_row_ms, gs, ps, lb)
+    screen.fill(constants.BLACK)
+    field.draw(screen)
+
+    expected = pygame.Surface((constants.WIDTH, constants.HEIGHT))
+    for row in field.rows:
+        for wo in row:
+            wo.draw_wo(expected)
+    band = pygame.Rect(0, 0, constants.WIDTH, field.layer.get_height())
+    assert (pygame.image.tobytes(screen.subsurface(band), 'RGB') ==
+            pygame.image.tobytes(expected.subsurface(band), 'RGB'))
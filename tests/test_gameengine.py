@@ -9,6 +9,9 @@
     Module Description: This is the test harness for the GameEngine class.
     Does not test GameState.handle_gamestate
 """
+import asyncio
+from collections import defaultdict
+from time import perf_counter
 from unittest.mock import patch
 
 import pygame
@@ -16,6 +19,7 @@ import pytest
 
 import assets
 import constants
+import persistence
 from unittest import mock
 
 import playerstate
@@ -27,6 +31,7 @@ from leveltheme import LevelTheme
 from userinterface import UserInterface
 from leaderboard import Leaderboard
 from ball import Ball
+from motionmodels import MotionModels
 
 
 @pytest.fixture
@@ -63,6 +68,7 @@ def starting_ge(mock_pygame):
     gset = mock.MagicMock(GameSettings)
     gs = GameState()
     gw = mock.MagicMock(GameWorld)
+    gw.brick_field = None
     ps = playerstate.PlayerState()
     lb = mock.MagicMock(Leaderboard)
 
@@ -116,8 +122,7 @@ def test_next_level(starting_ge):
     FPS is reset, and GameState is set to READY_TO_LAUNCH
     """
     ge, mock_pygame = starting_ge
-    with mock.patch("gameengine.Levels.get_level_name_from_num", return_value="Level_2") as mock_get_level_name, \
-            mock.patch("gameengine.Levels.build_level") as mock_build_level:
+    with mock.patch("gameengine.Levels.get_level_name_from_num", return_value="Level_2") as mock_get_level_name:
 
         mock_ball = mock.MagicMock(Ball)
         mock_ball.v_vel_unit = 1
@@ -139,7 +144,7 @@ def test_next_level(starting_ge):
 
         # Ensure the level is built
         mock_get_level_name.assert_called_once_with(ge.ps.theme, ge.ps.level)
-        mock_build_level.assert_called()
+        ge.gw.build_level.assert_called_once_with("Level_2")
 
         # Ensure FPS is reset and game state is ready to launch
         assert ge.fps == constants.INITIAL_FPS_SIMPLE
@@ -187,6 +192,47 @@ def test_clean_shutdown(mock_exit, starting_ge):
     mock_exit.assert_called_once()
 
 
+def test_run_loop_async(starting_ge):
+    """
+    Tests run_loop_async yields to the event loop every frame, paces the frames without busy-waiting,
+    and stores the leaderboard/settings by awaiting them once a QUIT ends the loop
+    """
+    ge, mock_pygame = starting_ge
+    ge.gs.motion_model = MotionModels.SIMPLE_1
+    ge.fps = 100
+    ge.gset.paddle_under_mouse_control = True
+    ge.gset.paddle_under_auto_control = False
+    frames = 5
+    events = [[] for _ in range(frames - 1)] + [[pygame.event.Event(pygame.QUIT)]]
+    other_task_turns = []
+
+    async def other_task():
+        while ge.gs.running:
+            other_task_turns.append(1)
+            await asyncio.sleep(0)
+
+    async def run_both():
+        await asyncio.gather(ge.run_loop_async(), other_task())
+
+    with patch("pygame.event.get", side_effect=events), \
+         patch("pygame.key.get_pressed", return_value=defaultdict(bool)), \
+         patch("pygame.display.flip") as mock_flip, \
+         patch.object(ge, "play_music"):
+        start = perf_counter()
+        asyncio.run(run_both())
+        elapsed = perf_counter() - start
+
+    assert mock_flip.call_count == frames
+    assert len(other_task_turns) >= frames - 1
+    # 5 frames at 100 FPS, paced by sleeping
+    assert elapsed >= 0.04
+    ge.lb.store_async.assert_awaited_once_with(persistence.LEADERBOARD_FILENAME)
+    ge.gset.store_async.assert_awaited_once_with(persistence.SETTINGS_FILENAME)
+    mock_pygame['quit'].assert_called_once()
+    # (the browser build has no threads to pre-build the levels on)
+    assert not ge.level_prebuilder.threaded
+
+
 def test_play_music_bgm_sound_off(starting_ge):
     """
     Tests that when bgm_sounds is False, the music is stopped
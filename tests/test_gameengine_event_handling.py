@@ -13,7 +13,7 @@ from unittest.mock import MagicMock, patch
 import pygame
 from gameengine import GameEngine
 from gamestate import GameState
-from constants import PADDLE_IMPULSE_INCREMENT, WORLD_GRAVITY_ACC_INCREMENT
+from constants import PADDLE_IMPULSE_INCREMENT, WORLD_GRAVITY_ACC_INCREMENT, WIDTH, HEIGHT
 from motionmodels import MotionModels
 
 
@@ -36,6 +36,7 @@ def mock_pygame():
          patch("pygame.draw.line") as mock_draw_line:
 
         # Setup return values if needed
+        mock_set_mode.return_value.get_size.return_value = (WIDTH, HEIGHT)
 
         yield {
             "set_mode": mock_set_mode,
@@ -60,6 +61,7 @@ def setup_gameengine(mock_pygame):
     ps.score = 0
     lb = MagicMock()
     gw = MagicMock()
+    gw.brick_field = None
 
     ge = GameEngine(lb, ps, gw, gs, gset, ui)
     ge.restart_game_button = MagicMock(pygame.Rect)
@@ -125,6 +127,19 @@ def test_toggle_dev_overlay(setup_gameengine):
     assert ge.gs.show_dev_overlay is True
 
 
+def test_dump_profile(setup_gameengine):
+    """Test dumping the frame profiler timings with CTRL+T."""
+    ge, mock_pygame = setup_gameengine
+    events = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_t, mod=pygame.KMOD_CTRL)]
+
+    with patch("gameengine.persistence.store_text") as mock_store_text:
+        ge.handle_events(events)
+
+        assert mock_store_text.call_count == 2
+        assert mock_store_text.call_args_list[0][0][1].endswith('.csv')
+        assert mock_store_text.call_args_list[1][0][1].endswith('.json')
+
+
 def test_toggle_auto_play(setup_gameengine):
     """Test toggling auto-play mode with CTRL+A."""
     ge, mock_pygame = setup_gameengine
@@ -173,7 +188,9 @@ def test_adjust_ball_speed(event, expected_speed, setup_gameengine):
         assert ge.gs.ball_speed_step == expected_speed
 
 
-@pytest.mark.parametrize("model_current, model_expected", [(MotionModels.VECTOR_1, MotionModels.SIMPLE_1), (MotionModels.SIMPLE_1, MotionModels.VECTOR_1)])
+@pytest.mark.parametrize("model_current, model_expected", [(MotionModels.VECTOR_1, MotionModels.SUBSTEP_1),
+                                                           (MotionModels.SUBSTEP_1, MotionModels.SIMPLE_1),
+                                                           (MotionModels.SIMPLE_1, MotionModels.VECTOR_1)])
 def test_toggle_motion_model(model_current, model_expected, setup_gameengine):
     """Test toggling motion models with CTRL+M."""
     ge, mock_pygame = setup_gameengine
@@ -8,6 +8,7 @@
 
     Module Description: This is the test harness for testing the GameEngine.handle_gamestate().
 """
+from collections import defaultdict
 from unittest.mock import patch
 
 import pygame
@@ -17,8 +18,11 @@ import constants
 from unittest import mock
 from unittest.mock import MagicMock
 
+import assets
+import gameevents
 import playerstate
 from gameengine import GameEngine
+from gameevents import GameEventType
 from gamesettings import GameSettings
 from gamestate import GameState
 from gameworld import GameWorld
@@ -28,7 +32,10 @@ from leaderboard import Leaderboard
 from ball import Ball
 from brick import Brick
 from paddle import Paddle
+from poweruptype import PowerUpType
 from animation import Animation
+from endless import EndlessField
+from worldobject import CollisionLayer
 import utils
 
 
@@ -43,6 +50,7 @@ def mock_pygame():
          mock.patch.object(pygame.mixer, "find_channel") as mock_mixer_find_channel, \
          mock.patch("pygame.mouse.set_visible") as mock_mouse_set_visible, \
          mock.patch("pygame.mouse.get_pos", return_value=[4]) as mock_mouse_pos, \
+         mock.patch("pygame.key.get_pressed", return_value=defaultdict(bool)), \
          mock.patch("pygame.time.get_ticks", return_value=123456) as mock_get_ticks, \
          mock.patch("pygame.display.set_mode") as mock_set_mode, \
          mock.patch.object(pygame.mixer, "set_num_channels"), \
@@ -85,12 +93,15 @@ def starting_ge(mock_pygame):
         gs = GameState()
         gw = mock.MagicMock(GameWorld)
         gw.world_objects = []
+        gw.brick_field = None
         ps = playerstate.PlayerState()
         lb = mock.MagicMock(Leaderboard)
 
         gset.is_fullscreen = False
 
         ge = GameEngine(lb, ps, gw, gs, gset, ui)
+        # the mock GameWorld can't be snapshot, so skip the level start (CTRL+r retry) snapshot
+        ge.level_start_snapshot = b''
         return ge, mock_pygame
 
 
@@ -104,6 +115,8 @@ def starting_ge_main_menu(starting_ge):
 
     ge.ui.start_classic_button_rect = pygame.Rect(100, 100, 100, 50)
     ge.ui.start_modern_button_rect = pygame.Rect(100, 200, 100, 50)
+    ge.ui.versus_button_rect = pygame.Rect(300, 100, 100, 50)
+    ge.ui.endless_button_rect = pygame.Rect(300, 200, 100, 50)
     ge.ui.how_to_play_button_rect = pygame.Rect(100, 300, 100, 50)
     ge.ui.settings_button_rect = pygame.Rect(100, 400, 100, 50)
     ge.ui.leader_button_rect = pygame.Rect(100, 500, 100, 50)
@@ -180,6 +193,30 @@ def test_gamestate_menu_play_btn(position, theme, starting_ge_main_menu):
         mock_reset_game.assert_called_once()
 
 
+def test_gamestate_menu_versus_btn(starting_ge_main_menu):
+    """
+    Tests the 2 PLAYER VERSUS button starts a versus match
+    """
+    ge, mock_pygame = starting_ge_main_menu
+    event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(350, 125))
+
+    with patch.object(ge, 'start_versus') as mock_start_versus:
+        ge.handle_gamestate([event])
+        mock_start_versus.assert_called_once()
+
+
+def test_gamestate_menu_endless_btn(starting_ge_main_menu):
+    """
+    Tests the ENDLESS MODE button starts an endless run
+    """
+    ge, mock_pygame = starting_ge_main_menu
+    event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(350, 225))
+
+    with patch.object(ge, 'start_endless') as mock_start_endless:
+        ge.handle_gamestate([event])
+        mock_start_endless.assert_called_once()
+
+
 def test_gamestate_menu_quit_btn(starting_ge_main_menu):
     """
     Tests quit button is pressed and clean_shutdown is called
@@ -344,7 +381,13 @@ def test_gamestate_ready_to_launch_initialization(mock_levels, starting_ge):
     ball = mock.MagicMock(spec=Ball)
     ball.can_react = True
     ball.commanded_pos_x = 0
-    ball.rect = mock.MagicMock
+    ball.rect = mock.MagicMock()
+    brick.rect = mock.MagicMock()
+    paddle.rect = mock.MagicMock()
+    brick.collision_layer = CollisionLayer.BRICK
+    paddle.collision_layer = CollisionLayer.PADDLE
+    ball.collision_layer = CollisionLayer.BALL
+    ball.collision_mask = CollisionLayer.PADDLE | CollisionLayer.BRICK
     ge.gw.world_objects = [paddle, ball, brick]
     ge.gs.cur_state = GameState.GameStateName.READY_TO_LAUNCH
     ge.gs.last_mouse_pos_x = 5
@@ -464,28 +507,35 @@ def test_gamestate_playing_skip_non_reacting_objects(mock_levels, can_react, sta
 @mock.patch("levels.Levels")
 def test_gamestate_playing_remove_animation_when_done(mock_levels, should_remove, starting_ge):
     """
-    Test that an Animation object is removed if should_remove() returns True.
+    Test that an Animation is returned to the pool if should_remove() returns True, and is never collision tested.
     """
     ge, mock_pygame = starting_ge
     ge.gs.cur_state = GameState.GameStateName.PLAYING
 
-    # mock animation world object
+    # mock animation, playing in the pool (not in the world)
     animation_wo = mock.MagicMock(spec=Animation)
     animation_wo.should_remove.return_value = should_remove
-    animation_wo.can_react = False
-    ge.gw.world_objects = [animation_wo]
+    ge.animations.active = [animation_wo]
+    # a Brick left in the world, so the level isn't cleared (that would spawn another Animation)
+    brick_wo = mock.MagicMock(spec=Brick)
+    brick_wo.can_react = False
+    ge.gw.world_objects = [brick_wo]
 
     # run function being tested
-    ge.handle_gamestate([])
+    with patch.object(ge, "handle_collisions_between_worldobjects") as mock_handle_collisions:
+        ge.handle_gamestate([])
+        mock_handle_collisions.assert_not_called()
 
+    animation_wo.update_wo.assert_called_once()
     animation_wo.should_remove.assert_called_once()
     if should_remove:
-        # Verify the Animation object was removed
-        assert animation_wo not in ge.gw.world_objects
+        # Verify the Animation was returned to the pool's free list
+        assert animation_wo not in ge.animations.active
+        assert animation_wo in ge.animations.free
 
     else:
-        # Verify the Animation object was not removed
-        assert animation_wo in ge.gw.world_objects
+        # Verify the Animation is still playing
+        assert animation_wo in ge.animations.active
 
 
 def test_handle_collisions_detects_collision(starting_ge):
@@ -513,12 +563,14 @@ def test_handle_collisions_detects_collision(starting_ge):
 
     with patch.object(utils, "start_shake") as mock_shake:
         ge.handle_collisions_between_worldobjects(current_wo, other_wo)
+        # the scoring and shake happen when the step's GameEvents are consumed
+        ge.dispatch_game_events()
 
         # Assert collision was detected and methods were called
         current_wo.detect_collision.assert_called_once_with(other_wo, ge.gs, ge.gset)
         other_wo.add_collision.assert_called_once()
         assert ge.ps.score == 15  # Score updated
-        other_wo.trigger_destruction_effect.assert_called_once_with(ge.gw.world_objects, ge.gset, ge.ps)
+        other_wo.trigger_destruction_effect.assert_called_once_with(ge.animations, ge.gset, ge.ps)
 
         # Assert shake logic was triggered
         mock_shake.assert_called_once_with(ge.gs, (constants.SHAKE_STRENGTH_THRESHOLD + 1) * constants.SHAKE_OFFSET_BASE)
@@ -533,23 +585,120 @@ def test_handle_collisions_detects_collision(starting_ge):
             assert current_wo.v_vel == current_wo.v_vel_unit * current_wo.speed_v
 
 
-def test_handle_collisions_resets_collision_flag(starting_ge):
+def test_handle_collisions_latches_contact(starting_ge):
     """
-    Tests that nothing happens when collisions aren't allowed
+    Tests a touching pair only reacts when the contact begins, and can react again once they've separated
     """
     ge, mock_pygame = starting_ge
     current_wo = mock.MagicMock()
     other_wo = mock.MagicMock()
+    other_wo.should_remove.return_value = False
+    other_wo.should_score.return_value = False
     ge.gw.world_objects = [current_wo, other_wo]
 
-    # Mock no collision
-    current_wo.rect.colliderect.return_value = False
+    # touching for two checks
+    current_wo.rect.colliderect.return_value = True
+    ge.handle_collisions_between_worldobjects(current_wo, other_wo)
+    ge.handle_collisions_between_worldobjects(current_wo, other_wo)
+    current_wo.detect_collision.assert_called_once()
+    assert (current_wo, other_wo) in ge.contacts
 
-    # Call the function
+    # separated, then touching again
+    current_wo.rect.colliderect.return_value = False
+    ge.handle_collisions_between_worldobjects(current_wo, other_wo)
+    assert (current_wo, other_wo) not in ge.contacts
+    current_wo.rect.colliderect.return_value = True
     ge.handle_collisions_between_worldobjects(current_wo, other_wo)
+    assert current_wo.detect_collision.call_count == 2
+
+
+def test_handle_collisions_for_tests_only_masked_layers(starting_ge):
+    """
+    Tests a reacting object is only tested against the objects on the layers in its collision mask
+    """
+    ge, mock_pygame = starting_ge
+    ball = Ball(100, 100)
+    paddle = Paddle(constants.RED, constants.PAD_WIDTH, constants.PAD_HEIGHT)
+    brick = Brick(pygame.Rect(10, 10, 20, 10), constants.RED)
+    effect = Animation(100, (0, 0, 10, 10), constants.RED)
+    far_brick = Brick(pygame.Rect(500, 500, 20, 10), constants.RED)
+    # all overlapping the ball, except far_brick
+    paddle.rect = ball.rect.copy()
+    brick.rect = ball.rect.copy()
+    effect.rect = ball.rect.copy()
+    ge.gw.world_objects = [ball, paddle, effect, brick, far_brick]
+
+    with patch.object(ge, "handle_collisions_between_worldobjects") as mock_handle_collisions:
+        ge.handle_collisions_for(ball)
+        tested = [call.args[1] for call in mock_handle_collisions.call_args_list]
+    assert tested == [paddle, brick]
+
+    # a previous contact is still handled (as an exit) once it's no longer touching
+    ge.contacts.add((ball, far_brick))
+    with patch.object(ge, "handle_collisions_between_worldobjects") as mock_handle_collisions:
+        ge.handle_collisions_for(ball)
+        tested = [call.args[1] for call in mock_handle_collisions.call_args_list]
+    assert tested == [paddle, brick, far_brick]
 
-    # Assert prime_for_collision was called
-    other_wo.prime_for_collision.assert_called_once()
+
+def test_handle_collisions_in_the_endless_field(starting_ge):
+    """
+    Tests the endless mode's bricks are tested from just the field's overlapped rows, and a destroyed one is
+    removed from the field (the world keeps only its Ball and Paddle)
+    """
+    ge, mock_pygame = starting_ge
+    ge.gw = GameWorld(LevelTheme.CLASSIC)
+    field = EndlessField(ge.gw, LevelTheme.CLASSIC, seed=495)
+    ball = ge.gw.world_objects[0]
+    brick = next(wo for wo in field.rows[1] if isinstance(wo, Brick))
+    brick.strength = 1
+    ball.rect.center = brick.rect.center
+    bricks_left = field.brick_count
+
+    with patch.object(field, "query", wraps=field.query) as mock_query:
+        ge.handle_collisions_for(ball)
+        mock_query.assert_called_once_with(ball.rect)
+    assert brick not in field.rows[1]
+    assert field.brick_count == bricks_left - 1
+    assert len(ge.gw.world_objects) == 2
+
+
+def test_handle_collisions_releases_power_up(starting_ge):
+    """
+    Tests a destroyed Brick's timed power-up is released as a falling capsule
+    """
+    ge, mock_pygame = starting_ge
+    ge.gw = GameWorld(LevelTheme.CLASSIC)
+    ball = ge.gw.world_objects[0]
+    brick = Brick(pygame.Rect(ball.rect.x, ball.rect.y, 100, 50), constants.RED, power_up=PowerUpType.SLOW_BALL)
+    brick.strength = 1
+    ge.gw.world_objects.append(brick)
+
+    ge.handle_collisions_for(ball)
+    assert brick not in ge.gw.world_objects
+    assert [capsule.power_up for capsule in ge.power_ups.capsules] == [PowerUpType.SLOW_BALL]
+
+
+def test_laser_shot_destroys_brick(starting_ge):
+    """
+    Tests a laser shot damages a Brick the way the ball does - destroying, scoring, and releasing its power-up
+    """
+    ge, mock_pygame = starting_ge
+    ge.gw = GameWorld(LevelTheme.CLASSIC)
+    ge.gw.world_objects = ge.gw.world_objects[:2]
+    ge.gs.cur_state = GameState.GameStateName.PLAYING
+    ge.gs.tick_time = 10
+    brick = Brick(pygame.Rect(100, 300, 100, 50), constants.RED, power_up=PowerUpType.LASER)
+    brick.strength = 1
+    ge.gw.world_objects.append(brick)
+    gameevents.clear()
+
+    ge.lasers.spawn(150, 400)
+    for _ in range(20):
+        ge.lasers.update(ge.gw, ge.gs, ge.apply_hit)
+    assert brick not in ge.gw.world_objects and len(ge.lasers) == 0
+    assert [event.event_type for event in gameevents.drain()] == [GameEventType.BRICK_DESTROYED]
+    assert [capsule.power_up for capsule in ge.power_ups.capsules] == [PowerUpType.LASER]
 
 
 def test_handle_collisions_no_effect_on_disallowed_collision(starting_ge):
@@ -830,3 +979,28 @@ def test_settings_reset_slider_checks(starting_ge_settings):
 
 
 
+
+
+def test_dispatch_game_events_dedupes_and_scores(starting_ge):
+    """
+    Tests the frame's GameEvents are voiced once per distinct sound, scored, and shaken by the strongest Brick
+    """
+    ge, mock_pygame = starting_ge
+    ge.ps.score = 0
+    strong = constants.SHAKE_STRENGTH_THRESHOLD
+    for strength in (strong, strong + 2, 1):
+        gameevents.emit(GameEventType.BRICK_DESTROYED, points=10, strength=strength)
+    gameevents.emit(GameEventType.WALL_HIT_TOP)
+
+    with patch.object(utils, "start_shake") as mock_shake, \
+         patch.object(assets, "BRICK_SFX", "brick.wav"), \
+         patch.object(assets, "TOP_WALL_SFX", "top_wall.wav"):
+        ge.dispatch_game_events()
+
+        mock_shake.assert_called_once_with(ge.gs, (strong + 2) * constants.SHAKE_OFFSET_BASE)
+
+    assert ge.ps.score == 30
+    # three Brick destructions and a wall hit -> two voiced sounds
+    assert mock_pygame["mixer.sound"].call_count == 2
+    assert mock_pygame["mixer.find_channel"].return_value.play.call_count == 2
+    assert gameevents.pending == []
@@ -0,0 +1,80 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the gameevents bus and the SfxPlayer.
+"""
+from unittest.mock import patch
+
+import pytest
+
+import assets
+import gameevents
+from gameevents import GameEventType
+from sfxplayer import SfxPlayer
+
+
+@pytest.fixture(autouse=True)
+def empty_bus():
+    """
+    Start and end every test with an empty bus
+    """
+    gameevents.clear()
+    yield
+    gameevents.clear()
+
+
+def test_emit_and_drain():
+    """
+    Tests events are drained in emission order and the bus is left empty
+    """
+    gameevents.emit(GameEventType.WALL_HIT_LEFT)
+    gameevents.emit(GameEventType.BRICK_DESTROYED, points=7, strength=3)
+
+    events = gameevents.drain()
+
+    assert [event.event_type for event in events] == [GameEventType.WALL_HIT_LEFT, GameEventType.BRICK_DESTROYED]
+    assert events[1].points == 7
+    assert events[1].strength == 3
+    assert gameevents.drain() == []
+
+
+def test_clear():
+    """
+    Tests clear() drops the queued events
+    """
+    gameevents.emit(GameEventType.PADDLE_HIT)
+    gameevents.clear()
+    assert gameevents.drain() == []
+
+
+def test_sfx_player_caches_sounds():
+    """
+    Tests each Sound is only created once, however often it's played
+    """
+    with patch("pygame.mixer.Sound") as mock_sound, patch("pygame.mixer.find_channel") as mock_find_channel, \
+         patch.object(assets, "PADDLE_SFX", "paddle.wav"):
+        sfx_player = SfxPlayer()
+        for _ in range(3):
+            sfx_player.play_events([gameevents.GameEvent(GameEventType.PADDLE_HIT)], 0.5)
+
+        mock_sound.assert_called_once_with("paddle.wav")
+        mock_sound.return_value.set_volume.assert_called_with(0.5)
+        assert mock_find_channel.return_value.play.call_count == 3
+
+
+def test_sfx_player_disabled_is_silent():
+    """
+    Tests a disabled (headless) SfxPlayer never touches the mixer
+    """
+    with patch("pygame.mixer.Sound") as mock_sound, patch("pygame.mixer.find_channel") as mock_find_channel:
+        sfx_player = SfxPlayer(enabled=False)
+        sfx_player.play_events([gameevents.GameEvent(GameEventType.BRICK_DESTROYED)], 1.0)
+        sfx_player.play(assets.BRICK_SFX, 1.0)
+
+        mock_sound.assert_not_called()
+        mock_find_channel.assert_not_called()
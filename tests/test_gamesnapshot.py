@@ -0,0 +1,105 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the game-state snapshot and restore.
+"""
+import random
+
+import pygame
+import pytest
+
+import gamesnapshot
+from brick import Brick
+from gamestate import GameState
+from gameworld import GameWorld
+from leveltheme import LevelTheme
+from smashenv import SmashEnv, ACTION_LEFT, ACTION_RIGHT, ACTION_STAY
+
+
+def play(env: SmashEnv, steps: int) -> list:
+    """
+    Step the env with a fixed action pattern, returning each step's observation and reward
+    """
+    return [env.step((ACTION_LEFT, ACTION_STAY, ACTION_RIGHT)[(i // 7) % 3])[:2] for i in range(steps)]
+
+
+def get_level_layout(gw: GameWorld) -> list:
+    """
+    The level objects' kinds, positions, and strengths
+    """
+    return [(type(wo).__name__, tuple(wo.rect), getattr(wo, 'strength', 0)) for wo in gw.level_objects]
+
+
+def test_restore_replays_the_same_game():
+    """
+    Test restoring a snapshot puts back the Ball, Paddle, Bricks, score, contacts, and random state, so the game
+    plays out exactly as it did from that point
+    """
+    env = SmashEnv()
+    env.reset(seed=4)
+    play(env, 150)
+    data = env.snapshot()
+    bricks = [wo for wo in env.gw.world_objects if isinstance(wo, Brick)]
+    score, contacts = env.ps.score, set(env.contacts)
+    expected = play(env, 400)
+
+    # play on from there, until Bricks are gone, then go back
+    while sum(isinstance(wo, Brick) for wo in env.gw.world_objects) == len(bricks):
+        play(env, 50)
+    random.random()
+    env.restore(data)
+    assert [wo for wo in env.gw.world_objects if isinstance(wo, Brick)] == bricks
+    assert (env.ps.score, env.contacts) == (score, contacts)
+    assert play(env, 400) == expected
+
+
+def test_restore_into_a_new_world_rebuilds_the_level():
+    """
+    Test a snapshot restored into a GameWorld with another level rebuilds the same layout from the level's seed
+    """
+    env = SmashEnv()
+    env.reset(seed=9)
+    play(env, 300)
+    data = env.snapshot()
+    layout = get_level_layout(env.gw)
+    present = [wo in env.gw.world_objects for wo in env.gw.level_objects]
+    expected = play(env, 200)
+
+    other = SmashEnv()
+    other.reset(seed=1)
+    other.restore(data)
+    assert get_level_layout(other.gw) == layout
+    assert [wo in other.gw.world_objects for wo in other.gw.level_objects] == present
+    assert play(other, 200) == expected
+
+
+def test_restore_rejects_other_data():
+    """
+    Test restore() raises a ValueError for bytes that aren't a snapshot
+    """
+    gw, gs = GameWorld(LevelTheme.CLASSIC), GameState()
+    with pytest.raises(ValueError):
+        gamesnapshot.restore(b'not a snapshot' * 4, gw, gs, None)
+
+
+def test_restore_respawns_the_playing_animations():
+    """
+    Test the AnimationPool's playing Animations come back with their motion, color, and progress
+    """
+    env = SmashEnv()
+    env.reset(seed=2)
+    pool = env.animations
+    pool.spawn(500, (10, 20, 30, 40), (1, 2, 3), fade=True, v_vel=pygame.Vector2(0.5, -1.0), is_ball=True)
+    data = gamesnapshot.snapshot(env.gw, env.gs, env.ps, env.contacts, pool)
+    pool.clear()
+
+    gamesnapshot.restore(data, env.gw, env.gs, env.ps, env.contacts, pool)
+    anim = pool.active[0]
+    assert (len(pool.active), anim.duration, tuple(anim.rect)) == (1, 500, (10, 20, 30, 40))
+    assert (tuple(anim.v_vel), tuple(anim.color)[:3], anim.fade, anim.is_ball) == ((0.5, -1.0), (1, 2, 3), True, True)
+    assert 0 <= anim.cur_ticks - anim.start_ticks < 500
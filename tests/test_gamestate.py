@@ -36,3 +36,23 @@ def test_gamestate_init():
     assert gs.v_gravity_acc == gs.v_gravity_unit * gs.gravity_acc_length
     assert gs.paddle_impulse_vel_length == PADDLE_IMPULSE
     assert gs.ball_speed_step == BALL_SPEED_STEP
+
+
+def test_shake_tables_scaled_once():
+    """
+    Test the shake offsets are scaled to integers once per strength and sequenced until they run out
+    """
+    import utils
+    gs = GameState()
+    utils.start_shake(gs, 40)
+    table_x = gs.shake_table_x
+    assert list(table_x) == [int(off * 40 / 4) for off in gs.shake_offsets_x]
+
+    offsets = [utils.get_shaking_offset(gs) for _ in range(len(gs.shake_offsets_x))]
+    assert offsets[0] == (50, 50)
+    assert all(isinstance(off_x, int) and isinstance(off_y, int) for off_x, off_y in offsets)
+    assert utils.get_shaking_offset(gs) == (0, 0)
+    assert gs.shake_screen_brick is False
+
+    utils.start_shake(gs, 40)
+    assert gs.shake_table_x is table_x
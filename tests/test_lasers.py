@@ -0,0 +1,162 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the LASER power-up's shots.
+"""
+import pygame
+import pytest
+
+import constants
+from brick import Brick
+from endless import EndlessField
+from gamestate import GameState
+from gameworld import GameWorld
+from lasers import LaserPool
+from leveltheme import LevelTheme
+from obstacle import Obstacle
+
+
+@pytest.fixture
+def game():
+    """
+    A CLASSIC game in play with just its Ball and Paddle, and a LaserPool
+    """
+    gw = GameWorld(LevelTheme.CLASSIC)
+    gw.world_objects = gw.world_objects[:2]
+    gs = GameState()
+    gs.cur_state = GameState.GameStateName.PLAYING
+    gs.tick_time = 10
+    return gw, gs, LaserPool()
+
+
+class Hits:
+    """ An on_hit that records the hits, destroying (and removing) each object after so many """
+
+    def __init__(self, gw: GameWorld, hits_to_destroy: int = 1) -> None:
+        self.gw = gw
+        self.hits_to_destroy = hits_to_destroy
+        self.hits = []
+
+    def __call__(self, wo) -> bool:
+        self.hits.append(wo)
+        if self.hits.count(wo) < self.hits_to_destroy:
+            return False
+        self.gw.world_objects.remove(wo)
+        return True
+
+
+def test_spawn_up_to_capacity():
+    """
+    Test the pool only holds so many shots, counting the ones it couldn't fire
+    """
+    lasers = LaserPool(capacity=3)
+    assert all(lasers.spawn(100, 100) for _ in range(3))
+    assert not lasers.spawn(100, 100)
+    assert len(lasers) == 3 and lasers.high_water == 3 and lasers.exhausted_count == 1
+    lasers.clear()
+    assert len(lasers) == 0
+
+
+def test_armed_paddle_fires_from_its_cannons(game):
+    """
+    Test the armed paddle fires a shot from each cannon every LASER_FIRE_INTERVAL_MS, only during play
+    """
+    gw, gs, lasers = game
+    paddle = gw.world_objects[1]
+    hits = Hits(gw)
+    lasers.update(gw, gs, hits)
+    assert len(lasers) == 0
+
+    paddle.laser = gs.paddle_laser = True
+    lasers.update(gw, gs, hits)
+    assert len(lasers) == 2
+    assert list(lasers.xs[:2]) == [paddle.rect.left + 7, paddle.rect.right - 7]
+
+    for _ in range((constants.LASER_FIRE_INTERVAL_MS // gs.tick_time) - 1):
+        lasers.update(gw, gs, hits)
+    assert len(lasers) == 2
+    lasers.update(gw, gs, hits)
+    assert len(lasers) == 4
+
+    gs.cur_state = GameState.GameStateName.PAUSED
+    ys = list(lasers.ys[:4])
+    lasers.update(gw, gs, hits)
+    assert len(lasers) == 4 and list(lasers.ys[:4]) == ys
+
+
+def test_shots_leave_the_window(game):
+    """
+    Test the shots rise at LASER_SPEED, and are spent once they're out the top of the window
+    """
+    gw, gs, lasers = game
+    lasers.spawn(100, 200)
+    lasers.spawn(300, 50)
+    lasers.update(gw, gs, Hits(gw))
+    assert list(lasers.ys[:2]) == [pytest.approx(200 - constants.LASER_SPEED * gs.tick_time),
+                                   pytest.approx(50 - constants.LASER_SPEED * gs.tick_time)]
+    for _ in range(10):
+        lasers.update(gw, gs, Hits(gw))
+    # (the spent shot's place was taken by the live one)
+    assert len(lasers) == 1 and lasers.xs[0] == 100
+
+
+def test_shot_hits_the_lowest_brick_over_it(game):
+    """
+    Test a shot hits the first Brick it reaches in its column (and not one beside its path), and only once it's
+    destroyed do the shots reach the one above it
+    """
+    gw, gs, lasers = game
+    low = Brick(pygame.Rect(100, 300, 100, 50), constants.RED)
+    high = Brick(pygame.Rect(100, 200, 100, 50), constants.RED)
+    beside = Brick(pygame.Rect(205, 300, 100, 50), constants.RED)
+    gw.world_objects.extend([high, low, beside])
+    hits = Hits(gw, hits_to_destroy=2)
+
+    lasers.spawn(150, 360)
+    lasers.spawn(150, 370)
+    lasers.spawn(203, 360)
+    for _ in range(50):
+        lasers.update(gw, gs, hits)
+    assert hits.hits == [low, low]
+    assert len(lasers) == 0
+
+    lasers.spawn(150, 360)
+    for _ in range(20):
+        lasers.update(gw, gs, hits)
+    assert hits.hits == [low, low, high]
+    assert gw.world_objects[2:] == [high, beside]
+
+
+def test_index_follows_the_world(game):
+    """
+    Test the column index is rebuilt when the world's objects change (e.g. a Brick destroyed by the ball), and
+    takes in Obstacles and the endless mode's rows
+    """
+    gw, gs, lasers = game
+    pygame.font.init()
+    brick = Brick(pygame.Rect(100, 200, 100, 50), constants.RED)
+    obstacle = Obstacle(pygame.Rect(400, 200, 100, 50), constants.WHITE)
+    gw.world_objects.extend([brick, obstacle])
+    hits = Hits(gw, hits_to_destroy=99)
+
+    lasers.spawn(150, 300)
+    lasers.update(gw, gs, hits)
+    assert brick in lasers.columns[150 // constants.LASER_COLUMN_WIDTH]
+    assert obstacle in lasers.columns[450 // constants.LASER_COLUMN_WIDTH]
+
+    gw.world_objects.remove(brick)
+    for _ in range(40):
+        lasers.update(gw, gs, hits)
+    assert hits.hits == [] and len(lasers) == 0
+
+    field = EndlessField(gw, LevelTheme.CLASSIC, seed=495)
+    target = next(wo for wo in field.rows[-1] if isinstance(wo, Brick))
+    lasers.spawn(target.rect.centerx, constants.HEIGHT - 100)
+    for _ in range(60):
+        lasers.update(gw, gs, lambda wo: hits.hits.append(wo) or False)
+    assert hits.hits == [target]
@@ -167,3 +167,37 @@ def test_store():
     with mock.patch.object(persistence, "store_object") as mock_store:
         lb.store("xyz")
         mock_store.assert_called_with(lb, "xyz")
+
+
+def test_sorted_scores_follow_version(leaderboard_partial):
+    """
+    Test the highest-first view is only re-sorted when the version changes, and add_score() bumps it
+    """
+    scores = leaderboard_partial.get_sorted_scores()
+    assert [scr.score for scr in scores] == [500, 300, 100, 50]
+    assert leaderboard_partial.get_sorted_scores() is scores
+
+    ps = PlayerState()
+    ps.score = 400
+    ui = mock.Mock()
+    ui.tb_initials_text = "abc"
+    version = leaderboard_partial.version
+    leaderboard_partial.add_score(ps, ui)
+    assert leaderboard_partial.version == version + 1
+    assert [scr.score for scr in leaderboard_partial.get_sorted_scores()] == [500, 400, 300, 100, 50]
+
+
+def test_pickle_keeps_only_scores(leaderboard_partial):
+    """
+    Test the sorted view isn't pickled, and older pickles without a version still load
+    """
+    import pickle
+    leaderboard_partial.get_sorted_scores()
+    restored = pickle.loads(pickle.dumps(leaderboard_partial))
+    assert restored.l_top_scores == leaderboard_partial.l_top_scores
+    assert restored.sorted_scores == []
+
+    old = Leaderboard.__new__(Leaderboard)
+    old.__setstate__({'l_top_scores': leaderboard_partial.l_top_scores})
+    assert old.version == 0
+    assert old.get_sorted_scores()[0].score == 500
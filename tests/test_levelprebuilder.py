@@ -0,0 +1,137 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the LevelPrebuilder class.
+"""
+from unittest.mock import patch
+
+import pygame
+import pytest
+
+import deferredsurfaces
+from brick import Brick
+from levelprebuilder import LevelPrebuilder
+from levels import Levels
+
+
+@pytest.fixture
+def prebuilder():
+    """
+    Create a LevelPrebuilder with pygame initialized (for the Fonts)
+    :return:
+    """
+    pygame.init()
+    yield LevelPrebuilder()
+    pygame.quit()
+
+
+def test_deferring_skips_surface_work():
+    """
+    Test that a Brick built while deferring has no font/image until realized
+    :return:
+    """
+    pygame.init()
+    image = pygame.Surface((20, 10))
+    with deferredsurfaces.deferring():
+        brk = Brick(pygame.Rect(0, 0, 100, 50), (255, 0, 0), bonus=10,
+                    image=deferredsurfaces.scale(image, (100, 50)))
+
+    assert not deferredsurfaces.is_deferring()
+    assert brk.font_strength is None
+    assert isinstance(brk.image, deferredsurfaces.PendingImage)
+
+    brk.realize_surfaces()
+    assert brk.font_strength is not None
+    assert brk.image.get_size() == (100, 50)
+    pygame.quit()
+
+
+def test_prebuild_and_take(prebuilder):
+    """
+    Test that the pre-built level is fully realized and handed over
+    :param prebuilder:
+    :return:
+    """
+    prebuilder.start(Levels.LevelName.CLASSIC_MIXED_1)
+    prebuilder.thread.join()
+    prebuilder.step(1)
+    assert prebuilder.realized_count == 1
+    assert not prebuilder.is_ready()
+
+    level_objects = prebuilder.take(Levels.LevelName.CLASSIC_MIXED_1)
+    assert len(level_objects) > 0
+    assert all(wo.font_strength is not None for wo in level_objects if isinstance(wo, Brick) and wo.bonus > 0)
+    assert prebuilder.level_name is None
+
+
+def test_take_different_level(prebuilder):
+    """
+    Test that asking for a level other than the one pre-built returns None (so it's built normally)
+    :param prebuilder:
+    :return:
+    """
+    prebuilder.start(Levels.LevelName.CLASSIC_SOLID_ROWS_1)
+    assert prebuilder.take(Levels.LevelName.CLASSIC_MIXED_2) is None
+    assert prebuilder.level_name is None
+
+
+def test_start_same_level_ignored(prebuilder):
+    """
+    Test that restarting the same level doesn't spawn another build
+    :param prebuilder:
+    :return:
+    """
+    with patch("levelprebuilder.threading.Thread") as mock_thread:
+        prebuilder.start(Levels.LevelName.CLASSIC_SOLID_ROWS_1)
+        prebuilder.start(Levels.LevelName.CLASSIC_SOLID_ROWS_1)
+        mock_thread.assert_called_once()
+
+
+def test_take_failed_build(prebuilder, caplog):
+    """
+    Test that a pre-build that raised returns None (so it's built normally), logging the error
+    :param prebuilder:
+    :return:
+    """
+    with patch("levelprebuilder.Levels.build_level", side_effect=ValueError):
+        prebuilder.start(Levels.LevelName.CLASSIC_MIXED_1)
+        prebuilder.thread.join()
+    assert prebuilder.failed
+    assert "CLASSIC_MIXED_1" in caplog.text
+    assert prebuilder.take(Levels.LevelName.CLASSIC_MIXED_1) is None
+    assert not prebuilder.failed
+
+
+def test_prebuild_without_threads(prebuilder):
+    """
+    Test that without threads, the level is built by the first step() after start() (and realized by the next ones)
+    :param prebuilder:
+    :return:
+    """
+    prebuilder.threaded = False
+    with patch("levelprebuilder.threading.Thread") as mock_thread:
+        prebuilder.start(Levels.LevelName.CLASSIC_MIXED_1)
+        assert prebuilder.staged_objects == [] and not prebuilder.is_ready()
+        prebuilder.step(1)
+        assert len(prebuilder.staged_objects) > 0 and prebuilder.realized_count == 0
+        prebuilder.step(1)
+        assert prebuilder.realized_count == 1
+        mock_thread.assert_not_called()
+    assert len(prebuilder.take(Levels.LevelName.CLASSIC_MIXED_1)) > 0
+
+
+def test_prebuild_when_a_thread_cant_start(prebuilder):
+    """
+    Test that if a thread can't be started, the level is still built (by take(), if no step() came first)
+    :param prebuilder:
+    :return:
+    """
+    with patch("levelprebuilder.threading.Thread.start", side_effect=RuntimeError):
+        prebuilder.start(Levels.LevelName.CLASSIC_MIXED_1)
+    assert not prebuilder.threaded and prebuilder.thread is None
+    assert len(prebuilder.take(Levels.LevelName.CLASSIC_MIXED_1)) > 0
@@ -1,8 +1,11 @@
+import asyncio
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 import main
 
 
+@patch("main.autosave")
 @patch("main.pygame.init")
 @patch("main.assets.load_assets")
 @patch("main.UserInterface")
@@ -15,7 +18,7 @@ import main
 def test_main(mock_gameengine, mock_leaderboard, mock_playerstate,
               mock_gameworld, mock_gamestate, mock_gamesettings,
               mock_userinterface, mock_load_assets, mock_pygame_init,
-              ):
+              mock_autosave):
     """
     Tests that all dependent objects are instantiated.
     Test that assets are loaded
@@ -29,6 +32,7 @@ def test_main(mock_gameengine, mock_leaderboard, mock_playerstate,
     :param mock_userinterface:
     :param mock_load_assets:
     :param mock_pygame_init:
+    :param mock_autosave:
     :return:
     """
     mock_gameengine_instance = MagicMock()
@@ -61,5 +65,69 @@ def test_main(mock_gameengine, mock_leaderboard, mock_playerstate,
         mock_userinterface.return_value,
     )
 
+    # Assert autosave is on, offering any saved run to resume
+    mock_autosave.enable.assert_called_once()
+    mock_gameengine_instance.offer_resume.assert_called_once_with(mock_autosave.load.return_value)
+
     # Assert ge.run_loop() is called
     mock_gameengine_instance.run_loop.assert_called_once()
+
+
+@patch("main.pygame.init")
+@patch("main.assets.load_assets_async", new_callable=AsyncMock)
+@patch("main.UserInterface")
+@patch("main.GameSettings.create_persisted_object_async", new_callable=AsyncMock)
+@patch("main.GameState")
+@patch("main.GameWorld")
+@patch("main.PlayerState")
+@patch("main.Leaderboard.create_persisted_object_async", new_callable=AsyncMock)
+@patch("main.GameEngine")
+def test_main_async(mock_gameengine, mock_leaderboard, mock_playerstate,
+                    mock_gameworld, mock_gamestate, mock_gamesettings,
+                    mock_userinterface, mock_load_assets, mock_pygame_init,
+                    ):
+    """
+    Tests that main_async awaits the asset/persisted object loading and the async game loop
+    :return:
+    """
+    mock_gameengine_instance = MagicMock()
+    mock_gameengine_instance.run_loop_async = AsyncMock()
+    mock_gameengine.return_value = mock_gameengine_instance
+
+    asyncio.run(main.main_async())
+
+    mock_pygame_init.assert_called_once()
+    mock_load_assets.assert_awaited_once()
+    mock_gamesettings.assert_awaited_once()
+    mock_leaderboard.assert_awaited_once()
+    mock_gameengine.assert_called_once_with(
+        mock_leaderboard.return_value,
+        mock_playerstate.return_value,
+        mock_gameworld.return_value,
+        mock_gamestate.return_value,
+        mock_gamesettings.return_value,
+        mock_userinterface.return_value,
+    )
+    mock_gameengine_instance.run_loop_async.assert_awaited_once()
+    mock_gameengine_instance.run_loop.assert_not_called()
+
+
+@patch("main.pygame.init")
+@patch("main.GameEngine")
+def test_main_bad_link_args(mock_gameengine, mock_pygame_init, capsys):
+    """
+    Test missing or bad --link arguments print the usage instead of starting the game, and good ones start the
+    networked match
+    :param mock_gameengine:
+    :param mock_pygame_init:
+    :param capsys:
+    :return:
+    """
+    for argv in (["main.py", "--link"], ["main.py", "--link", "one", "host"], ["main.py", "--link", "3", "host"]):
+        with patch("main.sys.argv", argv):
+            main.main()
+        assert capsys.readouterr().out.strip() == main.LINK_USAGE
+    mock_pygame_init.assert_not_called()
+    mock_gameengine.assert_not_called()
+
+    assert main.get_link_args(["main.py", "--link", "2", "host"]) == (2, "host")
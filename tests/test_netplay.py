@@ -0,0 +1,227 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the networked versus play.
+"""
+import random
+import time
+
+import pygame
+import pytest
+
+import constants
+import netplay
+from gamestate import GameState
+from leveltheme import LevelTheme
+from netplay import LoopbackLink, NetSession, UdpTransport, HEADER, INPUT
+
+FRAME_MS = 16
+
+
+def play(link: LoopbackLink, sessions: tuple, frames: int) -> None:
+    """
+    Run both sessions frame by frame over the link, each player chasing their ball (wiggling, so the inputs change
+    all the time) and launching when ready
+    """
+    for frame in range(frames):
+        for session in sessions:
+            if session.match is not None:
+                side = session.match.sides[session.player - 1]
+                session.local_x = int(side.ball.rect.centerx) + ((frame % 7) * 3)
+                if side.gs.cur_state == GameState.GameStateName.READY_TO_LAUNCH:
+                    session.launch_pressed = True
+            session.update(FRAME_MS)
+        link.advance(FRAME_MS)
+
+
+def settle(link: LoopbackLink, sessions: tuple) -> None:
+    """
+    Stop adding time and let the in-flight inputs land (re-sending the lost ones), so both sessions confirm every
+    step they've run
+    """
+    for _ in range(100):
+        for session in sessions:
+            session.update(0)
+        link.advance(FRAME_MS)
+
+
+def assert_same_checksums(sessions: tuple) -> None:
+    """
+    Both sessions' gameplay checksums agree at every sync step they've both run
+    """
+    first, second = sessions
+    common = set(first.checksums) & set(second.checksums)
+    assert len(common) >= 5
+    assert all(first.checksums[tick] == second.checksums[tick] for tick in common)
+
+
+def make_sessions(link: LoopbackLink, max_rollback: int = constants.NET_MAX_ROLLBACK_TICKS) -> tuple:
+    """
+    Player 1 with a fixed seed, and player 2 learning it over the link
+    """
+    first = NetSession(1, link.ends[0], seed=1234, level_theme=LevelTheme.CLASSIC, max_rollback=max_rollback)
+    second = NetSession(2, link.ends[1], level_theme=LevelTheme.CLASSIC, max_rollback=max_rollback)
+    return first, second
+
+
+def test_loopback_link_delays_reorders_and_drops():
+    """
+    Test packets arrive only after the latency, the jitter can reorder them, and the loss drops about its share
+    """
+    link = LoopbackLink(latency_ms=50, jitter_ms=40, loss=0.25, seed=7)
+    near, far = link.ends
+    for i in range(400):
+        near.send(bytes([i % 256]))
+    assert far.receive() == [] and near.receive() == []
+    link.advance(49)
+    assert far.receive() == []
+    link.advance(100)
+    arrived = far.receive()
+    assert len(arrived) + link.dropped == 400
+    assert 60 < link.dropped < 140
+    assert arrived != sorted(arrived)
+
+
+def test_sessions_stay_in_sync_over_a_bad_link():
+    """
+    Test both cabinets' matches stay identical - through latency, jitter, and loss, with rollbacks - and player 2
+    learns the seed from player 1
+    """
+    link = LoopbackLink(latency_ms=40, jitter_ms=20, loss=0.1, seed=3)
+    sessions = make_sessions(link)
+    first, second = sessions
+    assert second.match is None
+
+    # the game code's global random state isn't disturbed by the matches
+    random.seed(99)
+    expected = random.random()
+    random.seed(99)
+    play(link, sessions, 300)
+    assert random.random() == expected
+
+    assert second.seed == first.seed
+    settle(link, sessions)
+    assert min(first.match.steps, second.match.steps) > 1000
+    assert_same_checksums(sessions)
+    for session in sessions:
+        stats = session.get_stats()
+        assert stats['rollbacks'] > 0 and stats['resimulated_ticks'] > 0
+        assert stats['syncs_checked'] > 0 and stats['desyncs'] == 0
+        assert stats['bytes_sent'] > 0 and stats['packets_received'] > 0
+        # only the steps past the peer's last input (the session that's ahead) are still predicted
+        assert all(tick >= session.remote_next for tick in session.predicted)
+
+
+def test_lockstep_never_predicts():
+    """
+    Test a max_rollback of 0 is pure lockstep - it stalls for the peer's input instead of predicting it, and still
+    stays in sync
+    """
+    link = LoopbackLink(latency_ms=40, jitter_ms=20, loss=0.1, seed=3)
+    sessions = make_sessions(link, max_rollback=0)
+    play(link, sessions, 150)
+    settle(link, sessions)
+    assert_same_checksums(sessions)
+    for session in sessions:
+        stats = session.get_stats()
+        assert stats['stalls'] > 0
+        assert (stats['rollbacks'], stats['resimulated_ticks'], stats['desyncs']) == (0, 0, 0)
+
+
+def test_desync_is_detected():
+    """
+    Test the swapped checksums catch matches that have drifted apart
+    """
+    link = LoopbackLink(seed=1)
+    sessions = make_sessions(link)
+    play(link, sessions, 10)
+    sessions[1].match.sides[0].ps.score += 10
+    play(link, sessions, 20)
+    assert sessions[0].desyncs > 0 and sessions[1].desyncs > 0
+
+
+def test_packets_resend_unacked_inputs():
+    """
+    Test a packet carries every local input the peer hasn't acknowledged, and the peer ignores duplicates and
+    other players' packets
+    """
+    link = LoopbackLink(seed=1)
+    first, second = make_sessions(link)
+    first.local_x = 123
+    first.update(constants.VERSUS_STEP_MS * 3)
+    packet = link.ends[1].receive()[-1]
+    fields = HEADER.unpack_from(packet, 0)
+    assert fields[:4] == (netplay.MAGIC, netplay.VERSION, 1, 1234)
+    first_tick, count = fields[-2:]
+    # (the first NET_INPUT_DELAY_TICKS steps are neutral on both sides, never sent)
+    assert (first_tick, count) == (constants.NET_INPUT_DELAY_TICKS, 3)
+    assert len(packet) == HEADER.size + (count * INPUT.size)
+    assert INPUT.unpack_from(packet, HEADER.size + ((count - 1) * INPUT.size)) == (123, 0)
+
+    second.transport = type('Replay', (), {'receive': lambda self: [packet, packet, b'junk'],
+                                           'send': lambda self, data: None})()
+    second.receive()
+    assert second.remote_next == first_tick + count
+    assert second.packets_received == 3
+    # player 1 doesn't take a "player 1" packet as its peer's
+    first.transport = second.transport
+    first.receive()
+    assert first.remote_next == constants.NET_INPUT_DELAY_TICKS
+
+
+def test_run_frame_input_and_leaving():
+    """
+    Test the local mouse steers the local player's own side, and ESC closes the link and leaves
+    """
+    link = LoopbackLink(seed=1)
+    first, second = make_sessions(link)
+    screen = pygame.Surface((constants.WIDTH, constants.HEIGHT))
+    second.run_frame([], screen, FRAME_MS)
+    assert second.match is None
+    first.update(FRAME_MS)
+    link.advance(FRAME_MS)
+
+    right_view_x = constants.WIDTH - netplay.versus.VIEW_WIDTH
+    mouse_pos = (right_view_x + (netplay.versus.VIEW_WIDTH // 4), 300)
+    second.run_frame([pygame.event.Event(pygame.MOUSEMOTION, pos=mouse_pos)], screen, FRAME_MS)
+    assert second.match is not None and second.local_x == constants.WIDTH // 4
+
+    second.run_frame([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)], screen, FRAME_MS)
+    assert second.done
+
+
+def test_player_must_be_1_or_2():
+    """
+    Test a session can only be player 1 or 2
+    """
+    link = LoopbackLink(latency_ms=0, jitter_ms=0, loss=0)
+    with pytest.raises(ValueError):
+        NetSession(3, link.ends[0])
+
+
+def test_udp_transport_round_trip():
+    """
+    Test the UDP transport carries packets between two local sockets without blocking
+    """
+    near = UdpTransport('127.0.0.1', local_port=0)
+    far = UdpTransport('127.0.0.1', local_port=0)
+    try:
+        near.remote_addr = ('127.0.0.1', far.sock.getsockname()[1])
+        assert far.receive() == []
+        near.send(b'hello')
+        near.send(b'again')
+        received = []
+        for _ in range(100):
+            received += far.receive()
+            if len(received) == 2:
+                break
+            time.sleep(0.01)
+        assert received == [b'hello', b'again']
+    finally:
+        near.close()
+        far.close()
@@ -0,0 +1,112 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the PaddleInput stage.
+"""
+from collections import defaultdict
+from unittest import mock
+
+import pygame
+import pytest
+
+from gamesettings import GameSettings
+from gamestate import GameState
+from paddleinput import PaddleInput
+
+MS = 1_000_000  # ns
+
+
+@pytest.fixture
+def states():
+    """
+    A GameState and GameSettings with the paddle under automatic (mouse or keys) control
+    """
+    gs = GameState()
+    gset = GameSettings()
+    gset.paddle_under_auto_control = True
+    return gs, gset
+
+
+def sample(paddle_input, states, mouse_x, now_ns, events=(), pressed=None):
+    """
+    Run one frame's sample() with the mouse at mouse_x and the given keys held
+    """
+    gs, gset = states
+    with mock.patch("pygame.mouse.get_pos", return_value=(mouse_x, 0)), \
+            mock.patch("pygame.key.get_pressed", return_value=pressed or defaultdict(bool)):
+        return paddle_input.sample(list(events), gs, gset, now_ns)
+
+
+def test_passthrough_by_default(states):
+    """
+    Test that with no smoothing or prediction the mouse x comes straight through
+    """
+    paddle_input = PaddleInput(0.0, 0.0)
+    assert sample(paddle_input, states, 100, 10 * MS) == 100
+    assert sample(paddle_input, states, 137, 14 * MS, [pygame.event.Event(pygame.MOUSEMOTION)]) == 137
+
+
+def test_key_tap_applies_this_frame(states):
+    """
+    Test that an arrow key pressed (even if released again) before the poll sets this frame's key flag
+    """
+    gs, _ = states
+    paddle_input = PaddleInput()
+    sample(paddle_input, states, 100, 10 * MS, [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT)])
+    assert gs.paddle_under_key_control_right
+    assert not gs.paddle_under_key_control_left
+
+    held = defaultdict(bool)
+    held[pygame.K_LEFT] = True
+    sample(paddle_input, states, 100, 14 * MS, pressed=held)
+    assert gs.paddle_under_key_control_left
+
+
+def test_prediction_and_smoothing(states):
+    """
+    Test prediction extrapolates along the mouse velocity and smoothing lags behind the mouse
+    """
+    predicting = PaddleInput(0.0, 8.0)
+    sample(predicting, states, 100, 10 * MS)
+    sample(predicting, states, 104, 14 * MS)  # input midway at 12 ms: 4 px in 2 ms
+    # 2 px/ms, 8 ms ahead
+    assert sample(predicting, states, 112, 18 * MS) == 112 + 16
+    # the mouse stopped, so no more extrapolation
+    assert sample(predicting, states, 112, 22 * MS) == 112
+
+    smoothing = PaddleInput(0.5, 0.0)
+    sample(smoothing, states, 100, 10 * MS)
+    assert sample(smoothing, states, 200, 14 * MS) == 150
+    assert sample(smoothing, states, 200, 18 * MS) == 175
+
+
+def test_latency_recorded_on_present(states):
+    """
+    Test the input-to-photon latency runs from the estimated input time to the flip, once per input
+    """
+    paddle_input = PaddleInput()
+    sample(paddle_input, states, 100, 10 * MS)
+    paddle_input.record_present(11 * MS)
+    sample(paddle_input, states, 120, 14 * MS)  # moved sometime in 10..14 ms, called 12 ms
+    paddle_input.record_present(17 * MS)
+    paddle_input.record_present(21 * MS)  # nothing new shown
+
+    assert paddle_input.get_latency_ms() == (5.0, 5.0)
+
+
+def test_latency_after_a_pause(states):
+    """
+    Test the first poll after a pause (more than a frame since the last) doesn't spread the input over the pause
+    """
+    paddle_input = PaddleInput()
+    sample(paddle_input, states, 100, 10 * MS)
+    paddle_input.record_present(11 * MS)
+    sample(paddle_input, states, 120, 5000 * MS)
+    paddle_input.record_present(5003 * MS)
+
+    assert paddle_input.get_latency_ms() == (3.0, 3.0)
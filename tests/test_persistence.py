@@ -1,3 +1,4 @@
+import asyncio
 import pickle
 import os
 import persistence
@@ -68,4 +69,13 @@ def test_read_object_success():
 def test_read_object_file_not_found(mock_os_path_getsize):
     filename = "nonexistent.pkl"
     result = persistence.read_object(filename)
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+
+def test_store_and_read_object_async(tmp_path, monkeypatch):
+    test_object = {"key": "value"}
+    monkeypatch.setattr(persistence, "GAME_DATA_PATH", str(tmp_path))
+
+    asyncio.run(persistence.store_object_async(test_object, "test_async.pkl"))
+
+    assert asyncio.run(persistence.read_object_async("test_async.pkl")) == test_object
@@ -0,0 +1,71 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the offscreen PixelRenderer and the shared memory FrameRing.
+"""
+import pickle
+
+import pytest
+
+from constants import WIDTH, HEIGHT
+from framering import FrameRing
+from gameworld import GameWorld
+from leveltheme import LevelTheme
+from paddle import Paddle
+from pixelrenderer import PixelRenderer
+
+
+def test_grayscale_frame_is_a_live_zero_copy_view():
+    """
+    Test the 84x84 grayscale frame is a byte per pixel, row major, and the same view shows each new render
+    """
+    gw = GameWorld(LevelTheme.CLASSIC)
+    paddle = next(wo for wo in gw.world_objects if isinstance(wo, Paddle))
+    renderer = PixelRenderer((84, 84))
+
+    view = renderer.render(gw)
+    assert len(view) == renderer.frame_size == 84 * 84
+    # the paddle (bottom center) is lit, the screen corners are black
+    row, col = paddle.rect.centery * 84 // HEIGHT, paddle.rect.centerx * 84 // WIDTH
+    assert view[row * 84 + col] > 0
+    assert view[83 * 84] == 0
+
+    paddle.move_to_x(0)
+    assert renderer.render(gw) is view
+    assert view[row * 84 + col] == 0
+
+
+def test_full_size_color_frame():
+    """
+    Test a full size, non-grayscale frame is the 32-bit pixels
+    """
+    renderer = PixelRenderer((WIDTH, HEIGHT), grayscale=False)
+    assert len(renderer.render(GameWorld(LevelTheme.CLASSIC))) == WIDTH * HEIGHT * 4
+
+
+def test_frame_ring_keeps_the_latest_slots_frames():
+    """
+    Test the ring numbers the published frames, keeps only the latest slots, and attaches by name when unpickled
+    """
+    ring = FrameRing(3, slots=4)
+    try:
+        for i in range(6):
+            assert ring.publish(bytes([i, i, i])) == i
+        assert ring.get_count() == 6
+        assert bytes(ring.get_frame()) == bytes([5, 5, 5])
+        assert bytes(ring.get_frame(2)) == bytes([2, 2, 2])
+        with pytest.raises(IndexError):
+            ring.get_frame(1)
+
+        attached = pickle.loads(pickle.dumps(ring))
+        attached.publish(b'abc')
+        assert bytes(ring.get_frame(6)) == b'abc'
+        attached.close()
+    finally:
+        ring.close()
+        ring.unlink()
@@ -0,0 +1,253 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the power-ups.
+"""
+from unittest import mock
+
+import pygame
+import pytest
+
+import constants
+import gameevents
+from animationpool import AnimationPool
+from brick import Brick
+from endless import EndlessField
+from gameevents import GameEventType
+from gamestate import GameState
+from gameworld import GameWorld
+from leaderboard import Leaderboard
+from leveltheme import LevelTheme
+from playerstate import PlayerState
+from powerups import PowerUps, EffectScheduler
+from poweruptype import PowerUpType
+
+
+@pytest.fixture
+def game():
+    """
+    A CLASSIC game (no images needed) in play, with its power-ups
+    """
+    gw = GameWorld(LevelTheme.CLASSIC)
+    gs = GameState()
+    gs.cur_state = GameState.GameStateName.PLAYING
+    gs.tick_time = 10
+    gameevents.clear()
+    return gw, gs, PlayerState(), PowerUps(set())
+
+
+def catch(power_ups: PowerUps, gw: GameWorld, gs: GameState, power_up: PowerUpType) -> None:
+    """
+    Release a power-up from a Brick right above the paddle, and let it fall until it's caught
+    """
+    paddle = gw.world_objects[1]
+    brick = Brick(pygame.Rect(paddle.rect.centerx - 50, paddle.rect.y - 100, 100, 50), constants.RED,
+                  power_up=power_up)
+    power_ups.release(brick, AnimationPool(), PlayerState())
+    while power_ups.capsules:
+        power_ups.update(gw, gs)
+
+
+def test_scheduler_ends_effects_in_order():
+    """
+    Test the effects end soonest first, and a kind running more than once only ends with its last
+    """
+    scheduler = EffectScheduler()
+    assert scheduler.schedule(PowerUpType.LASER, 300)
+    assert scheduler.schedule(PowerUpType.WIDE_PADDLE, 100)
+    assert not scheduler.schedule(PowerUpType.WIDE_PADDLE, 200)
+    assert len(scheduler) == 3
+    assert scheduler.expire(99) == []
+    assert scheduler.expire(150) == []
+    assert scheduler.is_active(PowerUpType.WIDE_PADDLE)
+    assert scheduler.expire(200) == [PowerUpType.WIDE_PADDLE]
+    assert scheduler.get_active() == [PowerUpType.LASER]
+    assert scheduler.expire(10000) == [PowerUpType.LASER]
+    assert len(scheduler) == 0
+
+
+def test_release_drops_capsules_and_extra_life_is_instant(game):
+    """
+    Test a timed power-up drops a capsule (unless only the instant ones are played), and EXTRA_LIFE takes effect
+    right away
+    """
+    gw, gs, ps, power_ups = game
+    rect = pygame.Rect(100, 100, 100, 50)
+    lives = ps.lives
+    power_ups.release(Brick(rect, constants.RED, power_up=PowerUpType.EXTRA_LIFE), AnimationPool(), ps)
+    assert ps.lives == lives + 1 and power_ups.capsules == []
+    assert [event.event_type for event in gameevents.drain()] == [GameEventType.POWER_UP]
+
+    power_ups.release(Brick(rect, constants.RED), AnimationPool(), ps)
+    power_ups.release(Brick(rect, constants.RED, power_up=PowerUpType.LASER), AnimationPool(), ps)
+    assert [capsule.power_up for capsule in power_ups.capsules] == [PowerUpType.LASER]
+    assert power_ups.capsules[0].rect.center == rect.center
+
+    instant_only = PowerUps(set(), timed=False)
+    instant_only.release(Brick(rect, constants.RED, power_up=PowerUpType.LASER), AnimationPool(), ps)
+    assert instant_only.capsules == []
+
+
+def test_missed_capsule_falls_away(game):
+    """
+    Test a capsule the paddle misses is gone once it's below the window, and nothing falls or runs out while the
+    game isn't in play
+    """
+    gw, gs, ps, power_ups = game
+    paddle = gw.world_objects[1]
+    far_x = 100 if paddle.rect.centerx > constants.WIDTH // 2 else constants.WIDTH - 100
+    power_ups.release(Brick(pygame.Rect(far_x, 500, 100, 50), constants.RED, power_up=PowerUpType.LASER),
+                      AnimationPool(), ps)
+    gs.cur_state = GameState.GameStateName.PAUSED
+    power_ups.update(gw, gs)
+    assert power_ups.capsules[0].rect.y == 500 + 15 and power_ups.now_ms == 0
+
+    gs.cur_state = GameState.GameStateName.PLAYING
+    while power_ups.capsules:
+        power_ups.update(gw, gs)
+    assert not power_ups.is_active() and not paddle.laser
+
+
+def test_wide_paddle_and_laser(game):
+    """
+    Test a caught WIDE_PADDLE widens the paddle (and the ball's room on it) until it runs out, and a LASER arms it
+    """
+    gw, gs, ps, power_ups = game
+    paddle = gw.world_objects[1]
+    center = paddle.rect.centerx
+    catch(power_ups, gw, gs, PowerUpType.WIDE_PADDLE)
+    catch(power_ups, gw, gs, PowerUpType.LASER)
+    assert paddle.rect.width == int(constants.PAD_WIDTH * constants.POWER_UP_WIDE_PADDLE_SCALE)
+    assert paddle.rect.centerx == center and gs.paddle_width == paddle.rect.width
+    assert paddle.laser and gs.paddle_laser
+
+    # the ball is kept on the wider paddle at the screen's edge
+    ball = gw.world_objects[0]
+    ball.move_to_x(0, gs.paddle_width)
+    assert ball.rect.left == (gs.paddle_width // 2) - ball.radius
+
+    for _ in range(constants.POWER_UP_DURATION_MS // gs.tick_time):
+        power_ups.update(gw, gs)
+    assert paddle.rect.width == constants.PAD_WIDTH and not (paddle.laser or gs.paddle_laser)
+    assert not power_ups.is_active()
+
+
+def test_slow_ball(game):
+    """
+    Test a SLOW_BALL slows the ball in every motion model's terms, then puts its speed back
+    """
+    gw, gs, ps, power_ups = game
+    ball = gw.world_objects[0]
+    speed, speed_v = ball.speed, ball.speed_v
+    catch(power_ups, gw, gs, PowerUpType.SLOW_BALL)
+    assert ball.speed == pytest.approx(speed * constants.POWER_UP_SLOW_BALL_SCALE)
+    assert ball.speed_v == pytest.approx(speed_v * constants.POWER_UP_SLOW_BALL_SCALE)
+    assert ball.v_vel.length() == pytest.approx(ball.speed_v)
+    power_ups.clear(gw, gs)
+    assert (ball.speed, ball.speed_v) == (pytest.approx(speed), pytest.approx(speed_v))
+
+
+def test_slow_ball_through_an_endless_level_up(game):
+    """
+    Test an endless level-up while a SLOW_BALL runs keeps the ball slowed, and the level's speed is what comes back
+    """
+    gw, gs, ps, power_ups = game
+    field = EndlessField(gw, LevelTheme.CLASSIC, seed=495)
+    lb = mock.MagicMock(Leaderboard)
+    ball = gw.world_objects[0]
+    catch(power_ups, gw, gs, PowerUpType.SLOW_BALL)
+    for _ in range(constants.ENDLESS_ROWS_PER_LEVEL):
+        field.update(field.next_row_ms, gs, ps, lb)
+    assert ps.level == 2
+    level_speed_v = constants.BALL_SPEED_VECTOR + (2 * constants.BALL_SPEED_LEVEL_INCREMENT)
+    assert ball.speed_v == pytest.approx(level_speed_v * constants.POWER_UP_SLOW_BALL_SCALE)
+
+    power_ups.clear(gw, gs)
+    assert ball.speed_v == pytest.approx(level_speed_v) and gs.ball_speed_scale == 1.0
+
+
+def test_multi_ball(game):
+    """
+    Test a MULTI_BALL splits off extra balls, which are just lost below the window (no life) and all go when it
+    runs out
+    """
+    gw, gs, ps, power_ups = game
+    ball = gw.world_objects[0]
+    catch(power_ups, gw, gs, PowerUpType.MULTI_BALL)
+    extras = gw.world_objects[-constants.POWER_UP_MULTI_BALL_COUNT:]
+    assert power_ups.extra_balls == extras and all(extra.extra for extra in extras)
+    assert all(extra.v_vel_unit != ball.v_vel_unit for extra in extras)
+    assert gw.world_objects[:2] == [ball, gw.world_objects[1]]
+
+    power_ups.contacts.add((extras[0], gw.world_objects[1]))
+    extras[0].rect.y = extras[0].y = extras[0].v_pos.y = constants.HEIGHT + 10
+    extras[0].update_wo(gs, ps, None, None)
+    power_ups.update(gw, gs)
+    assert extras[0] not in gw.world_objects and power_ups.contacts == set()
+    assert ps.lives == constants.START_LIVES
+
+    power_ups.clear(gw, gs)
+    assert extras[1] not in gw.world_objects and len(gw.world_objects) == len(gw.level_objects) + 2
+
+
+def drop_below_window(ball) -> None:
+    """
+    Put a ball below the window
+    """
+    ball.rect.y = ball.y = ball.v_pos.y = constants.HEIGHT + 100
+
+
+def test_extra_ball_takes_over_from_a_lost_ball(game):
+    """
+    Test losing the Ball while extra balls are in play hands over to one of them (no life lost), and only losing
+    the last ball costs a life
+    """
+    gw, gs, ps, power_ups = game
+    ball = gw.world_objects[0]
+    catch(power_ups, gw, gs, PowerUpType.MULTI_BALL)
+    extras = list(power_ups.extra_balls)
+    assert gs.extra_balls_in_play == len(extras)
+
+    power_ups.contacts.add((ball, gw.world_objects[1]))
+    drop_below_window(ball)
+    ball.update_wo(gs, ps, None, None)
+    power_ups.update(gw, gs)
+    assert ps.lives == constants.START_LIVES and gs.cur_state == GameState.GameStateName.PLAYING
+    assert gw.world_objects[0] is extras[0] and not extras[0].extra
+    assert ball not in gw.world_objects and power_ups.contacts == set()
+    assert power_ups.extra_balls == extras[1:] and gs.extra_balls_in_play == len(extras) - 1
+
+    # the rest go in the same frame as the new Ball, so it's lost as usual
+    for extra in extras:
+        drop_below_window(extra)
+        extra.update_wo(gs, ps, None, None)
+    power_ups.update(gw, gs)
+    assert gs.extra_balls_in_play == 0 and ps.lives == constants.START_LIVES
+    gw.world_objects[0].update_wo(gs, ps, None, None)
+    assert ps.lives == constants.START_LIVES - 1
+    assert gs.cur_state == GameState.GameStateName.READY_TO_LAUNCH
+
+
+def test_sticky_paddle_holds_the_ball(game):
+    """
+    Test a STICKY_PADDLE holds a ball that hits it, until it's launched or the hold runs out
+    """
+    gw, gs, ps, power_ups = game
+    ball = gw.world_objects[0]
+    power_ups.on_paddle_hit(ball)
+    assert not ball.freeze_ball
+    catch(power_ups, gw, gs, PowerUpType.STICKY_PADDLE)
+    power_ups.on_paddle_hit(ball)
+    assert ball.freeze_ball
+    power_ups.launch_caught_balls()
+    assert not ball.freeze_ball
+
+    power_ups.on_paddle_hit(ball)
+    for _ in range(constants.POWER_UP_STICKY_HOLD_MS // gs.tick_time):
+        power_ups.update(gw, gs)
+    assert not ball.freeze_ball
@@ -0,0 +1,87 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the presenter (logical backbuffer to display scaling).
+"""
+from unittest.mock import patch
+
+import pygame
+import pytest
+
+import presenter
+from constants import WIDTH, HEIGHT, RED, BLACK
+
+
+@pytest.fixture(autouse=True)
+def restore_presenter():
+    """
+    Put the presenter back to presenting directly, since it's global
+    """
+    yield
+    presenter.mode = presenter.DIRECT
+    presenter.window = presenter.backbuffer = presenter.dest_surface = None
+    presenter.dest_rect = pygame.Rect(0, 0, WIDTH, HEIGHT)
+
+
+def use_display(width: int, height: int) -> pygame.Surface:
+    """
+    Present to a plain Surface standing in for a display of this size
+    """
+    return presenter.use_display(pygame.Surface((width, height)), (width, height))
+
+
+def test_logical_size_draws_directly_on_the_display():
+    """
+    Test a logical-size display is drawn into directly, and positions aren't mapped
+    """
+    display = pygame.Surface((WIDTH, HEIGHT))
+    assert presenter.use_display(display, (WIDTH, HEIGHT)) is display
+    assert presenter.mode == presenter.DIRECT
+    assert presenter.to_logical((17, 23)) == (17, 23)
+
+
+@patch("pygame.display.flip")
+def test_large_display_integer_scales_and_maps_the_mouse(mock_flip):
+    """
+    Test a display over 2x the logical size gets the whole-number 2x scale, centered, with mapped mouse events
+    """
+    backbuffer = use_display(2560, 1700)
+    assert presenter.mode == presenter.INTEGER
+    assert presenter.dest_rect == pygame.Rect(80, 50, 2 * WIDTH, 2 * HEIGHT)
+
+    backbuffer.fill(BLACK)
+    backbuffer.fill(RED, (0, 0, 1, 1))
+    presenter.present()
+
+    mock_flip.assert_called_once()
+    assert presenter.window.get_at((81, 51))[:3] == RED  # the 2x2 block for the logical pixel
+    assert presenter.window.get_at((82, 50))[:3] == BLACK
+    assert presenter.window.get_at((10, 10))[:3] == BLACK  # letterbox
+
+    events = presenter.map_events([pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(80 + 601, 50 + 401), button=1),
+                                   pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)])
+    assert events[0].pos == (300, 200)
+    assert presenter.to_window((300, 200)) == (680, 450)
+
+
+@patch("pygame.display.flip")
+def test_other_sizes_smoothscale_to_fit(mock_flip):
+    """
+    Test a 1080p display gets the frame smoothscaled to its full height, pillarboxed
+    """
+    backbuffer = use_display(1920, 1080)
+    assert presenter.mode == presenter.SMOOTH
+    assert presenter.dest_rect == pygame.Rect(150, 0, 1620, 1080)
+
+    backbuffer.fill(RED)
+    presenter.present()
+
+    assert presenter.window.get_at((960, 540))[:3] == RED
+    assert presenter.window.get_at((149, 540))[:3] == BLACK
+    with patch("pygame.mouse.get_pos", return_value=(150 + 1620, 1080)):
+        assert presenter.get_mouse_pos() == (WIDTH, HEIGHT)
@@ -0,0 +1,101 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the FrameProfiler and RingTimings classes.
+"""
+import json
+
+from profiler import FrameProfiler, RingTimings
+
+
+def test_ring_running_mean():
+    """
+    Test that the running sum drops the oldest samples once the ring is full
+    :return:
+    """
+    ring = RingTimings(4)
+    for value in [10, 20, 30, 40]:
+        ring.add(value)
+    assert ring.mean() == 25
+
+    ring.add(50)
+    assert ring.total == 20 + 30 + 40 + 50
+    assert ring.ordered() == [20, 30, 40, 50]
+    assert ring.max() == 50
+
+
+def test_ring_percentiles():
+    """
+    Test the nearest-rank percentiles
+    :return:
+    """
+    ring = RingTimings(100)
+    for value in range(1, 101):
+        ring.add(value)
+    assert ring.percentiles((50, 95, 99)) == [51, 96, 100]
+    assert RingTimings(5).percentiles((50,)) == [0]
+
+
+def test_spans_accumulate_per_frame():
+    """
+    Test that a span begun/ended several times in a frame is summed into one sample
+    :return:
+    """
+    prof = FrameProfiler(8)
+    prof.begin('collision')
+    prof.end('collision')
+    prof.begin('collision')
+    prof.end('collision')
+    prof.end_frame()
+
+    assert prof.rings['collision'].count == 1
+    assert prof.rings[FrameProfiler.FRAME].count == 1
+
+    # a frame without the span still records a zero sample for it
+    prof.end_frame()
+    assert prof.rings['collision'].ordered()[-1] == 0
+
+
+def test_dumps():
+    """
+    Test the CSV and JSON dumps contain every span
+    :return:
+    """
+    prof = FrameProfiler(8)
+    for _ in range(3):
+        prof.begin('draw')
+        prof.end('draw')
+        prof.end_frame()
+
+    csv_lines = prof.to_csv().splitlines()
+    assert csv_lines[0] == 'frame,draw'
+    assert len(csv_lines) == 4
+
+    dump = json.loads(prof.to_json())
+    assert dump['frames'] == 3
+    assert set(dump['summary_ms'].keys()) == {'frame', 'draw'}
+    assert len(dump['samples_ns']['draw']) == 3
+
+
+def test_late_span_lines_up_with_frames():
+    """
+    Test a span first seen partway through is zero-filled back, so each CSV row holds one frame's samples
+    :return:
+    """
+    prof = FrameProfiler(4)
+    for frame in range(6):
+        if frame >= 4:
+            prof.frame_ns['late'] = 100 + frame
+        prof.end_frame()
+
+    late = prof.rings['late'].ordered()
+    assert late == [0, 0, 104, 105]
+    assert len(late) == len(prof.rings[FrameProfiler.FRAME].ordered())
+    csv_lines = prof.to_csv().splitlines()
+    assert csv_lines[0] == 'frame,late'
+    assert [line.split(',')[1] for line in csv_lines[1:]] == ['0', '0', '104', '105']
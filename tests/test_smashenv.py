@@ -0,0 +1,129 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the SmashEnv training environment and its vectorized variants.
+"""
+import random
+
+from brick import Brick
+from smashenv import (SmashEnv, SmashVectorEnv, SubprocVectorEnv, OBS_SIZE, STATE_SIZE,
+                      ACTION_STAY, ACTION_LEFT, ACTION_RIGHT, NUM_ACTIONS)
+
+
+def follow_ball(obs, row: int = 0) -> int:
+    """
+    A simple agent - keep the paddle under the ball
+    """
+    ball_x, paddle_x = obs[row * OBS_SIZE], obs[row * OBS_SIZE + 4]
+    if ball_x < paddle_x - 0.03:
+        return ACTION_LEFT
+    if ball_x > paddle_x + 0.03:
+        return ACTION_RIGHT
+    return ACTION_STAY
+
+
+def test_reset_observation_and_seeded_replay():
+    """
+    Test the observation has a bitmap bit per Brick, and the same seed and actions replay the same episode
+    """
+    env = SmashEnv()
+    obs, info = env.reset(seed=7)
+    assert len(obs) == OBS_SIZE
+    assert sum(obs[STATE_SIZE:]) == sum(isinstance(wo, Brick) for wo in env.gw.world_objects)
+    assert info == {'score': 0, 'lives': 3, 'steps': 0}
+
+    rng = random.Random(1)
+    actions = [rng.randrange(NUM_ACTIONS) for _ in range(300)]
+    first = [env.step(action)[:4] for action in actions]
+    env.reset(seed=7)
+    assert [env.step(action)[:4] for action in actions] == first
+
+
+def test_reward_is_the_score_gained_and_bricks_leave_the_bitmap():
+    """
+    Test the step reward is the PlayerState.score gained, and a destroyed Brick's bit clears
+    """
+    env = SmashEnv()
+    obs, info = env.reset(seed=3)
+    total = 0.0
+    while info['score'] == 0:
+        bricks = sum(obs[STATE_SIZE:])
+        obs, reward, terminated, truncated, info = env.step(follow_ball(obs))
+        total += reward
+        assert not (terminated or truncated)
+    assert total == info['score'] == env.ps.score
+    assert sum(obs[STATE_SIZE:]) == bricks - 1
+
+
+def test_vector_env_resets_finished_envs():
+    """
+    Test the in-process vector env steps every env, and resets the finished ones
+    """
+    vector_env = SmashVectorEnv(3, max_steps=5)
+    obs, infos = vector_env.reset(seed=1)
+    assert len(obs) == 3 * OBS_SIZE and len(infos) == 3
+
+    for _ in range(4):
+        obs, rewards, terminated, truncated, infos = vector_env.step([ACTION_LEFT, ACTION_STAY, ACTION_RIGHT])
+        assert truncated == bytes(3)
+    obs, rewards, terminated, truncated, infos = vector_env.step([ACTION_LEFT, ACTION_STAY, ACTION_RIGHT])
+
+    assert truncated == bytes([1, 1, 1]) and len(rewards) == 3
+    # the left-moved paddle of the final observation, then the new episode's centered one
+    assert infos[0]['final_observation'][4] < 0.5
+    assert obs[4] == 0.5 and vector_env.envs[0].steps == 0
+
+
+def test_subprocess_vector_env_matches_in_process():
+    """
+    Test the subprocess workers return the same lockstep results as the in-process vector env
+    """
+    in_process = SmashVectorEnv(2)
+    subprocess_env = SubprocVectorEnv(2, num_workers=1)
+    try:
+        expected, _ = in_process.reset(seed=11)
+        obs, _ = subprocess_env.reset(seed=11)
+        assert obs == expected
+        for _ in range(50):
+            actions = [follow_ball(expected, 0), follow_ball(expected, 1)]
+            expected, expected_rewards, _, _, _ = in_process.step(actions)
+            obs, rewards, _, _, _ = subprocess_env.step(actions)
+            assert (obs, rewards) == (expected, expected_rewards)
+    finally:
+        subprocess_env.close()
+
+    split_env = SubprocVectorEnv(3, num_workers=2)
+    try:
+        obs, infos = split_env.reset(seed=11)
+        obs, rewards, terminated, truncated, infos = split_env.step([ACTION_STAY] * 3)
+        assert split_env.chunks == [(0, 1), (1, 2)]
+        assert len(obs) == 3 * OBS_SIZE and len(rewards) == 3 and len(terminated) == 3 and len(infos) == 3
+    finally:
+        split_env.close()
+
+
+def test_subprocess_workers_publish_pixel_frames():
+    """
+    Test the workers render each env's frame into its shared memory ring on every reset/step
+    """
+    vector_env = SubprocVectorEnv(2, num_workers=2, pixel_size=(84, 84))
+    try:
+        vector_env.reset(seed=5)
+        first = [bytes(frame) for frame in vector_env.get_frames()]
+        vector_env.step([ACTION_LEFT, ACTION_LEFT])
+        vector_env.step([ACTION_LEFT, ACTION_LEFT])
+
+        frames = vector_env.get_frames()
+        assert [len(frame) for frame in frames] == [84 * 84, 84 * 84]
+        assert [ring.get_count() for ring in vector_env.rings] == [3, 3]
+        assert [bytes(frame) for frame in vector_env.get_frames(age=2)] == first
+        assert bytes(frames[0]) != first[0]
+        for frame in frames:
+            frame.release()
+    finally:
+        vector_env.close()
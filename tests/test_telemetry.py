@@ -0,0 +1,118 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the telemetry recorder and the telemetryheatmap viewer.
+"""
+import os
+from unittest.mock import patch
+
+import pygame
+import pytest
+
+import constants
+import persistence
+import telemetry
+import telemetryheatmap
+from levels import Levels
+
+
+@pytest.fixture(autouse=True)
+def telemetry_on(tmp_path):
+    """
+    Record into a temporary game data dir, turning telemetry back off afterwards
+    """
+    with patch.object(persistence, "GAME_DATA_PATH", str(tmp_path)):
+        telemetry.enable()
+        yield tmp_path
+        telemetry.end_level(False)
+        telemetry.wait()
+        telemetry.enable(False)
+
+
+def read_file(tmp_path) -> list[dict]:
+    """
+    Wait for the writes, then parse the telemetry file
+    """
+    telemetry.wait()
+    with open(os.path.join(tmp_path, telemetry.TELEMETRY_FILENAME), 'rb') as file_in:
+        return telemetry.read_records(file_in.read())
+
+
+def test_disabled_records_nothing(telemetry_on):
+    """
+    Test that with telemetry off, no counts are kept and no file is written
+    """
+    telemetry.enable(False)
+    telemetry.begin_level(Levels.LevelName.CLASSIC_RANDOM_1)
+    telemetry.record_brick_hit(100, 100)
+    telemetry.end_level(True)
+    telemetry.wait()
+
+    assert sum(telemetry.brick_hits) == 0
+    assert not os.path.exists(os.path.join(telemetry_on, telemetry.TELEMETRY_FILENAME))
+
+
+def test_level_record_round_trip(telemetry_on):
+    """
+    Test a level's counts are appended at level end and read back by cell, bin, and wall
+    """
+    telemetry.begin_level(Levels.LevelName.CLASSIC_RANDOM_1)
+    telemetry.record_brick_hit(60, 130)
+    telemetry.record_brick_hit(60, 130)
+    telemetry.record_brick_hit(constants.WIDTH + 50, -5)  # clamped into the grid
+    telemetry.record_paddle_contact(0)
+    telemetry.record_paddle_contact(-1000)
+    telemetry.record_wall_bounce(telemetry.WALL_TOP)
+    telemetry.record_life_lost()
+    telemetry.add_play_time(4)
+    telemetry.add_play_time(4)
+    telemetry.end_level(True)
+    # the next level starts from zero, and ending a game mid-level records it as not cleared
+    telemetry.begin_level(Levels.LevelName.CLASSIC_SOLID_ROWS_1)
+    telemetry.record_brick_hit(60, 130)
+    telemetry.begin_level(Levels.LevelName.CLASSIC_RANDOM_1)
+    telemetry.end_level(False)
+
+    first, second, third = read_file(telemetry_on)
+
+    cell = constants.TELEMETRY_CELL_SIZE
+    assert first['level'] == Levels.LevelName.CLASSIC_RANDOM_1.value
+    assert first['cleared'] and first['play_ms'] == 8 and first['lives_lost'] == 1
+    assert first['brick_hits'][(130 // cell) * first['cols'] + (60 // cell)] == 2
+    assert first['brick_hits'][first['cols'] - 1] == 1
+    assert sum(first['brick_hits']) == 3
+    assert first['paddle_offsets'][constants.TELEMETRY_PADDLE_BINS // 2] == 1
+    assert first['paddle_offsets'][0] == 1
+    assert list(first['wall_bounces']) == [0, 0, 1]
+
+    assert second['level'] == Levels.LevelName.CLASSIC_SOLID_ROWS_1.value
+    assert not second['cleared']
+    assert sum(second['brick_hits']) == 1
+    assert sum(third['brick_hits']) == 0
+
+
+def test_heatmap_sums_and_renders_each_level(telemetry_on):
+    """
+    Test the viewer sums the records per LevelName and renders a heatmap image for each
+    """
+    for _ in range(2):
+        telemetry.begin_level(Levels.LevelName.CLASSIC_RANDOM_1)
+        telemetry.record_brick_hit(60, 130)
+        telemetry.add_play_time(1000)
+        telemetry.end_level(True)
+
+    levels = telemetryheatmap.sum_by_level(read_file(telemetry_on))
+
+    total = levels[Levels.LevelName.CLASSIC_RANDOM_1]
+    assert total['plays'] == 2 and total['clears'] == 2 and total['clear_ms'] == 2000
+    assert max(total['brick_hits']) == 2
+
+    pygame.font.init()
+    surface = telemetryheatmap.render_level(Levels.LevelName.CLASSIC_RANDOM_1, total, pygame.font.Font(None, 18))
+    cell = constants.TELEMETRY_CELL_SIZE
+    assert surface.get_at(((60 // cell) * cell, (130 // cell) * cell))[:3] == (255, 255, 255)  # hottest
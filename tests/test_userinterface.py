@@ -229,4 +229,117 @@ def test_update_background_elements(ui_fixture):
     initial_positions = [ball["rect"].topleft for ball in ui.background_balls]
     ui.update_background_elements()
     updated_positions = [ball["rect"].topleft for ball in ui.background_balls]
-    assert initial_positions != updated_positions  # Ensure positions are updated
\ No newline at end of file
+    assert initial_positions != updated_positions  # Ensure positions are updated
+
+def test_static_screen_cache(ui_fixture):
+    """Test a static screen is only re-rendered when its inputs or hovered button change."""
+    ui, mock_pygame = ui_fixture
+    button = pygame.Rect(0, 0, 20, 20)
+    render = MagicMock(return_value=[button])
+    mock_pygame["mouse"].get_pos.return_value = (100, 100)
+
+    first = ui.get_static_screen("test", (1,), render)
+    assert ui.get_static_screen("test", (1,), render) is first
+    assert render.call_count == 1
+
+    # new inputs
+    ui.get_static_screen("test", (2,), render)
+    assert render.call_count == 2
+
+    # hovering over the button
+    mock_pygame["mouse"].get_pos.return_value = (10, 10)
+    ui.get_static_screen("test", (2,), render)
+    ui.get_static_screen("test", (2,), render)
+    assert render.call_count == 3
+
+    ui.invalidate_static_screens()
+    ui.get_static_screen("test", (2,), render)
+    assert render.call_count == 4
+
+
+def test_leaderboard_rows_cached_and_scrolled(ui_fixture):
+    """Test the leaderboard rows are only rendered once per version, and scrolling is clamped."""
+    from leaderboard import Leaderboard
+    from score import Score
+    ui, _ = ui_fixture
+    lb = Leaderboard()
+    lb.l_top_scores = [Score(i, 1, "abc") for i in range(25)]
+    lb.mark_changed()
+    ui.font_leaderboard = MagicMock()
+
+    ui.surface = MagicMock()
+    ui._render_leaderboard_screen(lb)
+    assert ui.font_leaderboard.render.call_count == 1 + constants.LEADERBOARD_VISIBLE_ROWS
+    ui._render_leaderboard_screen(lb)
+    assert ui.font_leaderboard.render.call_count == 2 + constants.LEADERBOARD_VISIBLE_ROWS
+
+    ui.scroll_leaderboard(100, lb)
+    assert ui.leaderboard_first_row == 25 - constants.LEADERBOARD_VISIBLE_ROWS
+    ui.scroll_leaderboard(-100, lb)
+    assert ui.leaderboard_first_row == 0
+
+    lb.mark_changed()
+    ui.get_leaderboard_row(lb, 0)
+    assert len(ui.leaderboard_rows) == 1
+
+
+def test_settings_knob_only_redraw(ui_fixture):
+    """Test a slider drag only moves the knob (the static layer and widget Surfaces aren't rebuilt)."""
+    from gamesettings import GameSettings
+    ui, mock_pygame = ui_fixture
+    gset = GameSettings()
+    gset.bgm_sounds = True
+    gset.music_volume = 0.5
+    ui.slider_bgm_rect = pygame.Rect(100, 300, constants.SLIDER_WIDTH, constants.SLIDER_HEIGHT)
+    ui.slider_sfx_rect = pygame.Rect(100, 500, constants.SLIDER_WIDTH, constants.SLIDER_HEIGHT)
+    ui.settings_widgets = {'knob': MagicMock(), 'knob_hover': MagicMock()}
+    mock_pygame["mouse"].get_pos.return_value = (0, 0)
+
+    with mock.patch.object(ui, "_render_settings_screen", return_value=[]) as mock_render:
+        ui.draw_settings_screen(gset)
+        gset.music_volume = 0.75
+        ui.draw_settings_screen(gset)
+        mock_render.assert_called_once()
+
+    assert ui.knob_bg_rect.centerx == 100 + int(0.75 * constants.SLIDER_WIDTH)
+    assert ui.knob_bg_rect.centery == ui.slider_bgm_rect.centery
+    ui.screen.blit.assert_any_call(ui.settings_widgets['knob'], ui.knob_bg_rect)
+
+
+def test_settings_buttons_after_the_pause_menu(ui_fixture, gamestate):
+    """Test the cached settings screen puts back its button rects after the pause menu has moved pad_btn_rect."""
+    from gamesettings import GameSettings
+    ui, mock_pygame = ui_fixture
+    gset = GameSettings()
+    ui.slider_bgm_rect = pygame.Rect(100, 300, constants.SLIDER_WIDTH, constants.SLIDER_HEIGHT)
+    ui.slider_sfx_rect = pygame.Rect(100, 500, constants.SLIDER_WIDTH, constants.SLIDER_HEIGHT)
+    ui.settings_widgets = {'knob': MagicMock(), 'knob_hover': MagicMock()}
+    mock_pygame["mouse"].get_pos.return_value = (0, 0)
+    settings_pad_btn_rect = pygame.Rect(440, 657, 210, 40)
+
+    def render_settings(_gset):
+        ui.graphics_btn_rect = pygame.Rect(440, 230, 210, 40)
+        ui.vol_bgm_btn_rect = pygame.Rect(213, 331, 75, 75)
+        ui.vol_sfx_btn_rect = pygame.Rect(213, 481, 75, 75)
+        ui.pad_btn_rect = settings_pad_btn_rect
+        ui.back_button_rect = pygame.Rect(20, 730, 100, 40)
+        ui.slider_bgm_rect = pygame.Rect(288, 361, constants.SLIDER_WIDTH, constants.SLIDER_HEIGHT)
+        return [ui.graphics_btn_rect, ui.vol_bgm_btn_rect, ui.vol_sfx_btn_rect, ui.pad_btn_rect,
+                ui.back_button_rect]
+
+    ui.font_buttons = mock_pygame["font"]
+    ui.font_buttons.render.side_effect = lambda text, flag, color: type("FakeSurface", (), {
+            "get_rect": lambda self, **kwargs: type("FakeRect", (), {"x": 100, "y": kwargs.get("topright", (0, 0))[1]})(),
+            "get_width": lambda self: 80},)()
+
+    with mock.patch.object(ui, "_render_settings_screen", side_effect=render_settings) as mock_render:
+        ui.draw_settings_screen(gset)
+        ui.draw_pause_menu(gamestate)
+        assert ui.pad_btn_rect != settings_pad_btn_rect
+        ui.slider_bgm_rect = None
+        ui.draw_settings_screen(gset)
+        mock_render.assert_called_once()
+
+    assert ui.pad_btn_rect == settings_pad_btn_rect
+    # (the knobs are drawn on the cached screen's slider bars)
+    assert ui.knob_bg_rect.centery == 361 + (constants.SLIDER_HEIGHT // 2)
@@ -0,0 +1,128 @@
+"""
+    Project: SmashCore
+    Course: UMGC CMSC 495 (7383)
+    Term: Spring 2025
+    Date: 20250401
+    Code Repository: https://github.com/jcooke-dev/smashCore
+    Authors: Justin Cooke, Ann Rauscher, Camila Roxo, Justin Smith, Rex Vargas
+
+    Module Description: This is the test harness for the two player versus mode.
+"""
+from collections import defaultdict
+from unittest import mock
+
+import pygame
+
+import constants
+from brick import Brick
+from gamestate import GameState
+from leveltheme import LevelTheme
+from versus import VersusMatch, DRAW, VIEW_WIDTH
+
+NO_KEYS = defaultdict(bool)
+
+
+def get_bricks(side) -> list:
+    """
+    The side's Bricks' positions and strengths
+    """
+    return [(tuple(wo.rect), wo.strength) for wo in side.gw.world_objects if isinstance(wo, Brick)]
+
+
+def test_both_sides_play_the_same_level():
+    """
+    Test the second side is built from the first side's level seed, with its own objects and state
+    """
+    match = VersusMatch(LevelTheme.CLASSIC)
+    first, second = match.sides
+    assert second.gw.level_seed == first.gw.level_seed
+    assert get_bricks(second) == get_bricks(first)
+    assert first.ball is not second.ball and first.gs is not second.gs and first.ps is not second.ps
+    assert first.view_rect.right <= second.view_rect.left
+
+
+def test_scheduler_runs_whole_steps_for_both_worlds():
+    """
+    Test the elapsed time runs whole fixed steps (the rest carried over), capped per frame, each moving both Balls
+    """
+    match = VersusMatch(LevelTheme.CLASSIC)
+    for side in match.sides:
+        side.launch()
+    start = [tuple(side.ball.rect) for side in match.sides]
+
+    match.advance((2 * constants.VERSUS_STEP_MS) + 1, NO_KEYS)
+    assert (match.steps, match.accumulator_ms) == (2, 1)
+    assert all(tuple(side.ball.rect) != pos for side, pos in zip(match.sides, start))
+
+    match.advance(10_000, NO_KEYS)
+    assert match.steps == 2 + constants.VERSUS_MAX_STEPS_PER_FRAME
+
+
+def test_input_goes_to_each_players_side():
+    """
+    Test player 1's mouse steers and launches the left side only, and player 2's keys the right side only
+    """
+    match = VersusMatch(LevelTheme.CLASSIC)
+    first, second = match.sides
+    second_paddle_x = second.paddle.rect.centerx
+
+    match.handle_input([pygame.event.Event(pygame.MOUSEMOTION, pos=(VIEW_WIDTH // 4, 300)),
+                        pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(VIEW_WIDTH // 4, 300))])
+    match.advance(constants.VERSUS_STEP_MS, NO_KEYS)
+    assert first.paddle.rect.centerx == constants.WIDTH // 4
+    assert first.gs.cur_state == GameState.GameStateName.PLAYING
+    assert second.gs.cur_state == GameState.GameStateName.READY_TO_LAUNCH
+
+    keys = defaultdict(bool, {pygame.K_LEFT: True})
+    match.handle_input([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)])
+    match.advance(constants.VERSUS_STEP_MS, keys)
+    assert second.paddle.rect.centerx < second_paddle_x
+    assert second.gs.cur_state == GameState.GameStateName.PLAYING
+    assert first.paddle.rect.centerx == constants.WIDTH // 4
+
+    match.handle_input([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)])
+    assert match.done
+
+
+def test_result_and_leaving_for_the_menu():
+    """
+    Test running out of lives loses, clearing the level wins, a tie on both is a DRAW, and the steps stop once over
+    """
+    match = VersusMatch(LevelTheme.CLASSIC)
+    match.sides[1].ps.lives = 0
+    assert match.update_result() and match.winner == 1
+
+    match = VersusMatch(LevelTheme.CLASSIC)
+    match.sides[0].ps.lives = 0
+    match.sides[0].ps.score = 500
+    match.sides[1].cleared = True
+    assert match.update_result() and match.winner == 2
+
+    match = VersusMatch(LevelTheme.CLASSIC)
+    for side in match.sides:
+        side.cleared = True
+    match.advance(constants.VERSUS_STEP_MS, NO_KEYS)
+    assert (match.winner, match.steps) == (DRAW, 1)
+    match.advance(constants.VERSUS_STEP_MS, NO_KEYS)
+    assert match.steps == 1
+
+    match.handle_input([pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(10, 10))])
+    assert match.done
+
+
+def test_draw_fills_each_side_view():
+    """
+    Test each side's world is scaled into its own view, leaving the rest of the screen to the status/prompts
+    """
+    match = VersusMatch(LevelTheme.CLASSIC)
+    screen = pygame.Surface((constants.WIDTH, constants.HEIGHT))
+    with mock.patch("pygame.key.get_pressed", return_value=NO_KEYS):
+        events = match.run_frame([], screen, constants.VERSUS_STEP_MS)
+    assert events == []
+    for side in match.sides:
+        view = screen.subsurface(side.view_rect.inflate(-4, -4))
+        assert pygame.transform.average_color(view)[:3] != (0, 0, 0)
+    # the canvas is made once per screen
+    canvas = match.get_canvas(screen)
+    match.draw(screen)
+    assert match.get_canvas(screen) is canvas
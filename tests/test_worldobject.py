@@ -1,6 +1,6 @@
 import pytest
 
-from worldobject import WorldObject
+from worldobject import WorldObject, CollisionLayer
 
 
 @pytest.fixture
@@ -13,7 +13,8 @@ def test_default_initialization(wo):
     assert wo.value == 0
     assert wo.rect is None
     assert wo.can_react is False
-    assert wo.primed_collision is True
+    assert wo.collision_layer == CollisionLayer.NONE
+    assert wo.collision_mask == CollisionLayer.NONE
 
 def test_should_score(wo):
     assert wo.should_score() is False